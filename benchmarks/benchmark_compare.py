@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+DESCRIPTION
+The benchmark_compare utility compares two tool_benchmark reports - typically made on one machine, at two commits. For
+each utility in both reports, it gives the ratio of the current to the baseline docs_per_sec, peak_rss_kb and
+startup_ms. A docs_per_sec ratio above 1.0 is an improvement; peak_rss_kb and startup_ms ratios below 1.0 are
+improvements.
+
+A warning is written to stderr if the reports were made with different parameters, or on different hosts.
+
+The result is written to stdout as a JSON document.
+
+SYNOPSIS
+benchmark_compare.py BASELINE_REPORT CURRENT_REPORT
+
+EXAMPLES
+benchmarks/benchmark_compare.py benchmark-5a1c2e0.json benchmark-9f3b7d4.json
+"""
+
+import json
+import optparse
+import sys
+
+from collections import OrderedDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+METRICS = ('docs_per_sec', 'peak_rss_kb', 'startup_ms')
+
+
+def load(filename):
+    with open(filename, 'r') as file:
+        return json.load(file, object_pairs_hook=OrderedDict)
+
+
+def ratio(baseline, current):
+    if not baseline or current is None:
+        return None
+
+    return round(current / baseline, 2)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = optparse.OptionParser(usage="%prog BASELINE_REPORT CURRENT_REPORT")
+
+    _, args = parser.parse_args()
+
+    if len(args) != 2:
+        parser.print_help(sys.stderr)
+        exit(2)
+
+    baseline_report = load(args[0])
+    current_report = load(args[1])
+
+    for field in ('parameters', 'host', 'python'):
+        if baseline_report.get(field) != current_report.get(field):
+            print("benchmark_compare: %s differ: %s / %s" %
+                  (field, baseline_report.get(field), current_report.get(field)), file=sys.stderr)
+
+    comparison = OrderedDict()
+    comparison['baseline'] = baseline_report.get('commit')
+    comparison['current'] = current_report.get('commit')
+    comparison['utilities'] = OrderedDict()
+
+    for name, current in current_report['utilities'].items():
+        baseline = baseline_report['utilities'].get(name)
+
+        if baseline is None:
+            continue
+
+        result = OrderedDict()
+
+        if baseline.get('status') != 0 or current.get('status') != 0:
+            result['status'] = [baseline.get('status'), current.get('status')]
+
+        else:
+            for metric in METRICS:
+                result[metric] = ratio(baseline.get(metric), current.get(metric))
+
+        comparison['utilities'][name] = result
+
+    print(json.dumps(comparison, indent=4))
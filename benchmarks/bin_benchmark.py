@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+DESCRIPTION
+The bin_benchmark measures the rate at which a gas document is written and read by the JSONCodec, and by the binary
+interchange format. The sizes of the two representations of the document are also reported.
+
+The result is written to stdout as a JSON document.
+
+SYNOPSIS
+bin_benchmark.py [-n DOCUMENTS]
+
+EXAMPLES
+PYTHONPATH=src benchmarks/bin_benchmark.py -n 200000
+"""
+
+import json
+import optparse
+import time
+
+from collections import OrderedDict
+
+from scs_analysis.helper.binary_codec import BinaryDecoder, BinaryEncoder
+from scs_analysis.helper.json_codec import JSONCodec
+
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+GASES = ('NO2', 'CO', 'SO2', 'H2S')
+
+DOCUMENT = OrderedDict((
+    ('tag', 'scs-bgx-401'),
+    ('rec', '2019-02-16T13:53:52Z'),
+    ('val', OrderedDict(
+        [(gas, OrderedDict((('weV', 0.29), ('aeV', 0.28), ('weC', 0.01), ('cnc', 12.3)))) for gas in GASES] +
+        [('sht', OrderedDict((('hmd', 59.7), ('tmp', 23.8))))]))
+))
+
+BLOCK_SIZE = 65536
+
+
+def json_encode(codec, data):
+    return [codec.dumps(datum) + '\n' for datum in data]
+
+
+def bin_encode(codec, data):
+    encoder = BinaryEncoder(codec)
+
+    return [encoder.encode(datum) for datum in data]
+
+
+def json_decode(codec, lines):
+    for line in lines:
+        codec.decode(line)
+
+
+def bin_decode(blocks):
+    for jdict in BinaryDecoder().documents(blocks):
+        PathDict(jdict)
+
+
+def blocks(frames):
+    stream = b''.join(frames)
+
+    return [stream[i:i + BLOCK_SIZE] for i in range(0, len(stream), BLOCK_SIZE)]
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def rate(count, func, *args):
+    start_time = time.time()
+    func(*args)
+
+    return round(count / (time.time() - start_time))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = optparse.OptionParser(usage="%prog [-n DOCUMENTS]")
+
+    parser.add_option("--documents", "-n", type="int", nargs=1, action="store", dest="documents", default=200000,
+                      help="number of documents (default 200000)")
+
+    opts, _ = parser.parse_args()
+
+    json_codec = JSONCodec.construct()
+    documents = [PathDict(DOCUMENT)] * opts.documents
+
+    json_lines = json_encode(json_codec, documents)
+    bin_frames = bin_encode(json_codec, documents)
+
+    report = OrderedDict()
+    report['documents'] = opts.documents
+    report['backend'] = json_codec.backend
+    report['json_size'] = len(json_lines[-1])
+    report['bin_size'] = len(bin_frames[-1])
+    report['json_encode'] = rate(opts.documents, json_encode, json_codec, documents)
+    report['bin_encode'] = rate(opts.documents, bin_encode, json_codec, documents)
+    report['json_decode'] = rate(opts.documents, json_decode, json_codec, json_lines)
+    report['bin_decode'] = rate(opts.documents, bin_decode, blocks(bin_frames))
+
+    print(json.dumps(report))
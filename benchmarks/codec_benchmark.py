@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+DESCRIPTION
+The codec_benchmark measures the rate at which documents are parsed and serialised by the
+PathDict.construct_from_jstr(..) / JSONify.dumps(..) pair, and by the JSONCodec with each of its available backends.
+
+The result is written to stdout as a JSON document.
+
+SYNOPSIS
+codec_benchmark.py [-n DOCUMENTS]
+
+EXAMPLES
+PYTHONPATH=src benchmarks/codec_benchmark.py -n 200000
+"""
+
+import json
+import optparse
+import time
+
+from collections import OrderedDict
+
+from scs_analysis.helper.json_codec import JSONCodec
+
+from scs_core.data.json import JSONify
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+DOCUMENT = '{"val": {"hmd": 59.7, "tmp": 23.8, "bar": {"p0": 103.2, "pA": 102.0, "tmp": 23.3}}, ' \
+           '"rec": "2019-02-16T13:53:52Z", "tag": "scs-ap1-6"}'
+
+
+def jsonify_round_trip(lines):
+    for line in lines:
+        JSONify.dumps(PathDict.construct_from_jstr(line))
+
+
+def codec_round_trip(codec, lines):
+    for line in lines:
+        codec.dumps(codec.decode(line))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def rate(func, *args):
+    start_time = time.time()
+    func(*args)
+
+    return round(len(args[-1]) / (time.time() - start_time))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = optparse.OptionParser(usage="%prog [-n DOCUMENTS]")
+
+    parser.add_option("--documents", "-n", type="int", nargs=1, action="store", dest="documents", default=200000,
+                      help="number of documents (default 200000)")
+
+    opts, _ = parser.parse_args()
+
+    documents = [DOCUMENT] * opts.documents
+
+    report = OrderedDict()
+    report['documents'] = opts.documents
+    report['jsonify'] = rate(jsonify_round_trip, documents)
+
+    for backend in JSONCodec.backends():
+        report[backend] = rate(codec_round_trip, JSONCodec.construct(backend), documents)
+
+    print(json.dumps(report))
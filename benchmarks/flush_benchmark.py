@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+DESCRIPTION
+The flush_benchmark measures the throughput of a pass-through filter, with one flush per document (as the stream
+utilities were written originally) and with the OutputStream flush policy. The filter is run as a child process with
+stdin read from a file and stdout written to a pipe, as it would be in a batch pipeline.
+
+The result is written to stdout as a JSON document.
+
+SYNOPSIS
+flush_benchmark.py [-n DOCUMENTS]
+
+EXAMPLES
+PYTHONPATH=src benchmarks/flush_benchmark.py -n 1000000
+"""
+
+import json
+import optparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from collections import OrderedDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+DOCUMENT = '{"val": {"hmd": 59.7, "tmp": 23.8, "bar": {"p0": 103.2, "pA": 102.0, "tmp": 23.3}}, ' \
+           '"rec": "2019-02-16T13:53:52Z", "tag": "scs-ap1-6"}\n'
+
+
+def per_document_filter():
+    for line in sys.stdin:
+        print(line, end='')
+        sys.stdout.flush()
+
+
+def output_stream_filter():
+    from scs_analysis.helper.input_stream import InputStream
+    from scs_analysis.helper.output_stream import OutputStream
+
+    stdout = OutputStream.construct()
+    stdin = InputStream.construct(idle_handler=stdout.idle)
+
+    for line in stdin.lines():
+        stdout.write(line)
+
+    stdout.close()
+
+
+FILTERS = OrderedDict((('per-document', per_document_filter), ('output-stream', output_stream_filter)))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def run(filter_name, input_filename, documents):
+    start_time = time.time()
+
+    with open(input_filename, 'r') as stdin:
+        p = subprocess.Popen((sys.executable, __file__, '--filter', filter_name), stdin=stdin, stdout=subprocess.PIPE)
+
+        received = 0
+
+        while True:
+            block = p.stdout.read(65536)
+
+            if not block:
+                break
+
+            received += block.count(b'\n')
+
+        p.wait()
+
+    elapsed = time.time() - start_time
+
+    if received != documents:
+        raise RuntimeError("%s: expected %d documents, received %d" % (filter_name, documents, received))
+
+    return round(documents / elapsed)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = optparse.OptionParser(usage="%prog [-n DOCUMENTS]")
+
+    parser.add_option("--documents", "-n", type="int", nargs=1, action="store", dest="documents", default=1000000,
+                      help="number of documents in the stream (default 1000000)")
+
+    parser.add_option("--filter", type="string", nargs=1, action="store", dest="filter",
+                      help="run as the named child filter")
+
+    opts, _ = parser.parse_args()
+
+    # child...
+    if opts.filter is not None:
+        FILTERS[opts.filter]()
+        exit(0)
+
+    # parent...
+    fd, filename = tempfile.mkstemp(suffix='.json')
+
+    try:
+        with os.fdopen(fd, 'w') as file:
+            for _ in range(opts.documents):
+                file.write(DOCUMENT)
+
+        report = OrderedDict()
+        report['documents'] = opts.documents
+
+        for name in FILTERS.keys():
+            report[name] = run(name, filename, opts.documents)
+
+        report['gain'] = round(report['output-stream'] / report['per-document'], 2)
+
+        print(json.dumps(report))
+
+    finally:
+        os.remove(filename)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+DESCRIPTION
+The path_benchmark measures the rate at which a wide gas document is tested and read for two paths, as gas_exegesis
+does - firstly with datum.paths() and datum.node(..), and secondly with compiled PathAccessors.
+
+The result is written to stdout as a JSON document.
+
+SYNOPSIS
+path_benchmark.py [-n DOCUMENTS]
+
+EXAMPLES
+PYTHONPATH=src benchmarks/path_benchmark.py -n 100000
+"""
+
+import json
+import optparse
+import time
+
+from collections import OrderedDict
+
+from scs_analysis.helper.path_accessor import PathAccessor
+
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+GASES = ('NO2', 'CO', 'SO2', 'H2S', 'Ox', 'NO')
+
+DOCUMENT = OrderedDict((
+    ('tag', 'scs-bgx-401'),
+    ('rec', '2019-02-16T13:53:52Z'),
+    ('val', OrderedDict(
+        [(gas, OrderedDict((('weV', 0.29), ('aeV', 0.28), ('weC', 0.01), ('cnc', 12.3)))) for gas in GASES] +
+        [('sht', OrderedDict((('hmd', 59.7), ('tmp', 23.8))))]))
+))
+
+RH_PATH = 'val.sht.hmd'
+REPORT_PATH = 'val.NO2.cnc'
+
+
+def paths_access(data):
+    for datum in data:
+        paths = datum.paths()
+
+        if RH_PATH not in paths or REPORT_PATH not in paths:
+            continue
+
+        datum.node(RH_PATH)
+        datum.node(REPORT_PATH)
+
+
+def accessor_access(data):
+    rh_accessor = PathAccessor.construct(RH_PATH)
+    report_accessor = PathAccessor.construct(REPORT_PATH)
+
+    for datum in data:
+        if not rh_accessor.has(datum) or not report_accessor.has(datum):
+            continue
+
+        rh_accessor.node(datum)
+        report_accessor.node(datum)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def rate(func, data):
+    start_time = time.time()
+    func(data)
+
+    return round(len(data) / (time.time() - start_time))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = optparse.OptionParser(usage="%prog [-n DOCUMENTS]")
+
+    parser.add_option("--documents", "-n", type="int", nargs=1, action="store", dest="documents", default=100000,
+                      help="number of documents (default 100000)")
+
+    opts, _ = parser.parse_args()
+
+    documents = [PathDict(DOCUMENT)] * opts.documents
+
+    report = OrderedDict()
+    report['documents'] = opts.documents
+    report['paths'] = rate(paths_access, documents)
+    report['accessor'] = rate(accessor_access, documents)
+    report['gain'] = round(report['accessor'] / report['paths'], 1)
+
+    print(json.dumps(report))
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+DESCRIPTION
+The sample_generator writes a reproducible sequence of synthetic sensor documents, in the form delivered by the
+scs_dev samplers. Three kinds of document are supported:
+
+gases           electrochemical sensor voltages and concentrations, with an SHT humidity / temperature node
+climate         humidity, temperature and barometric pressure
+particulates    OPC PM1, PM2.5 and PM10, bin counts and an SHT node
+
+Values follow a diurnal cycle with a random walk and noise. The width option adds fields to each document - further
+gases, further climate fields or further OPC bins. Documents are spaced by the interval, and each rec is displaced by a
+random jitter of up to the given number of seconds. For a given seed, the rec sequence is the same for every kind,
+so that documents of different kinds can be joined on rec.
+
+Output is a sequence of JSON documents or, with the -c flag, a CSV file in the form read by csv_reader.
+
+SYNOPSIS
+sample_generator.py [-k { gases | climate | particulates }] [-n DOCUMENTS] [-w WIDTH] [-i INTERVAL] [-j JITTER]
+[-s SEED] [-c]
+
+EXAMPLES
+benchmarks/sample_generator.py -k gases -n 100000 -w 4 -j 2 -c > gases.csv
+"""
+
+import json
+import math
+import optparse
+import random
+import sys
+
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleGenerator(object):
+    """
+    classdocs
+    """
+
+    KINDS = ('gases', 'climate', 'particulates')
+
+    GASES = ('NO2', 'CO', 'SO2', 'H2S', 'Ox', 'NO', 'VOC', 'CO2')
+
+    START = datetime(2019, 2, 16, 0, 0, 0)
+
+    DAY = 86400.0                                   # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, kind, width=0, interval=60, jitter=0, seed=1):
+        """
+        Constructor
+        """
+        if kind not in self.KINDS:
+            raise ValueError(kind)
+
+        self.__kind = kind                          # string
+        self.__width = width                        # int
+        self.__interval = interval                  # int seconds
+        self.__jitter = jitter                      # int seconds
+        self.__seed = seed                          # int
+
+        self.__rec_random = random.Random(seed)
+        self.__value_random = random.Random(seed * 1000003 + self.KINDS.index(kind))
+
+        self.__walk = {}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def documents(self, count):
+        document = getattr(self, '_SampleGenerator__' + self.__kind)
+
+        for i in range(count):
+            rec = self.START + timedelta(seconds=i * self.__interval + self.__displacement())
+            phase = 2 * math.pi * ((i * self.__interval) % self.DAY) / self.DAY
+
+            yield document(rec.strftime('%Y-%m-%dT%H:%M:%SZ'), phase)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __gases(self, rec, phase):
+        hmd = self.__value('hmd', 60.0, -15.0, phase, 0.5, 2)
+        tmp = self.__value('tmp', 15.0, 6.0, phase, 0.1, 2)
+
+        val = OrderedDict()
+
+        for name in self.__gas_names():
+            cnc = self.__value(name, 20.0, 10.0, phase, 2.0, 1)
+
+            val[name] = OrderedDict((
+                ('weV', round(0.29 + cnc * 0.0003, 6)),
+                ('aeV', round(0.28 + self.__noise(0.0005), 6)),
+                ('weC', round(cnc * 0.001, 6)),
+                ('cnc', cnc)
+            ))
+
+        val['sht'] = OrderedDict((('hmd', hmd), ('tmp', tmp)))
+
+        return OrderedDict((('tag', 'scs-bgx-401'), ('rec', rec), ('val', val)))
+
+
+    def __climate(self, rec, phase):
+        val = OrderedDict()
+
+        val['hmd'] = self.__value('hmd', 60.0, -15.0, phase, 0.5, 1)
+        val['tmp'] = self.__value('tmp', 15.0, 6.0, phase, 0.1, 1)
+        val['bar'] = OrderedDict((
+            ('pA', self.__value('pA', 101.3, 0.2, phase, 0.02, 1)),
+            ('p0', self.__value('p0', 102.1, 0.2, phase, 0.02, 1)),
+            ('tmp', self.__value('btmp', 16.0, 5.0, phase, 0.1, 1))
+        ))
+
+        for i in range(self.__width):
+            val['x%d' % (i + 1)] = self.__value('x%d' % i, 50.0, 10.0, phase, 1.0, 2)
+
+        return OrderedDict((('tag', 'scs-ap1-6'), ('rec', rec), ('val', val)))
+
+
+    def __particulates(self, rec, phase):
+        pm1 = self.__value('pm1', 4.0, 2.0, phase, 0.3, 1)
+        pm2p5 = round(pm1 * 1.4 + abs(self.__noise(0.3)), 1)
+        pm10 = round(pm2p5 * 1.3 + abs(self.__noise(0.5)), 1)
+
+        val = OrderedDict()
+
+        val['per'] = 4.9
+        val['pm1'] = pm1
+        val['pm2p5'] = pm2p5
+        val['pm10'] = pm10
+        val['bin'] = [max(0, int(self.__value('bin%d' % i, 200.0 / (i + 1), 20.0 / (i + 1), phase, 5.0, 0)))
+                      for i in range(16 + self.__width)]
+        val['mtf1'] = 28
+        val['mtf3'] = 31
+        val['mtf5'] = 0
+        val['mtf7'] = 0
+        val['sfr'] = round(5.2 + self.__noise(0.05), 2)
+        val['sht'] = OrderedDict((
+            ('hmd', self.__value('hmd', 60.0, -15.0, phase, 0.5, 1)),
+            ('tmp', self.__value('tmp', 15.0, 6.0, phase, 0.1, 1))
+        ))
+
+        return OrderedDict((('tag', 'scs-bgx-431'), ('rec', rec), ('src', 'N3'), ('val', val)))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __gas_names(self):
+        names = list(self.GASES[:4])
+
+        for i in range(self.__width):
+            names.append(self.GASES[4 + i] if 4 + i < len(self.GASES) else 'G%d' % (i + 1))
+
+        return names
+
+
+    def __displacement(self):
+        if self.__jitter == 0:
+            return 0
+
+        return self.__rec_random.randint(-self.__jitter, self.__jitter)
+
+
+    def __value(self, key, mean, amplitude, phase, step, precision):
+        walk = self.__walk.get(key, 0.0) + self.__value_random.gauss(0.0, step)
+        walk *= 0.99                                # mean reverting
+
+        self.__walk[key] = walk
+
+        return round(mean + amplitude * math.sin(phase) + walk, precision)
+
+
+    def __noise(self, sigma):
+        return self.__value_random.gauss(0.0, sigma)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleGenerator:{kind:%s, width:%s, interval:%s, jitter:%s, seed:%s}" % \
+               (self.__kind, self.__width, self.__interval, self.__jitter, self.__seed)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def leaves(node, prefix=None):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield from leaves(value, key if prefix is None else prefix + '.' + key)
+
+    elif isinstance(node, list):
+        for i, value in enumerate(node):
+            yield from leaves(value, prefix + ':' + str(i))
+
+    else:
+        yield prefix, node
+
+
+def write_json(documents, file):
+    for document in documents:
+        file.write(json.dumps(document) + '\n')
+
+
+def write_csv(documents, file):
+    header = None
+
+    for document in documents:
+        paths, values = zip(*leaves(document))
+
+        if header is None:
+            header = paths
+            file.write(','.join(header) + '\n')
+
+        file.write(','.join('' if value is None else str(value) for value in values) + '\n')
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = optparse.OptionParser(usage="%prog [-k { gases | climate | particulates }] [-n DOCUMENTS] [-w WIDTH] "
+                                         "[-i INTERVAL] [-j JITTER] [-s SEED] [-c]")
+
+    parser.add_option("--kind", "-k", type="choice", choices=SampleGenerator.KINDS, action="store", dest="kind",
+                      default='gases', help="kind of document (default gases)")
+
+    parser.add_option("--documents", "-n", type="int", nargs=1, action="store", dest="documents", default=10000,
+                      help="number of documents (default 10000)")
+
+    parser.add_option("--width", "-w", type="int", nargs=1, action="store", dest="width", default=0,
+                      help="number of additional fields (default 0)")
+
+    parser.add_option("--interval", "-i", type="int", nargs=1, action="store", dest="interval", default=60,
+                      help="interval between documents in seconds (default 60)")
+
+    parser.add_option("--jitter", "-j", type="int", nargs=1, action="store", dest="jitter", default=0,
+                      help="maximum rec displacement in seconds (default 0)")
+
+    parser.add_option("--seed", "-s", type="int", nargs=1, action="store", dest="seed", default=1,
+                      help="random seed (default 1)")
+
+    parser.add_option("--csv", "-c", action="store_true", dest="csv", default=False,
+                      help="write CSV instead of JSON")
+
+    opts, _ = parser.parse_args()
+
+    generator = SampleGenerator(opts.kind, opts.width, opts.interval, opts.jitter, opts.seed)
+    writer = write_csv if opts.csv else write_json
+
+    try:
+        writer(generator.documents(opts.documents), sys.stdout)
+
+    except BrokenPipeError:
+        pass
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+DESCRIPTION
+The tool_benchmark runs each of the scs_analysis utilities as a child process, on synthetic data written by the
+sample_generator, and reports for each:
+
+documents       number of input documents
+elapsed         best wall time over the repeats, in seconds
+docs_per_sec    documents / elapsed
+peak_rss_kb     peak resident set size of the utility process, in KiB
+startup_ms      median wall time of utility.py --help - interpreter startup, imports and command line parsing
+status          exit status of the utility, with the last line of its stderr if it failed
+
+Utilities that fail - for example, because an optional dependency is not installed - are reported with their
+exit status, and do not stop the run. The utilities may be specified on the command line; otherwise all are run.
+
+The utilities are run with the interpreter that runs the benchmark, with src on their PYTHONPATH. The
+SCS_ANALYSIS_SERVER variable is set to an unused path, so that the utilities run standalone.
+
+The report is written to stdout as a JSON document, together with the parameters, the host, the interpreter and the
+git commit, so that reports made on one machine can be compared across commits with benchmark_compare.py.
+
+SYNOPSIS
+tool_benchmark.py [-n DOCUMENTS] [-w WIDTH] [-j JITTER] [-s SEED] [-r REPEATS] [-l] [UTILITY_1 .. UTILITY_N]
+
+EXAMPLES
+benchmarks/tool_benchmark.py -n 50000 > benchmark-$(git rev-parse --short HEAD).json
+benchmarks/tool_benchmark.py -n 20000 sample_median csv_reader
+"""
+
+import json
+import optparse
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from collections import OrderedDict
+
+from sample_generator import SampleGenerator, write_csv, write_json
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS = os.path.join(ROOT, 'src', 'scs_analysis')
+
+STARTUP_RUNS = 5
+
+
+# utility: (stdin: gases | climate | particulates | none, args) - '{tmp}' is the working directory...
+UTILITIES = OrderedDict((
+    ('csv_reader',              ('none', ['{tmp}/gases.csv'])),
+    ('csv_writer',              ('gases', ['{tmp}/out.csv'])),
+    ('csv_join',                ('none', ['-i', '-l', 'gas', 'rec', '{tmp}/gases.csv',
+                                          '-r', 'climate', 'rec', '{tmp}/climate.csv'])),
+    ('csv_collator',            ('gases', ['-l', '0', '-u', '100', '-d', '10', '-f', '{tmp}/collation/gases',
+                                           'val.sht.hmd'])),
+    ('node',                    ('gases', ['rec', 'val.NO2'])),
+    ('node_shift',              ('gases', ['-o', '1', 'val.sht.tmp'])),
+    ('sample_aggregate',        ('gases', ['-c', '**:/15:00'])),
+    ('sample_median',           ('gases', ['-w', '7', 'val.NO2.cnc'])),
+    ('sample_low_pass',         ('gases', ['-d', '60', '-c', '0.02', 'val.NO2.cnc'])),
+    ('sample_subset',           ('gases', ['-n', '-l', '20', 'val.NO2.cnc'])),
+    ('sample_ah',               ('gases', ['val.sht.hmd', 'val.sht.tmp'])),
+    ('sample_error',            ('gases', ['-l', 'val.NO2.cnc', 'val.CO.cnc', 'err'])),
+    ('sample_timezone',         ('gases', ['Europe/London'])),
+    ('gas_exegesis',            ('gases', ['-e', 'sbl1v1', 'val.sht.hmd', 'val.sht.tmp', 'val'])),
+    ('particulate_exegesis',    ('particulates', ['-e', 'iselutn2v1', 'val.sht.hmd', 'val'])),
+    ('sample_rh_t_grid',        ('gases', ['-r', '0', '100', '10', '-t', '0', '40', '10', '-o', 'S',
+                                           'val.sht.hmd', 'val.sht.tmp', 'val.NO2.cnc', 'val.CO.cnc'])),
+    ('stream_pipeline',         ('gases', ['node_shift.py -o 1 val.sht.tmp | sample_median.py -w 7 val.NO2.cnc'])),
+))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def generate(tmp, opts):
+    for kind in SampleGenerator.KINDS:
+        generator = SampleGenerator(kind, width=opts.width, jitter=opts.jitter, seed=opts.seed)
+
+        with open(os.path.join(tmp, kind + '.json'), 'w') as file:
+            write_json(generator.documents(opts.documents), file)
+
+        generator = SampleGenerator(kind, width=opts.width, jitter=opts.jitter, seed=opts.seed)
+
+        with open(os.path.join(tmp, kind + '.csv'), 'w') as file:
+            write_csv(generator.documents(opts.documents), file)
+
+    os.mkdir(os.path.join(tmp, 'collation'))
+
+
+def environment(tmp):
+    env = dict(os.environ)
+
+    env['PYTHONPATH'] = os.pathsep.join(path for path in (os.path.join(ROOT, 'src'), env.get('PYTHONPATH')) if path)
+    env['SCS_ANALYSIS_SERVER'] = os.path.join(tmp, 'no-server')
+
+    return env
+
+
+def execute(command, stdin, env, tmp):
+    stderr_filename = os.path.join(tmp, 'stderr.txt')
+
+    with open(stderr_filename, 'w') as stderr:
+        start_time = time.time()
+
+        p = subprocess.Popen(command, stdin=stdin, stdout=subprocess.DEVNULL, stderr=stderr, env=env, cwd=tmp)
+        _, wait_status, rusage = os.wait4(p.pid, 0)
+
+        elapsed = time.time() - start_time
+
+    p.returncode = os.WEXITSTATUS(wait_status) if os.WIFEXITED(wait_status) else -os.WTERMSIG(wait_status)
+
+    peak_rss = rusage.ru_maxrss // 1024 if sys.platform == 'darwin' else rusage.ru_maxrss     # bytes on macOS
+
+    with open(stderr_filename, 'r') as stderr:
+        lines = [line.strip() for line in stderr if line.strip()]
+
+    return p.returncode, elapsed, peak_rss, lines[-1] if lines else None
+
+
+def benchmark(utility, tmp, env, opts):
+    kind, args = UTILITIES[utility]
+
+    script = os.path.join(SCRIPTS, utility + '.py')
+    args = [arg.format(tmp=tmp) for arg in args]
+
+    result = OrderedDict()
+    result['documents'] = opts.documents
+
+    # startup...
+    timings = []
+
+    for _ in range(STARTUP_RUNS):
+        _, elapsed, _, _ = execute([sys.executable, script, '--help'], subprocess.DEVNULL, env, tmp)
+        timings.append(elapsed)
+
+    startup_ms = round(statistics.median(timings) * 1000, 1)
+
+    # throughput...
+    best = None
+
+    for _ in range(opts.repeats):
+        if kind == 'none':
+            status, elapsed, peak_rss, error = execute([sys.executable, script] + args, subprocess.DEVNULL, env, tmp)
+
+        else:
+            with open(os.path.join(tmp, kind + '.json'), 'r') as stdin:
+                status, elapsed, peak_rss, error = execute([sys.executable, script] + args, stdin, env, tmp)
+
+        if status != 0:
+            result['status'] = status
+            result['error'] = error
+            return result
+
+        if best is None or elapsed < best[0]:
+            best = (elapsed, peak_rss)
+
+    result['status'] = 0
+    result['elapsed'] = round(best[0], 3)
+    result['docs_per_sec'] = round(opts.documents / best[0])
+    result['peak_rss_kb'] = best[1]
+    result['startup_ms'] = startup_ms
+
+    return result
+
+
+def commit():
+    try:
+        output = subprocess.check_output(('git', 'rev-parse', 'HEAD'), cwd=ROOT, stderr=subprocess.DEVNULL)
+
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return output.decode().strip()
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = optparse.OptionParser(usage="%prog [-n DOCUMENTS] [-w WIDTH] [-j JITTER] [-s SEED] [-r REPEATS] [-l] "
+                                         "[UTILITY_1 .. UTILITY_N]")
+
+    parser.add_option("--documents", "-n", type="int", nargs=1, action="store", dest="documents", default=20000,
+                      help="number of documents of each kind (default 20000)")
+
+    parser.add_option("--width", "-w", type="int", nargs=1, action="store", dest="width", default=0,
+                      help="number of additional fields in each document (default 0)")
+
+    parser.add_option("--jitter", "-j", type="int", nargs=1, action="store", dest="jitter", default=0,
+                      help="maximum rec displacement in seconds (default 0)")
+
+    parser.add_option("--seed", "-s", type="int", nargs=1, action="store", dest="seed", default=1,
+                      help="random seed (default 1)")
+
+    parser.add_option("--repeats", "-r", type="int", nargs=1, action="store", dest="repeats", default=3,
+                      help="number of throughput runs, of which the best is reported (default 3)")
+
+    parser.add_option("--list", "-l", action="store_true", dest="list", default=False,
+                      help="list the available utilities to stderr")
+
+    opts, utilities = parser.parse_args()
+
+    if opts.list:
+        for name in UTILITIES.keys():
+            print(name, file=sys.stderr)
+        exit(0)
+
+    for name in utilities:
+        if name not in UTILITIES:
+            print("tool_benchmark: unknown utility: %s" % name, file=sys.stderr)
+            exit(2)
+
+    if not utilities:
+        utilities = list(UTILITIES.keys())
+
+    tmp = tempfile.mkdtemp(prefix='scs_benchmark-')
+
+    try:
+        generate(tmp, opts)
+        env = environment(tmp)
+
+        report = OrderedDict()
+        report['created'] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        report['commit'] = commit()
+        report['host'] = platform.node()
+        report['platform'] = platform.platform()
+        report['python'] = platform.python_version()
+        report['cpus'] = os.cpu_count()
+
+        parameters = OrderedDict()
+        parameters['documents'] = opts.documents
+        parameters['width'] = opts.width
+        parameters['jitter'] = opts.jitter
+        parameters['seed'] = opts.seed
+        parameters['repeats'] = opts.repeats
+
+        report['parameters'] = parameters
+        report['utilities'] = OrderedDict()
+
+        for name in utilities:
+            print("tool_benchmark: %s..." % name, file=sys.stderr)
+            sys.stderr.flush()
+
+            report['utilities'][name] = benchmark(name, tmp, env, opts)
+
+        print(json.dumps(report, indent=4))
+
+    finally:
+        shutil.rmtree(tmp)
@@ -62,14 +62,19 @@ setup(
         'src/scs_analysis/sample_midpoint.py',
         'src/scs_analysis/sample_min.py',
         'src/scs_analysis/sample_regression.py',
+        'src/scs_analysis/scs_analysis_server.py',
         'src/scs_analysis/single_chart.py',
         'src/scs_analysis/socket_receiver.py',
+        'src/scs_analysis/stream_pipeline.py',
         'src/scs_analysis/uds_receiver.py',
     ],
     install_requires=required,
     platforms=['any'],
     python_requires=">=3.3",
     extras_require={
+        'batch': [
+            'numpy'
+        ],
         'dev': [
             'pypandoc'
         ]
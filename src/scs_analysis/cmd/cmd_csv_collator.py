@@ -19,7 +19,8 @@ class CmdCSVCollator(object):
         Constructor
         """
         self.__parser = optparse.OptionParser(usage="%prog -l LOWER_BOUND -u UPPER_BOUND -d DELTA -f FILE_PREFIX "
-                                                    "[-v] PATH", version="%prog 1.0")
+                                                    "[--stats [--stats-interval INTERVAL]] [-v] PATH",
+                                              version="%prog 1.0")
 
         # compulsory...
         self.__parser.add_option("--lower", "-l", type="float", nargs=1, action="store", dest="lower",
@@ -35,6 +36,12 @@ class CmdCSVCollator(object):
                                  help="file prefix for collated CSVs")
 
         # optional...
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -73,6 +80,16 @@ class CmdCSVCollator(object):
         return self.__opts.file_prefix
 
 
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -90,5 +107,7 @@ class CmdCSVCollator(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdCSVCollator:{lower:%s, upper:%s, delta:%s, file_prefix:%s, verbose:%s, path:%s}" % \
-               (self.lower, self.upper, self.delta, self.file_prefix, self.verbose, self.path)
+        return "CmdCSVCollator:{lower:%s, upper:%s, delta:%s, file_prefix:%s, stats:%s, stats_interval:%s, " \
+               "verbose:%s, path:%s}" % \
+               (self.lower, self.upper, self.delta, self.file_prefix, self.stats, self.stats_interval,
+                self.verbose, self.path)
@@ -8,6 +8,8 @@ source repo: scs_analysis
 
 import optparse
 
+from scs_analysis.helper.sorted_join import SortedJoin
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -18,15 +20,20 @@ class CmdCSVJoin(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-t TYPE] [-i] [-v] -l PREFIX PK FILENAME "
-                                                    "-r PREFIX PK FILENAME", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [-t TYPE] [-i] "
+                                                    "[{ -s | --as-of MODE --tolerance SECONDS | --max-memory MB }] "
+                                                    "[--format FORMAT] "
+                                                    "[--stats [--stats-interval INTERVAL]] [-v] -l PREFIX PK FILENAME "
+                                                    "-r PREFIX PK FILENAME [-r PREFIX PK FILENAME ...]",
+                                              version="%prog 1.0")
 
         # compulsory...
         self.__parser.add_option("--left", "-l", type="string", nargs=3, action="store", dest="left",
                                  help="output path prefix, primary key and filename for left-hand set")
 
-        self.__parser.add_option("--right", "-r", type="string", nargs=3, action="store", dest="right",
-                                 help="output path prefix, primary key and filename for right-hand set")
+        self.__parser.add_option("--right", "-r", type="string", nargs=3, action="append", dest="right",
+                                 help="output path prefix, primary key and filename for right-hand set "
+                                      "(may be repeated, with -s or --as-of)")
 
         # optional...
         self.__parser.add_option("--type", "-t", type="string", nargs=1, action="store", dest="type", default='INNER',
@@ -35,6 +42,27 @@ class CmdCSVJoin(object):
         self.__parser.add_option("--iso8601", "-i", action="store_true", dest="iso8601", default=False,
                                  help="interpret the primary key as an ISO 8601 datetime")
 
+        self.__parser.add_option("--sorted", "-s", action="store_true", dest="sorted", default=False,
+                                 help="merge-join files that are in primary key order, in a single pass")
+
+        self.__parser.add_option("--as-of", type="choice", choices=SortedJoin.AS_OF_MODES, action="store",
+                                 dest="as_of", help="match datetime keys: nearest or preceding (implies -i -s)")
+
+        self.__parser.add_option("--tolerance", type="float", nargs=1, action="store", dest="tolerance",
+                                 help="greatest interval in seconds between as-of matched keys")
+
+        self.__parser.add_option("--max-memory", type="float", nargs=1, action="store", dest="max_memory",
+                                 help="join unsorted files in partitions of no more than MB megabytes")
+
+        self.__parser.add_option("--format", type="choice", choices=("json", "bin"), action="store", dest="doc_format",
+                                 default="json", help="output document format: json or bin (default json)")
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -47,14 +75,35 @@ class CmdCSVJoin(object):
         if self.__opts.left is None or self.__opts.right is None:
             return False
 
+        if len(self.__opts.right) > 1 and not self.sorted:
+            return False
+
+        if (self.as_of is None) != (self.tolerance is None):
+            return False
+
+        if self.as_of is not None and self.type not in SortedJoin.AS_OF_TYPES:
+            return False
+
+        if self.tolerance is not None and self.tolerance < 0:
+            return False
+
+        if self.max_memory is not None and (self.max_memory <= 0 or self.sorted):
+            return False
+
         return True
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_in_memory(self):
+        return not self.sorted and self.max_memory is None
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
     def type(self):
-        return self.__opts.type
+        return None if self.__opts.type is None else self.__opts.type.upper()
 
 
     @property
@@ -74,22 +123,62 @@ class CmdCSVJoin(object):
 
     @property
     def right_prefix(self):
-        return None if self.__opts.right is None else self.__opts.right[0]
+        return None if self.__opts.right is None else self.__opts.right[0][0]
 
 
     @property
     def right_pk(self):
-        return None if self.__opts.right is None else self.__opts.right[1]
+        return None if self.__opts.right is None else self.__opts.right[0][1]
 
 
     @property
     def right_filename(self):
-        return None if self.__opts.right is None else self.__opts.right[2]
+        return None if self.__opts.right is None else self.__opts.right[0][2]
+
+
+    @property
+    def tables(self):
+        return [self.__opts.left] + self.__opts.right
 
 
     @property
     def iso8601(self):
-        return self.__opts.iso8601
+        return self.__opts.iso8601 or self.as_of is not None
+
+
+    @property
+    def sorted(self):
+        return self.__opts.sorted or self.as_of is not None
+
+
+    @property
+    def as_of(self):
+        return self.__opts.as_of
+
+
+    @property
+    def tolerance(self):
+        return self.__opts.tolerance
+
+
+    @property
+    def max_memory(self):
+        return self.__opts.max_memory
+
+
+    @property
+    def doc_format(self):
+        return self.__opts.doc_format
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
 
 
     @property
@@ -104,5 +193,7 @@ class CmdCSVJoin(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdCSVJoin:{type:%s, left:%s, right:%s, iso8601:%s, verbose:%s}" % \
-               (self.type, self.__opts.left, self.__opts.right, self.iso8601, self.verbose)
+        return "CmdCSVJoin:{type:%s, left:%s, right:%s, iso8601:%s, sorted:%s, as_of:%s, tolerance:%s, " \
+               "max_memory:%s, doc_format:%s, stats:%s, stats_interval:%s, verbose:%s}" % \
+               (self.type, self.__opts.left, self.__opts.right, self.iso8601, self.sorted, self.as_of,
+                self.tolerance, self.max_memory, self.doc_format, self.stats, self.stats_interval, self.verbose)
@@ -18,7 +18,9 @@ class CmdCSVLogger(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-t TAG] [-e] [-v] TOPIC_NAME", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [-t TAG] [-e] [--stats [--stats-interval INTERVAL]] [-v] "
+                                                    "TOPIC_NAME",
+                                              version="%prog 1.0")
 
         # optional...
         self.__parser.add_option("--tag", "-t", type="string", nargs=1, action="store", dest="tag",
@@ -27,6 +29,12 @@ class CmdCSVLogger(object):
         self.__parser.add_option("--echo", "-e", action="store_true", dest="echo", default=False,
                                  help="echo stdin to stdout")
 
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -54,6 +62,16 @@ class CmdCSVLogger(object):
         return self.__opts.echo
 
 
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -71,5 +89,5 @@ class CmdCSVLogger(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdCSVLogger:{tag:%s, echo:%s, verbose:%s, topic_name:%s}" % \
-                    (self.tag, self.echo, self.verbose, self.topic_name)
+        return "CmdCSVLogger:{tag:%s, echo:%s, stats:%s, stats_interval:%s, verbose:%s, topic_name:%s}" % \
+               (self.tag, self.echo, self.stats, self.stats_interval, self.verbose, self.topic_name)
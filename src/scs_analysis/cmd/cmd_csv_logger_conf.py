@@ -8,6 +8,8 @@ source repo: scs_analysis
 
 import optparse
 
+from scs_analysis.helper.csv_logger_conf import CSVLoggerConf
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -18,8 +20,9 @@ class CmdCSVLoggerConf(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog { [-r ROOT_PATH] [-o DELETE_OLDEST] [-i WRITE_INTERVAL] | "
-                                                    "-d } [-v]", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog { [-r ROOT_PATH] [-o DELETE_OLDEST] [-i WRITE_INTERVAL] "
+                                                    "[-z COMPRESS] [-f FSYNC] [-a ARCHIVE] | -d } [-v]",
+                                              version="%prog 1.0")
 
         # optional...
         self.__parser.add_option("--root", "-r", type="string", nargs=1, action="store", dest="root_path",
@@ -31,6 +34,15 @@ class CmdCSVLoggerConf(object):
         self.__parser.add_option("--write-int", "-i", type="int", nargs=1, action="store", dest="write_interval",
                                  help="write interval in seconds (0 for immediate writes)")
 
+        self.__parser.add_option("--compress", "-z", type="int", nargs=1, action="store", dest="compress",
+                                 help="write gzip-compressed log files (1) or uncompressed log files (0)")
+
+        self.__parser.add_option("--fsync", "-f", type="choice", choices=CSVLoggerConf.FSYNC_POLICIES, action="store",
+                                 dest="fsync", help="force log files to storage on none, commit or close")
+
+        self.__parser.add_option("--archive", "-a", type="int", nargs=1, action="store", dest="archive",
+                                 help="compress closed log files in the background (1) or leave them (0)")
+
         self.__parser.add_option("--delete", "-d", action="store_true", dest="delete",
                                  help="delete the logger configuration")
 
@@ -60,7 +72,8 @@ class CmdCSVLoggerConf(object):
 
 
     def set(self):
-        if self.root_path is not None or self.delete_oldest is not None or self.write_interval is not None:
+        if self.root_path is not None or self.delete_oldest is not None or self.write_interval is not None or \
+                self.compress is not None or self.fsync is not None or self.archive is not None:
             return True
 
         return False
@@ -83,6 +96,21 @@ class CmdCSVLoggerConf(object):
         return self.__opts.write_interval
 
 
+    @property
+    def compress(self):
+        return None if self.__opts.compress is None else bool(self.__opts.compress)
+
+
+    @property
+    def fsync(self):
+        return self.__opts.fsync
+
+
+    @property
+    def archive(self):
+        return None if self.__opts.archive is None else bool(self.__opts.archive)
+
+
     @property
     def delete(self):
         return self.__opts.delete
@@ -100,7 +128,7 @@ class CmdCSVLoggerConf(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdCSVLoggerConf:{root_path:%s, delete_oldest:%s, write_interval:%s, delete:%s, " \
-               "verbose:%s}" % \
-               (self.root_path, self.delete_oldest, self.write_interval, self.delete,
-                self.verbose)
+        return "CmdCSVLoggerConf:{root_path:%s, delete_oldest:%s, write_interval:%s, compress:%s, fsync:%s, " \
+               "archive:%s, delete:%s, verbose:%s}" % \
+               (self.root_path, self.delete_oldest, self.write_interval, self.compress, self.fsync,
+                self.archive, self.delete, self.verbose)
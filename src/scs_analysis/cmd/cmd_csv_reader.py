@@ -8,18 +8,24 @@ source repo: scs_analysis
 
 import optparse
 
+from scs_core.data.datum import Datum
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
 class CmdCSVReader(object):
     """unix command line handler"""
 
-    def __init__(self):
+    def __init__(self, args=None, prog=None):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-s] [-n] [-l LIMIT] [-a] [-v] [FILENAME_1 .. FILENAME_N]",
-                                              version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [-s] [-n] [-l LIMIT] [-a] [--columns PATH_1,..,PATH_N] "
+                                                    "[{ --workers WORKERS | --merge-on PATH | [--start START] "
+                                                    "[--end END] [--window-on PATH] }] [--format FORMAT] "
+                                                    "[--stats [--stats-interval INTERVAL]] [-v] "
+                                                    "[FILENAME_1 .. FILENAME_N]",
+                                              version="%prog 1.0", prog=prog)
 
         # optional...
         self.__parser.add_option("--string", "-s", action="store_true", dest="string", default=False,
@@ -34,10 +40,67 @@ class CmdCSVReader(object):
         self.__parser.add_option("--array", "-a", action="store_true", dest="array", default=False,
                                  help="output JSON documents as array instead of a sequence")
 
+        self.__parser.add_option("--columns", type="string", nargs=1, action="store", dest="columns",
+                                 help="output only the comma-separated PATHS - leaf or internal nodes")
+
+        self.__parser.add_option("--workers", type="int", nargs=1, action="store", dest="workers",
+                                 help="read the files on WORKERS processes, with output in file order")
+
+        self.__parser.add_option("--merge-on", type="string", nargs=1, action="store", dest="merge_on",
+                                 help="merge files, each ordered by PATH, into a single sequence ordered by PATH")
+
+        self.__parser.add_option("--start", type="string", nargs=1, action="store", dest="start",
+                                 help="output only rows whose window value is at or after ISO 8601 START")
+
+        self.__parser.add_option("--end", type="string", nargs=1, action="store", dest="end",
+                                 help="output only rows whose window value is before ISO 8601 END")
+
+        self.__parser.add_option("--window-on", type="string", nargs=1, action="store", dest="window_on",
+                                 default="rec", help="the ISO 8601 column of the window (default rec)")
+
+        self.__parser.add_option("--format", type="choice", choices=("json", "bin"), action="store", dest="doc_format",
+                                 default="json", help="output document format: json or bin (default json)")
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
-        self.__opts, self.__args = self.__parser.parse_args()
+        self.__opts, self.__args = self.__parser.parse_args(args)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if self.doc_format == 'bin' and self.array:
+            return False
+
+        if self.__opts.columns is not None and not self.columns:
+            return False
+
+        if self.workers is not None and self.workers < 1:
+            return False
+
+        if self.workers is not None and self.merge_on is not None:
+            return False
+
+        if (self.workers is not None or self.merge_on is not None) and len(self.__args) == 0:
+            return False
+
+        if self.is_window() and (self.workers is not None or self.merge_on is not None):
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_window(self):
+        return self.__opts.start is not None or self.__opts.end is not None
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -69,6 +132,54 @@ class CmdCSVReader(object):
         return self.__opts.array
 
 
+    @property
+    def columns(self):
+        if self.__opts.columns is None:
+            return None
+
+        return [column.strip() for column in self.__opts.columns.split(',') if column.strip()]
+
+
+    @property
+    def workers(self):
+        return self.__opts.workers
+
+
+    @property
+    def merge_on(self):
+        return self.__opts.merge_on
+
+
+    @property
+    def start(self):
+        return self.__datetime(self.__opts.start)
+
+
+    @property
+    def end(self):
+        return self.__datetime(self.__opts.end)
+
+
+    @property
+    def window_on(self):
+        return self.__opts.window_on
+
+
+    @property
+    def doc_format(self):
+        return self.__opts.doc_format
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -79,6 +190,21 @@ class CmdCSVReader(object):
         return self.__args if len(self.__args) > 0 else [None]
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __datetime(value):
+        if value is None:
+            return None
+
+        datetime = Datum.datetime(value)
+
+        if datetime is None:
+            raise ValueError(value)
+
+        return datetime
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def print_help(self, file):
@@ -86,5 +212,9 @@ class CmdCSVReader(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdCSVReader:{string:%s, nullify:%s, limit:%s, array:%s, verbose:%s, filenames:%s}" % \
-               (self.string, self.nullify, self.limit, self.array, self.verbose, self.filenames)
+        return "CmdCSVReader:{string:%s, nullify:%s, limit:%s, array:%s, columns:%s, workers:%s, merge_on:%s, " \
+               "start:%s, end:%s, window_on:%s, doc_format:%s, stats:%s, stats_interval:%s, verbose:%s, " \
+               "filenames:%s}" % \
+               (self.string, self.nullify, self.limit, self.array, self.columns, self.workers, self.merge_on,
+                self.__opts.start, self.__opts.end, self.window_on, self.doc_format, self.stats, self.stats_interval,
+                self.verbose, self.filenames)
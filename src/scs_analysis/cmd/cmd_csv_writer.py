@@ -8,17 +8,22 @@ source repo: scs_analysis
 
 import optparse
 
+from scs_analysis.helper.csv_writer_pool import CSVWriterPool
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
 class CmdCSVWriter(object):
     """unix command line handler"""
 
-    def __init__(self):
+    def __init__(self, args=None, prog=None):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [{ -a | -x }] [-e] [-v] [FILENAME]", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [{ -a | -x }] [-e] [--partition-by PATH] "
+                                                    "[--partition-time UNIT [--partition-on PATH]] [--max-open MAX] "
+                                                    "[--stats [--stats-interval INTERVAL]] [-v] [FILENAME]",
+                                              version="%prog 1.0", prog=prog)
 
         # optional...
         self.__parser.add_option("--append", "-a", action="store_true", dest="append", default=False,
@@ -30,10 +35,29 @@ class CmdCSVWriter(object):
         self.__parser.add_option("--echo", "-e", action="store_true", dest="echo", default=False,
                                  help="echo stdin to stdout")
 
+        self.__parser.add_option("--partition-by", type="string", nargs=1, action="store", dest="partition_by",
+                                 help="write each document to the FILENAME partition for its value on PATH")
+
+        self.__parser.add_option("--partition-time", type="choice", choices=("day", "month"), action="store",
+                                 dest="partition_time", help="partition by the UTC day or month of the time path")
+
+        self.__parser.add_option("--partition-on", type="string", nargs=1, action="store", dest="partition_on",
+                                 default="rec", help="the ISO 8601 path of the time partition (default rec)")
+
+        self.__parser.add_option("--max-open", type="int", nargs=1, action="store", dest="max_open",
+                                 help="keep no more than MAX partition files open (default %d)" %
+                                 CSVWriterPool.DEFAULT_MAX_OPEN)
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
-        self.__opts, self.__args = self.__parser.parse_args()
+        self.__opts, self.__args = self.__parser.parse_args(args)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -42,9 +66,21 @@ class CmdCSVWriter(object):
         if self.append and self.exclude_header:
             return False
 
+        if self.is_partitioned() and self.filename is None:
+            return False
+
+        if self.__opts.max_open is not None and (not self.is_partitioned() or self.__opts.max_open < 1):
+            return False
+
         return True
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_partitioned(self):
+        return self.partition_by is not None or self.partition_time is not None
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -62,6 +98,36 @@ class CmdCSVWriter(object):
         return self.__opts.echo
 
 
+    @property
+    def partition_by(self):
+        return self.__opts.partition_by
+
+
+    @property
+    def partition_time(self):
+        return self.__opts.partition_time
+
+
+    @property
+    def partition_on(self):
+        return self.__opts.partition_on
+
+
+    @property
+    def max_open(self):
+        return CSVWriterPool.DEFAULT_MAX_OPEN if self.__opts.max_open is None else self.__opts.max_open
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -79,5 +145,7 @@ class CmdCSVWriter(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdCSVWriter:{append:%s, exclude_header:%s, echo:%s, verbose:%s, filename:%s}" % \
-                    (self.append, self.exclude_header, self.echo, self.verbose, self.filename)
+        return "CmdCSVWriter:{append:%s, exclude_header:%s, echo:%s, partition_by:%s, partition_time:%s, " \
+               "partition_on:%s, max_open:%s, stats:%s, stats_interval:%s, verbose:%s, filename:%s}" % \
+               (self.append, self.exclude_header, self.echo, self.partition_by, self.partition_time,
+                self.partition_on, self.max_open, self.stats, self.stats_interval, self.verbose, self.filename)
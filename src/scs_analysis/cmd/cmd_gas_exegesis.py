@@ -23,8 +23,10 @@ class CmdGasExegesis(object):
         """
         model_names = ' | '.join(ExegeteCatalogue.model_names())
 
-        self.__parser = optparse.OptionParser(usage="%prog -e EXEGETE [-o OFFSET] [-v] RH_PATH T_PATH REPORT_SUB_PATH "
-                                                    "[EXEGESIS_ROOT]", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog -e EXEGETE [-o OFFSET] [--format FORMAT] "
+                                                    "[--workers WORKERS] [--stats [--stats-interval INTERVAL]] [-v] "
+                                                    "RH_PATH T_PATH REPORT_SUB_PATH [EXEGESIS_ROOT]",
+                                              version="%prog 1.0")
 
         # compulsory...
         self.__parser.add_option("--exegete", "-e", type="string", nargs=1, action="store", default=None,
@@ -34,6 +36,18 @@ class CmdGasExegesis(object):
         self.__parser.add_option("--offset", "-o", type="int", nargs=1, action="store", default=0,
                                  dest="offset", help="baseline offset for the error correction (default 0")
 
+        self.__parser.add_option("--format", type="choice", choices=("json", "bin"), action="store", dest="doc_format",
+                                 default="json", help="output document format: json or bin (default json)")
+
+        self.__parser.add_option("--workers", type="int", nargs=1, action="store", dest="workers",
+                                 help="transform documents on WORKERS processes, in their original order")
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -43,6 +57,9 @@ class CmdGasExegesis(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def is_valid(self):
+        if self.workers is not None and self.workers < 1:
+            return False
+
         if self.exegete is None or self.rh_path is None or self.t_path is None or self.report_path is None:
             return False
 
@@ -64,6 +81,26 @@ class CmdGasExegesis(object):
         return self.__opts.offset
 
 
+    @property
+    def doc_format(self):
+        return self.__opts.doc_format
+
+
+    @property
+    def workers(self):
+        return self.__opts.workers
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -96,7 +133,7 @@ class CmdGasExegesis(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdGasExegesis:{exegete:%s, offset:%s, verbose:%s, " \
-               "rh_path:%s, t_path:%s, report_path:%s, exegesis_path:%s}" % \
-               (self.exegete, self.offset, self.verbose,
+        return "CmdGasExegesis:{exegete:%s, offset:%s, doc_format:%s, workers:%s, stats:%s, stats_interval:%s, " \
+               "verbose:%s, rh_path:%s, t_path:%s, report_path:%s, exegesis_path:%s}" % \
+               (self.exegete, self.offset, self.doc_format, self.workers, self.stats, self.stats_interval, self.verbose,
                 self.rh_path, self.t_path, self.report_path, self.exegesis_path)
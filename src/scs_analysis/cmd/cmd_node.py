@@ -8,20 +8,20 @@ source repo: scs_analysis
 
 import optparse
 
-from scs_core.data.path_dict import PathDict
-
 
 # --------------------------------------------------------------------------------------------------------------------
 
 class CmdNode(object):
     """unix command line handler"""
 
-    def __init__(self):
+    def __init__(self, args=None, prog=None):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [{ [-x] [-a] | -s }] [-v] [SUB_PATH_1 .. SUB_PATH_N]",
-                                              version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [{ [-x] [-a] | -s }] [--format FORMAT] "
+                                                    "[--stats [--stats-interval INTERVAL]] [-v] "
+                                                    "[SUB_PATH_1 .. SUB_PATH_N]",
+                                              version="%prog 1.0", prog=prog)
 
         # optional...
         self.__parser.add_option("--exclude", "-x", action="store_true", dest="exclude", default=False,
@@ -33,10 +33,19 @@ class CmdNode(object):
         self.__parser.add_option("--sequence", "-s", action="store_true", dest="sequence", default=False,
                                  help="output the contents of the input array node(s) as a sequence")
 
+        self.__parser.add_option("--format", type="choice", choices=("json", "bin"), action="store", dest="doc_format",
+                                 default="json", help="output document format: json or bin (default json)")
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
-        self.__opts, self.__args = self.__parser.parse_args()
+        self.__opts, self.__args = self.__parser.parse_args(args)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -48,15 +57,10 @@ class CmdNode(object):
         if self.array and self.sequence:
             return False
 
-        return True
-
-
-    def includes(self, path):
-        for sub_path in self.sub_paths:
-            if PathDict.sub_path_includes_path(sub_path, path):
-                return not self.exclude
+        if self.doc_format == 'bin' and (self.array or self.sequence):
+            return False
 
-        return self.exclude
+        return True
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -76,6 +80,21 @@ class CmdNode(object):
         return self.__opts.sequence
 
 
+    @property
+    def doc_format(self):
+        return self.__opts.doc_format
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -93,5 +112,7 @@ class CmdNode(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdNode:{exclude:%s, array:%s, sequence:%s, verbose:%s, sub_paths:%s}" %  \
-               (self.exclude, self.array, self.sequence, self.verbose, self.sub_paths)
+        return "CmdNode:{exclude:%s, array:%s, sequence:%s, doc_format:%s, stats:%s, stats_interval:%s, " \
+               "verbose:%s, sub_paths:%s}" % \
+               (self.exclude, self.array, self.sequence, self.doc_format, self.stats, self.stats_interval, self.verbose,
+                self.sub_paths)
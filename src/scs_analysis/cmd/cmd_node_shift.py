@@ -14,12 +14,14 @@ import optparse
 class CmdNodeShift(object):
     """unix command line handler"""
 
-    def __init__(self):
+    def __init__(self, args=None, prog=None):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog -o OFFSET [-f] [-v] SOURCE_SUB_PATH [TARGET_SUB_PATH]",
-                                              version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog -o OFFSET [-f] [--format FORMAT] "
+                                                    "[--stats [--stats-interval INTERVAL]] [-v] SOURCE_SUB_PATH "
+                                                    "[TARGET_SUB_PATH]",
+                                              version="%prog 1.0", prog=prog)
 
         # compulsory...
         self.__parser.add_option("--offset", "-o", type="int", nargs=1, action="store", dest="offset",
@@ -29,10 +31,19 @@ class CmdNodeShift(object):
         self.__parser.add_option("--fill", "-f", action="store_true", dest="fill", default=False,
                                  help="report documents with missing inner values")
 
+        self.__parser.add_option("--format", type="choice", choices=("json", "bin"), action="store", dest="doc_format",
+                                 default="json", help="output document format: json or bin (default json)")
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
-        self.__opts, self.__args = self.__parser.parse_args()
+        self.__opts, self.__args = self.__parser.parse_args(args)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -56,6 +67,21 @@ class CmdNodeShift(object):
         return self.__opts.fill
 
 
+    @property
+    def doc_format(self):
+        return self.__opts.doc_format
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -78,5 +104,7 @@ class CmdNodeShift(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdNodeShift:{offset:%s, fill:%s, verbose:%s, source_path:%s, target_path:%s}" % \
-               (self.offset, self.fill, self.verbose, self.source_path, self.target_path)
+        return "CmdNodeShift:{offset:%s, fill:%s, doc_format:%s, stats:%s, stats_interval:%s, verbose:%s, " \
+               "source_path:%s, target_path:%s}" % \
+               (self.offset, self.fill, self.doc_format, self.stats, self.stats_interval, self.verbose,
+                self.source_path, self.target_path)
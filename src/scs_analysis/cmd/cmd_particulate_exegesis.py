@@ -23,7 +23,9 @@ class CmdParticulateExegesis(object):
         """
         model_names = ' | '.join(ExegeteCatalogue.model_names())
 
-        self.__parser = optparse.OptionParser(usage="%prog -e EXEGETE [-v] RH_PATH PMX_PATH [EXEGESIS_ROOT]",
+        self.__parser = optparse.OptionParser(usage="%prog -e EXEGETE [--format FORMAT] [--workers WORKERS] "
+                                                    "[--stats [--stats-interval INTERVAL]] [-v] RH_PATH PMX_PATH "
+                                                    "[EXEGESIS_ROOT]",
                                               version="%prog 1.0")
 
         # compulsory...
@@ -31,6 +33,18 @@ class CmdParticulateExegesis(object):
                                  dest="exegete", help="exegete model { %s }" % model_names)
 
         # optional...
+        self.__parser.add_option("--format", type="choice", choices=("json", "bin"), action="store", dest="doc_format",
+                                 default="json", help="output document format: json or bin (default json)")
+
+        self.__parser.add_option("--workers", type="int", nargs=1, action="store", dest="workers",
+                                 help="transform documents on WORKERS processes, in their original order")
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -40,6 +54,9 @@ class CmdParticulateExegesis(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def is_valid(self):
+        if self.workers is not None and self.workers < 1:
+            return False
+
         if self.exegete is None or self.rh_path is None or self.pmx_path is None:
             return False
 
@@ -56,6 +73,26 @@ class CmdParticulateExegesis(object):
         return self.__opts.exegete
 
 
+    @property
+    def doc_format(self):
+        return self.__opts.doc_format
+
+
+    @property
+    def workers(self):
+        return self.__opts.workers
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -83,5 +120,7 @@ class CmdParticulateExegesis(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdParticulateExegesis:{exegete:%s, verbose:%s, rh_path:%s, pmx_path:%s, exegesis_path:%s}" % \
-               (self.exegete, self.verbose, self.rh_path, self.pmx_path, self.exegesis_path)
+        return "CmdParticulateExegesis:{exegete:%s, doc_format:%s, workers:%s, stats:%s, stats_interval:%s, " \
+               "verbose:%s, rh_path:%s, pmx_path:%s, exegesis_path:%s}" % \
+               (self.exegete, self.doc_format, self.workers, self.stats, self.stats_interval, self.verbose,
+                self.rh_path, self.pmx_path, self.exegesis_path)
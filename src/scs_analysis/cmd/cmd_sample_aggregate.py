@@ -14,12 +14,13 @@ import optparse
 class CmdSampleAggregate(object):
     """unix command line handler"""
 
-    def __init__(self):
+    def __init__(self, args=None, prog=None):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog -c HH:MM:SS [-m] [-f] [-i ISO] [-v] [PATH_1 .. PATH_N]",
-                                              version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog -c HH:MM:SS [-m] [-f] [-i ISO] [--format FORMAT] "
+                                                    "[--stats [--stats-interval INTERVAL]] [-v] [PATH_1 .. PATH_N]",
+                                              version="%prog 1.0", prog=prog)
 
         # compulsory...
         self.__parser.add_option("--checkpoint", "-c", type="string", nargs=1, action="store", dest="checkpoint",
@@ -35,10 +36,19 @@ class CmdSampleAggregate(object):
         self.__parser.add_option("--iso-path", "-i", type="string", nargs=1, action="store", default="rec", dest="iso",
                                  help="path for ISO 8601 datetime field (default 'rec')")
 
+        self.__parser.add_option("--format", type="choice", choices=("json", "bin"), action="store", dest="doc_format",
+                                 default="json", help="output document format: json or bin (default json)")
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
-        self.__opts, self.__args = self.__parser.parse_args()
+        self.__opts, self.__args = self.__parser.parse_args(args)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -72,6 +82,21 @@ class CmdSampleAggregate(object):
         return self.__opts.iso
 
 
+    @property
+    def doc_format(self):
+        return self.__opts.doc_format
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -89,5 +114,7 @@ class CmdSampleAggregate(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleAggregate:{checkpoint:%s, min_max:%s, fill:%s, iso:%s, verbose:%s, nodes:%s}" %  \
-               (self.checkpoint, self.min_max, self.fill, self.iso, self.verbose, self.nodes)
+        return "CmdSampleAggregate:{checkpoint:%s, min_max:%s, fill:%s, iso:%s, doc_format:%s, stats:%s, " \
+               "stats_interval:%s, verbose:%s, nodes:%s}" % \
+               (self.checkpoint, self.min_max, self.fill, self.iso, self.doc_format, self.stats, self.stats_interval,
+                self.verbose, self.nodes)
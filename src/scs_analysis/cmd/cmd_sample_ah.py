@@ -14,22 +14,48 @@ import optparse
 class CmdSampleAH(object):
     """unix command line handler"""
 
-    def __init__(self):
+    def __init__(self, args=None, prog=None):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-v] RH_PATH T_PATH", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [--format FORMAT] [{ --workers WORKERS | --batch BATCH }] "
+                                                    "[--stats [--stats-interval INTERVAL]] [-v] RH_PATH T_PATH",
+                                              version="%prog 1.0", prog=prog)
 
         # optional...
+        self.__parser.add_option("--format", type="choice", choices=("json", "bin"), action="store", dest="doc_format",
+                                 default="json", help="output document format: json or bin (default json)")
+
+        self.__parser.add_option("--workers", type="int", nargs=1, action="store", dest="workers",
+                                 help="transform documents on WORKERS processes, in their original order")
+
+        self.__parser.add_option("--batch", type="int", nargs=1, action="store", dest="batch",
+                                 help="transform documents in vectorised batches of BATCH (requires numpy)")
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
-        self.__opts, self.__args = self.__parser.parse_args()
+        self.__opts, self.__args = self.__parser.parse_args(args)
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def is_valid(self):
+        if self.workers is not None and self.workers < 1:
+            return False
+
+        if self.batch is not None and self.batch < 1:
+            return False
+
+        if self.workers is not None and self.batch is not None:
+            return False
+
         if len(self.__args) != 2:
             return False
 
@@ -38,6 +64,31 @@ class CmdSampleAH(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    @property
+    def doc_format(self):
+        return self.__opts.doc_format
+
+
+    @property
+    def workers(self):
+        return self.__opts.workers
+
+
+    @property
+    def batch(self):
+        return self.__opts.batch
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -60,4 +111,7 @@ class CmdSampleAH(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleAH:{verbose:%s, rh_path:%s, t_path:%s}" % (self.verbose, self.rh_path, self.t_path)
+        return "CmdSampleAH:{doc_format:%s, workers:%s, batch:%s, stats:%s, stats_interval:%s, verbose:%s, " \
+               "rh_path:%s, t_path:%s}" % \
+               (self.doc_format, self.workers, self.batch, self.stats, self.stats_interval, self.verbose, self.rh_path,
+                self.t_path)
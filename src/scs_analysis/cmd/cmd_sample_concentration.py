@@ -20,7 +20,9 @@ class CmdSampleConcentration(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-v] GAS DENSITY_PATH T_PATH [{P_PATH | -p PRESSURE}]",
+        self.__parser = optparse.OptionParser(usage="%prog [--format FORMAT] [{ --workers WORKERS | --batch BATCH }] "
+                                                    "[--stats [--stats-interval INTERVAL]] [-v] GAS DENSITY_PATH "
+                                                    "T_PATH [{P_PATH | -p PRESSURE}]",
                                               version="%prog 1.0")
 
         # optional...
@@ -28,6 +30,21 @@ class CmdSampleConcentration(object):
                                  default=Gas.STP_PRESSURE, help="assume constant atmospheric pressure in kPA "
                                                                 "(default 101.3)")
 
+        self.__parser.add_option("--format", type="choice", choices=("json", "bin"), action="store", dest="doc_format",
+                                 default="json", help="output document format: json or bin (default json)")
+
+        self.__parser.add_option("--workers", type="int", nargs=1, action="store", dest="workers",
+                                 help="transform documents on WORKERS processes, in their original order")
+
+        self.__parser.add_option("--batch", type="int", nargs=1, action="store", dest="batch",
+                                 help="transform documents in vectorised batches of BATCH (requires numpy)")
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -37,6 +54,15 @@ class CmdSampleConcentration(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def is_valid(self):
+        if self.workers is not None and self.workers < 1:
+            return False
+
+        if self.batch is not None and self.batch < 1:
+            return False
+
+        if self.workers is not None and self.batch is not None:
+            return False
+
         if len(self.__args) < 3:
             return False
 
@@ -53,6 +79,31 @@ class CmdSampleConcentration(object):
         return self.__opts.pressure
 
 
+    @property
+    def doc_format(self):
+        return self.__opts.doc_format
+
+
+    @property
+    def workers(self):
+        return self.__opts.workers
+
+
+    @property
+    def batch(self):
+        return self.__opts.batch
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -85,5 +136,7 @@ class CmdSampleConcentration(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleConcentration:{pressure:%s, verbose:%s, gas:%s, density_path:%s, t_path:%s, p_path:%s}" % \
-               (self.pressure, self.verbose, self.gas, self.density_path, self.t_path, self.p_path)
+        return "CmdSampleConcentration:{pressure:%s, doc_format:%s, workers:%s, batch:%s, stats:%s, " \
+               "stats_interval:%s, verbose:%s, gas:%s, density_path:%s, t_path:%s, p_path:%s}" % \
+               (self.pressure, self.doc_format, self.workers, self.batch, self.stats, self.stats_interval, self.verbose,
+                self.gas, self.density_path, self.t_path, self.p_path)
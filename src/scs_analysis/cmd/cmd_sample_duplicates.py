@@ -18,12 +18,19 @@ class CmdSampleDuplicates(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-c] [-v] PATH", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [-c] [--stats [--stats-interval INTERVAL]] [-v] PATH",
+                                              version="%prog 1.0")
 
         # optional...
         self.__parser.add_option("--counts", "-c", action="store_true", dest="counts", default=False,
                                  help="only list the count of matching documents")
 
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -46,6 +53,16 @@ class CmdSampleDuplicates(object):
         return self.__opts.counts
 
 
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -63,4 +80,5 @@ class CmdSampleDuplicates(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleDuplicates:{counts:%s, verbose:%s, path:%s}" % (self.counts, self.verbose, self.path)
+        return "CmdSampleDuplicates:{counts:%s, stats:%s, stats_interval:%s, verbose:%s, path:%s}" % \
+               (self.counts, self.stats, self.stats_interval, self.verbose, self.path)
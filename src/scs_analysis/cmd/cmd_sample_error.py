@@ -20,8 +20,11 @@ class CmdSampleError(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog { -l | -s } [-p PRECISION] [-v] "
-                                                    "REFERENCE_PATH REPORTED_PATH ERROR_PATH", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog { -l | -s } [-p PRECISION] [--format FORMAT] "
+                                                    "[{ --workers WORKERS | --batch BATCH }] "
+                                                    "[--stats [--stats-interval INTERVAL]] [-v] REFERENCE_PATH "
+                                                    "REPORTED_PATH ERROR_PATH",
+                                              version="%prog 1.0")
 
         # compulsory...
         self.__parser.add_option("--linear", "-l", action="store_true", dest="linear", default=False,
@@ -34,6 +37,21 @@ class CmdSampleError(object):
         self.__parser.add_option("--prec", "-p", type="int", nargs=1, action="store", default=3, dest="precision",
                                  help="precision (default 3 decimal places)")
 
+        self.__parser.add_option("--format", type="choice", choices=("json", "bin"), action="store", dest="doc_format",
+                                 default="json", help="output document format: json or bin (default json)")
+
+        self.__parser.add_option("--workers", type="int", nargs=1, action="store", dest="workers",
+                                 help="transform documents on WORKERS processes, in their original order")
+
+        self.__parser.add_option("--batch", type="int", nargs=1, action="store", dest="batch",
+                                 help="transform documents in vectorised batches of BATCH (requires numpy)")
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -43,6 +61,15 @@ class CmdSampleError(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def is_valid(self):
+        if self.workers is not None and self.workers < 1:
+            return False
+
+        if self.batch is not None and self.batch < 1:
+            return False
+
+        if self.workers is not None and self.batch is not None:
+            return False
+
         if not self.linear and not self.scaling:
             return False
 
@@ -69,6 +96,31 @@ class CmdSampleError(object):
         return self.__opts.precision
 
 
+    @property
+    def doc_format(self):
+        return self.__opts.doc_format
+
+
+    @property
+    def workers(self):
+        return self.__opts.workers
+
+
+    @property
+    def batch(self):
+        return self.__opts.batch
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -96,7 +148,7 @@ class CmdSampleError(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleError:{linear:%s, scaling:%s, precision:%s, verbose:%s, " \
-               "reference_path:%s, reported_path:%s, error_path:%s}" % \
-               (self.linear, self.scaling, self.precision, self.verbose,
-                self.reference_path, self.reported_path, self.error_path)
+        return "CmdSampleError:{linear:%s, scaling:%s, precision:%s, doc_format:%s, workers:%s, batch:%s, " \
+               "stats:%s, stats_interval:%s, verbose:%s, reference_path:%s, reported_path:%s, error_path:%s}" % \
+               (self.linear, self.scaling, self.precision, self.doc_format, self.workers, self.batch, self.stats,
+                self.stats_interval, self.verbose, self.reference_path, self.reported_path, self.error_path)
@@ -20,7 +20,9 @@ class CmdSampleISO8601(object):
         """
         self.__parser = optparse.OptionParser(usage="%prog { -z | { -o | -f DATE_FORMAT } "
                                                     "[-t TIMEZONE_NAME [-u]] [-i ISO_PATH] "
-                                                    "{ DATETIME_PATH | DATE_PATH TIME_PATH } } [-v]",
+                                                    "{ DATETIME_PATH | DATE_PATH TIME_PATH } } "
+                                                    "[--output-format FORMAT] [--workers WORKERS] "
+                                                    "[--stats [--stats-interval INTERVAL]] [-v]",
                                               version="%prog 1.0")
 
         # optional...
@@ -42,6 +44,19 @@ class CmdSampleISO8601(object):
         self.__parser.add_option("--iso-path", "-i", type="string", nargs=1, action="store", default="rec", dest="iso",
                                  help="path for ISO 8601 datetime output (default 'rec')")
 
+        self.__parser.add_option("--output-format", type="choice", choices=("json", "bin"), action="store",
+                                 dest="doc_format", default="json",
+                                 help="output document format: json or bin (default json)")
+
+        self.__parser.add_option("--workers", type="int", nargs=1, action="store", dest="workers",
+                                 help="transform documents on WORKERS processes, in their original order")
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -51,6 +66,9 @@ class CmdSampleISO8601(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def is_valid(self):
+        if self.workers is not None and self.workers < 1:
+            return False
+
         if self.zones:
             return True
 
@@ -119,6 +137,26 @@ class CmdSampleISO8601(object):
         return self.__opts.iso
 
 
+    @property
+    def doc_format(self):
+        return self.__opts.doc_format
+
+
+    @property
+    def workers(self):
+        return self.__opts.workers
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -146,7 +184,7 @@ class CmdSampleISO8601(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleISO8601:{zones:%s, oad:%s, format:%s, timezone:%s, utc:%s, iso:%s, verbose:%s, " \
-               "datetime_paths:%s}" % \
-               (self.zones, self.oad, self.format, self.timezone, self.utc, self.iso, self.verbose,
-                self.datetime_paths())
+        return "CmdSampleISO8601:{zones:%s, oad:%s, format:%s, timezone:%s, utc:%s, iso:%s, doc_format:%s, " \
+               "workers:%s, stats:%s, stats_interval:%s, verbose:%s, datetime_paths:%s}" % \
+               (self.zones, self.oad, self.format, self.timezone, self.utc, self.iso, self.doc_format, self.workers,
+                self.stats, self.stats_interval, self.verbose, self.datetime_paths())
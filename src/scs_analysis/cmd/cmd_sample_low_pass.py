@@ -20,7 +20,8 @@ class CmdLowPass(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog -d DELTA_T -c CUT_OFF [-p PRECISION] [-v] [PATH]",
+        self.__parser = optparse.OptionParser(usage="%prog -d DELTA_T -c CUT_OFF [-p PRECISION] [--format FORMAT] "
+                                                    "[--stats [--stats-interval INTERVAL]] [-v] [PATH]",
                                               version="%prog 1.0")
 
         # compulsory...
@@ -34,6 +35,15 @@ class CmdLowPass(object):
         self.__parser.add_option("--prec", "-p", type="int", nargs=1, action="store", default=None, dest="precision",
                                  help="precision (default 0 decimal places)")
 
+        self.__parser.add_option("--format", type="choice", choices=("json", "bin"), action="store", dest="doc_format",
+                                 default="json", help="output document format: json or bin (default json)")
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -66,6 +76,21 @@ class CmdLowPass(object):
         return self.__opts.precision
 
 
+    @property
+    def doc_format(self):
+        return self.__opts.doc_format
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -83,5 +108,7 @@ class CmdLowPass(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdLowPassFilter:{delta:%s, cut_off:%s, precision:%s, verbose:%s, path:%s}" % \
-               (self.delta, self.cut_off, self.precision, self.verbose, self.path)
+        return "CmdLowPassFilter:{delta:%s, cut_off:%s, precision:%s, doc_format:%s, stats:%s, stats_interval:%s, " \
+               "verbose:%s, path:%s}" % \
+               (self.delta, self.cut_off, self.precision, self.doc_format, self.stats, self.stats_interval,
+                self.verbose, self.path)
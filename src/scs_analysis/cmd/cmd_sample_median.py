@@ -16,12 +16,13 @@ class CmdSampleMedian(object):
     unix command line handler
     """
 
-    def __init__(self):
+    def __init__(self, args=None, prog=None):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-w SIZE] [-p PRECISION] [-v] [PATH]",
-                                              version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [-w SIZE] [-p PRECISION] [--format FORMAT] "
+                                                    "[--stats [--stats-interval INTERVAL]] [-v] [PATH]",
+                                              version="%prog 1.0", prog=prog)
 
         # optional...
         self.__parser.add_option("--window", "-w", type="int", nargs=1, action="store", dest="window", default=3,
@@ -30,10 +31,19 @@ class CmdSampleMedian(object):
         self.__parser.add_option("--prec", "-p", type="int", nargs=1, action="store", default=None, dest="precision",
                                  help="precision (default 0 decimal places)")
 
+        self.__parser.add_option("--format", type="choice", choices=("json", "bin"), action="store", dest="doc_format",
+                                 default="json", help="output document format: json or bin (default json)")
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
-        self.__opts, self.__args = self.__parser.parse_args()
+        self.__opts, self.__args = self.__parser.parse_args(args)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -57,6 +67,21 @@ class CmdSampleMedian(object):
         return self.__opts.precision
 
 
+    @property
+    def doc_format(self):
+        return self.__opts.doc_format
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -74,5 +99,6 @@ class CmdSampleMedian(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleMedian:{window:%s, verbose:%s, precision:%s, path:%s}" % \
-               (self.window, self.verbose, self.precision, self.path)
+        return "CmdSampleMedian:{window:%s, doc_format:%s, stats:%s, stats_interval:%s, verbose:%s, precision:%s, " \
+               "path:%s}" % \
+               (self.window, self.doc_format, self.stats, self.stats_interval, self.verbose, self.precision, self.path)
@@ -18,8 +18,9 @@ class CmdSampleNullify(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog -t TARGET_PATH -s SOURCE_PATH [-l LOWER] [-u UPPER]"
-                                                    " [-v]", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog -t TARGET_PATH -s SOURCE_PATH [-l LOWER] [-u UPPER] "
+                                                    "[--format FORMAT] [--stats [--stats-interval INTERVAL]] [-v]",
+                                              version="%prog 1.0")
 
         # compulsory...
         self.__parser.add_option("--target", "-t", type="string", nargs=1, action="store", dest="target",
@@ -35,6 +36,15 @@ class CmdSampleNullify(object):
         self.__parser.add_option("--upper", "-u", type="float", nargs=1, action="store", dest="upper",
                                  help="upper bound")
 
+        self.__parser.add_option("--format", type="choice", choices=("json", "bin"), action="store", dest="doc_format",
+                                 default="json", help="output document format: json or bin (default json)")
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -75,6 +85,21 @@ class CmdSampleNullify(object):
         return self.__opts.upper
 
 
+    @property
+    def doc_format(self):
+        return self.__opts.doc_format
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -87,5 +112,7 @@ class CmdSampleNullify(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleNullify:{target:%s, source:%s, lower:%s, upper:%s, verbose:%s}" % \
-               (self.target, self.source, self.lower, self.upper, self.verbose)
+        return "CmdSampleNullify:{target:%s, source:%s, lower:%s, upper:%s, doc_format:%s, stats:%s, " \
+               "stats_interval:%s, verbose:%s}" % \
+               (self.target, self.source, self.lower, self.upper, self.doc_format, self.stats, self.stats_interval,
+                self.verbose)
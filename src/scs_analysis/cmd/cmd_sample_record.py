@@ -18,9 +18,16 @@ class CmdSampleRecord(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-v] [PATH]", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [--stats [--stats-interval INTERVAL]] [-v] [PATH]",
+                                              version="%prog 1.0")
 
         # optional...
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -38,6 +45,16 @@ class CmdSampleRecord(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -55,4 +72,5 @@ class CmdSampleRecord(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleRecord:{verbose:%s, path:%s}" % (self.verbose, self.path)
+        return "CmdSampleRecord:{stats:%s, stats_interval:%s, verbose:%s, path:%s}" % \
+               (self.stats, self.stats_interval, self.verbose, self.path)
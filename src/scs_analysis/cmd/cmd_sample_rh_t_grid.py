@@ -27,7 +27,8 @@ class CmdSampleRhTGrid(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog -r MIN MAX STEP -t MIN MAX STEP -o { R | C | M | S } [-v] "
+        self.__parser = optparse.OptionParser(usage="%prog -r MIN MAX STEP -t MIN MAX STEP -o { R | C | M | S } "
+                                                    "[--stats [--stats-interval INTERVAL]] [-v] "
                                                     "RH_PATH T_PATH REPORT_PATH REF_PATH", version="%prog 1.0")
 
         # compulsory...
@@ -41,6 +42,12 @@ class CmdSampleRhTGrid(object):
                                  help="output mode (rH rows, rH cols, linear responses or surface)")
 
         # optional...
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -99,6 +106,16 @@ class CmdSampleRhTGrid(object):
         return None if self.__opts.output_mode is None else self.__opts.output_mode.upper()
 
 
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -131,7 +148,7 @@ class CmdSampleRhTGrid(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleRhTGrid:{rh:%s, t:%s, output_mode:%s, verbose:%s, " \
+        return "CmdSampleRhTGrid:{rh:%s, t:%s, output_mode:%s, stats:%s, stats_interval:%s, verbose:%s, " \
                "rh_path:%s, t_path:%s, report_path:%s, ref_path:%s}" % \
-               (self.__opts.rh, self.__opts.t, self.output_mode, self.verbose,
+               (self.__opts.rh, self.__opts.t, self.output_mode, self.stats, self.stats_interval, self.verbose,
                 self.rh_path, self.t_path, self.report_path, self.ref_path)
@@ -16,12 +16,13 @@ from scs_core.data.datum import Datum
 class CmdSampleSubset(object):
     """unix command line handler"""
 
-    def __init__(self):
+    def __init__(self, args=None, prog=None):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [{ -i | -n }] [-l LOWER] [-u UPPER] [-x] [-v] PATH",
-                                              version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [{ -i | -n }] [-l LOWER] [-u UPPER] [-x] [--format FORMAT] "
+                                                    "[--stats [--stats-interval INTERVAL]] [-v] PATH",
+                                              version="%prog 1.0", prog=prog)
 
         # compulsory...
         self.__parser.add_option("--iso8601", "-i", action="store_true", dest="iso8601", default=False,
@@ -40,10 +41,19 @@ class CmdSampleSubset(object):
         self.__parser.add_option("--exclusions", "-x", action="store_true", dest="exclusions", default=False,
                                  help="output exclusions instead of inclusions")
 
+        self.__parser.add_option("--format", type="choice", choices=("json", "bin"), action="store", dest="doc_format",
+                                 default="json", help="output document format: json or bin (default json)")
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
-        self.__opts, self.__args = self.__parser.parse_args()
+        self.__opts, self.__args = self.__parser.parse_args(args)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -90,6 +100,21 @@ class CmdSampleSubset(object):
         return self.__cast(self.__opts.upper)
 
 
+    @property
+    def doc_format(self):
+        return self.__opts.doc_format
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -129,7 +154,7 @@ class CmdSampleSubset(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleSubset:{iso8601:%s, numeric:%s, lower:%s, upper:%s, exclusions:%s, " \
-               "verbose:%s, path:%s}" % \
-               (self.iso8601, self.numeric, self.__opts.lower, self.__opts.upper, self.exclusions,
-                self.verbose, self.path)
+        return "CmdSampleSubset:{iso8601:%s, numeric:%s, lower:%s, upper:%s, exclusions:%s, doc_format:%s, " \
+               "stats:%s, stats_interval:%s, verbose:%s, path:%s}" % \
+               (self.iso8601, self.numeric, self.__opts.lower, self.__opts.upper, self.exclusions, self.doc_format,
+                self.stats, self.stats_interval, self.verbose, self.path)
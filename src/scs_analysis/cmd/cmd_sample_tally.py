@@ -18,7 +18,9 @@ class CmdSampleTally(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-t TALLY] [-p PRECISION] [-v] [PATH]", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [-t TALLY] [-p PRECISION] [--format FORMAT] "
+                                                    "[--stats [--stats-interval INTERVAL]] [-v] [PATH]",
+                                              version="%prog 1.0")
 
         # optional...
         self.__parser.add_option("--tally", "-t", type="int", nargs=1, action="store", dest="tally",
@@ -27,6 +29,15 @@ class CmdSampleTally(object):
         self.__parser.add_option("--prec", "-p", type="int", nargs=1, action="store", default=None, dest="precision",
                                  help="precision (default 0 decimal places)")
 
+        self.__parser.add_option("--format", type="choice", choices=("json", "bin"), action="store", dest="doc_format",
+                                 default="json", help="output document format: json or bin (default json)")
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -54,6 +65,21 @@ class CmdSampleTally(object):
         return self.__opts.precision
 
 
+    @property
+    def doc_format(self):
+        return self.__opts.doc_format
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -71,5 +97,6 @@ class CmdSampleTally(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleTally:{tally:%s, precision:%s, verbose:%s, path:%s}" % \
-                    (self.tally, self.precision, self.verbose, self.path)
+        return "CmdSampleTally:{tally:%s, precision:%s, doc_format:%s, stats:%s, stats_interval:%s, verbose:%s, " \
+               "path:%s}" % \
+               (self.tally, self.precision, self.doc_format, self.stats, self.stats_interval, self.verbose, self.path)
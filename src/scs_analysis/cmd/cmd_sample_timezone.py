@@ -18,12 +18,26 @@ class CmdSampleTimezone(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog { -z | TIMEZONE_NAME }", version="%prog 1.0")
+        self.__parser = optparse.OptionParser(usage="%prog [--format FORMAT] [--workers WORKERS] "
+                                                    "[--stats [--stats-interval INTERVAL]] { -z | TIMEZONE_NAME }",
+                                              version="%prog 1.0")
 
         # optional...
         self.__parser.add_option("--zones", "-z", action="store_true", dest="zones", default=False,
                                  help="list the available timezone names to stderr")
 
+        self.__parser.add_option("--format", type="choice", choices=("json", "bin"), action="store", dest="doc_format",
+                                 default="json", help="output document format: json or bin (default json)")
+
+        self.__parser.add_option("--workers", type="int", nargs=1, action="store", dest="workers",
+                                 help="transform documents on WORKERS processes, in their original order")
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -33,6 +47,9 @@ class CmdSampleTimezone(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def is_valid(self):
+        if self.workers is not None and self.workers < 1:
+            return False
+
         if bool(self.timezone) == bool(self.__opts.zones):
             return False
 
@@ -51,6 +68,26 @@ class CmdSampleTimezone(object):
         return self.__opts.zones
 
 
+    @property
+    def doc_format(self):
+        return self.__opts.doc_format
+
+
+    @property
+    def workers(self):
+        return self.__opts.workers
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -63,4 +100,6 @@ class CmdSampleTimezone(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleTimezone:{timezone:%s, zones:%s, verbose:%s}" % (self.timezone, self.zones, self.verbose)
+        return "CmdSampleTimezone:{timezone:%s, zones:%s, doc_format:%s, workers:%s, stats:%s, stats_interval:%s, " \
+               "verbose:%s}" % \
+               (self.timezone, self.zones, self.doc_format, self.workers, self.stats, self.stats_interval, self.verbose)
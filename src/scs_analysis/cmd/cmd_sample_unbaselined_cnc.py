@@ -18,7 +18,9 @@ class CmdSampleUnbaselinedCnc(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog -a AFE_SERIAL_NUMBER [-v] REPORT_SUB_PATH",
+        self.__parser = optparse.OptionParser(usage="%prog -a AFE_SERIAL_NUMBER [--format FORMAT] "
+                                                    "[{ --workers WORKERS | --batch BATCH }] "
+                                                    "[--stats [--stats-interval INTERVAL]] [-v] REPORT_SUB_PATH",
                                               version="%prog 1.0")
 
         # compulsory...
@@ -26,6 +28,21 @@ class CmdSampleUnbaselinedCnc(object):
                                  help="use given AFE calibration data")
 
         # optional...
+        self.__parser.add_option("--format", type="choice", choices=("json", "bin"), action="store", dest="doc_format",
+                                 default="json", help="output document format: json or bin (default json)")
+
+        self.__parser.add_option("--workers", type="int", nargs=1, action="store", dest="workers",
+                                 help="transform documents on WORKERS processes, in their original order")
+
+        self.__parser.add_option("--batch", type="int", nargs=1, action="store", dest="batch",
+                                 help="transform documents in vectorised batches of BATCH (requires numpy)")
+
+        self.__parser.add_option("--stats", action="store_true", dest="stats", default=False,
+                                 help="report stream statistics to stderr on exit")
+
+        self.__parser.add_option("--stats-interval", type="float", nargs=1, action="store", dest="stats_interval",
+                                 help="report stream statistics every INTERVAL seconds (implies --stats)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -35,6 +52,15 @@ class CmdSampleUnbaselinedCnc(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def is_valid(self):
+        if self.workers is not None and self.workers < 1:
+            return False
+
+        if self.batch is not None and self.batch < 1:
+            return False
+
+        if self.workers is not None and self.batch is not None:
+            return False
+
         if self.afe_serial_number is None:
             return False
 
@@ -51,6 +77,31 @@ class CmdSampleUnbaselinedCnc(object):
         return self.__opts.afe_serial_number
 
 
+    @property
+    def doc_format(self):
+        return self.__opts.doc_format
+
+
+    @property
+    def workers(self):
+        return self.__opts.workers
+
+
+    @property
+    def batch(self):
+        return self.__opts.batch
+
+
+    @property
+    def stats(self):
+        return self.__opts.stats or self.__opts.stats_interval is not None
+
+
+    @property
+    def stats_interval(self):
+        return self.__opts.stats_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -68,5 +119,7 @@ class CmdSampleUnbaselinedCnc(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampleUnbaselinedCnc:{afe_serial_number:%s, verbose:%s, report_sub_path:%s}" % \
-               (self.afe_serial_number, self.verbose, self.report_sub_path)
+        return "CmdSampleUnbaselinedCnc:{afe_serial_number:%s, doc_format:%s, workers:%s, batch:%s, stats:%s, " \
+               "stats_interval:%s, verbose:%s, report_sub_path:%s}" % \
+               (self.afe_serial_number, self.doc_format, self.workers, self.batch, self.stats, self.stats_interval,
+                self.verbose, self.report_sub_path)
@@ -0,0 +1,71 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+"""
+
+import optparse
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdSCSAnalysisServer(object):
+    """unix command line handler"""
+
+    UTILITIES = ('csv_join', 'csv_reader', 'csv_writer', 'node_shift', 'sample_aggregate', 'sample_rh_t_grid')
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [-s SOCKET] [-v] [UTILITY_1 .. UTILITY_N]",
+                                              version="%prog 1.0")
+
+        # optional...
+        self.__parser.add_option("--socket", "-s", type="string", nargs=1, action="store", dest="socket",
+                                 help="Unix domain socket (default SCS_ANALYSIS_SERVER or runtime directory)")
+
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        for utility in self.utilities:
+            if utility not in self.UTILITIES:
+                return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def socket(self):
+        return self.__opts.socket
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    @property
+    def utilities(self):
+        return self.__args if self.__args else self.UTILITIES
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdSCSAnalysisServer:{socket:%s, verbose:%s, utilities:%s}" % \
+               (self.socket, self.verbose, self.utilities)
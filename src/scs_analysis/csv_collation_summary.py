@@ -44,6 +44,7 @@ https://en.wikipedia.org/wiki/Dependent_and_independent_variables
 import sys
 
 from scs_analysis.cmd.cmd_csv_collation_summary import CmdCollationSummary
+from scs_analysis.helper.path_accessor import PathAccessor
 
 from scs_core.csv.csv_reader import CSVReader, CSVReaderException
 
@@ -74,6 +75,12 @@ if __name__ == '__main__':
     if cmd.verbose:
         print("csv_collation_summary: %s" % cmd, file=sys.stderr)
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # paths...
+
+    ind_accessor = PathAccessor.construct(cmd.ind_path)
+    dep_accessors = PathAccessor.construct_all(cmd.dep_paths)
+
     try:
         for filename in cmd.filenames:
 
@@ -103,27 +110,26 @@ if __name__ == '__main__':
             try:
                 for row in reader.rows():
                     datum = PathDict.construct_from_jstr(row)
-                    paths = datum.paths()
 
                     rows += 1
 
-                    if cmd.ind_path not in paths:
+                    if not ind_accessor.has(datum):
                         print("csv_collation_summary: ind_path not in datum: %s" % cmd.ind_path, file=sys.stderr)
                         exit(1)
 
                     try:
-                        ind_value = float(datum.node(cmd.ind_path))
+                        ind_value = float(ind_accessor.node(datum))
                     except ValueError:
                         continue                        # independent value is NaN - skip this row
 
                     dependents = {}
-                    for dep_path in cmd.dep_paths:
-                        if dep_path not in paths:
+                    for dep_path, dep_accessor in dep_accessors.items():
+                        if not dep_accessor.has(datum):
                             print("csv_collation_summary: dep_path not in datum: %s" % dep_path, file=sys.stderr)
                             exit(1)
 
                         try:
-                            dep_value = float(datum.node(dep_path))
+                            dep_value = float(dep_accessor.node(datum))
                         except ValueError:
                             break
 
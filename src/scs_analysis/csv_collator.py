@@ -20,10 +20,14 @@ specified, along with the path identifying the leaf node in the input document w
 Documents that do not contain a field at the specified path, or have values that cannot be evaluated as a float, are
 ignored. Likewise, values outside the upper and lower bounds are ignored.
 
-If the --verbose flag is used, a summary of the bin assignments is written to stderr.
+Any number of bins may be used: no more than 32 of the CSV files are open at any one time, and the documents of each
+bin are written to its file in blocks. A file is created for every bin - the file is empty if the bin has no documents.
+
+If the --verbose flag is used, a summary of the bin assignments is written to stderr. If the --stats flag is used,
+stream statistics are reported to stderr on exit.
 
 SYNOPSIS
-csv_collator.py -l LOWER_BOUND -u UPPER_BOUND -d DELTA -f FILE_PREFIX [-v] PATH
+csv_collator.py -l LOWER_BOUND -u UPPER_BOUND -d DELTA -f FILE_PREFIX [--stats [--stats-interval INTERVAL]] [-v] PATH
 
 EXAMPLES
 csv_reader.py alphasense_303_2018-08.csv |
@@ -37,8 +41,10 @@ import sys
 
 from scs_analysis.cmd.cmd_csv_collator import CmdCSVCollator
 from scs_analysis.helper.csv_collator import CSVCollator
-
-from scs_core.data.path_dict import PathDict
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.path_accessor import PathAccessor
+from scs_analysis.helper.stream_stats import StreamStats
 
 
 # TODO: collate by datetime interval?
@@ -64,33 +70,37 @@ if __name__ == '__main__':
     if cmd.verbose:
         print("csv_collator: %s" % cmd, file=sys.stderr)
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('csv_collator', cmd.stats_interval) if cmd.stats else None
+    stdin = InputStream.construct(stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
         collator = CSVCollator.construct(cmd.lower, cmd.upper, cmd.delta, cmd.file_prefix)
 
+        accessor = PathAccessor.construct(cmd.path)
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                break
-
+        for jstr, datum in stdin.documents(codec):
             document_count += 1
 
-            if cmd.path not in datum.paths():
+            if not accessor.has(datum):
                 continue
 
             try:
-                value = float(datum.node(cmd.path))
+                value = float(accessor.node(datum))
             except (TypeError, ValueError):
                 continue
 
-            if not collator.collate(value, line):
+            if not collator.collate(value, jstr or codec.dumps(datum)):
                 continue
 
             processed_count += 1
@@ -107,6 +117,9 @@ if __name__ == '__main__':
             print("csv_collator: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        if stats is not None:
+            stats.report()
+
         if collator is not None:
             collator.close()
 
@@ -8,8 +8,9 @@ Created on 22 Feb 2019
 source repo: scs_analysis
 
 DESCRIPTION
-The csv_join utility performs an SQL join operation on a pair of CSV files. This is particularly useful where a
-comparison is to be made on timeline data from two devices.
+The csv_join utility performs an SQL join operation on a pair of CSV files - or, in the --sorted and --as-of modes,
+on any number of CSV files. This is particularly useful where a comparison is to be made on timeline data from two or
+more devices.
 
 All four join types are supported: inner, left outer, right outer and full outer. Inner joins are used when the output
 should only contain rows that match on their primary key.
@@ -21,14 +22,50 @@ their primary key fields. For outer joins, content nodes may be null.
 The --iso8601 flag is provided to indicate that the primary key should be interpreted as a ISO 8601 datetime. This is
 useful where data sets use alternate datetime formats such as 2019-02-22T01:00:00Z and 2019-02-22T01:00:00+00:00.
 
+By default, both files are read into memory before the join is performed. If the --sorted flag is used, the files must
+each be in primary key order - as the files of csv_logger are on rec - and are merge-joined in a single pass, holding
+one document from each file at a time: output begins immediately, and memory use is independent of the size of the
+files. Output is in primary key order. As for the in-memory join, where a primary key is repeated within a file, the
+last of its documents is used. If a primary key is found out of order, the utility terminates.
+
+If the --max-memory option is given, files in any order are joined within a memory budget of MB megabytes. Where the
+join would not fit in the budget, both files are partitioned by the hash of their primary keys into temporary files,
+and the partitions are joined one after another - output is then grouped by partition, rather than in the order of
+either file. A partition that would still exceed the budget is partitioned again before it is joined. Temporary files
+are written in the system temporary directory (see TMPDIR), and deleted on completion.
+
+If the --as-of option is given, the primary keys are ISO 8601 datetimes that need not be exactly equal: each left row
+is joined to the nearest right row, or the latest preceding right row, whose primary key is within --tolerance seconds
+of its own. This replaces the alignment of both files to a common grid with sample_aggregate. The files must be in
+time order, and are merge-joined in a single pass, as for --sorted. Only inner and left joins are supported. The right
+contents retain their primary key, so that the time of each match is shown.
+
+In the --sorted and --as-of modes, the -r option may be repeated, so that any number of files are joined in a single
+k-way merge pass, with no intermediate files. The output then has a node for each PREFIX. The -l file is the left
+table, and the last -r file the right table, and the output is that of a chain of two-way joins, in the order of the
+files: an inner join outputs the primary keys found in every file, a left join those in the -l file, a right join
+those in the last -r file, and a full join those in any file. Nodes are null where their file does not have the
+primary key - for a right join, as for the chain, a node is also null unless every later file has the primary key. In
+the --as-of mode, each -r file is matched to the -l file independently.
+
 If the --verbose flag is used, a summary of the join operation is written to stderr.
 
 SYNOPSIS
-csv_join.py [-t TYPE] -l PREFIX PK FILENAME -r PREFIX PK FILENAME [-i] [-v]
+csv_join.py [-t TYPE] -l PREFIX PK FILENAME -r PREFIX PK FILENAME [-r PREFIX PK FILENAME ...] [-i]
+[{ -s | --as-of MODE --tolerance SECONDS | --max-memory MB }] [--format FORMAT]
+[--stats [--stats-interval INTERVAL]] [-v]
 
 EXAMPLES
 csv_join.py -i -v -l praxis rec praxis_301/praxis_301_2018-08.csv -r ref rec ref/ref_2018-08.csv
 
+csv_join.py -t LEFT -i -s -l praxis rec praxis_301/praxis_301_2018.csv -r ref rec ref/ref_2018.csv
+
+csv_join.py -t FULL -i --max-memory 512 -l praxis rec praxis_301_2018.csv -r ref rec ref_2018.csv
+
+csv_join.py --as-of nearest --tolerance 450 -l praxis rec praxis_301_2018-08.csv -r ref rec ref_2018-08.csv
+
+csv_join.py -t FULL -i -s -l ref rec ref.csv -r p301 rec praxis_301.csv -r p302 rec praxis_302.csv
+
 DOCUMENT EXAMPLE - INPUT
 left:
 {"rec": "2019-02-01T02:00:00Z", "val": {"NO2": {"weV": 0.297185, "cnc": 40.8, "aeV": 0.298467, "weC": 0.002271}}}
@@ -47,15 +84,24 @@ RESOURCES
 https://www.w3schools.com/sql/sql_join.asp
 """
 
+import os
 import sys
 
+from scs_analysis.helper.fork_client import ForkClient
+
+ForkClient.delegate()                   # if a scs_analysis_server is running, this utility is run there
+
 from scs_analysis.cmd.cmd_csv_join import CmdCSVJoin
+from scs_analysis.helper.grace_join import GraceJoin
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.path_accessor import PathAccessor
+from scs_analysis.helper.sorted_join import SortedJoin
+from scs_analysis.helper.stream_stats import StreamStats
 
 from scs_core.csv.csv_reader import CSVReader
 
 from scs_core.data.join import Join
-from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -63,7 +109,9 @@ from scs_core.data.path_dict import PathDict
 if __name__ == '__main__':
 
     reader = None
+    readers = []
     result = None
+    join = None
 
     left_document_count = 0
     left_processed_count = 0
@@ -89,104 +137,145 @@ if __name__ == '__main__':
     if cmd.verbose:
         print("csv_join: %s" % cmd, file=sys.stderr)
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('csv_join', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        join = Join.construct(cmd.left_prefix, cmd.left_pk, cmd.right_prefix, cmd.right_pk, cmd.iso8601)
+        if not cmd.is_in_memory():
+            if cmd.sorted:
+                join = SortedJoin.construct(cmd.tables, cmd.iso8601, codec)
+            else:
+                try:
+                    input_size = sum(os.path.getsize(filename) for _, _, filename in cmd.tables)
+                except OSError:
+                    input_size = 0                      # reported by the reader
 
-        # read left CSV file...
-        try:
-            reader = CSVReader.construct_for_file(cmd.left_filename)
-        except FileNotFoundError:
-            print("csv_join: file not found: %s" % cmd.left_filename, file=sys.stderr)
-            exit(1)
+                join = GraceJoin.construct(cmd.tables, cmd.iso8601, codec, cmd.max_memory * 1048576, input_size)
 
-        for row in reader.rows():
-            jstr = row.strip()
-            datum = PathDict.construct_from_jstr(row)
+            for _, _, filename in cmd.tables:
+                try:
+                    readers.append(CSVReader.construct_for_file(filename))
+                except FileNotFoundError:
+                    print("csv_join: file not found: %s" % filename, file=sys.stderr)
+                    exit(1)
 
-            if datum is None:
-                continue
+            if cmd.verbose:
+                print("csv_join: %s" % join, file=sys.stderr)
+                sys.stderr.flush()
 
-            left_document_count += 1
-
-            if cmd.left_pk not in datum.paths():
-                print("csv_join: pk '%s' missing: %s" % (cmd.left_pk, jstr), file=sys.stderr)
-                exit(1)
+        else:
+            join = Join.construct(cmd.left_prefix, cmd.left_pk, cmd.right_prefix, cmd.right_pk, cmd.iso8601)
 
-            if datum.node(cmd.left_pk) == '':
-                continue
+            left_pk_accessor = PathAccessor.construct(cmd.left_pk)
+            right_pk_accessor = PathAccessor.construct(cmd.right_pk)
 
+            # read left CSV file...
             try:
-                join.append_to_left(datum)
-            except ValueError as ex:
-                print("csv_join: invalid pk '%s' in: %s" % (datum.node(cmd.left_pk), jstr), file=sys.stderr)
+                reader = CSVReader.construct_for_file(cmd.left_filename)
+            except FileNotFoundError:
+                print("csv_join: file not found: %s" % cmd.left_filename, file=sys.stderr)
                 exit(1)
 
-            left_processed_count += 1
+            for row in reader.rows():
+                jstr = row.strip()
+                datum = codec.decode(row)
 
-        reader.close()
+                if datum is None:
+                    continue
 
-        # read right CSV file...
-        try:
-            reader = CSVReader.construct_for_file(cmd.right_filename)
-        except FileNotFoundError:
-            print("csv_join: file not found: %s" % cmd.right_filename, file=sys.stderr)
-            exit(1)
+                left_document_count += 1
 
-        for row in reader.rows():
-            jstr = row.strip()
-            datum = PathDict.construct_from_jstr(row)
+                if not left_pk_accessor.has(datum):
+                    print("csv_join: pk '%s' missing: %s" % (cmd.left_pk, jstr), file=sys.stderr)
+                    exit(1)
 
-            if datum is None:
-                continue
+                if left_pk_accessor.node(datum) == '':
+                    continue
 
-            right_document_count += 1
+                try:
+                    join.append_to_left(datum)
+                except ValueError as ex:
+                    print("csv_join: invalid pk '%s' in: %s" % (left_pk_accessor.node(datum), jstr), file=sys.stderr)
+                    exit(1)
 
-            if cmd.right_pk not in datum.paths():
-                print("csv_join: pk '%s' missing: %s" % (cmd.right_pk, jstr), file=sys.stderr)
-                exit(1)
+                left_processed_count += 1
 
-            if datum.node(cmd.right_pk) == '':
-                continue
+            reader.close()
 
+            # read right CSV file...
             try:
-                join.append_to_right(datum)
-            except ValueError as ex:
-                print("csv_join: invalid pk '%s' in: %s" % (datum.node(cmd.right_pk), jstr), file=sys.stderr)
+                reader = CSVReader.construct_for_file(cmd.right_filename)
+            except FileNotFoundError:
+                print("csv_join: file not found: %s" % cmd.right_filename, file=sys.stderr)
                 exit(1)
 
-            right_processed_count += 1
+            for row in reader.rows():
+                jstr = row.strip()
+                datum = codec.decode(row)
 
-        reader.close()
+                if datum is None:
+                    continue
 
-        if cmd.verbose:
-            print("csv_join: %s" % join, file=sys.stderr)
-            sys.stderr.flush()
+                right_document_count += 1
+
+                if not right_pk_accessor.has(datum):
+                    print("csv_join: pk '%s' missing: %s" % (cmd.right_pk, jstr), file=sys.stderr)
+                    exit(1)
+
+                if right_pk_accessor.node(datum) == '':
+                    continue
+
+                try:
+                    join.append_to_right(datum)
+                except ValueError as ex:
+                    print("csv_join: invalid pk '%s' in: %s" % (right_pk_accessor.node(datum), jstr), file=sys.stderr)
+                    exit(1)
+
+                right_processed_count += 1
+
+            reader.close()
+
+            if cmd.verbose:
+                print("csv_join: %s" % join, file=sys.stderr)
+                sys.stderr.flush()
 
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        if cmd.type == 'LEFT':
-            operation = join.left
+        if cmd.as_of:
+            documents = join.as_of(cmd.type, [reader.rows() for reader in readers], cmd.as_of, cmd.tolerance)
+
+        elif not cmd.is_in_memory():
+            documents = join.join(cmd.type, [reader.rows() for reader in readers])
+
+        elif cmd.type == 'LEFT':
+            documents = join.left()
 
         elif cmd.type == 'RIGHT':
-            operation = join.right
+            documents = join.right()
 
         elif cmd.type == 'FULL':
-            operation = join.full
+            documents = join.full()
 
         else:
-            operation = join.inner
+            documents = join.inner()
 
-        for datum in operation():
-            print(JSONify.dumps(datum))
-            sys.stdout.flush()
+        for datum in documents:
+            stdout.write_document(datum)
 
             joined_count += 1
 
+        for reader in readers:
+            reader.close()
+
 
     # ----------------------------------------------------------------------------------------------------------------
     # end...
@@ -194,15 +283,30 @@ if __name__ == '__main__':
     except KeyError as ex:
         print("csv_join: KeyError: %s" % ex, file=sys.stderr)
 
+    except ValueError as ex:
+        print("csv_join: %s" % ex, file=sys.stderr)
+        exit(1)
+
     except KeyboardInterrupt:
         if cmd and cmd.verbose:
             print("csv_join: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
-            print("csv_join: left: documents: %d processed: %d" % (left_document_count, left_processed_count),
-                  file=sys.stderr)
-            print("csv_join: right: documents: %d processed: %d" % (right_document_count, right_processed_count),
-                  file=sys.stderr)
+            if cmd.is_in_memory() or join is None:
+                print("csv_join: left: documents: %d processed: %d" % (left_document_count, left_processed_count),
+                      file=sys.stderr)
+                print("csv_join: right: documents: %d processed: %d" % (right_document_count, right_processed_count),
+                      file=sys.stderr)
+            else:
+                for join_set in join.sets:
+                    print("csv_join: %s: documents: %d processed: %d" %
+                          (join_set.set_path, join_set.document_count, join_set.processed_count), file=sys.stderr)
+
             print("csv_join: joined: %d" % joined_count,
                   file=sys.stderr)
@@ -19,8 +19,33 @@ for logging, together with the logging mode of operation.
 The csv_logger receives JSON data on stdin and writes this to the log file. The log file is named for its topic and the
 date / time of the first JSON document reception. Log files are closed - and a new log file opened - each day after
 00:00 UTC. All logging date / times are UTC, irrespective of the system or application timezone. Log files are stored in
-directories named for the year and month. Files are flushed on every write - this immunises the logging system from
-power failures or un-managed reboots.
+directories named for the year and month.
+
+Documents are received on stdin independently of the writing of the log: they are held on a bounded in-memory queue,
+and written by a background thread, so that a slow storage medium does not hold up the utilities upstream. Rows are
+written in group commits - each batch is flushed once - after each write-interval, or as soon as the previous commit
+is complete if the write-interval is zero. The csv_logger_conf fsync policy specifies whether files are also forced to
+the storage medium on every commit, or when they are closed, in order to survive power failures or un-managed
+reboots. If the queue is full, documents are dropped from the log - but not from the echo - and a warning is written
+to stderr. In verbose mode, the depth of the queue and the latency of the log are reported every minute, and on exit.
+
+If compression is specified by csv_logger_conf, log files are written as gzip streams, with the suffix .csv.gz. Rather
+than being flushed on every commit, a compressed file is given a sync point at most every ten seconds, and no more than
+ten seconds after a row is written, whether or not further documents are received. Rows written before the latest sync
+point are immune from power failures - a power failure loses no more than the rows written in the last ten seconds,
+together with any that are still queued. Compressed log files are read by csv_reader, even while they are being
+written.
+
+If archiving is specified by csv_logger_conf, uncompressed day files are compressed with gzip in the background, at
+low priority, once they are closed - and any day files of the same topic and tag left uncompressed by earlier runs
+are compressed when logging starts. The manifest of a file is kept, and csv_reader reads the archive as it read the
+uncompressed file. When space is recovered, the oldest files are deleted until enough is free, so the compressed
+size of each archived file is what counts.
+
+Next to each log file, csv_logger keeps a manifest, FILENAME.manifest, recording the number of rows, the earliest and
+latest rec values, and the offset of the first row of each hour. The manifest is saved when the first row is written,
+at the start of each hour, and when the file is closed. It is used by csv_reader in the --start / --end mode, so that
+files outside the time window are not opened, and the reader seeks to the hour of the start of the window.
 
 If a tag is specified on the command line, then log files are prepended with the device tag. Otherwise, the log file
 name begins with the date / time.
@@ -38,7 +63,7 @@ write to stdout irrespective of whether a csv_logger_conf is specified, or wheth
 because of a filesystem problem).
 
 SYNOPSIS
-csv_logger.py [-t TAG] [-e] [-v] TOPIC
+csv_logger.py [-t TAG] [-e] [--stats [--stats-interval INTERVAL]] [-v] TOPIC
 
 EXAMPLES
 socket_receiver.py | csv_logger.py -e climate
@@ -63,10 +88,16 @@ access to the storage medium.
 import sys
 
 from scs_analysis.cmd.cmd_csv_logger import CmdCSVLogger
+from scs_analysis.helper.csv_log_archiver import CSVLogArchiver
+from scs_analysis.helper.csv_log_writer import CSVLogWriter
+from scs_analysis.helper.csv_logger import CSVLogger
+from scs_analysis.helper.csv_logger_conf import CSVLoggerConf
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.stream_stats import StreamStats
 
 from scs_core.csv.csv_log import CSVLog
-from scs_core.csv.csv_logger import CSVLogger
-from scs_core.csv.csv_logger_conf import CSVLoggerConf
 
 from scs_host.sys.host import Host
 
@@ -75,23 +106,31 @@ from scs_host.sys.host import Host
 
 if __name__ == '__main__':
 
-    cmd = None
-    logger = None
+    writer = None
+    archiver = None
 
-    try:
-        # ------------------------------------------------------------------------------------------------------------
-        # cmd...
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
 
-        cmd = CmdCSVLogger()
+    cmd = CmdCSVLogger()
 
-        if not cmd.is_valid():
-            cmd.print_help(sys.stderr)
-            exit(2)
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
 
-        if cmd.verbose:
-            print("csv_logger: %s" % cmd, file=sys.stderr)
+    if cmd.verbose:
+        print("csv_logger: %s" % cmd, file=sys.stderr)
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('csv_logger', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, stats=stats)
+    stdin = InputStream.construct(idle_handler=stdout.idle, stats=stats)
+
+    try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
@@ -107,37 +146,40 @@ if __name__ == '__main__':
         if log and cmd.verbose:
             print("csv_logger: %s" % log, file=sys.stderr)
 
-        # CSVLogger...
-        logger = None if log is None else CSVLogger(Host, log, conf.delete_oldest, conf.write_interval)
+        # CSVLogArchiver...
+        if log is not None and conf.archive and not conf.compress:
+            archiver = CSVLogArchiver(Host, log, verbose=cmd.verbose)
+            archiver.start()
 
-        if logger and cmd.verbose:
-            print("csv_logger: %s" % logger, file=sys.stderr)
-            sys.stderr.flush()
+            if cmd.verbose:
+                print("csv_logger: %s" % archiver, file=sys.stderr)
 
+        # CSVLogWriter...
+        if log is not None:
+            logger = CSVLogger(Host, log, conf.delete_oldest, conf.write_interval, compress=conf.compress,
+                               fsync=conf.fsync, archiver=archiver)
 
-        # ------------------------------------------------------------------------------------------------------------
-        # run...
+            writer = CSVLogWriter(logger, report=cmd.verbose)
+            writer.start()
 
-        for line in sys.stdin:
-            datum = line.strip()
+            if cmd.verbose:
+                print("csv_logger: %s" % writer, file=sys.stderr)
+                sys.stderr.flush()
 
-            if datum is None:
-                break
 
-            if logger:
-                try:
-                    logger.write(datum)
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
 
-                except OSError as ex:
-                    logger.writing_inhibited = True
+        for jstr, datum in stdin.documents(codec):
+            if jstr is None:
+                jstr = codec.dumps(datum)
 
-                    print("csv_logger: %s" % ex, file=sys.stderr)
-                    sys.stderr.flush()
+            if writer:
+                writer.put(jstr)
 
             # echo...
             if cmd.echo:
-                print(datum)
-                sys.stdout.flush()
+                stdout.write(jstr)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -148,5 +190,19 @@ if __name__ == '__main__':
             print("csv_logger: KeyboardInterrupt", file=sys.stderr)
 
     finally:
-        if logger is not None:
-            logger.close()
+        stdout.close()
+
+        if writer is not None:
+            writer.close()
+
+            if cmd.verbose:
+                print("csv_logger: %s" % writer.status(), file=sys.stderr)
+
+        if archiver is not None:
+            archiver.close()
+
+            if cmd.verbose:
+                print("csv_logger: %s" % archiver.status(), file=sys.stderr)
+
+        if stats is not None:
+            stats.report()
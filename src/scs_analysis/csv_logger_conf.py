@@ -11,21 +11,29 @@ DESCRIPTION
 The csv_logger_conf utility is used to specify the filesystem path to the log files generated by csv_logger. It also
 specifies the csv_logger behaviour when the volume becomes full: if delete-oldest is true, the oldest logs are
 removed to make space, if false, then logging stops. A write-interval parameter may be used to specify time between
-flushes, in order to extend the life of SD cards.
+flushes, in order to extend the life of SD cards. If compress is true, log files are written with gzip compression.
+The fsync policy specifies when log files are forced to the storage medium: none (the operating system decides),
+commit (after every group commit), or close (when each day file is closed). The default is none. If archive is
+true, uncompressed day files are compressed in the background once they are closed - this has no effect if compress
+is also true.
 
 Note that the logging process(es) must be restarted for changes to take effect.
 
 SYNOPSIS
-csv_logger_conf.py { [-r ROOT_PATH] [-o DELETE_OLDEST] [-i WRITE_INTERVAL] | -d } [-v]
+csv_logger_conf.py { [-r ROOT_PATH] [-o DELETE_OLDEST] [-i WRITE_INTERVAL] [-z COMPRESS] [-f FSYNC] [-a ARCHIVE] |
+-d } [-v]
 
 EXAMPLES
-csv_logger_conf.py -r /srv/removable_data_storage -o 1 -i 0
+csv_logger_conf.py -r /srv/removable_data_storage -o 1 -i 0 -z 1 -f close
+
+csv_logger_conf.py -z 0 -a 1
 
 FILES
 ~/SCS/conf/csv_logger_conf.json
 
 DOCUMENT EXAMPLE
-{"root-path": "/srv/removable_data_storage", "delete-oldest": true, "write-interval": 0}
+{"root-path": "/srv/removable_data_storage", "delete-oldest": true, "write-interval": 0, "compress": true,
+"fsync": "close", "archive": false}
 
 SEE ALSO
 scs_dev/csv_logger
@@ -34,8 +42,8 @@ scs_dev/csv_logger
 import sys
 
 from scs_analysis.cmd.cmd_csv_logger_conf import CmdCSVLoggerConf
+from scs_analysis.helper.csv_logger_conf import CSVLoggerConf
 
-from scs_core.csv.csv_logger_conf import CSVLoggerConf
 from scs_core.data.json import JSONify
 from scs_core.sys.filesystem import Filesystem
 
@@ -80,13 +88,17 @@ if __name__ == '__main__':
         delete_oldest = conf.delete_oldest if cmd.delete_oldest is None else cmd.delete_oldest
         write_interval = conf.write_interval if cmd.write_interval is None else cmd.write_interval
 
+        compress = (False if conf is None else conf.compress) if cmd.compress is None else cmd.compress
+        fsync = (CSVLoggerConf.FSYNC_NONE if conf is None else conf.fsync) if cmd.fsync is None else cmd.fsync
+        archive = (False if conf is None else conf.archive) if cmd.archive is None else cmd.archive
+
         try:
             Filesystem.mkdir(root_path)
         except PermissionError:
             print("csv_logger_conf: You do not have permission to write in that directory.", file=sys.stderr)
             exit(1)
 
-        conf = CSVLoggerConf(root_path, delete_oldest, write_interval)
+        conf = CSVLoggerConf(root_path, delete_oldest, write_interval, compress, fsync, archive)
         conf.save(Host)
 
     elif cmd.delete:
@@ -21,11 +21,55 @@ By default, output is in the form of a sequence of JSON documents, separated by
 selected, output is in the form of a JSON array - the output opens with a '[' character, documents are separated by
 the ',' character, and the output is terminated by a ']' character.
 
+The header row is compiled once into a template of the JSON document, and the type of each column is inferred from the
+first row, so that each row is converted by filling the template. Cells that do not match the inferred type of their
+column are converted in the usual way, so the output is not affected.
+
+If the --columns option is given, only the given paths are output - as for csv_reader | node PATH_1 .. PATH_N, but
+without converting the cells of other columns. Paths are separated by commas, and may be leaf or internal nodes - for
+example, val.NO2 selects every column under val.NO2. In the --merge-on mode, the merge path must be selected.
+
+Files with the suffix .gz, .bz2 or .xz are decompressed with gzip, bzip2 or LZMA, respectively, as they are read, so
+that no separate decompression stage is needed. A compressed file that has not been closed - for example, a csv_logger
+file that is still being written - is read up to its last sync point, and reported as a badly-closed file. Compressed
+files are not indexed: in the --start / --end mode, they are scanned, unless they have a csv_logger manifest.
+
+If the binary format (--format bin) is selected, output is a binary document stream, which may be read by the
+stream utilities and csv_writer. The binary format cannot be used in array mode.
+
+If the --workers option is given, the files are read concurrently, on a number of processes. Each file is
+memory-mapped, and divided into byte ranges on line boundaries - newlines within quoted fields are respected - so that
+a single large file is also read in parallel, with bounded memory. Output is in the order in which the files were given,
+as it is when the files are read one after another.
+
+If the --start and / or --end options are given, only rows whose value on the --window-on column (default rec) is
+within the window start <= value < end are output - as for csv_reader | sample_subset -i -l START -u END rec, but
+without parsing the whole file. The first time that a file is read in this way, a sparse index of the column is built,
+and saved next to the file as FILENAME.PATH.idx; the index is reused until the file changes. If the file is in
+time order, the reader seeks to the start of the window, and stops at the first row past its end. Otherwise, or if
+the input is stdin, the whole file is scanned. Rows whose value is not an ISO 8601 datetime are not output.
+
+If the window is on rec, and a file has a manifest - FILENAME.manifest, as written by csv_logger - the manifest is
+used in place of the index, whether or not the file is compressed. A file whose rows are all outside the window is
+not opened, and the reader seeks to the start of the hour in which the window starts.
+
+If the --merge-on option is given, the files are merged into a single sequence, ordered by the value of the given
+path - typically rec. Each file must already be ordered by the path. Values that are ISO 8601 datetimes are compared
+as datetimes, so that the files of devices that report different UTC offsets are merged in time order. If the path is
+missing from any row, the utility terminates. The --workers, --merge-on and window options may not be used
+together, and neither --workers nor --merge-on may be used with stdin.
+
 SYNOPSIS
-csv_reader.py [-s] [-n] [-l LIMIT] [-a] [-v] [FILENAME_1 .. FILENAME_N]
+csv_reader.py [-s] [-n] [-l LIMIT] [-a] [--columns PATH_1,..,PATH_N]
+[{ --workers WORKERS | --merge-on PATH | [--start START] [--end END] [--window-on PATH] }] [--format FORMAT]
+[--stats [--stats-interval INTERVAL]] [-v] [FILENAME_1 .. FILENAME_N]
 
 EXAMPLES
 csv_reader.py -v scs-ph1-10-status-2019-07-*.csv
+csv_reader.py --workers 4 scs-bgx-401-gases-2019-07-*.csv.gz
+csv_reader.py --columns rec,val.NO2 scs-bgx-401-gases-2019-07.csv
+csv_reader.py --merge-on rec scs-bgx-401-gases-2019-07-*.csv scs-bgx-402-gases-2019-07-*.csv
+csv_reader.py --start 2019-07-04T00:00:00Z --end 2019-07-05T00:00:00Z scs-bgx-401-gases-2019-07.csv
 
 DOCUMENT EXAMPLE - INPUT
 tag,rec,val.hmd,val.tmp
@@ -47,9 +91,23 @@ scs_analysis/csv_writer
 
 import sys
 
+from itertools import islice
+
+from scs_analysis.helper.fork_client import ForkClient
+
+ForkClient.delegate()                   # if a scs_analysis_server is running, this utility is run there
+
 from scs_analysis.cmd.cmd_csv_reader import CmdCSVReader
+from scs_analysis.helper.csv_file_pool import CSVFilePool
+from scs_analysis.helper.csv_merge import CSVMerge
+from scs_analysis.helper.csv_template_reader import CSVTemplateReader
+from scs_analysis.helper.csv_window_reader import CSVWindowReader
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.row_writer import RowWriter
+from scs_analysis.helper.stream_stats import StreamStats
 
-from scs_core.csv.csv_reader import CSVReader, CSVReaderException
+from scs_core.csv.csv_reader import CSVReaderException
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -60,74 +118,199 @@ if __name__ == '__main__':
     total_rows = 0
 
     reader = None
+    readers = []
+    pool = None
 
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
 
     cmd = CmdCSVReader()
 
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
     if cmd.verbose:
         print("csv_reader: %s" % cmd, file=sys.stderr)
 
-    if cmd.array:
-        print('[', end='')
+    try:
+        start = cmd.start
+        end = cmd.end
+
+    except ValueError as ex:
+        print("csv_reader: invalid ISO 8601 datetime: %s" % ex, file=sys.stderr)
+        exit(2)
+
+    if start is not None and end is not None and end <= start:
+        print("csv_reader: END must be after START", file=sys.stderr)
+        exit(2)
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('csv_reader', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+
+    writer = RowWriter(stdout, codec, cmd.array)
+    writer.open()
 
     try:
-        for filename in cmd.filenames:
+        # ------------------------------------------------------------------------------------------------------------
+        # merge...
 
-            file_count += 1
-            rows = 0
+        if cmd.merge_on is not None:
+            for filename in cmd.filenames:
+                file_count += 1
+
+                try:
+                    reader = CSVTemplateReader.construct_for_file(filename, numeric_cast=cmd.cast,
+                                                                  empty_string_as_null=cmd.nullify,
+                                                                  columns=cmd.columns)
 
-            # --------------------------------------------------------------------------------------------------------
-            # resources...
+                except FileNotFoundError:
+                    print("csv_reader: file not found: %s" % filename, file=sys.stderr)
+                    exit(1)
+
+                if cmd.verbose:
+                    print("csv_reader: %s" % reader, file=sys.stderr)
+                    sys.stderr.flush()
+
+                readers.append(reader)
+
+            merge = CSVMerge.construct(cmd.merge_on, codec)
 
             try:
-                reader = CSVReader.construct_for_file(filename, numeric_cast=cmd.cast, empty_string_as_null=cmd.nullify)
+                for datum in merge.rows(islice(reader.rows(), cmd.limit) for reader in readers):
+                    writer.write(datum)
+
+            except CSVReaderException as ex:
+                if cmd.verbose:
+                    print("csv_reader: terminating on row %d: %s" % (writer.count, ex), file=sys.stderr)
+                    exit(1)
 
-            except FileNotFoundError:
-                print("csv_reader: file not found: %s" % filename, file=sys.stderr)
+            except (TypeError, ValueError) as ex:
+                print("csv_reader: %s" % ex, file=sys.stderr)
                 exit(1)
 
+            total_rows = writer.count
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # pool...
+
+        elif cmd.workers is not None:
+            pool = CSVFilePool.construct(cmd.workers, numeric_cast=cmd.cast, empty_string_as_null=cmd.nullify,
+                                         columns=cmd.columns, limit=cmd.limit)
+
             if cmd.verbose:
-                print("csv_reader: %s" % reader, file=sys.stderr)
+                print("csv_reader: %s" % pool, file=sys.stderr)
                 sys.stderr.flush()
 
+            rows = 0
+            terminated = False
+
+            for filename, index, last, description, part_rows, ex in pool.parts(cmd.filenames):
+                if index == 0:
+                    file_count += 1
+                    rows = 0
+                    terminated = False
 
-            # --------------------------------------------------------------------------------------------------------
-            # run...
+                    if isinstance(ex, FileNotFoundError):
+                        print("csv_reader: file not found: %s" % filename, file=sys.stderr)
+                        exit(1)
 
-            try:
-                for datum in reader.rows():
-                    if cmd.limit is not None and rows >= cmd.limit:
-                        break
+                    if cmd.verbose:
+                        print("csv_reader: %s" % description, file=sys.stderr)
+                        sys.stderr.flush()
+
+                if not terminated:
+                    for datum in part_rows:
+                        if cmd.limit is not None and rows >= cmd.limit:
+                            break
+
+                        writer.write(datum)
+
+                        rows += 1
+
+                    if ex is not None:
+                        if cmd.verbose:
+                            print("csv_reader: terminating on row %d: %s" % (rows, ex), file=sys.stderr)
+                            exit(1)
+
+                        terminated = True
 
-                    if cmd.array:
-                        if rows == 0:
-                            print(datum, end='')
+                if last:
+                    if cmd.verbose:
+                        print("csv_reader: rows: %d" % rows, file=sys.stderr)
 
-                        else:
-                            print(", %s" % datum, end='')
+                    total_rows += rows
 
+
+        # ------------------------------------------------------------------------------------------------------------
+        # sequence...
+
+        else:
+            for filename in cmd.filenames:
+                file_count += 1
+                rows = 0
+
+                # ----------------------------------------------------------------------------------------------------
+                # resources...
+
+                try:
+                    if cmd.is_window():
+                        reader = CSVWindowReader.construct_for_file(filename, cmd.window_on, start=start, end=end,
+                                                                    numeric_cast=cmd.cast,
+                                                                    empty_string_as_null=cmd.nullify,
+                                                                    columns=cmd.columns)
                     else:
-                        print(datum)
+                        reader = CSVTemplateReader.construct_for_file(filename, numeric_cast=cmd.cast,
+                                                                      empty_string_as_null=cmd.nullify,
+                                                                      columns=cmd.columns)
 
-                    sys.stdout.flush()
+                except FileNotFoundError:
+                    print("csv_reader: file not found: %s" % filename, file=sys.stderr)
+                    exit(1)
 
-                    rows += 1
+                except ValueError as ex:
+                    print("csv_reader: %s" % ex, file=sys.stderr)
+                    exit(1)
 
-            except CSVReaderException as ex:
                 if cmd.verbose:
-                    print("csv_reader: terminating on row %d: %s" % (rows, ex), file=sys.stderr)
-                    exit(1)
+                    print("csv_reader: %s" % reader, file=sys.stderr)
+                    sys.stderr.flush()
 
-            finally:
-                if reader is not None:
-                    reader.close()
 
-            if cmd.verbose:
-                print("csv_reader: rows: %d" % rows, file=sys.stderr)
+                # ----------------------------------------------------------------------------------------------------
+                # run...
+
+                try:
+                    for datum in reader.rows():
+                        if cmd.limit is not None and rows >= cmd.limit:
+                            break
+
+                        writer.write(datum)
+
+                        rows += 1
+
+                except CSVReaderException as ex:
+                    if cmd.verbose:
+                        print("csv_reader: terminating on row %d: %s" % (rows, ex), file=sys.stderr)
+                        exit(1)
+
+                finally:
+                    if reader is not None:
+                        reader.close()
 
-            total_rows += rows
+                if cmd.verbose:
+                    if cmd.is_window():
+                        print("csv_reader: indexed: %s skipped: %s scanned: %d" %
+                              (reader.is_indexed, reader.is_skipped, reader.scan_count), file=sys.stderr)
+
+                    print("csv_reader: rows: %d" % rows, file=sys.stderr)
+
+                total_rows += rows
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -138,8 +321,18 @@ if __name__ == '__main__':
             print("csv_reader: KeyboardInterrupt", file=sys.stderr)
 
     finally:
-        if cmd.array:
-            print(']')
+        if pool is not None:
+            pool.close()
+
+        for reader in readers:
+            reader.close()
+
+        writer.close()
+
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
 
         if cmd and cmd.verbose and file_count > 1:
             print("csv_reader: total rows: %d" % total_rows, file=sys.stderr)
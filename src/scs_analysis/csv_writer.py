@@ -17,11 +17,28 @@ All the leaf nodes of the first JSON document are included in the CSV. If subseq
 contain fields that were not in this first document, these extra fields are ignored. If subsequent JSON documents
 do not contain a field that is in the header, then this field is given the null value.
 
+Input may be in the form of JSON documents, or the binary document stream written by the stream utilities with the
+--format bin option - the format is detected automatically.
+
+If the FILENAME has the suffix .gz, .bz2 or .xz, the file is compressed with gzip, bzip2 or LZMA, respectively, as it
+is written. Compressed files are read by csv_reader without decompression to an intermediate file.
+
+If the --partition-by and / or --partition-time options are given, the input is divided into partitions in a single
+pass - by the value of the given path, such as tag, and / or by the UTC day or month of the --partition-on path
+(default rec). Each partition is written to its own file, named for the FILENAME with the partition key inserted
+before its suffix - for example, climate-scs-ap1-6-2018-04-04.csv. Documents that have no value on the partition path,
+or no ISO 8601 datetime on the time path, are not written. No more than --max-open files are held open at once: when
+more partitions are active, the least-recently used file is closed, and later appended to - its header is written
+only once. Partition files are buffered, rather than flushed on every row.
+
 SYNOPSIS
-csv_writer.py [{ -a | -x }] [-e] [-v] [FILENAME]
+csv_writer.py [{ -a | -x }] [-e] [--partition-by PATH] [--partition-time UNIT [--partition-on PATH]]
+[--max-open MAX] [--stats [--stats-interval INTERVAL]] [-v] [FILENAME]
 
 EXAMPLES
 socket_receiver.py | csv_writer.py temp.csv -e
+csv_reader.py climate.csv | csv_writer.py --partition-by tag --partition-time day climate.csv
+csv_reader.py climate.csv | sample_aggregate.py -c **:/01:00 rec | csv_writer.py climate-hourly.csv.gz
 
 DOCUMENT EXAMPLE - INPUT
 {"tag": "scs-ap1-6", "rec": "2018-04-04T14:50:27.641+00:00", "val": {"hmd": 59.6, "tmp": 23.8}}
@@ -37,9 +54,18 @@ scs_analysis/csv_reader
 
 import sys
 
-from scs_analysis.cmd.cmd_csv_writer import CmdCSVWriter
+from scs_analysis.helper.fork_client import ForkClient
 
-from scs_core.csv.csv_writer import CSVWriter
+ForkClient.delegate()                   # if a scs_analysis_server is running, this utility is run there
+
+from scs_analysis.cmd.cmd_csv_writer import CmdCSVWriter
+from scs_analysis.helper.csv_partitioner import CSVPartitioner
+from scs_analysis.helper.csv_writer import CSVWriter
+from scs_analysis.helper.csv_writer_pool import CSVWriterPool
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.stream_stats import StreamStats
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -47,6 +73,7 @@ from scs_core.csv.csv_writer import CSVWriter
 if __name__ == '__main__':
 
     writer = None
+    partitioner = None
 
     document_count = 0
     processed_count = 0
@@ -64,11 +91,28 @@ if __name__ == '__main__':
         print("csv_writer: %s" % cmd, file=sys.stderr)
         sys.stderr.flush()
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('csv_writer', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, stats=stats)
+    stdin = InputStream.construct(idle_handler=stdout.idle, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        writer = CSVWriter(filename=cmd.filename, append=cmd.append, exclude_header=cmd.exclude_header)
+        if cmd.is_partitioned():
+            partitioner = CSVPartitioner.construct(cmd.filename, path=cmd.partition_by, time_unit=cmd.partition_time,
+                                                   time_path=cmd.partition_on)
+            writer = CSVWriterPool(max_open=cmd.max_open, append=cmd.append, exclude_header=cmd.exclude_header)
+
+            if cmd.verbose:
+                print("csv_writer: %s" % partitioner, file=sys.stderr)
+
+        else:
+            writer = CSVWriter(filename=cmd.filename, append=cmd.append, exclude_header=cmd.exclude_header)
 
         if cmd.verbose:
             print("csv_writer: %s" % writer, file=sys.stderr)
@@ -77,18 +121,25 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            jstr = line.strip()
+        for jstr, datum in stdin.documents(codec):
+            if jstr is None:
+                jstr = codec.dumps(datum)
 
             document_count += 1
 
-            if not writer.write(jstr):
-                continue
+            if partitioner is None:
+                if not writer.write(jstr):
+                    continue
+
+            else:
+                filename = partitioner.filename(datum)
+
+                if filename is None or not writer.write(filename, jstr):
+                    continue
 
             # echo...
             if cmd.echo:
-                print(jstr)
-                sys.stdout.flush()
+                stdout.write(jstr)
 
             processed_count += 1
 
@@ -101,8 +152,17 @@ if __name__ == '__main__':
             print("csv_writer: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        stdout.close()
+
         if writer is not None:
             writer.close()
 
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
             print("csv_writer: documents: %d processed: %d" % (document_count, processed_count), file=sys.stderr)
+
+            if partitioner is not None and writer is not None:
+                print("csv_writer: partitions: %d opens: %d" % (len(writer.row_counts), writer.open_count),
+                      file=sys.stderr)
@@ -24,8 +24,12 @@ are malformed, the gas_exegesis utility terminates.
 A list of available gas exegetes can be found using the --help flag. The name of the model forms the last part
 of the path for its report field. For the output, the default exegesis root is "exg".
 
+The documents are corrected independently, so that a large input may be divided between a number of processes,
+with the --workers option. The output is in the same order as the input.
+
 SYNOPSIS
-Usage: gas_exegesis.py -e EXEGETE [-o OFFSET] [-v] RH_PATH T_PATH REPORT_SUB_PATH [EXEGESIS_ROOT]
+Usage: gas_exegesis.py -e EXEGETE [-o OFFSET] [--format FORMAT] [--workers WORKERS]
+[--stats [--stats-interval INTERVAL]] [-v] RH_PATH T_PATH REPORT_SUB_PATH [EXEGESIS_ROOT]
 
 EXAMPLES
 csv_reader.py -v gases.csv | \
@@ -52,10 +56,14 @@ https://github.com/south-coast-science/scs_core/blob/develop/src/scs_core/gas/ex
 import sys
 
 from scs_analysis.cmd.cmd_gas_exegesis import CmdGasExegesis
+from scs_analysis.helper.document_pool import DocumentPool
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.path_accessor import PathAccessor
+from scs_analysis.helper.stream_stats import StreamStats
 
 from scs_core.data.datum import Datum
-from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 from scs_core.gas.exegesis.exegete_catalogue import ExegeteCatalogue
 
@@ -64,10 +72,81 @@ from scs_core.gas.exegesis.exegete_catalogue import ExegeteCatalogue
 
 # --------------------------------------------------------------------------------------------------------------------
 
-if __name__ == '__main__':
+class GasExegesis(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, exegete, offset, rh_path, t_path, report_path, exegesis_root, codec):
+        """
+        Constructor
+        """
+        self.__exegete = exegete
+        self.__offset = offset
+        self.__codec = codec
+
+        self.__exegesis_path = exegesis_root + '.' + exegete.name()
+
+        self.__rh_accessor = PathAccessor.construct(rh_path)
+        self.__t_accessor = PathAccessor.construct(t_path)
+        self.__report_accessor = PathAccessor.construct(report_path)
+
+        self.__corrected_accessors = {gas_name: PathAccessor.construct(self.__exegesis_path + '.' + gas_name + '.cnc')
+                                      for gas_name in exegete.gas_names()}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def datum(self, sample):
+        # source...
+        if not self.__rh_accessor.has(sample) or not self.__t_accessor.has(sample) or \
+                not self.__report_accessor.has_node(sample):
+            return None
+
+        rh_node = self.__rh_accessor.node(sample)
+        t_node = self.__t_accessor.node(sample)
+        report_node = self.__report_accessor.node(sample)
+
+        if rh_node == '' or t_node == '':
+            return None
+
+        try:
+            rh = float(rh_node)
+        except ValueError:
+            print("gas_exegesis: invalid value for rh in %s" % self.__codec.dumps(sample), file=sys.stderr)
+            exit(1)
+
+        try:
+            t = float(t_node)
+        except ValueError:
+            print("gas_exegesis: invalid value for t in %s" % self.__codec.dumps(sample), file=sys.stderr)
+            exit(1)
+
+        # correction...
+        for gas_name in report_node:                                # uses source document ordering
+            if gas_name not in self.__corrected_accessors:
+                continue
+
+            text = report_node[gas_name]['cnc']
+            interpretation = self.__exegete.interpretation(gas_name, text, rh, t) + self.__offset
+
+            self.__corrected_accessors[gas_name].append(sample, Datum.float(interpretation, 1))
+
+        return sample
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "GasExegesis:{exegete:%s, offset:%s, exegesis_path:%s}" % \
+               (self.__exegete.name(), self.__offset, self.__exegesis_path)
+
+
+# --------------------------------------------------------------------------------------------------------------------
 
-    rh = None
-    t = None
+if __name__ == '__main__':
 
     document_count = 0
     processed_count = 0
@@ -84,6 +163,15 @@ if __name__ == '__main__':
     if cmd.verbose:
         print("gas_exegesis: %s" % cmd, file=sys.stderr)
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('gas_exegesis', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    pool = None if cmd.workers is None else DocumentPool.construct(cmd.workers, codec, stdout)
+    stdin = InputStream.construct(idle_handler=stdout.idle if pool is None else pool.idle, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
@@ -92,66 +180,32 @@ if __name__ == '__main__':
 
         if cmd.verbose:
             print("gas_exegesis: %s" % exegete, file=sys.stderr)
-            sys.stderr.flush()
 
-        exegete_gas_names = exegete.gas_names()
-        exegesis_path = cmd.exegesis_path + '.' + exegete.name()
+        sampler = GasExegesis(exegete, cmd.offset, cmd.rh_path, cmd.t_path, cmd.report_path, cmd.exegesis_path, codec)
+
+        if cmd.verbose:
+            print("gas_exegesis: %s" % sampler, file=sys.stderr)
+            sys.stderr.flush()
 
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
-            document_count += 1
-
-            paths = datum.paths()
-
-            # source...
-            if cmd.rh_path not in paths or cmd.t_path not in paths or not datum.has_sub_path(cmd.report_path):
-                continue
+        if pool is not None:
+            pool.run(stdin, sampler.datum)
 
-            rh_node = datum.node(cmd.rh_path)
-            t_node = datum.node(cmd.t_path)
-            report_node = datum.node(cmd.report_path)
+        else:
+            for _, datum in stdin.documents(codec):
+                document_count += 1
 
-            if rh_node == '' or t_node == '':
-                continue
+                target = sampler.datum(datum)
 
-            try:
-                rh = float(rh_node)
-            except ValueError:
-                print("gas_exegesis: invalid value for rh in %s" % jstr, file=sys.stderr)
-                exit(1)
-
-            try:
-                t = float(t_node)
-            except ValueError:
-                print("gas_exegesis: invalid value for t in %s" % jstr, file=sys.stderr)
-                exit(1)
-
-            # correction...
-            for gas_name in report_node:                            # uses source document ordering
-                if gas_name not in exegete_gas_names:
+                if target is None:
                     continue
 
-                corrected_path = exegesis_path + '.' + gas_name + '.cnc'
-
-                text = report_node[gas_name]['cnc']
-                interpretation = exegete.interpretation(gas_name, text, rh, t) + cmd.offset
+                stdout.write_document(target)
 
-                datum.append(corrected_path, Datum.float(interpretation, 1))
-
-            # report...
-            print(JSONify.dumps(datum))
-            sys.stdout.flush()
-
-            processed_count += 1
+                processed_count += 1
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -165,5 +219,14 @@ if __name__ == '__main__':
             print("gas_exegesis: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        if pool is not None:
+            pool.close()
+            document_count, processed_count = pool.document_count, pool.processed_count
+
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
             print("gas_exegesis: documents: %d processed: %d" % (document_count, processed_count), file=sys.stderr)
@@ -0,0 +1,72 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+An array form of scs_core.climate.absolute_humidity.AbsoluteHumidity, for the --batch mode of sample_ah. The
+operations - and their order - and the constants are those of the scalar implementation, so that each element is the
+value that AbsoluteHumidity.from_rh_t(..) returns for the same rH and t. The constants are held here, rather than read
+from the private attributes of the scalar implementation - tests/helper/batch_parity_test.py checks that the two agree.
+
+NumPy is imported by this module: it should only be imported once DocumentBatch.is_available() has been checked.
+
+The formula is evaluated under DocumentBatch.strict(): where the scalar implementation would divide by zero, or raise
+an exception for a temperature above the critical point, a FloatingPointError is raised.
+
+https://www.aqua-calc.com/calculate/humidity
+"""
+
+import numpy
+
+from scs_analysis.helper.document_batch import DocumentBatch
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AbsoluteHumidityArray(object):
+    """
+    classdocs
+    """
+
+    __TCK =     647.096                     # critical temperature (K)
+    __PC = 22064000.0                       # critical pressure (Pa)
+
+    __RW =      461.52                      # specific gas constant for water vapour
+
+    __A1 =       -7.85951783
+    __A2 =        1.84408259
+    __A3 =      -11.7866497
+    __A4 =       22.6807411
+    __A5 =      -15.9618719
+    __A6 =        1.80122502
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def from_rh_t(cls, rh, t):              # arrays of %, °C -> array of g/m3
+        with DocumentBatch.strict():
+            return cls.__from_rh_t(rh, t)
+
+
+    @classmethod
+    def __from_rh_t(cls, rh, t):
+        tk = t + 273.15
+
+        theta = 1.0 - (tk / cls.__TCK)
+
+        sequence = (cls.__A1 * theta) + (cls.__A2 * numpy.power(theta, 1.5)) + \
+                   (cls.__A3 * numpy.power(theta, 3.0)) + (cls.__A4 * numpy.power(theta, 3.5)) + \
+                   (cls.__A5 * numpy.power(theta, 4.0)) + (cls.__A6 * numpy.power(theta, 7.5))
+
+        ln_pws_pc = (cls.__TCK / tk) * sequence
+
+        pws = numpy.exp(ln_pws_pc) * cls.__PC
+
+        pw = pws * (rh / 100.0)
+
+        ah = pw / (cls.__RW * tk)
+
+        return ah * 1000.0
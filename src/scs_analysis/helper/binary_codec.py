@@ -0,0 +1,485 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+The binary interchange format is an alternative to a sequence of JSON documents, for use between the stages of a
+pipeline. It saves the cost of formatting and parsing floats and keys for every document.
+
+A binary stream starts with MAGIC, followed by a sequence of frames. Each frame is a one-byte type, a four-byte
+little-endian payload length, and the payload, which starts with a uint16 id:
+
+S   schema: schema id, then the JSON skeleton of the document - the document with every leaf set to null
+L   layout: layout id, uint16 schema id, then one ASCII type code for each leaf of the schema
+D   document: layout id, then the leaf values, packed according to the layout
+
+Leaf type codes are: d float (float64), q int (int64), ? bool, n null (no bytes), s string (uint32 length, with the
+UTF-8 bytes following the packed values) and j any other value (as s, holding JSON text - for example, a very large
+int). Schemas and layouts are written once, when they are first used, so a stream of documents of the same shape
+costs one struct.pack(..) per document.
+
+For each schema, a DocumentTemplate is compiled to Python code that extracts the leaves of a document without
+walking it, and builds a document from its leaves.
+"""
+
+import json
+import struct
+
+from scs_core.data.json import JSONable
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TemplateMismatch(ValueError):
+    """
+    classdocs
+    """
+    pass
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DocumentTemplate(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_skeleton(cls, node):
+        if isinstance(node, dict):
+            return {key: cls.construct_skeleton(value) for key, value in node.items()}
+
+        if isinstance(node, list):
+            return [cls.construct_skeleton(item) for item in node]
+
+        return None
+
+
+    @classmethod
+    def construct(cls, skeleton):
+        leaves = []
+
+        extract_lines = ["def extract(n0):"]
+        names = [0]
+
+        def visit(node, var):
+            if isinstance(node, dict):
+                extract_lines.append("    if not isinstance(%s, dict) or tuple(%s) != %r: raise TemplateMismatch()" %
+                                     (var, var, tuple(node.keys())))
+                items = node.items()
+
+            elif isinstance(node, list):
+                extract_lines.append("    if not isinstance(%s, list) or len(%s) != %d: raise TemplateMismatch()" %
+                                     (var, var, len(node)))
+                items = enumerate(node)
+
+            else:
+                leaves.append(var)
+                return
+
+            for key, child in items:
+                if child is None:
+                    leaves.append("%s[%r]" % (var, key))
+                    continue
+
+                names[0] += 1
+                child_var = "n%d" % names[0]
+
+                extract_lines.append("    %s = %s[%r]" % (child_var, var, key))
+                visit(child, child_var)
+
+        visit(skeleton, 'n0')
+
+        extract_lines.append("    return (%s)" % ''.join(leaf + ', ' for leaf in leaves))
+
+        namespace = {'TemplateMismatch': TemplateMismatch}
+        exec('\n'.join(extract_lines), namespace)
+
+        return cls(skeleton, len(leaves), namespace['extract'], cls.__expression(skeleton, [0]))
+
+
+    @classmethod
+    def __expression(cls, node, counter):
+        if isinstance(node, dict):
+            return "{%s}" % ', '.join("%r: %s" % (key, cls.__expression(value, counter)) for key, value in node.items())
+
+        if isinstance(node, list):
+            return "[%s]" % ', '.join(cls.__expression(item, counter) for item in node)
+
+        counter[0] += 1
+        return "v%d" % (counter[0] - 1)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, skeleton, width, extract, expression):
+        """
+        Constructor
+        """
+        self.__skeleton = skeleton                  # skeleton document
+        self.__width = width                        # int
+        self.__extract = extract                    # function
+        self.__expression = expression              # string: document as a Python expression of v0 .. vn
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def extract(self, document):
+        return self.__extract(document)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def skeleton(self):
+        return self.__skeleton
+
+
+    @property
+    def width(self):
+        return self.__width
+
+
+    @property
+    def expression(self):
+        return self.__expression
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DocumentTemplate:{width:%s, expression:%s}" % (self.width, self.expression)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BinaryFormat(object):
+    """
+    classdocs
+    """
+
+    MAGIC = b'\xffSCSB\x01\n'                       # 0xff is not valid UTF-8, so cannot start a JSON or CSV stream
+
+    SCHEMA = b'S'
+    LAYOUT = b'L'
+    DOCUMENT = b'D'
+
+    FRAME_HEADER = struct.Struct('<cI')
+    FRAME_ID_HEADER = struct.Struct('<cIH')
+    ID = struct.Struct('<H')
+
+    MAX_ID = 0xffff
+
+    STRUCT_CODES = {'d': 'd', 'q': 'q', '?': '?', 'n': '', 's': 'I', 'j': 'I'}
+
+    TYPE_CODES = {float: 'd', int: 'q', bool: '?', type(None): 'n', str: 's'}
+
+    INT_MIN = -(2 ** 63)
+    INT_MAX = 2 ** 63 - 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def code(cls, value):
+        code = cls.TYPE_CODES.get(value.__class__)
+
+        if code == 'q' and not cls.INT_MIN <= value <= cls.INT_MAX:
+            return 'j'
+
+        return 'j' if code is None else code
+
+
+    @classmethod
+    def fixed_format(cls, codes):
+        return '<cIH' + ''.join(cls.STRUCT_CODES[code] for code in codes)
+
+
+    @classmethod
+    def frame(cls, frame_type, payload):
+        return cls.FRAME_HEADER.pack(frame_type, len(payload)) + payload
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BinaryEncoder(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, codec):
+        """
+        Constructor
+        """
+        self.__codec = codec                        # JSONCodec
+
+        self.__schemas = {}                         # dict of skeleton JSON: (schema id, template)
+        self.__layouts = {}                         # dict of (schema id, codes): layout encoder
+
+        self.__template = None                      # DocumentTemplate
+        self.__encoders = {}                        # dict of type tuple: layout encoder, for self.__template
+
+        self.__started = False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def encode(self, document):
+        if document.__class__ is PathDict:
+            document = document.node()
+
+        # fast path - same schema, same leaf types...
+        if self.__template is not None:
+            try:
+                values = self.__template.extract(document)
+                return self.__encoders[tuple(map(type, values))](values)
+
+            except (TemplateMismatch, KeyError, struct.error):
+                pass
+
+        return self.__encode(document)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __encode(self, document):
+        frames = []
+
+        if not self.__started:
+            frames.append(BinaryFormat.MAGIC)
+            self.__started = True
+
+        # non-JSON values - for example, LocalizedDatetime...
+        if isinstance(document, JSONable) or not self.__is_native(document):
+            document = json.loads(self.__codec.dumps(document))
+
+        # schema...
+        skeleton = DocumentTemplate.construct_skeleton(document)
+        skeleton_jstr = json.dumps(skeleton)
+
+        if skeleton_jstr not in self.__schemas:
+            schema_id = len(self.__schemas)
+            self.__check_id(schema_id)
+
+            self.__schemas[skeleton_jstr] = (schema_id, DocumentTemplate.construct(skeleton))
+            frames.append(BinaryFormat.frame(BinaryFormat.SCHEMA, BinaryFormat.ID.pack(schema_id) +
+                                             skeleton_jstr.encode('utf-8')))
+
+        schema_id, template = self.__schemas[skeleton_jstr]
+
+        if template is not self.__template:
+            self.__template = template
+            self.__encoders = {}
+
+        # layout...
+        values = template.extract(document)
+        codes = ''.join(BinaryFormat.code(value) for value in values)
+
+        key = (schema_id, codes)
+
+        if key not in self.__layouts:
+            layout_id = len(self.__layouts)
+            self.__check_id(layout_id)
+
+            self.__layouts[key] = self.__layout_encoder(layout_id, codes)
+            frames.append(BinaryFormat.frame(BinaryFormat.LAYOUT, BinaryFormat.ID.pack(layout_id) +
+                                             BinaryFormat.ID.pack(schema_id) + codes.encode('ascii')))
+
+        encoder = self.__layouts[key]
+
+        if 'j' not in codes:
+            self.__encoders[tuple(map(type, values))] = encoder
+
+        frames.append(encoder(values))
+
+        return b''.join(frames)
+
+
+    def __layout_encoder(self, layout_id, codes):
+        fixed = struct.Struct(BinaryFormat.fixed_format(codes))
+        lines = ["def encode(v):"]
+
+        args = []
+        tails = []
+
+        for i, code in enumerate(codes):
+            if code == 'n':
+                continue
+
+            if code == 's':
+                lines.append("    s%d = v[%d].encode('utf-8')" % (i, i))
+
+            elif code == 'j':
+                lines.append("    s%d = dumps(v[%d]).encode('utf-8')" % (i, i))
+
+            else:
+                args.append("v[%d]" % i)
+                continue
+
+            args.append("len(s%d)" % i)
+            tails.append("s%d" % i)
+
+        size = "%d%s" % (fixed.size - BinaryFormat.FRAME_HEADER.size, ''.join(" + len(%s)" % tail for tail in tails))
+        packed = "pack(b'D', %s, %d%s)" % (size, layout_id, ''.join(", %s" % arg for arg in args))
+
+        if tails:
+            lines.append("    return b''.join((%s, %s))" % (packed, ', '.join(tails)))
+        else:
+            lines.append("    return %s" % packed)
+
+        namespace = {'pack': fixed.pack, 'dumps': self.__codec.dumps}
+        exec('\n'.join(lines), namespace)
+
+        return namespace['encode']
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __is_native(cls, node):
+        if isinstance(node, dict):
+            return all(isinstance(key, str) and cls.__is_native(value) for key, value in node.items())
+
+        if isinstance(node, list):
+            return all(cls.__is_native(item) for item in node)
+
+        return node is None or isinstance(node, (str, int, float))
+
+
+    @staticmethod
+    def __check_id(identifier):
+        if identifier > BinaryFormat.MAX_ID:
+            raise ValueError("too many distinct document schemas or layouts in stream")
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BinaryEncoder:{schemas:%d, layouts:%d}" % (len(self.__schemas), len(self.__layouts))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BinaryDecoder(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__templates = {}                       # dict of schema id: DocumentTemplate
+        self.__decoders = {}                        # dict of layout id: layout decoder
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def documents(self, blocks):
+        buffer = b''
+        started = False
+
+        decoders = self.__decoders
+        unpack_header = BinaryFormat.FRAME_ID_HEADER.unpack_from
+
+        header_size = BinaryFormat.FRAME_HEADER.size            # type and length
+        payload_offset = BinaryFormat.FRAME_ID_HEADER.size      # type, length and id
+
+        for block in blocks:
+            buffer = buffer + block if buffer else block
+            offset = 0
+
+            if not started:
+                if len(buffer) < len(BinaryFormat.MAGIC):
+                    continue
+
+                if not buffer.startswith(BinaryFormat.MAGIC):
+                    raise ValueError("not a binary document stream")
+
+                offset = len(BinaryFormat.MAGIC)
+                started = True
+
+            size = len(buffer)
+
+            while offset + payload_offset <= size:
+                frame_type, length, identifier = unpack_header(buffer, offset)
+                end = offset + header_size + length
+
+                if end > size:
+                    break
+
+                if frame_type == BinaryFormat.DOCUMENT:
+                    yield decoders[identifier](buffer, offset + payload_offset)
+
+                elif frame_type == BinaryFormat.LAYOUT:
+                    self.__layout(identifier, buffer[offset + payload_offset:end])
+
+                elif frame_type == BinaryFormat.SCHEMA:
+                    self.__schema(identifier, buffer[offset + payload_offset:end])
+
+                else:
+                    raise ValueError("unknown frame type: %s" % frame_type)
+
+                offset = end
+
+            buffer = buffer[offset:]
+
+        if buffer:
+            raise ValueError("truncated binary document stream")
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __schema(self, schema_id, payload):
+        skeleton = json.loads(payload.decode('utf-8'))
+
+        self.__templates[schema_id] = DocumentTemplate.construct(skeleton)
+
+
+    def __layout(self, layout_id, payload):
+        schema_id, = BinaryFormat.ID.unpack_from(payload)
+        codes = payload[BinaryFormat.ID.size:].decode('ascii')
+
+        template = self.__templates[schema_id]
+
+        fixed = struct.Struct('<' + ''.join(BinaryFormat.STRUCT_CODES[code] for code in codes))
+        lines = ["def decode(p, o):", "    f = unpack_from(p, o)", "    o += %d" % fixed.size]
+
+        field = 0
+
+        for i, code in enumerate(codes):
+            if code == 'n':
+                lines.append("    v%d = None" % i)
+                continue
+
+            if code in 'sj':
+                lines.append("    e = o + f[%d]" % field)
+                lines.append("    v%d = %s(p[o:e].decode('utf-8'))" % (i, 'loads' if code == 'j' else ''))
+                lines.append("    o = e")
+
+            else:
+                lines.append("    v%d = f[%d]" % (i, field))
+
+            field += 1
+
+        lines.append("    return %s" % template.expression)
+
+        namespace = {'unpack_from': fixed.unpack_from, 'loads': json.loads}
+        exec('\n'.join(lines), namespace)
+
+        self.__decoders[layout_id] = namespace['decode']
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BinaryDecoder:{schemas:%d, layouts:%d}" % (len(self.__templates), len(self.__decoders))
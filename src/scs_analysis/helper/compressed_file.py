@@ -0,0 +1,77 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A CompressedFile opens a file that is compressed according to the suffix of its filename - .gz (gzip), .bz2 (bzip2)
+or .xz (LZMA) - as a stream, so that the file is compressed or decompressed as it is written or read, without an
+intermediate file. Other files are opened as they are by open(..).
+
+A gzip file that is still being written, or that was not closed - for example, because of a power failure - has no
+end-of-stream marker. Reading it raises EOFError once all of the data that was written before its last sync point has
+been read.
+
+Text written to a gzip file is held by the compressor until sync(..) is called, or the file is closed. Each sync
+point costs a little compression, so should not be made for every row. bzip2 and LZMA streams do not support sync
+points: sync(..) flushes only the text buffer.
+
+https://docs.python.org/3/library/archiving.html
+"""
+
+import bz2
+import gzip
+import lzma
+import os
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CompressedFile(object):
+    """
+    classdocs
+    """
+
+    CODECS = {'.gz': gzip, '.bz2': bz2, '.xz': lzma}
+
+    GZIP_SUFFIX = '.gz'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def codec(cls, filename):
+        if filename is None:
+            return None
+
+        return cls.CODECS.get(os.path.splitext(filename)[1].lower())
+
+
+    @classmethod
+    def is_compressed(cls, filename):
+        return cls.codec(filename) is not None
+
+
+    @classmethod
+    def uncompressed_name(cls, filename):
+        return os.path.splitext(filename)[0] if cls.is_compressed(filename) else filename
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def open(cls, filename, mode="r", newline=None):
+        codec = cls.codec(filename)
+
+        if codec is None:
+            return open(filename, mode, newline=newline)
+
+        if 'b' in mode:
+            return codec.open(filename, mode)
+
+        return codec.open(filename, mode + 't', newline=newline)
+
+
+    @staticmethod
+    def sync(file):
+        file.flush()                                # a gzip stream is flushed with Z_SYNC_FLUSH
@@ -4,9 +4,16 @@ Created on 2 Mar 2019
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 
 source repo: scs_analysis
+
+A CSVCollator writes each document to the CSV file of the bin of its value. The bins share a CSVWriterPool, so that
+no more than max_open files are open at once, however many bins there are. Each bin holds its documents in memory
+until they amount to BUFFER_SIZE characters of JSON, then writes them to its file as a block - a file that has been
+closed by the pool is reopened only once per block. Each file is written from the start, with its header written
+once. The file of a bin that receives no documents is left empty.
 """
 
-from scs_core.csv.csv_writer import CSVWriter
+from scs_analysis.helper.csv_writer_pool import CSVWriterPool
+
 from scs_core.data.datum import Datum
 
 
@@ -20,7 +27,8 @@ class CSVCollator(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
-    def construct(cls, dataset_lower, dataset_upper, delta, file_prefix):
+    def construct(cls, dataset_lower, dataset_upper, delta, file_prefix, max_open=CSVWriterPool.DEFAULT_MAX_OPEN):
+        pool = CSVWriterPool(max_open=max_open)
         bins = []
 
         bin_lower = dataset_lower
@@ -28,22 +36,23 @@ class CSVCollator(object):
 
         while bin_lower < dataset_upper:
             bin_upper = bin_lower + delta
-            bins.append(CSVCollatorBin.construct(bin_lower, bin_upper, file_prefix, form))
+            bins.append(CSVCollatorBin.construct(bin_lower, bin_upper, file_prefix, form, pool))
 
             bin_lower = bin_upper
 
-        return CSVCollator(dataset_lower, delta, bins)
+        return CSVCollator(dataset_lower, delta, bins, pool)
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, dataset_lower, delta, bins):
+    def __init__(self, dataset_lower, delta, bins, pool):
         """
         Constructor
         """
         self.__dataset_lower = dataset_lower            # float
         self.__delta = delta                            # float
         self.__bins = bins                              # array of CSVCollatorBin
+        self.__pool = pool                              # CSVWriterPool
 
         self.__max_bin_index = len(bins) - 1            # int
 
@@ -65,6 +74,8 @@ class CSVCollator(object):
         for b in self.__bins:
             b.close()
 
+        self.__pool.close()
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
@@ -83,11 +94,16 @@ class CSVCollator(object):
         return self.__bins
 
 
+    @property
+    def pool(self):
+        return self.__pool
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "CSVCollator:{dataset_lower:%s, delta:%s, bins:%s}" % \
-               (self.dataset_lower, self.delta, self.bins)
+        return "CSVCollator:{dataset_lower:%s, delta:%s, bins:%s, pool:%s}" % \
+               (self.dataset_lower, self.delta, self.bins, self.pool)
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -97,14 +113,15 @@ class CSVCollatorBin(object):
     classdocs
     """
 
+    BUFFER_SIZE =       65536                           # characters
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
-    def construct(cls, lower, upper, file_prefix, form):
+    def construct(cls, lower, upper, file_prefix, form, pool):
         file_name = file_prefix + cls.__infix(form, lower) + cls.__infix(form, upper) + '.csv'
-        writer = CSVWriter(file_name)
 
-        return CSVCollatorBin(lower, upper, writer)
+        return CSVCollatorBin(lower, upper, file_name, pool)
 
 
     @classmethod
@@ -114,27 +131,45 @@ class CSVCollatorBin(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, lower, upper, writer):
+    def __init__(self, lower, upper, file_name, pool):
         """
         Constructor
         """
         self.__lower = lower                            # float
         self.__upper = upper                            # float
-        self.__writer = writer                          # CSVWriter
+        self.__file_name = file_name                    # string
+        self.__pool = pool                              # CSVWriterPool
 
+        self.__buffer = []                              # array of string
+        self.__buffer_size = 0                          # int
         self.__count = 0                                # int
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def write(self, datum):
-        self.__writer.write(datum)
+    def write(self, jstr):
+        self.__buffer.append(jstr)
+        self.__buffer_size += len(jstr)
 
         self.__count += 1
 
+        if self.__buffer_size >= self.BUFFER_SIZE:
+            self.flush()
+
+
+    def flush(self):
+        for jstr in self.__buffer:
+            self.__pool.write(self.file_name, jstr)
+
+        self.__buffer = []
+        self.__buffer_size = 0
+
 
     def close(self):
-        self.__writer.close()
+        self.flush()
+
+        if self.count == 0:
+            open(self.file_name, "w").close()           # as for the previous run, the file is emptied
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -149,6 +184,11 @@ class CSVCollatorBin(object):
         return self.__upper
 
 
+    @property
+    def file_name(self):
+        return self.__file_name
+
+
     @property
     def count(self):
         return self.__count
@@ -157,5 +197,5 @@ class CSVCollatorBin(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "CSVCollatorBin:{lower:%s, upper:%s, count:%s, writer:%s}" % \
-               (self.lower, self.upper, self.count, self.__writer)
+        return "CSVCollatorBin:{lower:%s, upper:%s, count:%s, file_name:%s}" % \
+               (self.lower, self.upper, self.count, self.file_name)
@@ -0,0 +1,325 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A CSVFilePool reads CSV files on a pool of worker processes, for the --workers mode of csv_reader. Converting rows to
+JSON documents is the costly part of csv_reader, and is done by the workers.
+
+Each file is memory-mapped and divided into parts - byte ranges of about RANGE_SIZE, which end on a line boundary
+that is not within a quoted field. (A newline is outside any quoted field if the number of quote characters before it
+is even - escaped quotes are doubled, so do not change the parity.) A worker reads its part with a CSVTemplateReader,
+given the header row of the file, so that rows are converted exactly as they are when the file is read from the start.
+The parts are returned in order.
+
+No more than IN_FLIGHT parts per worker are outstanding, and the boundaries of the parts are found as they are
+needed, so that memory use is bounded by RANGE_SIZE, and not by the size of the files. A file with an unbalanced quote
+character - which the csv module accepts within an unquoted field - may yield larger parts.
+
+For each part, parts(..) yields a tuple of the filename, the index of the part within the file, whether it is the
+last part of the file, the description of the file's reader, the list of its rows - up to the limit, if one is
+given - and the exception that terminated the reading of the part, or None. A file that cannot be found is reported
+as a single part with a FileNotFoundError.
+
+A compressed file - see CompressedFile - cannot be memory-mapped, and is decompressed as a stream by the pool itself.
+The stream is divided into parts in the same way, and the bytes of each part are passed to a worker, with the header
+row. A compressed file that ends without its end-of-stream marker is reported with a CSVReaderException on its last
+part.
+"""
+
+import io
+import mmap
+import multiprocessing
+import os
+import signal
+
+from collections import deque
+
+from scs_analysis.helper.compressed_file import CompressedFile
+from scs_analysis.helper.csv_template_reader import CSVTemplateReader
+
+from scs_core.csv.csv_reader import CSVReaderException
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVFilePool(object):
+    """
+    classdocs
+    """
+
+    IN_FLIGHT =         2                           # parts per worker
+    RANGE_SIZE =        8 * 1024 * 1024             # bytes
+    BLOCK_SIZE =        io.DEFAULT_BUFFER_SIZE      # bytes, read from a compressed stream
+
+    __worker = None                                 # (numeric_cast, empty_string_as_null, columns, limit)
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, workers, numeric_cast=True, empty_string_as_null=False, columns=None, limit=None):
+        return cls(multiprocessing.get_context('fork'), workers, numeric_cast, empty_string_as_null, columns, limit)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def initialise(cls, numeric_cast, empty_string_as_null, columns, limit):
+        signal.signal(signal.SIGINT, signal.SIG_IGN)  # KeyboardInterrupt is handled by the utility
+
+        cls.__worker = (numeric_cast, empty_string_as_null, columns, limit)
+
+
+    @classmethod
+    def read(cls, filename, header_end, start, end):
+        with open(filename, 'rb') as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                data = mapped[:header_end] + mapped[start:end]
+
+        return cls.read_bytes(data)
+
+
+    @classmethod
+    def read_bytes(cls, data):
+        numeric_cast, empty_string_as_null, columns, limit = cls.__worker
+
+        text = io.TextIOWrapper(io.BytesIO(data))
+        reader = CSVTemplateReader(text, numeric_cast=numeric_cast, empty_string_as_null=empty_string_as_null,
+                                   columns=columns)
+        rows = []
+
+        try:
+            for datum in reader.rows():
+                if limit is not None and len(rows) >= limit:
+                    break
+
+                rows.append(datum)
+
+        except CSVReaderException as ex:
+            return rows, ex
+
+        return rows, None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __boundary(cls, mapped, start, candidate, size):
+        quotes = cls.__quotes(mapped, start, candidate)
+        position = candidate
+
+        while position < size:
+            newline = mapped.find(b'\n', position)
+
+            if newline < 0:
+                break
+
+            quotes += cls.__quotes(mapped, position, newline)
+
+            if quotes % 2 == 0:
+                return newline + 1
+
+            position = newline + 1
+
+        return size
+
+
+    @classmethod
+    def __quotes(cls, mapped, start, end):
+        count = 0
+
+        for offset in range(start, end, cls.RANGE_SIZE):
+            count += mapped[offset:min(offset + cls.RANGE_SIZE, end)].count(b'"')
+
+        return count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, context, workers, numeric_cast, empty_string_as_null, columns, limit):
+        """
+        Constructor
+        """
+        self.__context = context                    # multiprocessing context
+        self.__workers = workers                    # int
+        self.__numeric_cast = numeric_cast          # bool
+        self.__empty_string_as_null = empty_string_as_null  # bool
+        self.__columns = columns                    # array of string or None
+        self.__limit = limit                        # int or None
+
+        self.__pool = None                          # multiprocessing.Pool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def parts(self, filenames):
+        self.__pool = self.__context.Pool(self.__workers, initializer=CSVFilePool.initialise,
+                                          initargs=(self.__numeric_cast, self.__empty_string_as_null, self.__columns,
+                                                    self.__limit))
+
+        capacity = self.__workers * self.IN_FLIGHT
+        pending = deque()
+
+        for filename in filenames:
+            for part in self.__parts(filename):
+                pending.append(part)
+
+                while len(pending) >= capacity:
+                    yield self.__result(pending.popleft())
+
+        while pending:
+            yield self.__result(pending.popleft())
+
+
+    def close(self):
+        if self.__pool is None:
+            return
+
+        self.__pool.terminate()
+        self.__pool.join()
+
+        self.__pool = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __parts(self, filename):
+        try:
+            reader = CSVTemplateReader.construct_for_file(filename, numeric_cast=self.__numeric_cast,
+                                                          empty_string_as_null=self.__empty_string_as_null,
+                                                          columns=self.__columns)
+        except FileNotFoundError as ex:
+            yield filename, 0, True, None, None, ex
+            return
+
+        description = str(reader)
+        reader.close()
+
+        tasks = self.__stream_tasks(filename) if CompressedFile.is_compressed(filename) else self.__tasks(filename)
+
+        index = 0
+        previous = None
+        error = None
+
+        try:
+            for task in tasks:
+                if previous is not None:
+                    yield filename, index, False, description, self.__submit(previous), None
+                    index += 1
+
+                previous = task
+
+        except EOFError as ex:                      # a compressed file that was not closed
+            error = CSVReaderException(ex)
+
+        result = None if previous is None else self.__submit(previous)
+
+        yield filename, index, True, description, result, error
+
+
+    def __tasks(self, filename):
+        with open(filename, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+
+            if size == 0:
+                return
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                header_end = self.__boundary(mapped, 0, 0, size)
+                start = header_end
+
+                while start < size:
+                    candidate = min(start + self.RANGE_SIZE, size)
+                    end = size if candidate == size else self.__boundary(mapped, start, candidate, size)
+
+                    yield CSVFilePool.read, (filename, header_end, start, end)
+
+                    start = end
+
+
+    def __stream_tasks(self, filename):
+        with CompressedFile.open(filename, 'rb') as file:
+            header = [file.readline()]
+            self.__complete_row(file, header)
+            header = b''.join(header)
+
+            while True:
+                lines = []
+
+                try:
+                    self.__read_part(file, lines)
+
+                except EOFError:                    # the rows before the end of the stream are read
+                    data = b''.join(lines)
+                    yield CSVFilePool.read_bytes, (header + data[:data.rfind(b'\n') + 1], )
+                    raise
+
+                data = b''.join(lines)
+
+                if not data:
+                    return
+
+                yield CSVFilePool.read_bytes, (header + data, )
+
+
+    def __read_part(self, file, lines):
+        size = 0
+
+        while size < self.RANGE_SIZE:
+            block = file.read1(self.BLOCK_SIZE)
+
+            if not block:
+                return
+
+            lines.append(block)
+            size += len(block)
+
+        self.__complete_row(file, lines)
+
+
+    @staticmethod
+    def __complete_row(file, lines):
+        quotes = sum(line.count(b'"') for line in lines)
+        line = lines[-1]
+
+        while line and (not line.endswith(b'\n') or quotes % 2 != 0):
+            line = file.readline()
+
+            lines.append(line)
+            quotes += line.count(b'"')
+
+
+    def __submit(self, task):
+        function, args = task
+
+        return self.__pool.apply_async(function, args)
+
+
+    @staticmethod
+    def __result(part):
+        filename, index, last, description, result, ex = part
+
+        if result is None:
+            return filename, index, last, description, [], ex
+
+        rows, error = result.get()
+
+        return filename, index, last, description, rows, ex if error is None else error
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def workers(self):
+        return self.__workers
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVFilePool:{workers:%s, in_flight:%s, range_size:%s, numeric_cast:%s, empty_string_as_null:%s, " \
+               "columns:%s, limit:%s}" % \
+               (self.workers, self.IN_FLIGHT, self.RANGE_SIZE, self.__numeric_cast, self.__empty_string_as_null,
+                self.__columns, self.__limit)
@@ -0,0 +1,236 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A CSVLogArchiver compresses the day files of a csv_logger log once they are closed, on a background thread, so that
+the live write path is never held up. Each file is compressed with gzip to FILENAME.gz - which is read by csv_reader
+without a separate decompression stage - and the uncompressed file is then deleted. The CSVLogManifest of the file is
+kept, since it is named for the uncompressed file, and its offsets are positions in the uncompressed CSV text.
+
+The thread runs at low priority: it is given a niceness of NICENESS, where the host allows the priority of a single
+thread to be set, and gives way to the writer between blocks.
+
+The compressed file is written to FILENAME.gz.part, forced to the storage medium, and renamed, before the uncompressed
+file is deleted: a power failure loses neither. A file is not compressed unless the volume has room for the
+uncompressed size, with the CSVLogger's reserve to spare - otherwise, it is left for oldest-first deletion. Since the
+CSVLogger deletes files until there is enough free space, deletion counts the compressed size of each archived file.
+
+On scan(..), the files of the log that are not compressed - left by earlier runs - are queued, together with any
+partial compressed files, which are deleted. The files of the log are those of the same topic and tag. A file that is
+deleted by the CSVLogger while it is being compressed is not archived.
+
+https://docs.python.org/3/library/gzip.html
+"""
+
+import gzip
+import os
+import queue
+import sys
+import threading
+import time
+
+from scs_analysis.helper.compressed_file import CompressedFile
+
+from scs_core.csv.csv_log import CSVLogFile
+
+from scs_core.sys.filesystem import Filesystem
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVLogArchiver(object):
+    """
+    classdocs
+    """
+
+    NICENESS =              19                      # lowest priority
+    BLOCK_SIZE =            1048576                 # 1MB
+
+    MIN_FREE_SPACE =        10485760                # 10MB, as for the CSVLogger
+
+    __PART_SUFFIX =         '.part'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, host, log, verbose=False):
+        """
+        Constructor
+        """
+        self.__host = host                          # Host
+        self.__log = log                            # CSVLog
+        self.__verbose = bool(verbose)              # bool
+
+        self.__queue = queue.Queue()
+        self.__thread = threading.Thread(target=self.__run, name='CSVLogArchiver', daemon=True)
+        self.__closing = threading.Event()
+
+        self.__archived_count = 0                   # int
+        self.__skipped_count = 0                    # int
+        self.__bytes_in = 0                         # int
+        self.__bytes_out = 0                        # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start(self):
+        self.__thread.start()
+
+
+    def put(self, path):
+        self.__queue.put((self.__archive, path))
+
+
+    def scan(self, current_path):
+        self.__queue.put((self.__scan, current_path))
+
+
+    def close(self):
+        self.__closing.set()
+        self.__queue.put(None)
+
+        if self.__thread.ident is not None:
+            self.__thread.join()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __run(self):
+        try:
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), self.NICENESS)
+        except (AttributeError, OSError):
+            pass                                    # the process priority is unchanged
+
+        while not self.__closing.is_set():
+            task = self.__queue.get()
+
+            if task is None:
+                return
+
+            function, path = task
+
+            try:
+                function(path)
+
+            except OSError as ex:
+                print("CSVLogArchiver: %s: %s" % (path, ex), file=sys.stderr)
+                sys.stderr.flush()
+
+
+    def __scan(self, current_path):
+        for container in Filesystem.ls(self.__log.root_path):
+            if not container.is_directory:
+                continue
+
+            for file in Filesystem.ls(container.path()):
+                if file.is_directory or not self.__is_own(file):
+                    continue
+
+                path = file.path()
+
+                if path.endswith(self.__PART_SUFFIX):
+                    os.remove(path)                 # interrupted by an earlier run
+
+                elif file.has_suffix('csv') and path != current_path:
+                    self.put(path)
+
+
+    def __is_own(self, file):
+        log_file = CSVLogFile.construct(file)
+
+        if log_file is None:
+            return False
+
+        return log_file.topic_subject == self.__log.topic_subject and log_file.tag == self.__log.tag
+
+
+    def __archive(self, path):
+        if not os.path.exists(path):
+            return
+
+        size = os.path.getsize(path)
+
+        if self.__host.disk_usage(self.__log.root_path).free < size + self.MIN_FREE_SPACE:
+            self.__skipped_count += 1
+            return
+
+        archive_path = path + CompressedFile.GZIP_SUFFIX
+        part_path = archive_path + self.__PART_SUFFIX
+
+        # compress...
+        with open(path, 'rb') as fin, gzip.open(part_path, 'wb') as fout:
+            while True:
+                if self.__closing.is_set():
+                    break
+
+                block = fin.read(self.BLOCK_SIZE)
+
+                if not block:
+                    break
+
+                fout.write(block)
+                time.sleep(0)                       # give way to the writer
+
+        if self.__closing.is_set():
+            os.remove(part_path)                    # the file is archived on the next run
+            return
+
+        self.__fsync_path(part_path)
+
+        # replace...
+        os.replace(part_path, archive_path)
+
+        if not os.path.exists(path):
+            os.remove(archive_path)                 # deleted to recover space while it was being compressed
+            return
+
+        os.remove(path)
+
+        self.__archived_count += 1
+        self.__bytes_in += size
+        self.__bytes_out += os.path.getsize(archive_path)
+
+        if self.__verbose:
+            print("CSVLogArchiver: archived: %s" % archive_path, file=sys.stderr)
+            sys.stderr.flush()
+
+
+    @staticmethod
+    def __fsync_path(path):
+        fd = os.open(path, os.O_RDONLY)
+
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def status(self):
+        ratio = self.__bytes_in / self.__bytes_out if self.__bytes_out else 0.0
+
+        return "archived: %d skipped: %d pending: %d bytes: %d -> %d ratio: %0.1f" % \
+               (self.__archived_count, self.__skipped_count, self.__queue.qsize(), self.__bytes_in,
+                self.__bytes_out, ratio)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def log(self):
+        return self.__log
+
+
+    @property
+    def archived_count(self):
+        return self.__archived_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVLogArchiver:{log:%s, niceness:%s, block_size:%s, verbose:%s}" % \
+               (self.log, self.NICENESS, self.BLOCK_SIZE, self.__verbose)
@@ -0,0 +1,237 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A CSVLogManifest summarises a csv_logger log file on its rec path: the number of rows, the earliest and latest rec
+values, and the byte offset of the first row of each UTC hour. The manifest is held in a sidecar file next to the log
+file, named FILENAME.manifest - the name of a compressed log file is taken without its compression suffix, so that
+the manifest of a day file is kept when the file is compressed. Offsets are positions in the uncompressed CSV text.
+
+The manifest is maintained by the CSVLogger as it writes, and saved when the first row is written, at the start of
+each hour, and when the log file is closed. The manifest of a file that is still being written - or that was not
+closed - may not include the latest rows: its latest rec value is not used.
+
+A manifest is used by csv_reader, in the --start / --end mode, in place of a CSVWindowIndex: a file whose rows are all
+outside the window is not opened, and the reader seeks to the start of the hour of the start of the window. Hourly
+offsets are recorded only while rec values are in non-decreasing order.
+"""
+
+import bisect
+
+from collections import OrderedDict
+
+from scs_analysis.helper.compressed_file import CompressedFile
+
+from scs_core.data.datum import Datum
+from scs_core.data.json import JSONReport
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVLogManifest(JSONReport):
+    """
+    classdocs
+    """
+
+    PATH =      'rec'
+    SUFFIX =    'manifest'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def sidecar(cls, filename):
+        return '.'.join((CompressedFile.uncompressed_name(filename), cls.SUFFIX))
+
+
+    @classmethod
+    def find(cls, filename):
+        try:
+            return cls.load(cls.sidecar(filename))
+        except (OSError, TypeError, ValueError):    # unreadable or malformed - the log file is read without it
+            return None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, header_end):
+        return cls(cls.PATH, header_end, 0, None, None, True, False, [])
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        path = jdict.get('path')
+        header_end = jdict.get('header-end')
+        rows = jdict.get('rows')
+        min_rec = jdict.get('min-rec')
+        max_rec = jdict.get('max-rec')
+        is_sorted = jdict.get('sorted')
+        is_closed = jdict.get('closed')
+        hours = [tuple(hour) for hour in jdict.get('hours')]
+
+        return cls(path, header_end, rows, min_rec, max_rec, is_sorted, is_closed, hours)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path, header_end, rows, min_rec, max_rec, is_sorted, is_closed, hours):
+        """
+        Constructor
+        """
+        self.__path = path                          # string
+        self.__header_end = int(header_end)         # int byte offset
+        self.__rows = int(rows)                     # int
+        self.__min_rec = min_rec                    # string ISO 8601 or None
+        self.__max_rec = max_rec                    # string ISO 8601 or None
+        self.__is_sorted = bool(is_sorted)          # bool
+        self.__is_closed = bool(is_closed)          # bool
+        self.__hours = hours                        # array of (string ISO 8601 hour, int byte offset)
+
+        self.__min = Datum.datetime(min_rec)        # LocalizedDatetime
+        self.__max = Datum.datetime(max_rec)        # LocalizedDatetime
+        self.__latest = self.__max                  # LocalizedDatetime: the rec of the latest row
+        self.__hour = None                          # datetime: the UTC hour of the latest row
+        self.__values = None                        # array of LocalizedDatetime
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # writing...
+
+    @staticmethod
+    def hour(rec):
+        return rec.utc_datetime.replace(minute=0, second=0, microsecond=0)
+
+
+    def is_new_hour(self, rec):
+        return self.__is_sorted and (self.__latest is None or rec >= self.__latest) and self.hour(rec) != self.__hour
+
+
+    def add(self, value, rec, offset=None):
+        self.__rows += 1
+
+        if rec is None:
+            return
+
+        if self.__min is None or rec < self.__min:
+            self.__min, self.__min_rec = rec, value
+
+        if self.__max is None or rec > self.__max:
+            self.__max, self.__max_rec = rec, value
+
+        if self.__latest is not None and rec < self.__latest:
+            self.__is_sorted = False
+
+        if offset is not None:                      # the row starts a new hour
+            self.__hour = self.hour(rec)
+            self.__hours.append((self.__hour.isoformat(), offset))
+
+        self.__latest = rec
+
+
+    def close(self):
+        self.__is_closed = True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # reading...
+
+    def overlaps(self, start, end):
+        if not self.is_closed:
+            return not (self.is_sorted and end is not None and self.__min is not None and self.__min >= end)
+
+        if self.__min is None:
+            return False
+
+        if end is not None and self.__min >= end:
+            return False
+
+        if start is not None and self.__max < start:
+            return False
+
+        return True
+
+
+    def offset(self, start):
+        if start is None or not self.is_sorted:
+            return self.header_end
+
+        if self.__values is None:
+            self.__values = [Datum.datetime(hour) for hour, _ in self.__hours]
+
+        i = bisect.bisect_right(self.__values, start)
+
+        return self.header_end if i == 0 else self.__hours[i - 1][1]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['path'] = self.path
+        jdict['header-end'] = self.header_end
+        jdict['rows'] = self.rows
+        jdict['min-rec'] = self.min_rec
+        jdict['max-rec'] = self.max_rec
+        jdict['sorted'] = self.is_sorted
+        jdict['closed'] = self.is_closed
+        jdict['hours'] = self.hours
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    @property
+    def header_end(self):
+        return self.__header_end
+
+
+    @property
+    def rows(self):
+        return self.__rows
+
+
+    @property
+    def min_rec(self):
+        return self.__min_rec
+
+
+    @property
+    def max_rec(self):
+        return self.__max_rec
+
+
+    @property
+    def is_sorted(self):
+        return self.__is_sorted
+
+
+    @property
+    def is_closed(self):
+        return self.__is_closed
+
+
+    @property
+    def hours(self):
+        return self.__hours
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVLogManifest:{path:%s, header_end:%s, rows:%s, min_rec:%s, max_rec:%s, is_sorted:%s, " \
+               "is_closed:%s, hours:%s}" % \
+               (self.path, self.header_end, self.rows, self.min_rec, self.max_rec, self.is_sorted,
+                self.is_closed, len(self.hours))
@@ -0,0 +1,218 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A CSVLogWriter decouples csv_logger from its storage medium. Documents are put on a bounded in-memory queue, and
+written to the CSVLogger by a writer thread, so that the reading of stdin never waits for the disk.
+
+The writer thread makes group commits: it appends a batch of rows to the log, then commits the batch with a single
+flush - and fsync, if the logger's policy requires it. If the logger has a write interval, a batch is committed when
+the interval has elapsed since its first document, or when it holds BATCH_RECORDS documents. Otherwise, a batch holds
+the documents that were queued while the previous batch was being written, up to BATCH_RECORDS - when the disk is
+slow, batches grow, so that the rate of commits falls but the rate of rows does not.
+
+Where the logger has a sync point pending - see CSVLogger.sync_due() - the writer thread commits when it is due, even
+if no further documents are received, so that the rows of a compressed log are never held in the compressor for more
+than the logger's SYNC_INTERVAL.
+
+put(..) never blocks: if the queue is full, the document is dropped, and counted. The depth of the queue, and the
+latency of each document - from put(..) to its commit - are recorded. If report is set, these are written to stderr
+every REPORT_INTERVAL seconds, while documents are received.
+
+A filesystem error inhibits writing, as it does for the synchronous csv_logger. The documents that are queued when
+close() is called are written before the logger is closed.
+
+https://docs.python.org/3/library/queue.html
+"""
+
+import queue
+import sys
+import threading
+import time
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVLogWriter(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_DEPTH =         100000                  # documents
+    BATCH_RECORDS =         1000                    # documents
+    REPORT_INTERVAL =       60.0                    # seconds
+
+    __CLOSE_TIMEOUT =       1.0                     # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, logger, depth=DEFAULT_DEPTH, batch_records=BATCH_RECORDS, report=False):
+        """
+        Constructor
+        """
+        self.__logger = logger                      # CSVLogger
+        self.__depth = int(depth)                   # int
+        self.__batch_records = int(batch_records)   # int
+        self.__report = bool(report)                # bool
+
+        self.__queue = queue.Queue(maxsize=self.__depth)
+        self.__thread = threading.Thread(target=self.__run, name='CSVLogWriter', daemon=True)
+
+        self.__record_count = 0                     # int
+        self.__commit_count = 0                     # int
+        self.__dropped_count = 0                    # int
+        self.__max_depth = 0                        # int
+        self.__total_latency = 0.0                  # float seconds
+        self.__max_latency = 0.0                    # float seconds
+        self.__latest_report = None                 # float monotonic time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start(self):
+        self.__latest_report = time.monotonic()
+        self.__thread.start()
+
+
+    def put(self, jstr):
+        try:
+            self.__queue.put_nowait((time.monotonic(), jstr))
+
+        except queue.Full:
+            if self.__dropped_count == 0:
+                print("CSVLogWriter: queue full - documents are being dropped", file=sys.stderr)
+                sys.stderr.flush()
+
+            self.__dropped_count += 1
+            return False
+
+        self.__max_depth = max(self.__max_depth, self.__queue.qsize())
+
+        return True
+
+
+    def close(self):
+        while self.__thread.is_alive():
+            try:
+                self.__queue.put(None, timeout=self.__CLOSE_TIMEOUT)
+                break
+
+            except queue.Full:
+                continue
+
+        if self.__thread.ident is not None:
+            self.__thread.join()
+
+        self.__logger.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __run(self):
+        interval = self.__logger.write_interval
+
+        while True:
+            try:
+                item = self.__queue.get(timeout=self.__logger.sync_due())
+
+            except queue.Empty:
+                self.__sync()
+                continue
+
+            if item is None:
+                return
+
+            batch = [item]
+            closing = False
+            deadline = time.monotonic() + interval
+
+            while len(batch) < self.__batch_records:
+                try:
+                    item = self.__queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+
+                if item is None:
+                    closing = True
+                    break
+
+                batch.append(item)
+
+            self.__commit(batch)
+
+            if closing:
+                return
+
+            if self.__report and time.monotonic() - self.__latest_report >= self.REPORT_INTERVAL:
+                print("CSVLogWriter: %s" % self.status(), file=sys.stderr)
+                sys.stderr.flush()
+
+                self.__latest_report = time.monotonic()
+
+
+    def __commit(self, batch):
+        try:
+            for _, jstr in batch:
+                self.__logger.append(jstr)
+
+            self.__logger.commit()
+
+        except OSError as ex:
+            self.__logger.writing_inhibited = True
+
+            print("CSVLogWriter: %s" % ex, file=sys.stderr)
+            sys.stderr.flush()
+
+        now = time.monotonic()
+
+        for put_time, _ in batch:
+            latency = now - put_time
+
+            self.__total_latency += latency
+            self.__max_latency = max(self.__max_latency, latency)
+
+        self.__record_count += len(batch)
+        self.__commit_count += 1
+
+
+    def __sync(self):
+        try:
+            self.__logger.commit()
+
+        except OSError as ex:
+            self.__logger.writing_inhibited = True
+
+            print("CSVLogWriter: %s" % ex, file=sys.stderr)
+            sys.stderr.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def status(self):
+        mean_latency = self.__total_latency / self.__record_count if self.__record_count else 0.0
+
+        return "depth: %d max_depth: %d records: %d commits: %d dropped: %d latency: mean: %0.3f max: %0.3f" % \
+               (self.__queue.qsize(), self.__max_depth, self.__record_count, self.__commit_count,
+                self.__dropped_count, mean_latency, self.__max_latency)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def logger(self):
+        return self.__logger
+
+
+    @property
+    def dropped_count(self):
+        return self.__dropped_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVLogWriter:{depth:%s, batch_records:%s, report:%s, logger:%s}" % \
+               (self.__depth, self.__batch_records, self.__report, self.logger)
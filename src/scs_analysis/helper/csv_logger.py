@@ -0,0 +1,387 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A CSVLogger is a drop-in replacement for the scs_core CSVLogger, for csv_logger. If compress is set, each day file is
+written as a gzip stream, named for the CSVLog file, with the suffix .gz.
+
+The rows of an uncompressed file are flushed on every write - or every write interval - as they are by the scs_core
+CSVLogger. The rows of a compressed file are flushed at a sync point, at most once every SYNC_INTERVAL seconds - a
+sync point costs a little compression, so is not made for every row. All of the rows written before a sync point can
+be read from the file, even if the file is not closed. A commit that comes too soon after a sync point leaves its rows
+pending: sync_due() gives the time until the pending sync point may be made by a further commit. The CSVLogWriter
+commits when it is due, whether or not more rows arrive, so that a power failure loses no more than the rows written
+in the last SYNC_INTERVAL seconds. The file is closed - and the gzip stream completed - at the end of each day.
+
+Rows may also be written by append(..), and made durable as a group by commit(..) - as they are by a CSVLogWriter.
+The fsync policy - see CSVLoggerConf - specifies whether a file is also forced to the storage medium on every commit,
+or when it is closed.
+
+A CSVLogManifest is maintained for each log file, and saved next to it when its first row is written, at the start of
+each hour, and when the file is closed. The manifest is deleted with its log file.
+
+If a CSVLogArchiver is given, each uncompressed file is queued for compression when it is closed, and the files left
+uncompressed by earlier runs are queued when the first file is opened.
+
+When space is recovered, compressed and uncompressed log files are deleted alike, oldest first.
+"""
+
+import csv
+import os
+import sys
+import time
+
+from scs_analysis.helper.compressed_file import CompressedFile
+from scs_analysis.helper.csv_log_manifest import CSVLogManifest
+from scs_analysis.helper.csv_logger_conf import CSVLoggerConf
+
+from scs_core.csv.csv_dict import CSVDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.datum import Datum
+
+from scs_core.sys.filesystem import Filesystem
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVLogger(object):
+    """
+    classdocs
+    """
+
+    SYNC_INTERVAL =         10.0                        # seconds
+
+    __MIN_FREE_SPACE =      10485760                    # 10MB
+
+    __SUFFIXES =            ('csv', 'csv' + CompressedFile.GZIP_SUFFIX)
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, host, log, delete_oldest, write_interval, compress=False, fsync=CSVLoggerConf.FSYNC_NONE,
+                 archiver=None):
+        """
+        Constructor
+        """
+        self.__host = host                              # Host
+        self.__log = log                                # CSVLog
+        self.__delete_oldest = delete_oldest            # bool
+        self.__write_interval = write_interval          # int
+        self.__compress = bool(compress)                # bool
+        self.__fsync = fsync                            # string
+        self.__archiver = archiver                      # CSVLogArchiver or None
+
+        self.__paths = None                             # array of string
+        self.__file = None                              # file handle
+        self.__file_path = None                         # string
+        self.__manifest = None                          # CSVLogManifest
+        self.__latest_write = None                      # timestamp
+        self.__latest_sync = None                       # timestamp
+        self.__sync_pending = False                     # bool
+        self.__writing_inhibited = False                # bool
+
+        self.__buffer = []                              # array of CSVDict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, jstr):
+        if self.writing_inhibited:
+            return None
+
+        if jstr is None or self.log is None:
+            return None
+
+        datum = CSVDict.construct_from_jstr(jstr)
+
+        if datum is None:
+            return None
+
+        # direct write...
+        if not self.write_interval:
+            self.__write(datum)
+            self.__flush()
+            return self.file_path()
+
+        # interval write...
+        now = time.time()
+
+        if self.__latest_write is None:
+            self.__latest_write = now
+
+        interval = now - self.__latest_write
+
+        # append to buffer...
+        if interval < self.write_interval:
+            self.__buffer.append(datum)
+            return self.file_path()
+
+        self.__latest_write = now
+
+        # deferred write...
+        for datum in self.__buffer:
+            self.__write(datum)
+
+        self.__flush()
+
+        self.__buffer = []
+
+        return self.file_path()
+
+
+    def append(self, jstr):
+        if self.writing_inhibited:
+            return None
+
+        if jstr is None or self.log is None:
+            return None
+
+        datum = CSVDict.construct_from_jstr(jstr)
+
+        if datum is None:
+            return None
+
+        self.__write(datum)
+
+        return self.file_path()
+
+
+    def commit(self):
+        self.__flush()
+
+
+    def sync_due(self):
+        if not self.__sync_pending:
+            return None
+
+        return max(0.0, self.__latest_sync + self.SYNC_INTERVAL - time.time())
+
+
+    def close(self):
+        if self.__file is None:
+            return
+
+        self.__file.close()
+        self.__file = None
+        self.__sync_pending = False
+
+        if self.__manifest is not None:
+            self.__manifest.close()
+            self.__manifest.save(CSVLogManifest.sidecar(self.__file_path))
+            self.__manifest = None
+
+        if self.fsync != CSVLoggerConf.FSYNC_NONE:
+            self.__fsync_path(self.__file_path)
+
+        if self.__archiver is not None and not self.compress:
+            self.__archiver.put(self.__file_path)
+
+
+    def file_path(self):
+        path = self.log.file_path()
+
+        return path + CompressedFile.GZIP_SUFFIX if self.compress else path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __write(self, datum):
+        # first run...
+        if not self.__file:
+            tag = datum.row(['tag'])[0]
+
+            if self.log.tag is None and tag is not None:
+                self.log.tag = tag
+
+            self.__open_file()
+
+            if self.__archiver is not None:
+                self.__archiver.scan(self.__file_path)
+
+        # start log for new day...
+        if not self.log.in_timeline(LocalizedDatetime.now().utc()):
+            self.close()
+            self.__open_file()
+
+        # write header...
+        if not self.__paths:
+            self.__paths = datum.paths()
+            self.__writer.writerow(self.__paths)
+
+        # update manifest...
+        if self.__manifest is None:
+            self.__manifest = CSVLogManifest.construct(self.__file.tell())
+
+        value = datum.row([CSVLogManifest.PATH])[0]
+        rec = Datum.datetime(value)
+
+        offset = self.__file.tell() if rec is not None and self.__manifest.is_new_hour(rec) else None
+        save = offset is not None or self.__manifest.rows == 0
+
+        self.__manifest.add(value, rec, offset=offset)
+
+        if save:
+            self.__manifest.save(CSVLogManifest.sidecar(self.__file_path))
+
+        # write row...
+        self.__writer.writerow(datum.row(self.__paths))
+        self.__sync_pending = self.compress
+
+
+    def __flush(self):
+        if self.__file is None:
+            return
+
+        if not self.compress:
+            self.__file.flush()
+
+        else:
+            # sync point...
+            now = time.time()
+
+            if self.__latest_sync is not None and now - self.__latest_sync < self.SYNC_INTERVAL:
+                return
+
+            CompressedFile.sync(self.__file)
+            self.__latest_sync = now
+            self.__sync_pending = False
+
+        if self.fsync == CSVLoggerConf.FSYNC_COMMIT:
+            os.fsync(self.__file.fileno())
+
+
+    @staticmethod
+    def __fsync_path(path):
+        fd = os.open(path, os.O_RDONLY)
+
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+    def __open_file(self):
+        self.log.timeline_start = LocalizedDatetime.now().utc()
+
+        self.__clear_space()
+        self.log.mkdir()
+
+        self.__file_path = self.file_path()
+        self.__file = CompressedFile.open(self.__file_path, "w")
+        self.__writer = csv.writer(self.__file, quoting=csv.QUOTE_MINIMAL)
+        self.__latest_sync = None
+
+        if self.__paths:
+            self.__writer.writerow(self.__paths)
+
+
+    def __clear_space(self):
+        if self.__has_sufficient_space():
+            return
+
+        # stop on no-delete...
+        if not self.delete_oldest:
+            print("CSVLogger.__clear_space: volume full.", file=sys.stderr)
+            self.writing_inhibited = True
+            return
+
+        # delete until enough free...
+        while not self.__has_sufficient_space():
+            success = self.__delete_oldest_log()
+
+            if not success:
+                print("CSVLogger.__clear_space: delete failed.", file=sys.stderr)
+                self.writing_inhibited = True
+                return
+
+
+    def __has_sufficient_space(self):
+        du = self.__host.disk_usage(self.log.root_path)
+
+        return du.free > self.__MIN_FREE_SPACE
+
+
+    def __delete_oldest_log(self):
+        # walk the directories...
+        containers = Filesystem.ls(self.log.root_path)
+
+        for container in containers:
+            if not container.is_directory:
+                continue
+
+            # walk the files...
+            files = Filesystem.ls(container.path())
+
+            for file in files:
+                if not file.is_directory and any(file.has_suffix(suffix) for suffix in self.__SUFFIXES):
+                    print("CSVLogger.__delete_oldest_log: deleting: %s" % file, file=sys.stderr)
+
+                    success = file.delete()
+
+                    if not success:
+                        return False
+
+                    manifest = CSVLogManifest.sidecar(file.path())
+
+                    if os.path.exists(manifest):
+                        os.remove(manifest)
+
+                    Filesystem.rmdir(container.path())          # remove empty directories
+
+                    return True
+
+        return False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def log(self):
+        return self.__log
+
+
+    @property
+    def delete_oldest(self):
+        return self.__delete_oldest
+
+
+    @property
+    def write_interval(self):
+        return self.__write_interval
+
+
+    @property
+    def compress(self):
+        return self.__compress
+
+
+    @property
+    def fsync(self):
+        return self.__fsync
+
+
+    @property
+    def archiver(self):
+        return self.__archiver
+
+
+    @property
+    def writing_inhibited(self):
+        return self.__writing_inhibited
+
+
+    @writing_inhibited.setter
+    def writing_inhibited(self, writing_inhibited):
+        self.__writing_inhibited = writing_inhibited
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVLogger:{log:%s, delete_oldest:%s, write_interval:%s, compress:%s, sync_interval:%s, fsync:%s, " \
+               "archiver:%s, writing_inhibited:%s}" % \
+               (self.log, self.delete_oldest, self.write_interval, self.compress, self.SYNC_INTERVAL, self.fsync,
+                self.archiver, self.writing_inhibited)
@@ -0,0 +1,139 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A CSVLoggerConf is a drop-in replacement for the scs_core CSVLoggerConf, for csv_logger and csv_logger_conf. The
+document is held in the same file, and a document written by the scs_core CSVLoggerConf is read without change.
+
+If compress is true, the csv_logger writes gzip-compressed log files. The fsync policy specifies when log files are
+forced to the storage medium: never - the operating system decides (none), after every group commit (commit), or
+when each log file is closed (close). If archive is true, uncompressed log files are compressed in the background
+once they are closed - see CSVLogArchiver.
+
+example JSON:
+{"root-path": "/home/pi/SCS/logs", "delete-oldest": true, "write-interval": 0, "compress": false, "fsync": "none",
+"archive": false}
+"""
+
+from collections import OrderedDict
+
+from scs_core.csv.csv_log import CSVLog
+from scs_core.data.json import PersistentJSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVLoggerConf(PersistentJSONable):
+    """
+    classdocs
+    """
+
+    FSYNC_NONE =        'none'
+    FSYNC_COMMIT =      'commit'
+    FSYNC_CLOSE =       'close'
+
+    FSYNC_POLICIES =    (FSYNC_NONE, FSYNC_COMMIT, FSYNC_CLOSE)
+
+    __FILENAME = "csv_logger_conf.json"
+
+    @classmethod
+    def persistence_location(cls, host):
+        return host.conf_dir(), cls.__FILENAME
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        root_path = jdict.get('root-path')
+        delete_oldest = jdict.get('delete-oldest')
+        write_interval = jdict.get('write-interval')
+        compress = jdict.get('compress', False)
+        fsync = jdict.get('fsync', cls.FSYNC_NONE)
+        archive = jdict.get('archive', False)
+
+        return CSVLoggerConf(root_path, delete_oldest, write_interval, compress, fsync, archive)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, root_path, delete_oldest, write_interval, compress, fsync, archive):
+        """
+        Constructor
+        """
+        if fsync not in self.FSYNC_POLICIES:
+            raise ValueError(fsync)
+
+        self.__root_path = root_path                            # string
+        self.__delete_oldest = bool(delete_oldest)              # bool
+        self.__write_interval = int(write_interval)             # int
+        self.__compress = bool(compress)                        # bool
+        self.__fsync = fsync                                    # string
+        self.__archive = bool(archive)                          # bool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def csv_log(self, topic_subject, tag=None, timeline_start=None):
+        return CSVLog(self.root_path, topic_subject, tag=tag, timeline_start=timeline_start)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['root-path'] = self.root_path
+        jdict['delete-oldest'] = self.delete_oldest
+        jdict['write-interval'] = self.write_interval
+        jdict['compress'] = self.compress
+        jdict['fsync'] = self.fsync
+        jdict['archive'] = self.archive
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def root_path(self):
+        return self.__root_path
+
+
+    @property
+    def delete_oldest(self):
+        return self.__delete_oldest
+
+
+    @property
+    def write_interval(self):
+        return self.__write_interval
+
+
+    @property
+    def compress(self):
+        return self.__compress
+
+
+    @property
+    def fsync(self):
+        return self.__fsync
+
+
+    @property
+    def archive(self):
+        return self.__archive
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVLoggerConf:{root_path:%s, delete_oldest:%s, write_interval:%s, compress:%s, fsync:%s, " \
+               "archive:%s}" %  \
+               (self.root_path, self.delete_oldest, self.write_interval, self.compress, self.fsync, self.archive)
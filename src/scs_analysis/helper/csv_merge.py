@@ -0,0 +1,86 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A CSVMerge performs a k-way merge of a number of sequences of JSON documents, each of which is already ordered by the
+value at the given path, for the --merge-on mode of csv_reader. The result is a single sequence, ordered by the
+value at the path. Documents with equal values are taken in the order of their sequences.
+
+Values that are ISO 8601 datetimes are compared as localised datetimes, so that documents reported with different
+UTC offsets are merged in time order. Other values are compared as they are.
+
+The merge holds one document from each sequence at a time, so that memory use is independent of the length of the
+sequences. A document that does not contain the path raises a ValueError.
+
+https://docs.python.org/3/library/heapq.html#heapq.merge
+"""
+
+import heapq
+
+from scs_analysis.helper.path_accessor import PathAccessor
+
+from scs_core.data.datetime import LocalizedDatetime
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVMerge(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, path, codec):
+        return cls(PathAccessor.construct(path), codec)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, accessor, codec):
+        """
+        Constructor
+        """
+        self.__accessor = accessor                  # PathAccessor
+        self.__codec = codec                        # JSONCodec
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def rows(self, sequences):
+        return heapq.merge(*sequences, key=self.__key)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __key(self, jstr):
+        datum = self.__codec.decode(jstr)
+
+        if datum is None or not self.__accessor.has(datum):
+            raise ValueError("merge path '%s' not in %s" % (self.path, jstr))
+
+        value = self.__accessor.node(datum)
+
+        if not isinstance(value, str):
+            return value
+
+        datetime = LocalizedDatetime.construct_from_iso8601(value)
+
+        return value if datetime is None else datetime
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__accessor.path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVMerge:{path:%s}" % self.path
@@ -0,0 +1,103 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A CSVPartitioner finds the partition file of each document, for the partitioned mode of csv_writer. A partition is
+given by the value of a path - for example, tag - and / or the UTC day or month of an ISO 8601 datetime path -
+typically rec. UTC is used, as it is by csv_logger, so that documents with different UTC offsets are partitioned alike.
+
+The name of the partition file is that of the given file, with the partition key inserted before its suffix - for
+example, climate.csv.gz is partitioned as climate-scs-ap1-6-2018-04-04.csv.gz. Characters that are not safe in a
+filename are replaced by the '_' character.
+
+A document whose path is missing or empty, or whose time path is not an ISO 8601 datetime, has no partition.
+"""
+
+import os
+import re
+
+from scs_analysis.helper.compressed_file import CompressedFile
+
+from scs_core.data.datum import Datum
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVPartitioner(object):
+    """
+    classdocs
+    """
+
+    TIME_UNITS = {'day': '%Y-%m-%d', 'month': '%Y-%m'}
+
+    __UNSAFE = re.compile(r'[^\w.+-]')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, filename, path=None, time_unit=None, time_path='rec'):
+        uncompressed = CompressedFile.uncompressed_name(filename)
+        stem, suffix = os.path.splitext(uncompressed)
+
+        time_format = None if time_unit is None else cls.TIME_UNITS[time_unit]
+
+        return cls(stem, suffix + filename[len(uncompressed):], path, time_format, time_path)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, stem, suffix, path, time_format, time_path):
+        """
+        Constructor
+        """
+        self.__stem = stem                          # string
+        self.__suffix = suffix                      # string
+        self.__path = path                          # string or None
+        self.__time_format = time_format            # string or None
+        self.__time_path = time_path                # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def filename(self, datum):
+        keys = []
+
+        if self.__path is not None:
+            value = self.__leaf(datum, self.__path)
+
+            if value is None or value == '':
+                return None
+
+            keys.append(self.__UNSAFE.sub('_', str(value)))
+
+        if self.__time_format is not None:
+            rec = Datum.datetime(self.__leaf(datum, self.__time_path))
+
+            if rec is None:
+                return None
+
+            keys.append(rec.utc_datetime.strftime(self.__time_format))
+
+        return '-'.join([self.__stem] + keys) + self.__suffix
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __leaf(datum, path):
+        if not datum.has_sub_path(path):
+            return None
+
+        value = datum.node(path)
+
+        return None if isinstance(value, (dict, list)) else value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVPartitioner:{stem:%s, suffix:%s, path:%s, time_format:%s, time_path:%s}" % \
+               (self.__stem, self.__suffix, self.__path, self.__time_format, self.__time_path)
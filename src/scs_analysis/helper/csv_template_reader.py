@@ -0,0 +1,416 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A CSVTemplateReader is a drop-in replacement for the scs_core CSVReader, for csv_reader. Rather than building a nested
+dictionary for each row, by inserting each cell at its header path, and then serialising the dictionary, the reader
+compiles the header once into a CSVRowTemplate - the JSON text of the document, with a placeholder for each leaf -
+and fills the template with the JSON text of each cell.
+
+The header is compiled by inserting a row of marker objects with the scs_core CSVHeader, so that the structure of the
+template - key order, list members, repeated and overwritten columns - is exactly that of the documents that the
+CSVHeader builds. A header whose paths clash is not compiled, and its rows are converted as they are by CSVReader.
+
+With numeric_cast, the type of each column is inferred from the first row, and selects the converter for the column:
+an int column tries int(..), a float column tries float(..) on cells that contain a decimal point, and a string column
+tries float(..) - any cell that int(..) accepts is also accepted by float(..). A cell that does not match the type of
+its column falls back to the full int(..) / float(..) / string cast, so the document written is always that of the
+CSVReader, byte for byte. Rows whose length does not match the header are also converted as they are by CSVReader.
+
+If columns are given, the template holds only the given paths - leaf or internal nodes - of the document. The
+projection is that of the node utility, found by applying the node algorithm to the compiled header, so that the
+selected subtrees are in the order of the given paths. The cells of other columns are not converted. If no column is
+selected, the template is empty, and rows should be skipped - as they are by node.
+
+Where documents are not to be serialised - as in a stream pipeline - documents() yields each row as a PathDict,
+converted as it is by CSVReader, in place of the JSON text yielded by rows().
+
+A compressed file - see CompressedFile - is decompressed as it is read. A compressed file that ends without its
+end-of-stream marker is reported with a CSVReaderException, as a badly-closed CSV file is.
+
+https://docs.python.org/3/library/json.html
+"""
+
+import csv
+import json
+import math
+import sys
+
+from scs_analysis.helper.compressed_file import CompressedFile
+
+from scs_core.csv.csv_dict import CSVHeader
+from scs_core.csv.csv_reader import CSVReaderException
+from scs_core.data.json import JSONify
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVRowTemplate(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def recast(value):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+
+        try:
+            return float(value)
+        except ValueError:
+            pass
+
+        return value
+
+
+    @staticmethod
+    def encode_float(value):
+        if math.isfinite(value):
+            return float.__repr__(value)
+
+        if value != value:
+            return 'NaN'
+
+        return 'Infinity' if value > 0 else '-Infinity'
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def project(document, columns):
+        if columns is None:
+            return document
+
+        datum = PathDict(document)
+        target = PathDict()
+
+        for column in columns:
+            if datum.has_sub_path(column):
+                target.append(column, datum.node(column))
+
+        return target.node()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, paths, first_row, numeric_cast=True, empty_string_as_null=False, columns=None):
+        header = CSVHeader.construct_from_paths(paths)
+
+        try:
+            skeleton = cls.project(header.as_dict(list(range(len(paths)))), columns)
+        except TypeError:                           # clashing column names - reported when the rows are read
+            return cls(header, columns, None, None, None, numeric_cast, empty_string_as_null)
+
+        leaves = []
+        text = cls.__text(skeleton, leaves)
+
+        if len(first_row) == len(paths):
+            converters = {i: cls.__converter(first_row[i], numeric_cast) for i in leaves}
+        else:                                       # converted by the fallback
+            converters = {i: 'g' for i in leaves}
+
+        lines = ["def jstr(r):",
+                 "    return T %% (%s)" % ''.join("%s(r[%d]), " % (converters[i], i) for i in leaves)]
+
+        template = cls(header, columns, sorted(set(leaves)), text, None, numeric_cast, empty_string_as_null)
+
+        namespace = {'T': text, 'i': template.__int, 'f': template.__float, 's': template.__string,
+                     'g': template.__generic}
+        exec('\n'.join(lines), namespace)
+
+        template.__jstr = namespace['jstr']
+
+        return template
+
+
+    @classmethod
+    def __text(cls, node, leaves):
+        if isinstance(node, dict):
+            return '{' + ', '.join(json.encoder.encode_basestring(key).replace('%', '%%') + ': ' +
+                                   cls.__text(value, leaves) for key, value in node.items()) + '}'
+
+        if isinstance(node, list):
+            return '[' + ', '.join(cls.__text(item, leaves) for item in node) + ']'
+
+        if node is None:                            # a list member that is not selected
+            return 'null'
+
+        leaves.append(node)
+
+        return '%s'
+
+
+    @classmethod
+    def __converter(cls, cell, numeric_cast):
+        if not numeric_cast:
+            return 's'
+
+        value = cls.recast(cell)
+
+        if isinstance(value, int):
+            return 'i'
+
+        if isinstance(value, float):
+            return 'f' if '.' in cell else 'g'
+
+        return 'g' if cell == '' else 's'
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, header, columns, selection, text, jstr, numeric_cast, empty_string_as_null):
+        """
+        Constructor
+        """
+        self.__header = header                      # CSVHeader
+        self.__columns = columns                    # array of string or None
+        self.__selection = selection                # array of int column index, or None
+        self.__text = text                          # string: JSON text with a %s placeholder for each leaf, or None
+        self.__jstr = jstr                          # function: row to JSON text
+        self.__numeric_cast = numeric_cast          # bool
+        self.__empty_string_as_null = empty_string_as_null  # bool
+
+        self.__width = len(header)                  # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def jstr(self, row):
+        if self.__text is None or len(row) != self.__width:
+            return self.__fallback(row)
+
+        return self.__jstr(row)
+
+
+    def document(self, row):
+        return PathDict(self.__node(row))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __fallback(self, row):
+        return JSONify.dumps(self.__node(row))
+
+
+    def __node(self, row):
+        if self.__numeric_cast:
+            row = [self.recast(cell) for cell in row]
+
+        if self.__empty_string_as_null:
+            row = [None if cell == "" else cell for cell in row]
+
+        return self.project(self.__header.as_dict(row), self.__columns)
+
+
+    def __int(self, cell):
+        try:
+            return int.__repr__(int(cell))
+        except ValueError:
+            return self.__generic(cell)
+
+
+    def __float(self, cell):
+        if '.' not in cell:                         # int(..) would not reject it
+            return self.__generic(cell)
+
+        try:
+            return self.encode_float(float(cell))
+        except ValueError:
+            return self.__string(cell)
+
+
+    def __string(self, cell):
+        if self.__numeric_cast:
+            try:
+                float(cell)
+            except ValueError:
+                return self.__encode_string(cell)
+
+            return self.__generic(cell)
+
+        return self.__encode_string(cell)
+
+
+    def __generic(self, cell):
+        value = self.recast(cell) if self.__numeric_cast else cell
+
+        if isinstance(value, str):
+            return self.__encode_string(value)
+
+        if isinstance(value, int):
+            return int.__repr__(value)
+
+        return self.encode_float(value)
+
+
+    def __encode_string(self, cell):
+        if self.__empty_string_as_null and cell == "":
+            return 'null'
+
+        return json.encoder.encode_basestring(cell)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def header(self):
+        return self.__header
+
+
+    @property
+    def is_empty(self):
+        return self.__columns is not None and self.__selection is not None and len(self.__selection) == 0
+
+
+    @property
+    def selection(self):
+        return self.__selection
+
+
+    @property
+    def text(self):
+        return self.__text
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVRowTemplate:{numeric_cast:%s, empty_string_as_null:%s, text:%s}" % \
+               (self.__numeric_cast, self.__empty_string_as_null, self.text)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVTemplateReader(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_for_file(cls, filename, numeric_cast=True, empty_string_as_null=False, start_row=0, columns=None):
+        iterable = sys.stdin if filename is None else CompressedFile.open(filename, "r")
+
+        return cls(iterable, filename=filename, numeric_cast=numeric_cast, empty_string_as_null=empty_string_as_null,
+                   start_row=start_row, columns=columns)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, iterable, filename=None, numeric_cast=True, empty_string_as_null=False, start_row=0,
+                 columns=None):
+        """
+        Constructor
+        """
+        self.__iterable = iterable                                              # iterable
+        self.__filename = filename                                              # string
+        self.__numeric_cast = bool(numeric_cast)                                # bool
+        self.__empty_string_as_null = bool(empty_string_as_null)                # bool
+        self.__start_row = int(start_row)                                       # int
+        self.__columns = columns                                                # array of string or None
+
+        self.__reader = csv.reader(iterable, quotechar='"', delimiter=',', quoting=csv.QUOTE_ALL, skipinitialspace=True)
+
+        try:
+            self.__paths = next(self.__reader)                                  # array of string
+        except StopIteration:                                                   # no input
+            self.__paths = []
+
+        self.__read_count = 0                                                   # int
+
+        try:
+            self.__header = CSVHeader.construct_from_paths(self.__paths)        # CSVHeader
+        except KeyError:
+            raise KeyError(', '.join(self.__paths))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def close(self):
+        if self.__filename is None:
+            return
+
+        self.__iterable.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def rows(self):
+        for template, row in self.__rows():
+            yield template.jstr(row)
+
+
+    def documents(self):
+        for template, row in self.__rows():
+            yield template.document(row)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __rows(self):
+        template = None
+        row_number = -1
+
+        try:
+            for row in self.__reader:
+                if len(row) == 0:
+                    continue
+
+                row_number += 1
+
+                if row_number < self.__start_row:
+                    continue
+
+                if template is None:
+                    template = CSVRowTemplate.construct(self.__paths, row, numeric_cast=self.__numeric_cast,
+                                                        empty_string_as_null=self.__empty_string_as_null,
+                                                        columns=self.__columns)
+
+                if template.is_empty:
+                    continue
+
+                yield template, row
+
+                self.__read_count += 1
+
+        except (csv.Error, EOFError) as ex:
+            raise CSVReaderException(ex)            # typically on the last line of a badly-closed CSV file
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def read_count(self):
+        return self.__read_count
+
+
+    @property
+    def header(self):
+        return self.__header
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        iterable = self.__iterable.__class__.__name__
+        header = '[' + ', '.join(self.header.paths()) + ']'
+
+        return "CSVTemplateReader:{iterable:%s, filename:%s, numeric_cast:%s, empty_string_as_null:%s, " \
+               "start_row:%s, columns:%s, read_count:%s, header:%s}" % \
+               (iterable, self.filename, self.__numeric_cast, self.__empty_string_as_null,
+                self.__start_row, self.__columns, self.read_count, header)
@@ -0,0 +1,281 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A CSVWindowIndex is a sparse index of a CSV file on an ISO 8601 column - typically rec - for the --start / --end mode
+of csv_reader. The index holds the value of the column, and the byte offset of the row, for every INTERVAL rows, so
+that the reader can seek to the last indexed row before the start of the window, rather than parse the whole file.
+
+The index is held in a sidecar file next to the CSV file, named FILENAME.PATH.idx. It records the size and
+modification time of the CSV file, and is rebuilt if either changes - for example, if the file has been appended to.
+If the sidecar cannot be written, the index is used for the current read only.
+
+An index can be used only if the values of the column are ISO 8601 datetimes, in non-decreasing order. If they are
+not, the index is recorded as unsorted, with no entries, and the reader scans the whole file.
+
+Byte offsets are found by reading the file in binary, line by line, and noting the offset of the first line of each
+row - the csv module consumes exactly the lines of a row, so that newlines within quoted fields are respected.
+"""
+
+import bisect
+import csv
+import os
+
+from collections import OrderedDict
+
+from scs_core.data.datum import Datum
+from scs_core.data.json import JSONReport
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVWindowIndex(JSONReport):
+    """
+    classdocs
+    """
+
+    INTERVAL =      1000                            # rows
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def sidecar(filename, path):
+        return '.'.join((filename, path, 'idx'))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def find(cls, filename, path):
+        status = os.stat(filename)
+        sidecar = cls.sidecar(filename, path)
+
+        try:
+            index = cls.load(sidecar)
+        except (OSError, TypeError, ValueError):    # unreadable or malformed - the index is rebuilt
+            index = None
+
+        if index is not None and index.matches(status, path, cls.INTERVAL):
+            return index
+
+        index = cls.construct_for_file(filename, path, cls.INTERVAL)
+
+        try:
+            index.save(sidecar)
+        except OSError:                             # the directory is not writable
+            pass
+
+        return index
+
+
+    @classmethod
+    def construct_for_file(cls, filename, path, interval):
+        with open(filename, 'rb') as file:
+            status = os.fstat(file.fileno())
+            lines = CSVOffsetLines(file)
+
+            reader = csv.reader(lines, quotechar='"', delimiter=',', quoting=csv.QUOTE_ALL, skipinitialspace=True)
+
+            try:
+                paths = next(reader)
+            except StopIteration:                   # no input
+                paths = []
+
+            if path not in paths:
+                raise ValueError("window path '%s' not in header of %s" % (path, filename))
+
+            column = paths.index(path)
+            header_end = lines.position
+            lines.mark()
+
+            entries = []
+            previous = None
+            row_number = 0
+
+            try:
+                for row in reader:
+                    offset = lines.mark()
+
+                    if len(row) == 0:
+                        continue
+
+                    value = Datum.datetime(row[column]) if column < len(row) else None
+
+                    if value is None or (previous is not None and value < previous):
+                        return cls(path, interval, status.st_size, status.st_mtime_ns, header_end, False, [])
+
+                    if row_number % interval == 0:
+                        entries.append((row[column], offset))
+
+                    previous = value
+                    row_number += 1
+
+            except csv.Error:                       # a badly-closed file is scanned, and the error reported
+                return cls(path, interval, status.st_size, status.st_mtime_ns, header_end, False, [])
+
+        return cls(path, interval, status.st_size, status.st_mtime_ns, header_end, True, entries)
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        path = jdict.get('path')
+        interval = jdict.get('interval')
+        size = jdict.get('size')
+        mtime = jdict.get('mtime')
+        header_end = jdict.get('header-end')
+        is_sorted = jdict.get('sorted')
+        entries = [tuple(entry) for entry in jdict.get('entries')]
+
+        return cls(path, interval, size, mtime, header_end, is_sorted, entries)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path, interval, size, mtime, header_end, is_sorted, entries):
+        """
+        Constructor
+        """
+        self.__path = path                          # string
+        self.__interval = int(interval)             # int rows
+        self.__size = int(size)                     # int bytes
+        self.__mtime = int(mtime)                   # int nanoseconds
+        self.__header_end = int(header_end)         # int byte offset
+        self.__is_sorted = bool(is_sorted)          # bool
+        self.__entries = entries                    # array of (string, int byte offset)
+
+        self.__values = None                        # array of LocalizedDatetime
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def matches(self, status, path, interval):
+        return self.size == status.st_size and self.mtime == status.st_mtime_ns and self.path == path and \
+               self.interval == interval
+
+
+    def offset(self, start):
+        if start is None:
+            return self.header_end
+
+        if self.__values is None:
+            self.__values = [Datum.datetime(value) for value, _ in self.__entries]
+
+        i = bisect.bisect_left(self.__values, start)
+
+        return self.header_end if i == 0 else self.__entries[i - 1][1]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['path'] = self.path
+        jdict['interval'] = self.interval
+        jdict['size'] = self.size
+        jdict['mtime'] = self.mtime
+        jdict['header-end'] = self.header_end
+        jdict['sorted'] = self.is_sorted
+        jdict['entries'] = self.entries
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    @property
+    def interval(self):
+        return self.__interval
+
+
+    @property
+    def size(self):
+        return self.__size
+
+
+    @property
+    def mtime(self):
+        return self.__mtime
+
+
+    @property
+    def header_end(self):
+        return self.__header_end
+
+
+    @property
+    def is_sorted(self):
+        return self.__is_sorted
+
+
+    @property
+    def entries(self):
+        return self.__entries
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVWindowIndex:{path:%s, interval:%s, size:%s, mtime:%s, header_end:%s, is_sorted:%s, entries:%s}" % \
+               (self.path, self.interval, self.size, self.mtime, self.header_end, self.is_sorted, len(self.entries))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVOffsetLines(object):
+    """
+    classdocs
+    """
+
+    def __init__(self, file):
+        """
+        Constructor
+        """
+        self.__file = file                          # binary file
+        self.__position = 0                         # int byte offset of the next line
+        self.__marked = None                        # int byte offset of the first line since the mark, or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __iter__(self):
+        return self
+
+
+    def __next__(self):
+        line = self.__file.readline()
+
+        if not line:
+            raise StopIteration
+
+        if self.__marked is None:
+            self.__marked = self.__position
+
+        self.__position += len(line)
+
+        return line.decode('utf-8', errors='replace')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def mark(self):
+        marked = self.__marked
+        self.__marked = None
+
+        return marked
+
+
+    @property
+    def position(self):
+        return self.__position
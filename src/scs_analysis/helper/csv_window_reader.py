@@ -0,0 +1,217 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A CSVWindowReader reads the rows of a CSV file whose value on an ISO 8601 column - typically rec - is within a time
+window, for the --start / --end mode of csv_reader. The window is start <= value < end, as for sample_subset. Either
+bound may be omitted. Rows whose value is empty or not an ISO 8601 datetime are outside the window.
+
+If the file is in order on the column, as found by its CSVWindowIndex, the reader seeks to the last indexed row
+before the start of the window, and stops at the first row past the end. Otherwise - or if the input is stdin - the
+reader scans the whole file. A compressed file - see CompressedFile - cannot be indexed, and is scanned.
+
+If the window path is rec, and the file has a CSVLogManifest - as the files of csv_logger do - the manifest is used
+in place of the index. A file whose rows are all outside the window is not opened. Otherwise, if the manifest has
+hourly offsets, the reader seeks to the hour of the start of the window - in a compressed file, by decompressing
+without parsing - and stops at the first row past the end.
+
+Rows in the window are converted by a CSVRowTemplate, exactly as they are by a CSVTemplateReader.
+"""
+
+import csv
+import io
+import sys
+
+from itertools import chain
+
+from scs_analysis.helper.compressed_file import CompressedFile
+from scs_analysis.helper.csv_log_manifest import CSVLogManifest
+from scs_analysis.helper.csv_template_reader import CSVRowTemplate
+from scs_analysis.helper.csv_window_index import CSVWindowIndex
+
+from scs_core.csv.csv_dict import CSVHeader
+from scs_core.csv.csv_reader import CSVReaderException
+from scs_core.data.datum import Datum
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVWindowReader(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_for_file(cls, filename, path, start=None, end=None, numeric_cast=True, empty_string_as_null=False,
+                           columns=None):
+        if filename is None:
+            return cls(sys.stdin, None, None, path, start, end, numeric_cast, empty_string_as_null, columns)
+
+        manifest = CSVLogManifest.find(filename) if path == CSVLogManifest.PATH else None
+
+        if manifest is not None:
+            if not manifest.overlaps(start, end):
+                return cls((), filename, manifest, path, start, end, numeric_cast, empty_string_as_null, columns,
+                           is_skipped=True)
+
+            return cls.__seek(filename, manifest, path, start, end, numeric_cast, empty_string_as_null, columns)
+
+        if CompressedFile.is_compressed(filename):
+            return cls(CompressedFile.open(filename, "r"), filename, None, path, start, end, numeric_cast,
+                       empty_string_as_null, columns)
+
+        index = CSVWindowIndex.find(filename, path)
+
+        return cls.__seek(filename, index, path, start, end, numeric_cast, empty_string_as_null, columns)
+
+
+    @classmethod
+    def __seek(cls, filename, index, path, start, end, numeric_cast, empty_string_as_null, columns):
+        if not index.is_sorted:
+            return cls(CompressedFile.open(filename, "r"), filename, index, path, start, end, numeric_cast,
+                       empty_string_as_null, columns)
+
+        file = CompressedFile.open(filename, "rb")
+        header = io.TextIOWrapper(io.BytesIO(file.read(index.header_end)))
+
+        file.seek(index.offset(start))
+
+        return cls(chain(header, io.TextIOWrapper(file)), filename, index, path, start, end, numeric_cast,
+                   empty_string_as_null, columns, file=file)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, iterable, filename, index, path, start, end, numeric_cast, empty_string_as_null, columns,
+                 file=None, is_skipped=False):
+        """
+        Constructor
+        """
+        self.__iterable = iterable                                              # iterable
+        self.__filename = filename                                              # string
+        self.__index = index                                                    # CSVWindowIndex or CSVLogManifest
+        self.__path = path                                                      # string
+        self.__start = start                                                    # LocalizedDatetime
+        self.__end = end                                                        # LocalizedDatetime
+        self.__numeric_cast = bool(numeric_cast)                                # bool
+        self.__empty_string_as_null = bool(empty_string_as_null)                # bool
+        self.__columns = columns                                                # array of string or None
+        self.__file = iterable if file is None else file                        # file
+        self.__is_skipped = is_skipped                                          # bool
+
+        self.__reader = csv.reader(iterable, quotechar='"', delimiter=',', quoting=csv.QUOTE_ALL, skipinitialspace=True)
+
+        try:
+            self.__paths = next(self.__reader)                                  # array of string
+        except StopIteration:                                                   # no input
+            self.__paths = []
+
+        self.__scan_count = 0                                                   # int
+        self.__read_count = 0                                                   # int
+
+        try:
+            self.__header = CSVHeader.construct_from_paths(self.__paths)        # CSVHeader
+        except KeyError:
+            raise KeyError(', '.join(self.__paths))
+
+        if path not in self.__paths and not is_skipped:
+            raise ValueError("window path '%s' not in header of %s" % (path, filename))
+
+        self.__column = self.__paths.index(path) if path in self.__paths else None  # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def close(self):
+        if self.__filename is None or self.is_skipped:
+            return
+
+        self.__file.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def rows(self):
+        template = None
+
+        try:
+            for row in self.__reader:
+                if len(row) == 0:
+                    continue
+
+                self.__scan_count += 1
+
+                value = Datum.datetime(row[self.__column]) if self.__column < len(row) else None
+
+                if value is None or (self.__start is not None and value < self.__start):
+                    continue
+
+                if self.__end is not None and value >= self.__end:
+                    if self.is_indexed:
+                        break
+
+                    continue
+
+                if template is None:
+                    template = CSVRowTemplate.construct(self.__paths, row, numeric_cast=self.__numeric_cast,
+                                                        empty_string_as_null=self.__empty_string_as_null,
+                                                        columns=self.__columns)
+
+                if template.is_empty:
+                    continue
+
+                yield template.jstr(row)
+
+                self.__read_count += 1
+
+        except (csv.Error, EOFError) as ex:
+            raise CSVReaderException(ex)            # typically on the last line of a badly-closed CSV file
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def is_indexed(self):
+        return self.__index is not None and self.__index.is_sorted
+
+
+    @property
+    def is_skipped(self):
+        return self.__is_skipped
+
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def scan_count(self):
+        return self.__scan_count
+
+
+    @property
+    def read_count(self):
+        return self.__read_count
+
+
+    @property
+    def header(self):
+        return self.__header
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        header = '[' + ', '.join(self.header.paths()) + ']'
+
+        return "CSVWindowReader:{filename:%s, index:%s, path:%s, start:%s, end:%s, numeric_cast:%s, " \
+               "empty_string_as_null:%s, columns:%s, is_skipped:%s, scan_count:%s, read_count:%s, header:%s}" % \
+               (self.filename, self.__index, self.__path, self.__start, self.__end, self.__numeric_cast,
+                self.__empty_string_as_null, self.__columns, self.is_skipped, self.scan_count, self.read_count,
+                header)
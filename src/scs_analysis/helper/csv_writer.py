@@ -0,0 +1,141 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A CSVWriter is a drop-in replacement for the scs_core CSVWriter, for csv_writer. If the filename has the suffix of a
+compressed file - see CompressedFile - the file is compressed as it is written.
+
+The rows of an uncompressed file are flushed as they are written, as they are by the scs_core CSVWriter. The rows of a
+compressed file are held by the compressor until the file is closed - a flush per row would defeat the compression.
+If buffered is set, the rows of an uncompressed file are also flushed only as the file buffer fills, or on close.
+In append mode, a further compressed stream is added to the file, and is read as the continuation of the first.
+
+In append mode, the paths of the rows are those of the header of the file - unless paths are given, as they must be
+for a file that was written without its header.
+
+Documents are written as JSON text with write(..), or - where they are already PathDicts, as in a stream pipeline -
+with write_document(..).
+
+https://stackoverflow.com/questions/3348460/csv-file-written-with-python-has-blank-lines-between-each-row
+"""
+
+import csv
+import os
+import sys
+
+from scs_analysis.helper.compressed_file import CompressedFile
+
+from scs_core.csv.csv_dict import CSVDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVWriter(object):
+    """
+    classdocs
+    """
+
+    QUOTING = csv.QUOTE_MINIMAL
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename=None, append=False, exclude_header=False, buffered=False, paths=None):
+        """
+        Constructor
+        """
+        self.__filename = filename                              # string
+        self.__paths = paths                                    # array of string
+        self.__is_compressed = CompressedFile.is_compressed(filename)   # bool
+
+        if self.__filename is None:
+            self.__append = append                              # bool
+            self.__file = sys.stdout                            # file
+        else:
+            self.__append = append and os.path.exists(self.__filename)
+
+            if self.__append and self.__paths is None:
+                self.__paths = self.__append_paths()
+                self.__append = self.__paths is not None        # an empty file is written from the start
+
+            self.__file = CompressedFile.open(self.__filename, "a" if self.__append else "w", newline='')
+
+        self.__writer = csv.writer(self.__file, quoting=self.QUOTING)
+        self.__exclude_header = exclude_header                  # bool
+        self.__buffered = buffered                              # bool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __append_paths(self):
+        with CompressedFile.open(self.__filename, "r") as file:
+            return next(csv.reader(file), None)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, jstr):
+        if jstr is None:
+            return False
+
+        datum = CSVDict.construct_from_jstr(jstr)
+
+        if datum is None:
+            return False
+
+        self.__write(datum)
+
+        return True
+
+
+    def write_document(self, document):
+        self.__write(CSVDict(document))
+
+
+    def __write(self, datum):
+        if self.__paths is None:
+            self.__paths = datum.paths()
+
+            # header...
+            if not self.__append and not self.__exclude_header:
+                self.__writer.writerow(self.__paths)
+
+        # row...
+        self.__writer.writerow(datum.row(self.__paths))
+
+        if not self.__is_compressed and not self.__buffered:
+            self.__file.flush()
+
+
+    def close(self):
+        if self.filename is None:
+            return
+
+        self.__file.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def is_compressed(self):
+        return self.__is_compressed
+
+
+    @property
+    def paths(self):
+        return self.__paths
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVWriter:{filename:%s, append:%s, exclude_header:%s, buffered:%s, is_compressed:%s, paths:%s}" % \
+               (self.filename, self.__append, self.__exclude_header, self.__buffered, self.is_compressed,
+                self.paths)
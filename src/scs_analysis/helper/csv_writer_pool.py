@@ -0,0 +1,117 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A CSVWriterPool writes documents to any number of CSV files, with no more than max_open files open at once. When the
+pool is full, the least-recently used file is closed. The writers are buffered - each file is flushed only as its
+buffer fills, when it is closed by the pool, or on close().
+
+Each file is written from the start - or appended to, if append is set - when it is first opened. A file that is
+reopened is appended to, and keeps the header that it was given when it was first opened, so that the header is
+written exactly once. The paths of a file are kept by the pool when it is closed, and given to its writer when it is
+reopened - the first line of a file that was written without its header is not a header.
+"""
+
+from collections import OrderedDict
+
+from scs_analysis.helper.csv_writer import CSVWriter
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVWriterPool(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_MAX_OPEN =      32                      # files
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, max_open=DEFAULT_MAX_OPEN, append=False, exclude_header=False):
+        """
+        Constructor
+        """
+        self.__max_open = int(max_open)             # int
+        self.__append = append                      # bool
+        self.__exclude_header = exclude_header      # bool
+
+        self.__writers = OrderedDict()              # dict of filename: CSVWriter, least-recently used first
+        self.__paths = {}                           # dict of filename: array of string, for files opened by the pool
+
+        self.__open_count = 0                       # int
+        self.__row_counts = {}                      # dict of filename: int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, filename, jstr):
+        if not self.__writer(filename).write(jstr):
+            return False
+
+        self.__row_counts[filename] += 1
+
+        return True
+
+
+    def close(self):
+        while self.__writers:
+            _, writer = self.__writers.popitem(last=False)
+            writer.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __writer(self, filename):
+        writer = self.__writers.get(filename)
+
+        if writer is not None:
+            self.__writers.move_to_end(filename)
+            return writer
+
+        if len(self.__writers) >= self.max_open:
+            evicted_filename, evicted = self.__writers.popitem(last=False)
+            evicted.close()
+
+            self.__paths[evicted_filename] = evicted.paths
+
+        reopened = filename in self.__paths
+        paths = self.__paths.get(filename)
+
+        writer = CSVWriter(filename=filename, append=self.__append or reopened, exclude_header=self.__exclude_header,
+                           buffered=True, paths=paths)
+
+        self.__writers[filename] = writer
+        self.__paths.setdefault(filename, None)
+        self.__row_counts.setdefault(filename, 0)
+
+        self.__open_count += 1
+
+        return writer
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def max_open(self):
+        return self.__max_open
+
+
+    @property
+    def open_count(self):
+        return self.__open_count
+
+
+    @property
+    def row_counts(self):
+        return self.__row_counts
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVWriterPool:{max_open:%s, append:%s, exclude_header:%s, files:%s, open_count:%s}" % \
+               (self.max_open, self.__append, self.__exclude_header, len(self.__paths), self.open_count)
@@ -0,0 +1,157 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A DocumentBatch runs a batch transform on groups of documents, for the --batch mode of the numeric utilities. The
+transform is a callable that takes a list of PathDicts, and yields a document - or None, if the document is to be
+dropped - for each, in order. The transform gathers the leaf values that it needs into NumPy arrays, evaluates its
+formula on the arrays, and writes the results back.
+
+Values are computed by the same sequence of operations as the scalar path, and are rounded by the Python round(..)
+function, so that the documents written are those of the scalar path. (NumPy's exp and power functions may differ
+from those of the math library in the last place on some platforms - this affects only values that fall within a
+fraction of a unit in the last place of a rounding boundary.)
+
+Formulas are evaluated under strict(): a division by zero, an overflow or an invalid operation - where NumPy would
+return inf or nan, but the scalar path may raise an exception - raises FloatingPointError. The transform then falls
+back to the scalar path for the batch, so that the documents written, and any exception raised, are those of the
+scalar path.
+
+When stdin is idle, the partial batch is transformed, so that the documents of a live stream are not held back.
+
+NumPy is an optional dependency - the batch extra of the package. It is imported by is_available(), rather than when
+this module is imported, so that the utilities do not pay for the import unless --batch is given: is_available()
+should be checked before a DocumentBatch is constructed, or an array helper is imported.
+
+https://numpy.org/doc/stable/reference/ufuncs.html
+"""
+
+import importlib
+
+numpy = None                                        # imported by DocumentBatch.is_available()
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DocumentBatch(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def is_available():
+        global numpy
+
+        if numpy is None:
+            try:
+                numpy = importlib.import_module('numpy')
+            except ImportError:
+                return False
+
+        return True
+
+
+    @staticmethod
+    def array(values):
+        return numpy.array(values, dtype=numpy.float64)
+
+
+    @staticmethod
+    def rounded(array, ndigits):
+        return [round(value, ndigits) for value in array.tolist()]
+
+
+    @staticmethod
+    def strict():
+        return numpy.errstate(divide='raise', over='raise', invalid='raise')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, size, stdout):
+        return cls(size, stdout)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, size, stdout):
+        """
+        Constructor
+        """
+        self.__size = size                          # int
+        self.__stdout = stdout                      # OutputStream
+
+        self.__transform = None                     # callable
+        self.__samples = []                         # array of PathDict
+
+        self.__document_count = 0                   # int
+        self.__processed_count = 0                  # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self, stdin, codec, transform):
+        self.__transform = transform
+
+        for _, datum in stdin.documents(codec):
+            self.__samples.append(datum)
+
+            if len(self.__samples) >= self.__size:
+                self.__flush()
+
+        self.__flush()
+
+
+    def idle(self):
+        self.__flush()
+        self.__stdout.idle()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __flush(self):
+        if not self.__samples:
+            return
+
+        samples = self.__samples
+        self.__samples = []
+
+        self.__document_count += len(samples)
+
+        for target in self.__transform(samples):
+            if target is None:
+                continue
+
+            self.__stdout.write_document(target)
+
+            self.__processed_count += 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def size(self):
+        return self.__size
+
+
+    @property
+    def document_count(self):
+        return self.__document_count
+
+
+    @property
+    def processed_count(self):
+        return self.__processed_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DocumentBatch:{size:%s, document_count:%s, processed_count:%s}" % \
+               (self.size, self.document_count, self.processed_count)
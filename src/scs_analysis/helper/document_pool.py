@@ -0,0 +1,225 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A DocumentPool runs a per-document transform on a pool of worker processes, for the --workers mode of the stateless
+utilities. The transform is a callable that takes a PathDict and returns a document, or None if the document is to be
+dropped.
+
+stdin is divided into chunks of CHUNK_DOCUMENTS. The workers decode, transform and encode the documents of a chunk, and
+the chunks are written to stdout in their original order. No more than IN_FLIGHT chunks per worker are outstanding, so
+that a slow consumer holds back the reading of stdin, and memory use is bounded.
+
+When stdin is idle, the chunks that have completed are written, and the partial chunk is submitted if a worker is free -
+while every worker is busy, the partial chunk continues to fill. Until there is further input, this is repeated every
+IDLE_POLL seconds, so that the documents of a live stream are not held back. The pool waits for outstanding chunks only
+when IN_FLIGHT chunks per worker are outstanding, and at the end of stdin.
+
+The workers are forked when run(..) is called, so the transform - and everything that it refers to - is inherited, not
+pickled. If the transform calls exit(..) - or raises an exception - the documents before the failing document are
+written, then the utility exits with the same status, or the exception is raised again, as it would be if the
+transform were run serially. Since other workers may be processing later chunks, their error messages may also appear.
+"""
+
+import multiprocessing
+import signal
+import sys
+
+from collections import deque
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DocumentPool(object):
+    """
+    classdocs
+    """
+
+    CHUNK_DOCUMENTS =   1000                        # documents
+    IN_FLIGHT =         2                           # chunks per worker
+    IDLE_POLL =         0.01                        # seconds
+
+    __worker = None                                 # (transform, codec, serialise) in each worker process
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, workers, codec, stdout):
+        return cls(multiprocessing.get_context('fork'), workers, codec, stdout)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def initialise(cls, transform, codec, serialise):
+        signal.signal(signal.SIGINT, signal.SIG_IGN)  # KeyboardInterrupt is handled by the utility
+
+        cls.__worker = (transform, codec, serialise)
+
+
+    @classmethod
+    def process(cls, chunk):
+        transform, codec, serialise = cls.__worker
+
+        outputs = []
+        document_count = 0
+
+        for item in chunk:
+            datum = codec.decode(item) if isinstance(item, str) else item
+
+            if datum is None:
+                continue
+
+            document_count += 1
+
+            try:
+                document = transform(datum)
+
+            except (SystemExit, Exception) as ex:
+                sys.stderr.flush()
+                return outputs, document_count, ex
+
+            if document is None:
+                continue
+
+            outputs.append(codec.dumps(document) if serialise else document)
+
+        return outputs, document_count, None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, context, workers, codec, stdout):
+        """
+        Constructor
+        """
+        self.__context = context                    # multiprocessing context
+        self.__workers = workers                    # int
+        self.__codec = codec                        # JSONCodec
+        self.__stdout = stdout                      # OutputStream
+
+        self.__stdin = None                         # InputStream
+        self.__pool = None                          # multiprocessing.Pool
+        self.__chunk = []                           # array of str or PathDict
+        self.__pending = deque()                    # deque of AsyncResult
+
+        self.__document_count = 0                   # int
+        self.__processed_count = 0                  # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self, stdin, transform):
+        serialise = not self.__stdout.is_binary     # JSON is encoded by the workers, binary by the OutputStream
+
+        self.__stdin = stdin
+        self.__pool = self.__context.Pool(self.__workers, initializer=DocumentPool.initialise,
+                                          initargs=(transform, self.__codec, serialise))
+
+        capacity = self.__workers * self.IN_FLIGHT
+
+        for jstr, datum in stdin.documents(self.__codec, decode=False):
+            self.__chunk.append(datum if jstr is None else jstr)
+
+            if len(self.__chunk) < self.CHUNK_DOCUMENTS:
+                continue
+
+            self.__submit()
+
+            while len(self.__pending) >= capacity:
+                self.__collect()
+
+        self.__drain()
+
+
+    def idle(self):
+        if self.__pool is None:
+            self.__stdout.idle()
+            return
+
+        while True:
+            self.__collect_completed()
+
+            if self.__chunk and len(self.__pending) < self.__workers:
+                self.__submit()
+
+            self.__stdout.idle()
+
+            if not self.__pending or self.__stdin.is_ready(self.IDLE_POLL):
+                return
+
+
+    def close(self):
+        if self.__pool is None:
+            return
+
+        self.__pool.terminate()
+        self.__pool.join()
+
+        self.__pool = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __submit(self):
+        if not self.__chunk:
+            return
+
+        self.__pending.append(self.__pool.apply_async(DocumentPool.process, (self.__chunk, )))
+        self.__chunk = []
+
+
+    def __collect(self):
+        outputs, document_count, ex = self.__pending.popleft().get()
+
+        self.__document_count += document_count
+
+        for output in outputs:
+            if isinstance(output, str):
+                self.__stdout.write_document(None, jstr=output)
+            else:
+                self.__stdout.write_document(output)
+
+            self.__processed_count += 1
+
+        if ex is not None:
+            raise ex
+
+
+    def __collect_completed(self):
+        while self.__pending and self.__pending[0].ready():
+            self.__collect()
+
+
+    def __drain(self):
+        self.__submit()
+
+        while self.__pending:
+            self.__collect()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def workers(self):
+        return self.__workers
+
+
+    @property
+    def document_count(self):
+        return self.__document_count
+
+
+    @property
+    def processed_count(self):
+        return self.__processed_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DocumentPool:{workers:%s, chunk_documents:%s, in_flight:%s}" % \
+               (self.workers, self.CHUNK_DOCUMENTS, self.IN_FLIGHT)
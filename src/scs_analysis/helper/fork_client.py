@@ -0,0 +1,216 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A ForkClient hands the invocation of a utility to a running scs_analysis_server, so that the utility does not pay
+for interpreter startup and imports. The client passes its argv, working directory and the ENV_NAMES and ENV_PREFIXES
+variables of its environment, together with its stdin, stdout and stderr file descriptors, then waits for the exit
+status of the worker that the server forks. Other variables - which may hold credentials - are not passed.
+
+ForkClient.delegate() is called by each served utility before its own imports. If no server is running - or the server
+declines the utility - delegate() returns, and the utility runs as usual. Otherwise it exits with the worker's status.
+
+Only light standard library modules are imported here, so that delegation is cheap - for this reason, the request is
+encoded with marshal rather than json.
+
+The server's Unix domain socket is given by the SCS_ANALYSIS_SERVER environment variable, or is scs_analysis_server in
+XDG_RUNTIME_DIR - or, where that is not set, in the private directory scs_analysis_server-UID in TMPDIR (default /tmp).
+Nothing is sent unless the socket belongs to the user, is accessible to its owner only, and - where the platform
+reports the credentials of a Unix domain socket peer - the server is run by the user. Otherwise, the utility runs as
+usual.
+"""
+
+import array
+import marshal
+import os
+import signal
+import socket
+import stat
+import struct
+import sys
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ForkClient(object):
+    """
+    classdocs
+    """
+
+    ENV_SOCKET =        'SCS_ANALYSIS_SERVER'
+
+    ENV_NAMES =         ('HOME', 'LANG', 'LANGUAGE', 'LOGNAME', 'PATH', 'PWD', 'SHELL', 'TERM', 'TMPDIR', 'TZ',
+                         'USER', ENV_SOCKET)
+    ENV_PREFIXES =      ('LC_', )
+
+    HEADER = struct.Struct('<I')                    # request length
+    STATUS = struct.Struct('<i')                    # worker pid, then exit status
+    PEERCRED = struct.Struct('3i')                  # pid, uid, gid
+
+    FDS = (0, 1, 2)
+
+    DECLINED =          0                           # pid sent by the server when the utility is not served
+
+    __enabled = True
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def socket_path(cls):
+        path = os.environ.get(cls.ENV_SOCKET)
+
+        if path:
+            return path
+
+        runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+
+        if runtime_dir:
+            return os.path.join(runtime_dir, 'scs_analysis_server')
+
+        private_dir = os.path.join(os.environ.get('TMPDIR', '/tmp'), 'scs_analysis_server-%d' % os.getuid())
+
+        return os.path.join(private_dir, 'scs_analysis_server')
+
+
+    @classmethod
+    def is_passed(cls, name):
+        return name in cls.ENV_NAMES or name.startswith(cls.ENV_PREFIXES)
+
+
+    @classmethod
+    def disable(cls):
+        cls.__enabled = False                       # the server itself, and its workers, must run utilities locally
+
+
+    @classmethod
+    def delegate(cls):
+        if not cls.__enabled or not hasattr(socket, 'AF_UNIX'):
+            return
+
+        client = cls.connect(cls.socket_path())
+
+        if client is None:
+            return
+
+        status = client.run(os.path.basename(sys.argv[0]), sys.argv[1:])
+
+        if status is None:
+            return
+
+        sys.exit(status)
+
+
+    @classmethod
+    def connect(cls, path):
+        if not cls.__is_private(path):
+            return None
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            sock.connect(path)
+
+            if not cls.__is_own_peer(sock):
+                sock.close()
+                return None
+
+        except OSError:                             # no server, or a stale socket
+            sock.close()
+            return None
+
+        return cls(sock)
+
+
+    @staticmethod
+    def __is_private(path):
+        try:
+            status = os.stat(path)
+
+        except OSError:                             # no server
+            return False
+
+        return stat.S_ISSOCK(status.st_mode) and status.st_uid == os.getuid() and not status.st_mode & 0o077
+
+
+    @classmethod
+    def __is_own_peer(cls, sock):
+        if not hasattr(socket, 'SO_PEERCRED'):
+            return True                             # the socket is private to its owner
+
+        _, uid, _ = cls.PEERCRED.unpack(sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, cls.PEERCRED.size))
+
+        return uid == os.getuid()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, sock):
+        """
+        Constructor
+        """
+        self.__sock = sock                          # socket
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self, name, args):
+        env = {key: value for key, value in os.environ.items() if self.is_passed(key)}
+        request = marshal.dumps({'name': name, 'args': args, 'cwd': os.getcwd(), 'env': env})
+
+        try:
+            fds = array.array('i', self.FDS)
+
+            self.__sock.sendmsg([self.HEADER.pack(len(request))], [(socket.SOL_SOCKET, socket.SCM_RIGHTS, fds)])
+            self.__sock.sendall(request)
+
+            pid = self.__receive()
+
+            if pid is None or pid == self.DECLINED:
+                return None
+
+            # wait...
+            while True:
+                try:
+                    status = self.__receive()
+                    break
+
+                except KeyboardInterrupt:
+                    os.kill(pid, signal.SIGINT)     # the worker is not in our process group
+
+            if status is None:
+                print("%s: scs_analysis_server worker %d terminated" % (name, pid), file=sys.stderr)
+                return 1
+
+            return status
+
+        except OSError as ex:
+            print("%s: scs_analysis_server: %s" % (name, ex), file=sys.stderr)
+            return 1
+
+        finally:
+            self.__sock.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __receive(self):
+        message = b''
+
+        while len(message) < self.STATUS.size:
+            chunk = self.__sock.recv(self.STATUS.size - len(message))
+
+            if not chunk:
+                return None
+
+            message += chunk
+
+        return self.STATUS.unpack(message)[0]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ForkClient:{sock:%s}" % self.__sock
@@ -0,0 +1,279 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A ForkServer holds the served utilities - and so scs_analysis, scs_core and any other modules that they use - imported
+in a single process. For each ForkClient connection, the server forks a worker. The worker takes over the client's
+stdin, stdout and stderr, working directory and argv, runs the utility's script as __main__, and returns its exit
+status to the client. The variables of the client's environment that are passed by the ForkClient replace those of the
+server - other variables are those of the server.
+
+A utility is served only if it is in the server's list of names. Only the scripts of the scs_analysis package itself
+are run, whatever the path by which the client was invoked. The socket is accessible to its owner only. If the
+directory of the socket does not exist, it is created accessible to its owner only.
+"""
+
+import array
+import marshal
+import os
+import runpy
+import signal
+import socket
+import sys
+import traceback
+
+from importlib import import_module
+
+from scs_analysis.helper.fork_client import ForkClient
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ForkServer(object):
+    """
+    classdocs
+    """
+
+    PACKAGE = 'scs_analysis'
+
+    BACKLOG =           64
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, names, path=None):
+        path = ForkClient.socket_path() if path is None else path
+        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+        return cls(path, package_dir, names)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path, package_dir, names):
+        """
+        Constructor
+        """
+        self.__path = path                          # string
+        self.__package_dir = package_dir            # string
+        self.__names = names                        # array of string
+
+        self.__sock = None                          # socket
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def preload(self):
+        ForkClient.disable()                        # the served scripts call delegate() on import
+
+        for name in self.__names:
+            import_module('.'.join((self.PACKAGE, name)))
+
+
+    def open(self):
+        directory = os.path.dirname(self.__path)
+
+        if directory and not os.path.isdir(directory):
+            os.mkdir(directory, 0o700)
+
+        if os.path.exists(self.__path):
+            if self.__is_running():
+                raise OSError("a server is already running on %s" % self.__path)
+
+            os.remove(self.__path)                  # stale
+
+        self.__sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        umask = os.umask(0o177)
+
+        try:
+            self.__sock.bind(self.__path)
+
+        finally:
+            os.umask(umask)
+
+        self.__sock.listen(self.BACKLOG)
+
+
+    def serve(self):
+        signal.signal(signal.SIGCHLD, signal.SIG_IGN)   # workers are reaped automatically
+
+        while True:
+            conn, _ = self.__sock.accept()
+
+            # flush before fork, so that nothing is written twice...
+            sys.stdout.flush()
+            sys.stderr.flush()
+
+            if os.fork() == 0:
+                status = 1
+
+                try:
+                    self.__sock.close()
+                    status = self.__work(conn)
+
+                finally:
+                    os._exit(status)                # the worker must never return to the server's loop
+
+            conn.close()
+
+
+    def close(self):
+        if self.__sock is None:
+            return
+
+        self.__sock.close()
+        self.__sock = None
+
+        try:
+            os.remove(self.__path)
+        except FileNotFoundError:
+            pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __work(self, conn):
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+        try:
+            request, fds = self.__receive(conn)
+
+        except (OSError, ValueError, EOFError, TypeError):
+            return 1
+
+        name = request['name'][:-3] if request['name'].endswith('.py') else request['name']
+
+        if name not in self.__names or len(fds) != len(ForkClient.FDS):
+            conn.sendall(ForkClient.STATUS.pack(ForkClient.DECLINED))
+            return 0
+
+        conn.sendall(ForkClient.STATUS.pack(os.getpid()))
+
+        # stdio...
+        for fd, target in zip(fds, ForkClient.FDS):
+            os.dup2(fd, target)
+            os.close(fd)
+
+        sys.stdin = open(0, 'r', closefd=False)
+        sys.stdout = open(1, 'w', closefd=False)
+        sys.stderr = open(2, 'w', buffering=1, closefd=False)
+
+        # context...
+        os.chdir(request['cwd'])
+
+        for key in [key for key in os.environ if ForkClient.is_passed(key) and key not in request['env']]:
+            del os.environ[key]
+
+        os.environ.update(request['env'])
+
+        script = os.path.join(self.__package_dir, name + '.py')
+        sys.argv = [script] + request['args']
+
+        # run...
+        status = self.__run(script)
+
+        try:
+            conn.sendall(ForkClient.STATUS.pack(status))
+        except OSError:
+            pass
+
+        return status
+
+
+    def __is_running(self):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            probe.connect(self.__path)
+            return True
+
+        except OSError:
+            return False
+
+        finally:
+            probe.close()
+
+
+    @staticmethod
+    def __run(script):
+        try:
+            runpy.run_path(script, run_name='__main__')
+            status = 0
+
+        except SystemExit as ex:
+            if ex.code is None:
+                status = 0
+
+            elif isinstance(ex.code, int):
+                status = ex.code
+
+            else:
+                print(ex.code, file=sys.stderr)
+                status = 1
+
+        except KeyboardInterrupt:
+            status = 130
+
+        except BaseException:
+            traceback.print_exc()
+            status = 1
+
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except OSError:                         # for example, BrokenPipeError
+                pass
+
+        return status
+
+
+    @staticmethod
+    def __receive(conn):
+        fds = array.array('i')
+        ancillary_size = socket.CMSG_LEN(len(ForkClient.FDS) * fds.itemsize)
+
+        header, ancdata, _, _ = conn.recvmsg(ForkClient.HEADER.size, ancillary_size)
+
+        for level, kind, data in ancdata:
+            if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+                fds.frombytes(data[:len(data) - (len(data) % fds.itemsize)])
+
+        if len(header) != ForkClient.HEADER.size:
+            raise ValueError("truncated header")
+
+        length = ForkClient.HEADER.unpack(header)[0]
+        message = b''
+
+        while len(message) < length:
+            chunk = conn.recv(length - len(message))
+
+            if not chunk:
+                raise ValueError("truncated request")
+
+            message += chunk
+
+        return marshal.loads(message), list(fds)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    @property
+    def names(self):
+        return self.__names
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ForkServer:{path:%s, package_dir:%s, names:%s}" % (self.path, self.__package_dir, self.names)
@@ -0,0 +1,67 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+An array form of the density to concentration conversion of scs_core.gas.gas.Gas, for the --batch mode of
+sample_concentration. The operations - and their order - and the molar masses are those of the scalar implementation,
+so that each element is the value that Gas.concentration(..) returns for the same density, t and p. Pressure may be an
+array, or a single value for every element. The molar masses are held here, rather than read from the private
+attributes of the scalar implementation - tests/helper/batch_parity_test.py checks that the two agree.
+
+The formula is evaluated under DocumentBatch.strict(): where the scalar implementation would divide by zero, a
+FloatingPointError is raised - or a ZeroDivisionError, where the single pressure is zero.
+
+http://www.apis.ac.uk/unit-conversion
+"""
+
+from scs_analysis.helper.document_batch import DocumentBatch
+
+from scs_core.gas.gas import Gas
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class GasArray(object):
+    """
+    classdocs
+    """
+
+    __MOLAR_MASS = {
+                'CO':   28.0100,
+                'CO2':  44.0100,
+                'NO':   30.0100,
+                'NO2':  46.0055,
+                'O3':   48.0000,
+                'SO2':  64.0660
+    }
+
+    @classmethod
+    def __molar_mass(cls, gas):
+        if gas not in cls.__MOLAR_MASS:
+            raise ValueError("Gas: unrecognised name: %s" % gas)
+
+        return cls.__MOLAR_MASS[gas]
+
+
+    @classmethod
+    def __molar_volume(cls, t, p):
+        tk = t + 273.15
+
+        return Gas.STP_MOLAR_VOLUME * (tk / 273.15) * (Gas.STP_PRESSURE / p)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def concentration(cls, gas, density, t, p):                 # arrays of g/m3, °C, kPa -> array of ppb
+        molar_mass = cls.__molar_mass(gas)
+
+        with DocumentBatch.strict():
+            molar_volume = cls.__molar_volume(t, p)
+
+            molar_density = molar_mass / molar_volume
+
+            return density / molar_density
@@ -0,0 +1,240 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A GraceJoin performs the SQL joins of the scs_core Join - inner, left, right and full - on two sequences of JSON
+documents in any order, within a memory budget, for the --max-memory mode of csv_join.
+
+If the tables of the join would fit in the budget, the join is performed in memory, exactly as it is by a Join.
+Otherwise, both sequences are partitioned by the hash of their primary keys into temporary files, so that the
+documents with a given primary key are in the same partition on both sides. The partitions are then joined one at a
+time, each in memory by a Join. The number of partitions is found from the sizes of the input files: a table in memory
+takes about EXPANSION times the size of its CSV text. No more than MAX_PARTITIONS partitions are made at a time.
+
+The estimate is not relied upon: before a partition is joined, the size of its temporary files is checked - a table in
+memory takes about SPILL_EXPANSION times the size of its spilled JSON. A partition that would exceed the budget is
+partitioned again, by a hash seeded for its level, so that its primary keys are divided differently, and so on, to
+MAX_DEPTH levels. A partition with the documents of a single primary key cannot be divided - but the Join keeps only
+one document for each primary key.
+
+Within each partition, the joined documents are in the order of the Join. Where the sequences are partitioned, the
+partitions are produced one after another, so that the output as a whole is not in the order of either sequence.
+
+The temporary files are deleted when the join is complete.
+
+https://en.wikipedia.org/wiki/Hash_join#Grace_hash_join
+https://prng.di.unimi.it/splitmix64.c
+"""
+
+import math
+import os
+import tempfile
+
+from scs_analysis.helper.sorted_join import SortedJoinSet
+
+from scs_core.data.join import Join
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class GraceJoin(object):
+    """
+    classdocs
+    """
+
+    EXPANSION =         20                          # memory of a Join table / size of its CSV text
+    SPILL_EXPANSION =   10                          # memory of a Join table / size of its spilled JSON
+    MAX_PARTITIONS =    512                         # partition files open at once on each side
+    MAX_DEPTH =         8                           # levels of re-partitioning
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, tables, pk_is_iso8601, codec, max_memory, input_size):
+        left, right = [SortedJoinSet(set_path, pk_path, pk_is_iso8601, codec) for set_path, pk_path, _ in tables]
+
+        required = cls.EXPANSION * input_size
+        partitions = min(max(1, math.ceil(required / max_memory)), cls.MAX_PARTITIONS)
+
+        return cls(left, right, codec, max_memory, partitions)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, left, right, codec, max_memory, partitions):
+        """
+        Constructor
+        """
+        self.__left = left                          # SortedJoinSet
+        self.__right = right                        # SortedJoinSet
+        self.__codec = codec                        # JSONCodec
+        self.__max_memory = int(max_memory)         # int bytes
+        self.__partitions = int(partitions)         # int
+
+        self.__max_partition_size = 0               # int bytes
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def join(self, join_type, sequences):
+        left_rows, right_rows = sequences
+
+        if self.partitions == 1:
+            join = self.__join()
+
+            for _, datum, _ in self.left.documents(left_rows):
+                join.append_to_left(datum)
+
+            for _, datum, _ in self.right.documents(right_rows):
+                join.append_to_right(datum)
+
+            yield from self.__operation(join, join_type)()
+            return
+
+        with tempfile.TemporaryDirectory(prefix='csv_join_') as tmp_dir:
+            left = ((pk, row) for pk, _, row in self.left.documents(left_rows))
+            right = ((pk, row) for pk, _, row in self.right.documents(right_rows))
+
+            names = self.__partition(left, right, self.partitions, 0, tmp_dir, 'p')
+
+            for name in names:
+                yield from self.__join_partition(join_type, tmp_dir, name, 1)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __join(self):
+        return Join.construct(self.left.set_path, self.left.pk_path, self.right.set_path, self.right.pk_path,
+                              self.left.pk_is_iso8601)
+
+
+    @staticmethod
+    def __operation(join, join_type):
+        join_type = join_type.upper()
+
+        if join_type == 'LEFT':
+            return join.left
+
+        if join_type == 'RIGHT':
+            return join.right
+
+        if join_type == 'FULL':
+            return join.full
+
+        return join.inner
+
+
+    def __join_partition(self, join_type, tmp_dir, name, depth):
+        left_path, right_path = self.__paths(tmp_dir, name)
+
+        size = os.path.getsize(left_path) + os.path.getsize(right_path)
+        required = self.SPILL_EXPANSION * size
+
+        # partition again...
+        if required > self.max_memory and depth <= self.MAX_DEPTH:
+            partitions = min(math.ceil(required / self.max_memory), self.MAX_PARTITIONS)
+
+            left = ((self.left.key(datum), line) for line, datum in self.__spilled(left_path))
+            right = ((self.right.key(datum), line) for line, datum in self.__spilled(right_path))
+
+            names = self.__partition(left, right, partitions, depth, tmp_dir, name)
+
+            for sub_name in names:
+                yield from self.__join_partition(join_type, tmp_dir, sub_name, depth + 1)
+
+            return
+
+        # join in memory...
+        self.__max_partition_size = max(self.__max_partition_size, size)
+
+        join = self.__join()
+
+        for _, datum in self.__spilled(left_path):
+            join.append_to_left(datum)
+
+        for _, datum in self.__spilled(right_path):
+            join.append_to_right(datum)
+
+        yield from self.__operation(join, join_type)()
+
+
+    def __partition(self, left, right, partitions, seed, tmp_dir, name):
+        names = ['%s-%d' % (name, i) for i in range(partitions)]
+
+        for side, documents in ((0, left), (1, right)):
+            files = [open(self.__paths(tmp_dir, sub_name)[side], 'w') for sub_name in names]
+
+            try:
+                for pk, row in documents:
+                    files[self.__bucket(pk, seed, partitions)].write(row.strip() + '\n')
+
+            finally:
+                for file in files:
+                    file.close()
+
+        return names
+
+
+    @staticmethod
+    def __bucket(pk, seed, partitions):
+        # splitmix64 of the primary key's hash, so that the buckets of each seed are independent of the others...
+        z = (hash(pk) + (seed + 1) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+
+        return (z ^ (z >> 31)) % partitions
+
+
+    @staticmethod
+    def __paths(tmp_dir, name):
+        return os.path.join(tmp_dir, 'left-%s.jsonl' % name), os.path.join(tmp_dir, 'right-%s.jsonl' % name)
+
+
+    def __spilled(self, path):
+        with open(path, 'r') as file:
+            for line in file:
+                yield line, self.__codec.decode(line)
+
+        os.remove(path)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def sets(self):
+        return [self.__left, self.__right]
+
+
+    @property
+    def left(self):
+        return self.__left
+
+
+    @property
+    def right(self):
+        return self.__right
+
+
+    @property
+    def max_memory(self):
+        return self.__max_memory
+
+
+    @property
+    def partitions(self):
+        return self.__partitions
+
+
+    @property
+    def max_partition_size(self):
+        return self.__max_partition_size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "GraceJoin:{left:%s, right:%s, max_memory:%s, partitions:%s, max_partition_size:%s}" % \
+               (self.left, self.right, self.max_memory, self.partitions, self.max_partition_size)
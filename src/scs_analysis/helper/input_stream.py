@@ -0,0 +1,236 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+An InputStream yields the lines of stdin, without their line terminators. stdin is read in large blocks, and lines are
+decoded a block at a time. Before the stream blocks waiting for input, the idle handler is called - this allows an
+OutputStream to flush its pending documents while there is nothing further to do. is_ready(..) reports whether input
+is available - or the end of the stream has been reached - waiting for up to the given timeout.
+
+documents(..) yields (jstr, datum) pairs. The input may be a sequence of JSON documents, or a binary document stream,
+which is detected by its MAGIC prefix. For binary input, jstr is None. If decode is False, JSON documents are yielded
+as (jstr, None), to be decoded elsewhere - for example, by the workers of a DocumentPool.
+
+If a StreamStats is given, bytes read and the time spent reading are recorded, and documents(..) records the parse time
+and latency of each document - lines(..) records each line as a document. Without a StreamStats, documents are yielded
+without measurement.
+"""
+
+import io
+import itertools
+import os
+import select
+import sys
+import time
+
+from scs_analysis.helper.binary_codec import BinaryDecoder, BinaryFormat
+
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class InputStream(object):
+    """
+    classdocs
+    """
+
+    READ_SIZE =         65536                       # bytes
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, stream=None, idle_handler=None, stats=None):
+        stream = sys.stdin if stream is None else stream
+
+        return cls(stream, idle_handler, stats)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, stream, idle_handler, stats):
+        """
+        Constructor
+        """
+        self.__stream = stream                      # text stream
+        self.__idle_handler = idle_handler          # callable or None
+        self.__stats = stats                        # StreamStats or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def lines(self):
+        fd = self.__fileno()
+
+        if fd is None:
+            lines = self.__text_lines()             # for example, a StringIO
+        else:
+            lines = self.__lines(self.__blocks(fd))
+
+        if self.__stats is None:
+            return lines
+
+        return (line for line, _ in self.__measured((line, None) for line in lines))
+
+
+    def documents(self, codec, decode=True):
+        if self.__stats is None:
+            return self.__documents(codec, decode)
+
+        return self.__measured(self.__documents(codec, decode))
+
+
+    def is_ready(self, timeout=0.0):
+        fd = self.__fileno()
+
+        if fd is None:
+            return True
+
+        return self.__is_ready(fd, timeout)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __documents(self, codec, decode):
+        fd = self.__fileno()
+
+        if fd is None:
+            lines = self.__text_lines()
+
+        else:
+            blocks = self.__blocks(fd)
+            head = b''
+
+            for block in blocks:
+                head += block
+
+                if len(head) >= len(BinaryFormat.MAGIC) or not BinaryFormat.MAGIC.startswith(head):
+                    break
+
+            blocks = itertools.chain((head, ), blocks)
+
+            # binary...
+            if head.startswith(BinaryFormat.MAGIC):
+                for jdict in BinaryDecoder().documents(blocks):
+                    yield None, PathDict(jdict)
+                return
+
+            lines = self.__lines(blocks)
+
+        # JSON...
+        if not decode:
+            for line in lines:
+                jstr = line.strip()
+
+                if jstr:
+                    yield jstr, None
+            return
+
+        for line in lines:
+            jstr = line.strip()
+            datum = codec.decode(jstr)
+
+            if datum is None:
+                continue
+
+            yield jstr, datum
+
+
+    def __measured(self, documents):
+        stats = self.__stats
+        clock = time.perf_counter
+
+        while True:
+            start = clock()
+            io_time = stats.io_time
+
+            try:
+                jstr, datum = next(documents)
+
+            except StopIteration:
+                return
+
+            parse_time = clock() - start - (stats.io_time - io_time)
+
+            yield jstr, datum
+
+            stats.document_in(parse_time, clock() - start - (stats.io_time - io_time))
+
+
+    def __fileno(self):
+        try:
+            return self.__stream.fileno()
+
+        except (AttributeError, ValueError, io.UnsupportedOperation):
+            return None
+
+
+    def __blocks(self, fd):
+        while True:
+            if not self.__is_ready(fd):
+                self.__idle()
+
+            if self.__stats is None:
+                block = os.read(fd, self.READ_SIZE)
+
+            else:
+                start = time.perf_counter()
+                block = os.read(fd, self.READ_SIZE)
+                self.__stats.read(len(block), time.perf_counter() - start)
+
+            if not block:
+                break
+
+            yield block
+
+
+    def __lines(self, blocks):
+        encoding = getattr(self.__stream, 'encoding', None) or 'utf-8'
+        errors = getattr(self.__stream, 'errors', None) or 'strict'
+
+        remainder = b''
+
+        for block in blocks:
+            block = remainder + block
+            end = block.rfind(b'\n') + 1
+
+            remainder = block[end:]
+
+            if end:
+                yield from block[:end].decode(encoding, errors).split('\n')[:-1]
+
+        if remainder:
+            yield remainder.decode(encoding, errors)
+
+
+    def __text_lines(self):
+        for line in self.__stream:
+            yield line.rstrip('\n')
+
+        self.__idle()
+
+
+    def __idle(self):
+        if self.__idle_handler is not None:
+            self.__idle_handler()
+
+
+    @staticmethod
+    def __is_ready(fd, timeout=0.0):
+        try:
+            readable, _, _ = select.select([fd], [], [], timeout)
+
+        except (OSError, ValueError):               # for example, a pipe on Windows
+            return False
+
+        return bool(readable)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "InputStream:{stream:%s, idle_handler:%s, stats:%s}" % \
+               (self.__stream.__class__.__name__, self.__idle_handler, self.__stats)
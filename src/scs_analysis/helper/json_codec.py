@@ -0,0 +1,152 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A JSONCodec parses and serialises the documents of a JSON stream. It replaces the PathDict.construct_from_jstr(..) /
+JSONify.dumps(..) pair in the loop of each stream utility.
+
+Parsing is performed by the fastest backend available - orjson, if it is installed, otherwise the C scanner of the
+standard library, which is called directly. Any document that the fast path rejects is offered to json.loads(..), so
+that the documents accepted - and the values returned - are the same for every backend. (The exception is integers
+beyond 64 bits, which orjson returns as floats. These are not found in sensor documents.)
+
+Serialisation is always performed by a single, reusable standard library encoder, so that output is byte-for-byte
+the same as that of JSONify.dumps(..). Known types are encoded by a type table, rather than the JSONify default hook.
+
+https://github.com/ijl/orjson
+"""
+
+import json
+
+from decimal import Decimal
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONable
+from scs_core.data.path_dict import PathDict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class JSONCodec(object):
+    """
+    classdocs
+    """
+
+    BACKENDS = ('orjson', 'stdlib')
+
+    __ENCODERS = {
+        Decimal:                float,
+        LocalizedDatetime:      LocalizedDatetime.as_iso8601,
+        PathDict:               PathDict.node
+    }
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def backends(cls):
+        return tuple(backend for backend in cls.BACKENDS if backend != 'orjson' or orjson is not None)
+
+
+    @classmethod
+    def construct(cls, backend=None):
+        available = cls.backends()
+
+        if backend is None:
+            backend = available[0]
+
+        if backend not in available:
+            raise ValueError("unavailable backend: %s" % backend)
+
+        return cls(backend)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, backend):
+        """
+        Constructor
+        """
+        self.__backend = backend                    # string
+
+        self.__parse = orjson.loads if backend == 'orjson' else self.__scan
+        self.__scan_once = json.JSONDecoder().scan_once
+
+        self.__encode = json.JSONEncoder(ensure_ascii=False, default=self.__default).encode
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def loads(self, jstr):
+        try:
+            return self.__parse(jstr)
+
+        except ValueError:
+            pass
+
+        # documents rejected by the fast path - for example, with NaN or surrounding whitespace...
+        try:
+            return json.loads(jstr)
+
+        except ValueError:
+            return None
+
+
+    def decode(self, jstr):
+        jdict = self.loads(jstr)
+
+        return None if jdict is None else PathDict(jdict)
+
+
+    def dumps(self, obj):
+        if obj.__class__ is PathDict:
+            obj = obj.node()
+
+        return self.__encode(obj)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __scan(self, jstr):
+        try:
+            obj, end = self.__scan_once(jstr, 0)
+
+        except StopIteration:
+            raise ValueError(jstr)
+
+        if end != len(jstr):
+            raise ValueError(jstr)
+
+        return obj
+
+
+    def __default(self, obj):
+        encoder = self.__ENCODERS.get(obj.__class__)
+
+        if encoder is not None:
+            return encoder(obj)
+
+        if isinstance(obj, JSONable):
+            return obj.as_json()
+
+        raise TypeError("Object of type %s is not JSON serializable" % obj.__class__.__name__)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def backend(self):
+        return self.__backend
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "JSONCodec:{backend:%s}" % self.backend
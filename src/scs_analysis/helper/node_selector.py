@@ -0,0 +1,73 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A NodeSelector performs the per-document selection of the node utility. By default, the nodes at the sub paths are
+selected, in the order of the sub paths, or the whole document if there are no sub paths. In the exclude mode, every
+node except those at the sub paths is selected, in the order of the document, or nothing if there are no sub paths.
+Empty selections are dropped. The selection is used by node, and by its pipeline stage.
+"""
+
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NodeSelector(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, sub_paths, exclude):
+        """
+        Constructor
+        """
+        self.__sub_paths = sub_paths                # array of string
+        self.__exclude = exclude                    # bool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def select(self, datum):
+        if self.__exclude and not self.__sub_paths:
+            return None                             # everything is excluded
+
+        # build...
+        if not self.__sub_paths:
+            target = datum                          # everything is included
+
+        else:
+            target = PathDict()
+
+            if self.__exclude:
+                # use datum field ordering...
+                for path in datum.paths():
+                    if self.includes(path):
+                        target.append(path, datum.node(path))
+
+            else:
+                # use sub_paths field ordering...
+                for sub_path in self.__sub_paths:
+                    if datum.has_sub_path(sub_path):
+                        target.append(sub_path, datum.node(sub_path))
+
+        return target if target else None           # skip empty outputs
+
+
+    def includes(self, path):
+        for sub_path in self.__sub_paths:
+            if PathDict.sub_path_includes_path(sub_path, path):
+                return not self.__exclude
+
+        return self.__exclude
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NodeSelector:{sub_paths:%s, exclude:%s}" % (self.__sub_paths, self.__exclude)
@@ -0,0 +1,102 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A NodeShift performs the document transform of the node_shift utility: the node at the source path is shifted by
+the offset, with a NodeShifter, and the residual documents are produced when the input is exhausted. A document
+without the source path, or with a node that cannot be shifted, terminates execution. The transform is used by
+node_shift, and by its pipeline stage.
+"""
+
+import sys
+
+from scs_core.data.node_shifter import NodeShifter
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NodeShift(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, offset, fill, source_path, target_path, codec):
+        """
+        Constructor
+        """
+        self.__source_path = source_path                    # string
+        self.__target_path = target_path                    # string
+        self.__codec = codec                                # JSONCodec
+
+        self.__shifter = NodeShifter(offset, fill, source_path, target_path)        # NodeShifter
+
+        self.__document_count = 0                           # int
+        self.__output_count = 0                             # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, documents):
+        for datum in documents:
+            self.__document_count += 1
+
+            if not datum.has_sub_path(self.__source_path):
+                print("node_shift: source path '%s' not in %s" % (self.__source_path, self.__codec.dumps(datum)),
+                      file=sys.stderr)
+                exit(1)
+
+            try:
+                target = self.__shifter.shift(datum)
+
+            except TypeError:
+                target = None
+                print("node_shift: incompatible types for '%s' and '%s'" % (self.__source_path, self.__target_path),
+                      file=sys.stderr)
+                exit(1)
+
+            if target is None:
+                continue
+
+            yield target
+
+            self.__output_count += 1
+
+        # residual...
+        while True:
+            target = self.__shifter.pop()
+
+            if target is None:
+                break
+
+            yield target
+
+            self.__output_count += 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def shifter(self):
+        return self.__shifter
+
+
+    @property
+    def document_count(self):
+        return self.__document_count
+
+
+    @property
+    def output_count(self):
+        return self.__output_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NodeShift:{shifter:%s, document_count:%s, output_count:%s}" % \
+               (self.shifter, self.document_count, self.output_count)
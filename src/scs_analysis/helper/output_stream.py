@@ -0,0 +1,242 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+An OutputStream replaces the print(..) / sys.stdout.flush() pair used by the stream utilities. The stream is flushed
+according to a FlushPolicy: on a terminal every document is flushed, whereas on a pipe or file documents are held,
+then written as a single block when a number of documents or an interval has elapsed, or when the input is idle.
+
+Documents are written with write_document(..), either as JSON text or, for the 'bin' format, as a binary document
+stream. If a StreamStats is given, the serialisation time of each document, and the bytes and time of each write, are
+recorded. Each write(..) of text is counted as a document.
+"""
+
+import sys
+import time
+
+from scs_analysis.helper.binary_codec import BinaryEncoder
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class FlushPolicy(object):
+    """
+    classdocs
+    """
+
+    BATCH_DOCUMENTS =       1000                    # documents
+    BATCH_INTERVAL =        0.5                     # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_for_stream(cls, stream):
+        try:
+            interactive = stream.isatty()
+        except (AttributeError, ValueError):
+            interactive = False
+
+        if interactive:
+            return cls.per_document()
+
+        return cls.batch()
+
+
+    @classmethod
+    def per_document(cls):
+        return cls(1, None, True)
+
+
+    @classmethod
+    def batch(cls, documents=BATCH_DOCUMENTS, interval=BATCH_INTERVAL):
+        return cls(documents, interval, True)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, documents, interval, on_idle):
+        """
+        Constructor
+        """
+        self.__documents = documents                # int or None
+        self.__interval = interval                  # float seconds or None
+        self.__on_idle = on_idle                    # bool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def documents(self):
+        return self.__documents
+
+
+    @property
+    def interval(self):
+        return self.__interval
+
+
+    @property
+    def on_idle(self):
+        return self.__on_idle
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "FlushPolicy:{documents:%s, interval:%s, on_idle:%s}" % (self.documents, self.interval, self.on_idle)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class OutputStream(object):
+    """
+    classdocs
+    """
+
+    CLOCK_DOCUMENTS =       16                      # documents between reads of the clock
+
+    FORMATS =               ('json', 'bin')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, stream=None, policy=None, codec=None, doc_format='json', stats=None):
+        stream = sys.stdout if stream is None else stream
+        policy = FlushPolicy.construct_for_stream(stream) if policy is None else policy
+
+        if doc_format not in cls.FORMATS:
+            raise ValueError("unknown format: %s" % doc_format)
+
+        encoder = BinaryEncoder(codec) if doc_format == 'bin' else None
+
+        return cls(stream, policy, codec, encoder, stats)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, stream, policy, codec, encoder, stats):
+        """
+        Constructor
+        """
+        self.__stream = stream                      # text stream
+        self.__policy = policy                      # FlushPolicy
+        self.__codec = codec                        # JSONCodec or None
+        self.__encoder = encoder                    # BinaryEncoder or None
+        self.__stats = stats                        # StreamStats or None
+
+        self.__buffer = []                          # array of str or bytes
+        self.__documents = policy.documents         # int or None
+        self.__interval = policy.interval           # float seconds or None
+
+        self.__pending = 0                          # int
+        self.__latest_flush = time.monotonic()      # float
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write_document(self, document, jstr=None):
+        if self.__stats is not None:
+            start = time.perf_counter()
+            self.__append(document, jstr)
+            self.__stats.document_out(time.perf_counter() - start)
+
+        else:
+            self.__append(document, jstr)
+
+        self.__pending += 1
+        self.__check_flush()
+
+
+    def write(self, text, end='\n'):
+        if self.__encoder is not None:
+            raise ValueError("text output to a binary document stream")
+
+        self.__buffer.append(text + end)
+
+        if self.__stats is not None:
+            self.__stats.document_out(0.0)          # the text is already serialised
+
+        self.__pending += 1
+        self.__check_flush()
+
+
+    def idle(self):
+        if self.__pending and self.__policy.on_idle:
+            self.flush()
+
+
+    def flush(self):
+        start = time.perf_counter()
+        count = 0
+
+        if self.__buffer:
+            if self.__encoder is not None:
+                count = self.__stream.buffer.write(b''.join(self.__buffer))
+            else:
+                count = self.__stream.write(''.join(self.__buffer))
+
+            self.__buffer = []
+
+        self.__stream.flush()
+
+        if self.__stats is not None:
+            self.__stats.written(count, time.perf_counter() - start)
+
+        self.__pending = 0
+        self.__latest_flush = time.monotonic()
+
+
+    def close(self):
+        try:
+            self.flush()
+
+        except BrokenPipeError:
+            pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __append(self, document, jstr):
+        if self.__encoder is not None:
+            self.__buffer.append(self.__encoder.encode(document))
+
+        else:
+            self.__buffer.append((self.__codec.dumps(document) if jstr is None else jstr) + '\n')
+
+
+    def __check_flush(self):
+        # documents...
+        if self.__documents is not None and self.__pending >= self.__documents:
+            self.flush()
+            return
+
+        # interval - the clock is read every CLOCK_DOCUMENTS documents...
+        if self.__interval is not None and self.__pending % self.CLOCK_DOCUMENTS == 0:
+            if time.monotonic() - self.__latest_flush >= self.__interval:
+                self.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def policy(self):
+        return self.__policy
+
+
+    @property
+    def is_binary(self):
+        return self.__encoder is not None
+
+
+    @property
+    def pending(self):
+        return self.__pending
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "OutputStream:{policy:%s, binary:%s, pending:%s}" % (self.policy, self.is_binary, self.pending)
@@ -0,0 +1,172 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A PathAccessor is a PathDict path - such as val.NO2.cnc or val:0 - compiled once, so that it can be tested, read
+and written on every document without splitting the path, or walking every leaf of the document with paths().
+
+The semantics are those of PathDict:
+
+has(datum)          path in datum.paths()
+has_node(datum)     datum.has_sub_path(path)
+node(datum)         datum.node(path)
+append(datum, v)    datum.append(path, v)
+"""
+
+import re
+
+from collections import OrderedDict
+from copy import deepcopy
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PathAccessor(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, path):
+        keys = re.split(r"[.:]", path)
+        separators = re.findall(r"[.:]", path)
+
+        steps = []
+
+        for i, key in enumerate(keys):
+            try:
+                index = int(key)
+            except ValueError:
+                index = None
+
+            preceding = separators[i - 1] if i > 0 else '.'                     # the root is always a dict
+            following = separators[i] if i < len(separators) else ''
+
+            steps.append((key, index, preceding == ':', following == ':'))
+
+        return cls(path, tuple(steps))
+
+
+    @classmethod
+    def construct_all(cls, paths):
+        return OrderedDict((path, cls.construct(path)) for path in paths)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path, steps):
+        """
+        Constructor
+        """
+        self.__path = path                          # string
+        self.__steps = steps                        # tuple of (key, index, in_list, list_next)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def has(self, datum):
+        container = datum.node()
+
+        for key, index, in_list, _ in self.__steps:
+            if isinstance(container, list):
+                if not in_list or index is None or not 0 <= index < len(container):
+                    return False
+
+                container = container[index]
+
+            elif isinstance(container, dict):
+                if in_list or key not in container:
+                    return False
+
+                container = container[key]
+
+            else:
+                return False
+
+        return not isinstance(container, (dict, list))
+
+
+    def has_node(self, datum):
+        try:
+            self.__walk(datum.node())
+            return True
+
+        except KeyError:
+            return False
+
+
+    def node(self, datum):
+        return self.__walk(datum.node())
+
+
+    def get(self, datum, default=None):
+        try:
+            return self.__walk(datum.node())
+
+        except KeyError:
+            return default
+
+
+    def append(self, datum, value):
+        container = datum.node()
+        last = len(self.__steps) - 1
+
+        for i, (key, index, _, list_next) in enumerate(self.__steps):
+            if isinstance(container, list):
+                if index is None:
+                    raise KeyError(self.__path)
+
+                key = index
+
+                while key >= len(container):
+                    container.append(None)
+
+                if container[key] is None:
+                    container[key] = [] if list_next else OrderedDict()
+
+            elif key not in container:
+                container[key] = [] if list_next else OrderedDict()
+
+            if i == last:
+                container[key] = deepcopy(value) if isinstance(value, (dict, list)) else value
+                return
+
+            container = container[key]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __walk(self, container):
+        try:
+            for key, index, _, _ in self.__steps:
+                if isinstance(container, list):
+                    if index is None:
+                        raise KeyError(key)
+
+                    container = container[index]
+
+                else:
+                    container = container[key]
+
+            return container
+
+        except (KeyError, IndexError, TypeError):
+            raise KeyError(self.__path)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "PathAccessor:{path:%s}" % self.path
@@ -0,0 +1,73 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A RowWriter writes the converted rows of csv_reader to an OutputStream. Rows are given as JSON strings. In array
+mode, the rows are written as the members of a single JSON array. In binary mode, each row is decoded, and written as
+a binary document. Otherwise, each row is written as it is, followed by a newline.
+"""
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RowWriter(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, stdout, codec, array):
+        """
+        Constructor
+        """
+        self.__stdout = stdout
+        self.__codec = codec
+        self.__array = array
+
+        self.__count = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def open(self):
+        if self.__array:
+            self.__stdout.write('[', end='')
+
+
+    def write(self, datum):
+        if self.__array:
+            if self.__count == 0:
+                self.__stdout.write(datum, end='')
+
+            else:
+                self.__stdout.write(", %s" % datum, end='')
+
+        elif self.__stdout.is_binary:
+            self.__stdout.write_document(self.__codec.loads(datum))
+
+        else:
+            self.__stdout.write(datum)
+
+        self.__count += 1
+
+
+    def close(self):
+        if self.__array:
+            self.__stdout.write(']')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "RowWriter:{array:%s, count:%s}" % (self.__array, self.count)
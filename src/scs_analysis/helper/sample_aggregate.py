@@ -8,12 +8,14 @@ source repo: scs_analysis
 
 import sys
 
+from collections import OrderedDict
 from decimal import InvalidOperation
 
+from scs_analysis.helper.path_accessor import PathAccessor
+
 from scs_core.data.categorical_regression import CategoricalRegression
 from scs_core.data.datetime import LocalizedDatetime
 from scs_core.data.datum import Datum
-from scs_core.data.json import JSONify
 from scs_core.data.linear_regression import LinearRegression
 from scs_core.data.path_dict import PathDict
 from scs_core.data.precision import Precision
@@ -36,17 +38,65 @@ class SampleAggregate(object):
         self.__iso_path = iso_path
         self.__nodes = nodes
 
+        self.__accessors = OrderedDict()
         self.__precisions = {}
         self.__regressions = {}
 
         self.__initialised = False
         self.__tag = None
 
+        self.__document_count = 0
+        self.__processed_count = 0
         self.__output_count = 0
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    def process(self, documents, generator, fill):
+        checkpoint = None
+
+        for datum in documents:
+            # sample...
+            self.__document_count += 1
+
+            try:
+                rec_node = datum.node(self.__iso_path)
+            except KeyError:
+                continue
+
+            rec = LocalizedDatetime.construct_from_iso8601(rec_node)
+
+            # set checkpoint...
+            if checkpoint is None:
+                checkpoint = generator.enclosing_localised_datetime(rec)
+
+            # report and reset...
+            if rec.datetime > checkpoint.datetime:
+                yield self.__report(checkpoint)
+                self.reset()
+
+                filler = checkpoint
+                checkpoint = generator.enclosing_localised_datetime(rec)
+
+                # fill missing...
+                while fill:
+                    filler = generator.next_localised_datetime(filler)
+
+                    if filler >= checkpoint:
+                        break
+
+                    yield self.__report(filler)
+
+            # append sample...
+            self.append(rec, datum)
+
+            self.__processed_count += 1
+
+        # report remainder...
+        if self.has_value():
+            yield self.__report(checkpoint)
+
+
     def has_value(self):
         for regression in self.__regressions.values():
             if regression.has_midpoint():
@@ -77,6 +127,7 @@ class SampleAggregate(object):
                     if path == 'rec':
                         continue
 
+                    self.__accessors[path] = PathAccessor.construct(path)
                     self.__precisions[path] = Precision()
                     self.__regressions[path] = LinearRegression() if Datum.is_numeric(sample.node(path)) else \
                         CategoricalRegression()
@@ -84,11 +135,8 @@ class SampleAggregate(object):
             self.__initialised = True
 
         # values...
-        for path in self.__precisions.keys():
-            try:
-                value = sample.node(path)
-            except KeyError:
-                continue
+        for path, accessor in self.__accessors.items():
+            value = accessor.get(sample)
 
             if value is None:
                 continue
@@ -129,15 +177,24 @@ class SampleAggregate(object):
         return report
 
 
-    def print(self, localised_datetime):
-        print(JSONify.dumps(self.report(localised_datetime)))
-        sys.stdout.flush()
-
+    def __report(self, localised_datetime):
         self.__output_count += 1
 
+        return self.report(localised_datetime)
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    @property
+    def document_count(self):
+        return self.__document_count
+
+
+    @property
+    def processed_count(self):
+        return self.__processed_count
+
+
     @property
     def output_count(self):
         return self.__output_count
@@ -0,0 +1,139 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A SampleAH performs the per-document transform of the sample_ah utility: the rH leaf node of a document is recreated
+as the dictionary {rH: RH_VALUE, aH: AH_VALUE}. Documents without rH or t values are dropped. The transform is used
+by the serial, --workers and --batch modes of sample_ah, and by its pipeline stage.
+"""
+
+import sys
+
+from scs_analysis.helper.document_batch import DocumentBatch
+
+from scs_core.climate.absolute_humidity import AbsoluteHumidity
+
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleAH(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, rh_path, t_path, codec):
+        """
+        Constructor
+        """
+        self.__rh_path = rh_path                    # string
+        self.__t_path = t_path                      # string
+        self.__codec = codec                        # JSONCodec
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def datum(self, sample):
+        try:
+            values = self.__values(sample)
+        except ValueError as ex:
+            print("sample_ah: %s" % ex, file=sys.stderr)
+            exit(1)
+
+        if values is None:
+            return None
+
+        paths, rh, t = values
+
+        # compute...
+        ah = round(AbsoluteHumidity.from_rh_t(rh, t), 3)                    # report to 0.001 g / m3
+
+        return self.__target(sample, paths, rh, ah)
+
+
+    def batch(self, samples):
+        # imported on the --batch path only...
+        from scs_analysis.helper.absolute_humidity_array import AbsoluteHumidityArray
+
+        values = []
+        error = None
+
+        for sample in samples:
+            try:
+                values.append(self.__values(sample))
+            except ValueError as ex:
+                error = ex
+                break
+
+        # compute...
+        valid = [value for value in values if value is not None]
+
+        rhs = DocumentBatch.array([value[1] for value in valid])
+        ts = DocumentBatch.array([value[2] for value in valid])
+
+        try:
+            ahs = iter(DocumentBatch.rounded(AbsoluteHumidityArray.from_rh_t(rhs, ts), 3))
+
+        except FloatingPointError:                  # the scalar path raises - if it does - at the same document
+            ahs = (round(AbsoluteHumidity.from_rh_t(value[1], value[2]), 3) for value in valid)
+
+        for sample, value in zip(samples, values):
+            yield None if value is None else self.__target(sample, value[0], value[1], next(ahs))
+
+        if error is not None:
+            print("sample_ah: %s" % error, file=sys.stderr)
+            exit(1)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __values(self, sample):
+        paths = sample.paths()
+
+        # rH / t...
+        if self.__rh_path not in paths or self.__t_path not in paths:
+            return None
+
+        rh_node = sample.node(self.__rh_path)
+        t_node = sample.node(self.__t_path)
+
+        if rh_node == '' or t_node == '':
+            return None
+
+        try:
+            rh = float(rh_node)
+        except ValueError:
+            raise ValueError("invalid value for rH in %s" % self.__codec.dumps(sample))
+
+        try:
+            t = float(t_node)
+        except ValueError:
+            raise ValueError("invalid value for t in %s" % self.__codec.dumps(sample))
+
+        return paths, rh, t
+
+
+    def __target(self, sample, paths, rh, ah):
+        target = PathDict()
+
+        for path in paths:
+            if path == self.__rh_path:
+                target.append(path + '.rH', rh)
+                target.append(path + '.aH', ah)
+
+            else:
+                target.append(path, sample.node(path))
+
+        return target
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleAH:{rh_path:%s, t_path:%s}" % (self.__rh_path, self.__t_path)
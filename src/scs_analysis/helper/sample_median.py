@@ -0,0 +1,66 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A SampleMedian performs the per-document transform of the sample_median utility: the value at the path is passed
+through a median filter, and the output document holds the rec field, the source value and the median. Documents
+without a value at the path are dropped. The transform is used by sample_median, and by its pipeline stage.
+"""
+
+from scs_core.data.median_filter import MedianFilter
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleMedian(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path, window, precision):
+        """
+        Constructor
+        """
+        self.__path = path                                      # string
+        self.__precision = precision                            # int
+
+        self.__median_filter = MedianFilter(window)             # MedianFilter
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def datum(self, sample):
+        value = sample.node(self.__path)
+
+        if value is None:
+            return None
+
+        target = PathDict()
+
+        if sample.has_path('rec'):
+            target.copy(sample, 'rec')
+
+        target.append(self.__path + '.src', value)
+        target.append(self.__path + '.med', round(self.__median_filter.compute(value), self.__precision))
+
+        return target
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def median_filter(self):
+        return self.__median_filter
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleMedian:{path:%s, precision:%s, median_filter:%s}" % \
+               (self.__path, self.__precision, self.__median_filter)
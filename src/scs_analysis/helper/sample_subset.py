@@ -0,0 +1,103 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A SampleSubset performs the per-document test of the sample_subset utility: the value at the path - as a string, an
+ISO 8601 datetime or a number - is compared with the lower (inclusive) and upper (exclusive) bounds. A document is
+included if its value is in bounds, or - in the exclusions mode - if it is out of bounds. Documents without a value
+are not included. A value that cannot be parsed terminates execution. The test is used by sample_subset, and by its
+pipeline stage.
+"""
+
+import sys
+
+from scs_analysis.helper.path_accessor import PathAccessor
+
+from scs_core.data.datum import Datum
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleSubset(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path, lower_bound, upper_bound, iso8601, numeric, exclusions, codec):
+        """
+        Constructor
+        """
+        self.__lower_bound = lower_bound                    # string, LocalizedDatetime or float
+        self.__upper_bound = upper_bound                    # string, LocalizedDatetime or float
+        self.__iso8601 = iso8601                            # bool
+        self.__numeric = numeric                            # bool
+        self.__exclusions = exclusions                      # bool
+        self.__codec = codec                                # JSONCodec
+
+        self.__accessor = PathAccessor.construct(path)      # PathAccessor
+
+        self.__processed_count = 0                          # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def includes(self, datum):
+        # value...
+        if not self.__accessor.has(datum):
+            return False
+
+        value_node = self.__accessor.node(datum)
+
+        if value_node == '':
+            return False
+
+        if self.__iso8601:
+            value = Datum.datetime(value_node)
+
+            if value is None:
+                print("sample_subset: invalid ISO 8601 value '%s' in %s" % (value_node, self.__codec.dumps(datum)),
+                      file=sys.stderr)
+                exit(1)
+
+        elif self.__numeric:
+            value = Datum.float(value_node)
+
+            if value is None:
+                print("sample_subset: invalid numeric value '%s' in %s" % (value_node, self.__codec.dumps(datum)),
+                      file=sys.stderr)
+                exit(1)
+
+        else:
+            value = value_node
+
+            if not value:
+                return False
+
+        self.__processed_count += 1
+
+        # bounds...
+        in_bounds = (self.__lower_bound is None or value >= self.__lower_bound) and \
+                    (self.__upper_bound is None or value < self.__upper_bound)
+
+        return not in_bounds if self.__exclusions else in_bounds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def processed_count(self):
+        return self.__processed_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleSubset:{lower_bound:%s, upper_bound:%s, iso8601:%s, numeric:%s, exclusions:%s, " \
+               "processed_count:%s}" % \
+               (self.__lower_bound, self.__upper_bound, self.__iso8601, self.__numeric, self.__exclusions,
+                self.processed_count)
@@ -0,0 +1,357 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A SortedJoin performs the SQL joins of the scs_core Join - inner, left, right and full - on two or more sequences of
+JSON documents that are each in primary key order, for the --sorted mode of csv_join. The sequences are merged in a
+single k-way pass: one document is held from each sequence at a time, so that memory use is independent of the length
+of the sequences, and joined documents are produced as soon as every sequence has passed their primary key.
+
+The joined documents are those of the Join: the primary key, and the document of each sequence - without its primary
+key - labelled for its set path. As for the Join, where a primary key is repeated within a sequence, the last of its
+documents is used. The joined documents are in primary key order.
+
+Where there are more than two sequences, the first is the left sequence, and the last is the right, and the result is
+that of a chain of two-way joins - ((s0 JOIN s1) JOIN s2) ..: an inner join includes the primary keys found in every
+sequence, a left join those in the first, a right join those in the last, and a full join those in any. The documents
+of sequences without the primary key are null. For a right join, as for the chain, the document of a sequence is also
+null unless every later sequence has the primary key.
+
+The as-of join matches each left document to a document of each right sequence whose primary key - a datetime - is
+not exactly equal: the latest document at or before the left primary key (preceding), or the document closest to it,
+either side (nearest - where two are equally close, the preceding document is used). The right document must be within
+the tolerance of the left primary key. Right documents may be matched any number of times, or not at all. For inner
+joins, left documents without a match in every right sequence are omitted; for left joins, the missing matches are
+null. Right documents retain their primary keys, so that the time of each match is shown.
+
+A document with a primary key that is less than that of its predecessor raises a ValueError, as does a primary key
+that is not an ISO 8601 datetime, where pk_is_iso8601 is set.
+
+https://en.wikipedia.org/wiki/Sort-merge_join
+"""
+
+from datetime import timedelta
+
+from scs_analysis.helper.path_accessor import PathAccessor
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.path_dict import PathDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SortedJoin(object):
+    """
+    classdocs
+    """
+
+    AS_OF_NEAREST =     'nearest'
+    AS_OF_PRECEDING =   'preceding'
+
+    AS_OF_MODES =       (AS_OF_NEAREST, AS_OF_PRECEDING)
+    AS_OF_TYPES =       ('INNER', 'LEFT')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, tables, pk_is_iso8601, codec):
+        sets = [SortedJoinSet(set_path, pk_path, pk_is_iso8601, codec) for set_path, pk_path, _ in tables]
+
+        return cls(sets)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, sets):
+        """
+        Constructor
+        """
+        if len(sets) < 2:
+            raise ValueError("a join requires at least two sets")
+
+        self.__sets = sets                      # array of SortedJoinSet
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def join(self, join_type, sequences):
+        join_type = join_type.upper()
+
+        pk_path = self.right.pk_path if join_type == 'RIGHT' else self.left.pk_path
+
+        iterators = [join_set.runs(rows) for join_set, rows in zip(self.sets, sequences)]
+        heads = [next(iterator, None) for iterator in iterators]
+
+        while True:
+            # stop when no further documents can be joined...
+            if join_type == 'INNER' and None in heads:
+                return
+
+            if (join_type == 'LEFT' and heads[0] is None) or (join_type == 'RIGHT' and heads[-1] is None):
+                return
+
+            pks = [head[0] for head in heads if head is not None]
+
+            if not pks:
+                return
+
+            # the least primary key...
+            pk = min(pks)
+            matches = [head is not None and head[0] == pk for head in heads]
+
+            if self.__includes(join_type, matches):
+                filled = self.__filled(join_type, matches)
+                documents = [head[1] if is_filled else None for head, is_filled in zip(heads, filled)]
+                yield self.__union(pk_path, pk, documents)
+
+            for i, matched in enumerate(matches):
+                if matched:
+                    heads[i] = next(iterators[i], None)
+
+
+    def as_of(self, join_type, sequences, mode, tolerance):
+        join_type = join_type.upper()
+
+        if join_type not in self.AS_OF_TYPES:
+            raise ValueError("as-of join type may not be %s" % join_type)
+
+        if mode not in self.AS_OF_MODES:
+            raise ValueError("invalid as-of mode: %s" % mode)
+
+        tolerance = timedelta(seconds=tolerance)
+
+        rights = [join_set.runs(rows) for join_set, rows in zip(self.sets[1:], sequences[1:])]
+
+        preceding = [None] * len(rights)
+        following = [next(iterator, None) for iterator in rights]
+
+        for pk, left in self.left.runs(sequences[0]):
+            matches = []
+
+            for i, iterator in enumerate(rights):
+                while following[i] is not None and following[i][0] <= pk:
+                    preceding[i] = following[i]
+                    following[i] = next(iterator, None)
+
+                if mode == self.AS_OF_PRECEDING:
+                    matches.append(self.__within(pk, tolerance, preceding[i]))
+                else:
+                    matches.append(self.__within(pk, tolerance, preceding[i], following[i]))
+
+            if join_type == 'INNER' and None in matches:
+                continue
+
+            pairs = [(self.left.pk_path, pk), (self.left.set_path, self.left.node(left))]
+
+            for join_set, match in zip(self.sets[1:], matches):
+                pairs.append((join_set.set_path, None if match is None else match[1]))
+
+            yield PathDict.union(*pairs)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __includes(join_type, matches):
+        if join_type == 'INNER':
+            return all(matches)
+
+        if join_type == 'LEFT':
+            return matches[0]
+
+        if join_type == 'RIGHT':
+            return matches[-1]
+
+        return True
+
+
+    @staticmethod
+    def __filled(join_type, matches):
+        if join_type != 'RIGHT':
+            return matches
+
+        # as for ((s0 RIGHT s1) RIGHT s2) ..: a document is kept only if every later sequence has the primary key...
+        filled = list(matches)
+
+        for i in range(len(filled) - 2, -1, -1):
+            filled[i] = filled[i] and filled[i + 1]
+
+        return filled
+
+
+    @staticmethod
+    def __within(pk, tolerance, *candidates):
+        match = None
+        match_interval = None
+
+        for candidate in candidates:
+            if candidate is None:
+                continue
+
+            interval = abs(pk - candidate[0])
+
+            if interval <= tolerance and (match is None or interval < match_interval):
+                match = candidate
+                match_interval = interval
+
+        return match
+
+
+    def __union(self, pk_path, pk, documents):
+        pairs = [(pk_path, pk)]
+
+        for join_set, document in zip(self.sets, documents):
+            pairs.append((join_set.set_path, None if document is None else join_set.node(document)))
+
+        return PathDict.union(*pairs)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def sets(self):
+        return self.__sets
+
+
+    @property
+    def left(self):
+        return self.__sets[0]
+
+
+    @property
+    def right(self):
+        return self.__sets[-1]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SortedJoin:{sets:[%s]}" % ', '.join(str(join_set) for join_set in self.sets)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SortedJoinSet(object):
+    """
+    classdocs
+    """
+
+    def __init__(self, set_path, pk_path, pk_is_iso8601, codec):
+        """
+        Constructor
+        """
+        self.__set_path = set_path                  # string
+        self.__pk_path = pk_path                    # string
+        self.__pk_is_iso8601 = pk_is_iso8601        # bool
+        self.__codec = codec                        # JSONCodec
+
+        self.__pk_accessor = PathAccessor.construct(pk_path)                   # PathAccessor
+
+        self.__document_count = 0                   # int
+        self.__processed_count = 0                  # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def runs(self, rows):
+        latest_pk = None
+        latest = None
+
+        for pk, document, _ in self.documents(rows):
+            if latest is not None:
+                if pk < latest_pk:
+                    raise ValueError("pk '%s' out of order: %s" % (self.pk_path, self.__pk_accessor.node(document)))
+
+                if pk != latest_pk:
+                    yield latest_pk, latest
+
+            latest_pk = pk
+            latest = document
+
+        if latest is not None:
+            yield latest_pk, latest
+
+
+    def documents(self, rows):
+        for row in rows:
+            datum = self.__codec.decode(row)
+
+            if datum is None:
+                continue
+
+            self.__document_count += 1
+
+            if not self.__pk_accessor.has(datum):
+                raise ValueError("pk '%s' missing: %s" % (self.pk_path, row.strip()))
+
+            pk = self.__pk_accessor.node(datum)
+
+            if pk == '':
+                continue
+
+            self.__processed_count += 1
+
+            yield self.pk(pk), datum, row
+
+
+    def key(self, document):
+        return self.pk(self.__pk_accessor.node(document))
+
+
+    def pk(self, pk_value):
+        if not self.pk_is_iso8601:
+            return pk_value
+
+        datetime = LocalizedDatetime.construct_from_iso8601(pk_value)
+
+        if datetime is None:
+            raise ValueError("invalid pk '%s'" % pk_value)
+
+        return datetime
+
+
+    def node(self, document):
+        node = PathDict()
+
+        for path in document.paths():
+            if path != self.pk_path:
+                node.append(path, document.node(path))
+
+        return node
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def set_path(self):
+        return self.__set_path
+
+
+    @property
+    def pk_path(self):
+        return self.__pk_path
+
+
+    @property
+    def pk_is_iso8601(self):
+        return self.__pk_is_iso8601
+
+
+    @property
+    def document_count(self):
+        return self.__document_count
+
+
+    @property
+    def processed_count(self):
+        return self.__processed_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SortedJoinSet:{set_path:%s, pk_path:%s, pk_is_iso8601:%s, document_count:%s, processed_count:%s}" % \
+               (self.set_path, self.pk_path, self.pk_is_iso8601, self.document_count, self.processed_count)
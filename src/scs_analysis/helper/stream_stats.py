@@ -0,0 +1,228 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A StreamStats collects the counters and timings of a stream utility, for its --stats report. The InputStream and
+OutputStream of the utility record documents and bytes in and out, and the time spent in each phase:
+
+read        waiting for, and reading, input
+parse       decoding input documents
+compute     the work of the utility itself - the remainder of the elapsed time
+serialise   encoding output documents
+write       writing to stdout
+
+The latency of a document is the time from the start of its parsing until the utility requests the next document -
+that is, parse, compute and serialise, but not the time spent reading or writing. Latencies are held in a histogram
+with LATENCY_RESOLUTION buckets per doubling, so that p50 and p99 are reported to within about 10%, in constant memory.
+
+The report is a single-line JSON document, written to stderr when the utility terminates and, if an interval is given,
+every interval seconds.
+"""
+
+import json
+import math
+import sys
+import time
+
+from collections import OrderedDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class StreamStats(object):
+    """
+    classdocs
+    """
+
+    LATENCY_RESOLUTION =    8                       # histogram buckets per doubling
+    LATENCY_UNIT =          1e-6                    # seconds - the lower bound of the histogram
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, name, interval=None, file=None):
+        file = sys.stderr if file is None else file
+
+        return cls(name, interval, file)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, name, interval, file):
+        """
+        Constructor
+        """
+        self.__name = name                          # string
+        self.__interval = interval                  # float seconds or None
+        self.__file = file                          # text stream
+
+        self.__start_time = time.perf_counter()     # float
+        self.__latest_report = self.__start_time    # float
+
+        self.__documents_in = 0                     # int
+        self.__documents_out = 0                    # int
+        self.__bytes_read = 0                       # int
+        self.__bytes_written = 0                    # int
+
+        self.__read_time = 0.0                      # float seconds
+        self.__parse_time = 0.0                     # float seconds
+        self.__serialise_time = 0.0                 # float seconds
+        self.__write_time = 0.0                     # float seconds
+
+        self.__latencies = {}                       # dict of bucket: count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # InputStream...
+
+    def read(self, count, elapsed):
+        self.__bytes_read += count
+        self.__read_time += elapsed
+
+
+    def document_in(self, parse_time, latency):
+        self.__documents_in += 1
+        self.__parse_time += parse_time
+
+        bucket = int(math.log2(latency / self.LATENCY_UNIT) * self.LATENCY_RESOLUTION) if \
+            latency > self.LATENCY_UNIT else 0
+
+        self.__latencies[bucket] = self.__latencies.get(bucket, 0) + 1
+
+        self.check()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # OutputStream...
+
+    def document_out(self, serialise_time):
+        self.__documents_out += 1
+        self.__serialise_time += serialise_time
+
+
+    def written(self, count, elapsed):
+        self.__bytes_written += count
+        self.__write_time += elapsed
+
+        self.check()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def check(self):
+        if self.__interval is None:
+            return
+
+        now = time.perf_counter()
+
+        if now - self.__latest_report >= self.__interval:
+            self.__report(now, False)
+
+
+    def report(self):
+        self.__report(time.perf_counter(), True)
+
+
+    def as_json(self, now=None, final=True):
+        now = time.perf_counter() if now is None else now
+        elapsed = now - self.__start_time
+
+        compute_time = elapsed - (self.__read_time + self.__parse_time + self.__serialise_time + self.__write_time)
+        documents = self.__documents_in if self.__documents_in else self.__documents_out
+
+        jdict = OrderedDict()
+
+        jdict['tool'] = self.__name
+        jdict['final'] = final
+        jdict['elapsed'] = round(elapsed, 3)
+
+        jdict['documents-in'] = self.__documents_in
+        jdict['documents-out'] = self.__documents_out
+        jdict['docs-per-sec'] = round(documents / elapsed, 1) if elapsed > 0 else None
+
+        jdict['bytes-read'] = self.__bytes_read
+        jdict['bytes-written'] = self.__bytes_written
+
+        jdict['time'] = OrderedDict((
+            ('read', round(self.__read_time, 3)),
+            ('parse', round(self.__parse_time, 3)),
+            ('compute', round(max(compute_time, 0.0), 3)),
+            ('serialise', round(self.__serialise_time, 3)),
+            ('write', round(self.__write_time, 3))
+        ))
+
+        jdict['latency-ms'] = OrderedDict((
+            ('p50', self.latency_percentile(50)),
+            ('p99', self.latency_percentile(99))
+        ))
+
+        return jdict
+
+
+    def latency_percentile(self, percentile):
+        count = sum(self.__latencies.values())
+
+        if count == 0:
+            return None
+
+        rank = math.ceil(count * percentile / 100.0)
+        cumulative = 0
+
+        for bucket in sorted(self.__latencies):
+            cumulative += self.__latencies[bucket]
+
+            if cumulative >= rank:
+                upper = self.LATENCY_UNIT * 2 ** ((bucket + 1) / self.LATENCY_RESOLUTION)
+                return round(upper * 1000, 3)
+
+        return None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __report(self, now, final):
+        self.__latest_report = now
+
+        try:
+            print(json.dumps(self.as_json(now, final)), file=self.__file)
+            self.__file.flush()
+
+        except (OSError, ValueError):               # for example, stderr has been closed
+            pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def name(self):
+        return self.__name
+
+
+    @property
+    def interval(self):
+        return self.__interval
+
+
+    @property
+    def io_time(self):
+        return self.__read_time + self.__write_time
+
+
+    @property
+    def documents_in(self):
+        return self.__documents_in
+
+
+    @property
+    def documents_out(self):
+        return self.__documents_out
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "StreamStats:{name:%s, interval:%s, documents_in:%s, documents_out:%s}" % \
+               (self.name, self.interval, self.documents_in, self.documents_out)
@@ -24,7 +24,7 @@ Alternatively, if the node is an array or other iterable type, then it may be ou
 separated by newline characters) according to the -s flag.
 
 SYNOPSIS
-node.py { [-x] [-a] | -s } [-v] [SUB_PATH_1 ... SUB_PATH_N]
+node.py { [-x] [-a] | -s } [--format FORMAT] [--stats [--stats-interval INTERVAL]] [-v] [SUB_PATH_1 ... SUB_PATH_N]
 
 EXAMPLES
 csv_reader.py climate.csv | node.py -x val.bar
@@ -46,9 +46,11 @@ array mode:
 import sys
 
 from scs_analysis.cmd.cmd_node import CmdNode
-
-from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.node_selector import NodeSelector
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.stream_stats import StreamStats
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -71,50 +73,33 @@ if __name__ == '__main__':
         print("node: %s" % cmd, file=sys.stderr)
         sys.stderr.flush()
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('node', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    stdin = InputStream.construct(idle_handler=stdout.idle, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
+        selector = NodeSelector(cmd.sub_paths, cmd.exclude)
+
         if cmd.array:
-            print('[', end='')
+            stdout.write('[', end='')
 
         node = None
         first = True
 
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
+        for _, datum in stdin.documents(codec):
             document_count += 1
 
-            if cmd.exclude and not cmd.sub_paths:
-                continue                                # everything is excluded
-
-            # build...
-            if not cmd.sub_paths:
-                target = datum                          # everything is included
+            target = selector.select(datum)
 
-            else:
-                target = PathDict()
-
-                if cmd.exclude:
-                    # use datum field ordering...
-                    for path in datum.paths():
-                        if cmd.includes(path):
-                            target.append(path, datum.node(path))
-
-                else:
-                    # use cmd.sub_paths field ordering...
-                    for sub_path in cmd.sub_paths:
-                        if datum.has_sub_path(sub_path):
-                            target.append(sub_path, datum.node(sub_path))
-
-            # report...
-            if not target:
-                continue                                # skip empty outputs
+            if target is None:
+                continue
 
             if cmd.sequence:
                 for path in cmd.sub_paths:
@@ -122,24 +107,22 @@ if __name__ == '__main__':
 
                     try:
                         for item in node:
-                            print(JSONify.dumps(item))
+                            stdout.write_document(item)
                     except TypeError as ex:
-                        print(ex)
-                        print(JSONify.dumps(node))
+                        stdout.write(str(ex))
+                        stdout.write_document(node)
 
             else:
                 if cmd.array:
                     if first:
-                        print(JSONify.dumps(target), end='')
+                        stdout.write(codec.dumps(target), end='')
                         first = False
 
                     else:
-                        print(", %s" % JSONify.dumps(target), end='')
+                        stdout.write(", %s" % codec.dumps(target), end='')
 
                 else:
-                    print(JSONify.dumps(target))
-
-            sys.stdout.flush()
+                    stdout.write_document(target)
 
             output_count += 1
 
@@ -156,7 +139,12 @@ if __name__ == '__main__':
 
     finally:
         if cmd.array:
-            print(']')
+            stdout.write(']')
+
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
 
         if cmd.verbose:
             print("node: documents: %d output: %d" % (document_count, output_count), file=sys.stderr)
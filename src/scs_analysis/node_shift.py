@@ -29,7 +29,8 @@ stream presents a regular sequence of datetime points. The stream should therefo
 sample_aggregate.py --fill.
 
 SYNOPSIS
-node_shift.py -o OFFSET [-r] [-v] SOURCE_SUB_PATH [TARGET_SUB_PATH]
+node_shift.py -o OFFSET [-r] [--format FORMAT] [--stats [--stats-interval INTERVAL]] [-v] SOURCE_SUB_PATH
+[TARGET_SUB_PATH]
 
 EXAMPLES
 csv_reader.py climate.csv | sample_aggregate.py -f -c **:/01:00 | node_shift.py -o 2 -f val.hmd val.hmd-s2
@@ -37,19 +38,23 @@ csv_reader.py climate.csv | sample_aggregate.py -f -c **:/01:00 | node_shift.py
 
 import sys
 
-from scs_analysis.cmd.cmd_node_shift import CmdNodeShift
+from scs_analysis.helper.fork_client import ForkClient
+
+ForkClient.delegate()                   # if a scs_analysis_server is running, this utility is run there
 
-from scs_core.data.json import JSONify
-from scs_core.data.node_shifter import NodeShifter
-from scs_core.data.path_dict import PathDict
+from scs_analysis.cmd.cmd_node_shift import CmdNodeShift
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.node_shift import NodeShift
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.stream_stats import StreamStats
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
 
-    document_count = 0
-    output_count = 0
+    node_shift = None
 
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
@@ -63,64 +68,30 @@ if __name__ == '__main__':
     if cmd.verbose:
         print("node_shift: %s" % cmd, file=sys.stderr)
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('node_shift', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    stdin = InputStream.construct(idle_handler=stdout.idle, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        shifter = NodeShifter(cmd.offset, cmd.fill, cmd.source_path, cmd.target_path)
+        node_shift = NodeShift(cmd.offset, cmd.fill, cmd.source_path, cmd.target_path, codec)
 
         if cmd.verbose:
-            print("node_shift: %s" % shifter, file=sys.stderr)
+            print("node_shift: %s" % node_shift.shifter, file=sys.stderr)
             sys.stderr.flush()
 
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        # input...
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
-            document_count += 1
-
-            if not datum.has_sub_path(cmd.source_path):
-                print("node_shift: source path '%s' not in %s" % (cmd.source_path, jstr),
-                      file=sys.stderr)
-                exit(1)
-
-            try:
-                target = shifter.shift(datum)
-
-            except TypeError:
-                target = None
-                print("node_shift: incompatible types for '%s' and '%s'" % (cmd.source_path, cmd.target_path),
-                      file=sys.stderr)
-                exit(1)
-
-            if target is None:
-                continue
-
-            # report...
-            print(JSONify.dumps(target))
-            sys.stdout.flush()
-
-            output_count += 1
-
-        # residual...
-        while True:
-            target = shifter.pop()
-
-            if target is None:
-                break
-
-            print(JSONify.dumps(target))
-            sys.stdout.flush()
-
-            output_count += 1
+        for target in node_shift.process(datum for _, datum in stdin.documents(codec)):
+            stdout.write_document(target)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -131,5 +102,11 @@ if __name__ == '__main__':
             print("node_shift: KeyboardInterrupt", file=sys.stderr)
 
     finally:
-        if cmd.verbose:
-            print("node_shift: documents: %d output: %d" % (document_count, output_count), file=sys.stderr)
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
+        if cmd.verbose and node_shift is not None:
+            print("node_shift: documents: %d output: %d" % (node_shift.document_count, node_shift.output_count),
+                  file=sys.stderr)
@@ -22,8 +22,12 @@ or malformed, the particulate_exegesis utility terminates.
 A list of available particulates exegetes can be found using the --help flag. The name of the model forms the last part
 of the path for its report field. For the output, the default exegesis root is "exg".
 
+Each document is interpreted on its own, so a large input may be shared between a number of processes with the
+--workers option. Documents are written in their original order.
+
 SYNOPSIS
-particulate_exegesis.py -e EXEGETE [-v] RH_PATH PMX_PATH [EXEGESIS_PATH]
+particulate_exegesis.py -e EXEGETE [--format FORMAT] [--workers WORKERS] [--stats [--stats-interval INTERVAL]] [-v]
+RH_PATH PMX_PATH [EXEGESIS_PATH]
 
 EXAMPLES
 csv_reader.py -v preston-circus-2020-01-07-joined.csv | \
@@ -46,9 +50,13 @@ https://github.com/south-coast-science/scs_core/blob/develop/src/scs_core/partic
 import sys
 
 from scs_analysis.cmd.cmd_particulate_exegesis import CmdParticulateExegesis
+from scs_analysis.helper.document_pool import DocumentPool
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.path_accessor import PathAccessor
+from scs_analysis.helper.stream_stats import StreamStats
 
-from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 from scs_core.particulate.exegesis.exegete_catalogue import ExegeteCatalogue
 from scs_core.particulate.exegesis.text import Text
@@ -56,9 +64,63 @@ from scs_core.particulate.exegesis.text import Text
 
 # --------------------------------------------------------------------------------------------------------------------
 
-if __name__ == '__main__':
+class ParticulateExegesis(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, exegete, rh_path, pmx_path, exegesis_root, codec):
+        """
+        Constructor
+        """
+        self.__exegete = exegete
+        self.__codec = codec
+
+        self.__exegesis_path = exegesis_root + '.' + exegete.name()
+
+        self.__rh_accessor = PathAccessor.construct(rh_path)
+        self.__pmx_accessor = PathAccessor.construct(pmx_path)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def datum(self, sample):
+        # source...
+        if not self.__rh_accessor.has(sample) or not self.__pmx_accessor.has_node(sample):
+            return None
+
+        rh_node = self.__rh_accessor.node(sample)
+        pmx_node = self.__pmx_accessor.node(sample)
+
+        if rh_node == '':
+            return None
+
+        try:
+            rh = float(rh_node)
+        except ValueError:
+            print("particulate_exegesis: invalid value for rh in %s" % self.__codec.dumps(sample), file=sys.stderr)
+            exit(1)
+
+        # correction...
+        text = Text.construct_from_jdict(pmx_node)
+        interpretation = self.__exegete.interpretation(text, rh)
+
+        sample.append(self.__exegesis_path, interpretation.as_json())
+
+        return sample
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ParticulateExegesis:{exegete:%s, exegesis_path:%s}" % (self.__exegete.name(), self.__exegesis_path)
 
-    rh = None
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
 
     document_count = 0
     processed_count = 0
@@ -75,6 +137,15 @@ if __name__ == '__main__':
     if cmd.verbose:
         print("particulate_exegesis: %s" % cmd, file=sys.stderr)
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('particulate_exegesis', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    pool = None if cmd.workers is None else DocumentPool.construct(cmd.workers, codec, stdout)
+    stdin = InputStream.construct(idle_handler=stdout.idle if pool is None else pool.idle, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
@@ -83,52 +154,32 @@ if __name__ == '__main__':
 
         if cmd.verbose:
             print("particulate_exegesis: %s" % exegete, file=sys.stderr)
-            sys.stderr.flush()
 
-        exegesis_path = cmd.exegesis_path + '.' + exegete.name()
+        sampler = ParticulateExegesis(exegete, cmd.rh_path, cmd.pmx_path, cmd.exegesis_path, codec)
+
+        if cmd.verbose:
+            print("particulate_exegesis: %s" % sampler, file=sys.stderr)
+            sys.stderr.flush()
 
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
-            document_count += 1
-
-            paths = datum.paths()
-
-            # source...
-            if cmd.rh_path not in paths or not datum.has_sub_path(cmd.pmx_path):
-                continue
+        if pool is not None:
+            pool.run(stdin, sampler.datum)
 
-            rh_node = datum.node(cmd.rh_path)
-            pmx_node = datum.node(cmd.pmx_path)
+        else:
+            for _, datum in stdin.documents(codec):
+                document_count += 1
 
-            if rh_node == '':
-                continue
+                target = sampler.datum(datum)
 
-            try:
-                rh = float(rh_node)
-            except ValueError:
-                print("particulate_exegesis: invalid value for rh in %s" % jstr, file=sys.stderr)
-                exit(1)
+                if target is None:
+                    continue
 
-            # correction...
-            text = Text.construct_from_jdict(pmx_node)
-            interpretation = exegete.interpretation(text, rh)
+                stdout.write_document(target)
 
-            datum.append(exegesis_path, interpretation.as_json())
-
-            # report...
-            print(JSONify.dumps(datum))
-            sys.stdout.flush()
-
-            processed_count += 1
+                processed_count += 1
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -142,6 +193,15 @@ if __name__ == '__main__':
             print("particulate_exegesis: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        if pool is not None:
+            pool.close()
+            document_count, processed_count = pool.document_count, pool.processed_count
+
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
             print("particulate_exegesis: documents: %d processed: %d" % (document_count, processed_count),
                   file=sys.stderr)
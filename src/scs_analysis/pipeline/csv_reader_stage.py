@@ -0,0 +1,118 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+"""
+
+import sys
+
+from scs_analysis.cmd.cmd_csv_reader import CmdCSVReader
+from scs_analysis.helper.csv_template_reader import CSVTemplateReader
+from scs_analysis.pipeline.pipeline_stage import PipelineStage
+
+from scs_core.csv.csv_reader import CSVReaderException
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVReaderStage(PipelineStage):
+    """
+    classdocs
+    """
+
+    @classmethod
+    def name(cls):
+        return 'csv_reader'
+
+
+    @classmethod
+    def construct(cls, args):
+        cmd = CmdCSVReader(args, prog=cls.prog())
+
+        cls._validate(cmd)
+
+        if cmd.array:
+            cls._unsupported('--array')
+
+        if cmd.workers is not None:
+            cls._unsupported('--workers')
+
+        if cmd.merge_on is not None:
+            cls._unsupported('--merge-on')
+
+        if cmd.is_window():
+            cls._unsupported('--start / --end')
+
+        return cls(cmd)
+
+
+    @classmethod
+    def is_source(cls):
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, cmd):
+        """
+        Constructor
+        """
+        super().__init__(cmd)
+
+        self.__file_count = 0
+        self.__total_rows = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, documents):
+        for filename in self.cmd.filenames:
+            self.__file_count += 1
+            rows = 0
+
+            try:
+                reader = CSVTemplateReader.construct_for_file(filename, numeric_cast=self.cmd.cast,
+                                                              empty_string_as_null=self.cmd.nullify,
+                                                              columns=self.cmd.columns)
+
+            except FileNotFoundError:
+                print("csv_reader: file not found: %s" % filename, file=sys.stderr)
+                exit(1)
+                return
+
+            except ValueError as ex:
+                print("csv_reader: %s" % ex, file=sys.stderr)
+                exit(1)
+                return
+
+            if self.cmd.verbose:
+                print("csv_reader: %s" % reader, file=sys.stderr)
+                sys.stderr.flush()
+
+            try:
+                for datum in reader.documents():
+                    if self.cmd.limit is not None and rows >= self.cmd.limit:
+                        break
+
+                    yield datum
+
+                    rows += 1
+
+            except CSVReaderException as ex:
+                if self.cmd.verbose:
+                    print("csv_reader: terminating on row %d: %s" % (rows, ex), file=sys.stderr)
+                    exit(1)
+
+            finally:
+                reader.close()
+
+            if self.cmd.verbose:
+                print("csv_reader: rows: %d" % rows, file=sys.stderr)
+
+            self.__total_rows += rows
+
+
+    def summary(self):
+        return "total rows: %d" % self.__total_rows
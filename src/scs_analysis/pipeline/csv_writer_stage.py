@@ -0,0 +1,86 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+https://stackoverflow.com/questions/3348460/csv-file-written-with-python-has-blank-lines-between-each-row
+"""
+
+import sys
+
+from scs_analysis.cmd.cmd_csv_writer import CmdCSVWriter
+from scs_analysis.helper.csv_writer import CSVWriter
+from scs_analysis.pipeline.pipeline_stage import PipelineStage
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVWriterStage(PipelineStage):
+    """
+    classdocs
+    """
+
+    @classmethod
+    def name(cls):
+        return 'csv_writer'
+
+
+    @classmethod
+    def construct(cls, args):
+        cmd = CmdCSVWriter(args, prog=cls.prog())
+
+        cls._validate(cmd)
+
+        if cmd.is_partitioned():
+            cls._unsupported('--partition-by / --partition-time')
+
+        return cls(cmd)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, cmd):
+        """
+        Constructor
+        """
+        super().__init__(cmd)
+
+        self.__writer = None
+
+        self.__document_count = 0
+        self.__processed_count = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, documents):
+        self.__writer = CSVWriter(filename=self.cmd.filename, append=self.cmd.append,
+                                  exclude_header=self.cmd.exclude_header, buffered=True)
+
+        if self.cmd.verbose:
+            print("csv_writer: %s" % self.__writer, file=sys.stderr)
+            sys.stderr.flush()
+
+        for datum in documents:
+            self.__document_count += 1
+
+            self.__writer.write_document(datum)
+
+            self.__processed_count += 1
+
+            # echo...
+            if self.cmd.echo:
+                yield datum
+
+
+    def close(self):
+        if self.__writer is not None:
+            self.__writer.close()
+
+        super().close()
+
+
+    def summary(self):
+        return "documents: %d processed: %d" % (self.__document_count, self.__processed_count)
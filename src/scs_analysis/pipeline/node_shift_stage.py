@@ -0,0 +1,54 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+"""
+
+from scs_analysis.cmd.cmd_node_shift import CmdNodeShift
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.node_shift import NodeShift
+from scs_analysis.pipeline.pipeline_stage import PipelineStage
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NodeShiftStage(PipelineStage):
+    """
+    classdocs
+    """
+
+    @classmethod
+    def name(cls):
+        return 'node_shift'
+
+
+    @classmethod
+    def construct(cls, args):
+        cmd = CmdNodeShift(args, prog=cls.prog())
+
+        cls._validate(cmd)
+
+        return cls(cmd)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, cmd):
+        """
+        Constructor
+        """
+        super().__init__(cmd)
+
+        self.__node_shift = NodeShift(cmd.offset, cmd.fill, cmd.source_path, cmd.target_path, JSONCodec.construct())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, documents):
+        return self.__node_shift.process(documents)
+
+
+    def summary(self):
+        return "documents: %d output: %d" % (self.__node_shift.document_count, self.__node_shift.output_count)
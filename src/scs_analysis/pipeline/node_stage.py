@@ -0,0 +1,72 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+"""
+
+from scs_analysis.cmd.cmd_node import CmdNode
+from scs_analysis.helper.node_selector import NodeSelector
+from scs_analysis.pipeline.pipeline_stage import PipelineStage
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NodeStage(PipelineStage):
+    """
+    classdocs
+    """
+
+    @classmethod
+    def name(cls):
+        return 'node'
+
+
+    @classmethod
+    def construct(cls, args):
+        cmd = CmdNode(args, prog=cls.prog())
+
+        cls._validate(cmd)
+
+        if cmd.array:
+            cls._unsupported('--array')
+
+        if cmd.sequence:
+            cls._unsupported('--sequence')
+
+        return cls(cmd)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, cmd):
+        """
+        Constructor
+        """
+        super().__init__(cmd)
+
+        self.__selector = NodeSelector(cmd.sub_paths, cmd.exclude)
+
+        self.__document_count = 0
+        self.__output_count = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, documents):
+        for datum in documents:
+            self.__document_count += 1
+
+            target = self.__selector.select(datum)
+
+            if target is None:
+                continue
+
+            yield target
+
+            self.__output_count += 1
+
+
+    def summary(self):
+        return "documents: %d output: %d" % (self.__document_count, self.__output_count)
@@ -0,0 +1,146 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A Pipeline is constructed from a command line in the shell-pipe form:
+
+csv_reader.py gases.csv | sample_aggregate.py -c **:/5:00 val | csv_writer.py gases-5min.csv
+
+Each command is resolved to its PipelineStage, and the command's arguments are parsed by the utility's own command
+line handler, so that flags and semantics are the same as those of the standalone utilities.
+"""
+
+import os
+import shlex
+
+from scs_analysis.pipeline.csv_reader_stage import CSVReaderStage
+from scs_analysis.pipeline.csv_writer_stage import CSVWriterStage
+from scs_analysis.pipeline.node_shift_stage import NodeShiftStage
+from scs_analysis.pipeline.node_stage import NodeStage
+from scs_analysis.pipeline.sample_aggregate_stage import SampleAggregateStage
+from scs_analysis.pipeline.sample_ah_stage import SampleAHStage
+from scs_analysis.pipeline.sample_median_stage import SampleMedianStage
+from scs_analysis.pipeline.sample_subset_stage import SampleSubsetStage
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Pipeline(object):
+    """
+    classdocs
+    """
+
+    __STAGES = (CSVReaderStage, CSVWriterStage, NodeShiftStage, NodeStage, SampleAggregateStage, SampleAHStage,
+                SampleMedianStage, SampleSubsetStage)
+
+    __SEPARATOR = '|'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def stage_names(cls):
+        return sorted(stage.name() for stage in cls.__STAGES)
+
+
+    @classmethod
+    def stage_class(cls, command):
+        name = os.path.basename(command)
+
+        if name.endswith('.py'):
+            name = name[:-3]
+
+        for stage in cls.__STAGES:
+            if stage.name() == name:
+                return stage
+
+        raise PipelineException("unsupported utility: %s" % command)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_command_line(cls, command_line):
+        return cls.construct_from_tokens(shlex.split(command_line))
+
+
+    @classmethod
+    def construct_from_tokens(cls, tokens):
+        commands = [[]]
+
+        for token in tokens:
+            if token == cls.__SEPARATOR:
+                commands.append([])
+            else:
+                commands[-1].append(token)
+
+        if [] in commands:
+            raise PipelineException("empty command in pipeline")
+
+        stages = []
+
+        for command in commands:
+            stage_class = cls.stage_class(command[0])
+
+            if stage_class.is_source() and stages:
+                raise PipelineException("%s must be the first utility in a pipeline" % stage_class.name())
+
+            stages.append(stage_class.construct(command[1:]))
+
+        return cls(stages)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, stages):
+        """
+        Constructor
+        """
+        self.__stages = stages                          # array of PipelineStage
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self, documents):
+        if self.__stages[0].is_source():
+            documents = None
+
+        for stage in self.__stages:
+            documents = stage.process(documents)
+
+        return documents                                # generator of PathDict
+
+
+    def close(self):
+        for stage in self.__stages:
+            stage.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def stages(self):
+        return self.__stages
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        stages = '[' + ', '.join(str(stage) for stage in self.stages) + ']'
+
+        return "Pipeline:{stages:%s}" % stages
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PipelineException(ValueError):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, *args):
+        super().__init__(*args)
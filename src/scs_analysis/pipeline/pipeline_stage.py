@@ -0,0 +1,104 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+A pipeline stage performs the per-document work of one of the scs_analysis stream utilities. Stages are chained as
+generators, so that PathDict documents are passed from one stage to the next without JSON serialisation.
+"""
+
+import sys
+
+from abc import ABC, abstractmethod
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PipelineStage(ABC):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    @abstractmethod
+    def name(cls):
+        pass
+
+
+    @classmethod
+    @abstractmethod
+    def construct(cls, args):
+        pass
+
+
+    @classmethod
+    def is_source(cls):
+        return False
+
+
+    @classmethod
+    def prog(cls):
+        return cls.name() + '.py'                       # the utility, for the help and usage of its cmd
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def _validate(cls, cmd):
+        if not cmd.is_valid():
+            cmd.print_help(sys.stderr)
+            exit(2)
+
+        if cmd.verbose:
+            print("%s: %s" % (cls.name(), cmd), file=sys.stderr)
+            sys.stderr.flush()
+
+
+    @classmethod
+    def _unsupported(cls, option):
+        print("%s: the %s option is not supported in a pipeline" % (cls.name(), option), file=sys.stderr)
+        exit(2)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, cmd):
+        """
+        Constructor
+        """
+        self.__cmd = cmd
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @abstractmethod
+    def process(self, documents):                       # generator of PathDict
+        pass
+
+
+    @abstractmethod
+    def summary(self):
+        pass
+
+
+    def close(self):
+        if self.cmd.verbose:
+            print("%s: %s" % (self.name(), self.summary()), file=sys.stderr)
+            sys.stderr.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def cmd(self):
+        return self.__cmd
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "%s:{cmd:%s}" % (self.__class__.__name__, self.cmd)
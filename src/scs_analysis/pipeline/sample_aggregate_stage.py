@@ -0,0 +1,63 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+"""
+
+import sys
+
+from scs_analysis.cmd.cmd_sample_aggregate import CmdSampleAggregate
+from scs_analysis.helper.sample_aggregate import SampleAggregate
+from scs_analysis.pipeline.pipeline_stage import PipelineStage
+
+from scs_core.data.checkpoint_generator import CheckpointGenerator
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleAggregateStage(PipelineStage):
+    """
+    classdocs
+    """
+
+    @classmethod
+    def name(cls):
+        return 'sample_aggregate'
+
+
+    @classmethod
+    def construct(cls, args):
+        cmd = CmdSampleAggregate(args, prog=cls.prog())
+
+        cls._validate(cmd)
+
+        if not CheckpointGenerator.is_valid(cmd.checkpoint):
+            print("sample_aggregate: the checkpoint specification %s is invalid." % cmd.checkpoint, file=sys.stderr)
+            exit(2)
+
+        return cls(cmd)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, cmd):
+        """
+        Constructor
+        """
+        super().__init__(cmd)
+
+        self.__generator = CheckpointGenerator.construct(cmd.checkpoint)
+        self.__aggregate = SampleAggregate(cmd.min_max, cmd.iso, cmd.nodes)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, documents):
+        return self.__aggregate.process(documents, self.__generator, self.cmd.fill)
+
+
+    def summary(self):
+        return "documents: %d processed: %d output: %d" % \
+               (self.__aggregate.document_count, self.__aggregate.processed_count, self.__aggregate.output_count)
@@ -0,0 +1,67 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+"""
+
+from scs_analysis.cmd.cmd_sample_ah import CmdSampleAH
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.sample_ah import SampleAH
+from scs_analysis.pipeline.pipeline_stage import PipelineStage
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleAHStage(PipelineStage):
+    """
+    classdocs
+    """
+
+    @classmethod
+    def name(cls):
+        return 'sample_ah'
+
+
+    @classmethod
+    def construct(cls, args):
+        cmd = CmdSampleAH(args, prog=cls.prog())
+
+        cls._validate(cmd)
+
+        return cls(cmd)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, cmd):
+        """
+        Constructor
+        """
+        super().__init__(cmd)
+
+        self.__sampler = SampleAH(cmd.rh_path, cmd.t_path, JSONCodec.construct())
+
+        self.__document_count = 0
+        self.__processed_count = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, documents):
+        for datum in documents:
+            self.__document_count += 1
+
+            target = self.__sampler.datum(datum)
+
+            if target is None:
+                continue
+
+            yield target
+
+            self.__processed_count += 1
+
+
+    def summary(self):
+        return "documents: %d processed: %d" % (self.__document_count, self.__processed_count)
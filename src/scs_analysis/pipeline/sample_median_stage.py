@@ -0,0 +1,66 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+"""
+
+from scs_analysis.cmd.cmd_sample_median import CmdSampleMedian
+from scs_analysis.helper.sample_median import SampleMedian
+from scs_analysis.pipeline.pipeline_stage import PipelineStage
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleMedianStage(PipelineStage):
+    """
+    classdocs
+    """
+
+    @classmethod
+    def name(cls):
+        return 'sample_median'
+
+
+    @classmethod
+    def construct(cls, args):
+        cmd = CmdSampleMedian(args, prog=cls.prog())
+
+        cls._validate(cmd)
+
+        return cls(cmd)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, cmd):
+        """
+        Constructor
+        """
+        super().__init__(cmd)
+
+        self.__sampler = SampleMedian(cmd.path, cmd.window, cmd.precision)
+
+        self.__document_count = 0
+        self.__processed_count = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, documents):
+        for datum in documents:
+            self.__document_count += 1
+
+            target = self.__sampler.datum(datum)
+
+            if target is None:
+                continue
+
+            yield target
+
+            self.__processed_count += 1
+
+
+    def summary(self):
+        return "documents: %d processed: %d" % (self.__document_count, self.__processed_count)
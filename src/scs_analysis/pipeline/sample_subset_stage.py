@@ -0,0 +1,81 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+"""
+
+import sys
+
+from scs_analysis.cmd.cmd_sample_subset import CmdSampleSubset
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.sample_subset import SampleSubset
+from scs_analysis.pipeline.pipeline_stage import PipelineStage
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleSubsetStage(PipelineStage):
+    """
+    classdocs
+    """
+
+    @classmethod
+    def name(cls):
+        return 'sample_subset'
+
+
+    @classmethod
+    def construct(cls, args):
+        cmd = CmdSampleSubset(args, prog=cls.prog())
+
+        cls._validate(cmd)
+
+        return cls(cmd)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, cmd):
+        """
+        Constructor
+        """
+        super().__init__(cmd)
+
+        try:
+            lower_bound = cmd.lower
+        except ValueError as ex:
+            print("sample_subset: invalid value for lower bound: %s" % ex, file=sys.stderr)
+            exit(2)
+
+        try:
+            upper_bound = cmd.upper
+        except ValueError as ex:
+            print("sample_subset: invalid value for upper bound: %s" % ex, file=sys.stderr)
+            exit(2)
+
+        self.__subset = SampleSubset(cmd.path, lower_bound, upper_bound, cmd.iso8601, cmd.numeric, cmd.exclusions,
+                                     JSONCodec.construct())
+
+        self.__document_count = 0
+        self.__output_count = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def process(self, documents):
+        for datum in documents:
+            self.__document_count += 1
+
+            if not self.__subset.includes(datum):
+                continue
+
+            yield datum
+
+            self.__output_count += 1
+
+
+    def summary(self):
+        return "documents: %d processed: %d output: %d" % \
+               (self.__document_count, self.__subset.processed_count, self.__output_count)
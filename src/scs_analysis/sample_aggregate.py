@@ -43,7 +43,8 @@ At each checkpoint, if there are no values for a given path, then only the rec f
 set, then any checkpoints missing in the input data are written to stdout in sequence.
 
 SYNOPSIS
-sample_aggregate.py -c HH:MM:SS [-m] [-t] [-f] [-i] [-v] [PATH_1..PATH_N]
+sample_aggregate.py -c HH:MM:SS [-m] [-t] [-f] [-i] [--format FORMAT] [--stats [--stats-interval INTERVAL]] [-v]
+[PATH_1..PATH_N]
 
 EXAMPLES
 csv_reader.py gases.csv | sample_aggregate.py -f -c **:/5:00 val
@@ -51,12 +52,18 @@ csv_reader.py gases.csv | sample_aggregate.py -f -c **:/5:00 val
 
 import sys
 
+from scs_analysis.helper.fork_client import ForkClient
+
+ForkClient.delegate()                   # if a scs_analysis_server is running, this utility is run there
+
 from scs_analysis.cmd.cmd_sample_aggregate import CmdSampleAggregate
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
 from scs_analysis.helper.sample_aggregate import SampleAggregate
+from scs_analysis.helper.stream_stats import StreamStats
 
 from scs_core.data.checkpoint_generator import CheckpointGenerator
-from scs_core.data.datetime import LocalizedDatetime
-from scs_core.data.path_dict import PathDict
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -65,9 +72,6 @@ if __name__ == '__main__':
 
     aggregate = None
 
-    document_count = 0
-    processed_count = 0
-
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
 
@@ -85,6 +89,14 @@ if __name__ == '__main__':
         print("sample_aggregate: %s" % cmd, file=sys.stderr)
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('sample_aggregate', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    stdin = InputStream.construct(idle_handler=stdout.idle, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
@@ -101,53 +113,10 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        checkpoint = None
-
-        for line in sys.stdin:
-            # sample...
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                continue
-
-            document_count += 1
-
-            try:
-                rec_node = datum.node(cmd.iso)
-            except KeyError:
-                continue
-
-            rec = LocalizedDatetime.construct_from_iso8601(rec_node)
+        documents = (datum for _, datum in stdin.documents(codec))
 
-            # set checkpoint...
-            if checkpoint is None:
-                checkpoint = generator.enclosing_localised_datetime(rec)
-
-            # report and reset...
-            if rec.datetime > checkpoint.datetime:
-                aggregate.print(checkpoint)
-                aggregate.reset()
-
-                filler = checkpoint
-                checkpoint = generator.enclosing_localised_datetime(rec)
-
-                # fill missing...
-                while cmd.fill:
-                    filler = generator.next_localised_datetime(filler)
-
-                    if filler >= checkpoint:
-                        break
-
-                    aggregate.print(filler)
-
-            # append sample...
-            aggregate.append(rec, datum)
-
-            processed_count += 1
-
-        # report remainder...
-        if aggregate.has_value():
-            aggregate.print(checkpoint)
+        for report in aggregate.process(documents, generator, cmd.fill):
+            stdout.write_document(report)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -158,8 +127,11 @@ if __name__ == '__main__':
             print("sample_aggregate: KeyboardInterrupt", file=sys.stderr)
 
     finally:
-        if cmd.verbose:
-            output_count = 0 if aggregate is None else aggregate.output_count
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
 
+        if cmd.verbose and aggregate is not None:
             print("sample_aggregate: documents: %d processed: %d output: %d" %
-                  (document_count, processed_count, output_count), file=sys.stderr)
+                  (aggregate.document_count, aggregate.processed_count, aggregate.output_count), file=sys.stderr)
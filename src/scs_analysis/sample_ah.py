@@ -20,8 +20,13 @@ leaf node is recreated as the dictionary {rh: RH_VALUE, ah: AH_VALUE} - see exam
 
 The conversion equation used by sample_ah does not take account of atmospheric pressure.
 
+Each document is transformed independently, so that a large input may be divided between a number of processes, with
+the --workers option. Documents are written in their original order. Alternatively, the --batch option gathers
+documents into batches, for which aH is computed as a NumPy array. The output is that of the scalar computation.
+
 SYNOPSIS
-sample_ah.py [-v] RH_PATH T_PATH
+sample_ah.py [--format FORMAT] [{ --workers WORKERS | --batch BATCH }] [--stats [--stats-interval INTERVAL]] [-v]
+RH_PATH T_PATH
 
 EXAMPLES
 csv_reader.py climate.csv | sample_ah.py val.hmd val.tmp
@@ -42,11 +47,13 @@ https://www.aqua-calc.com/calculate/humidity
 import sys
 
 from scs_analysis.cmd.cmd_sample_ah import CmdSampleAH
-
-from scs_core.climate.absolute_humidity import AbsoluteHumidity
-
-from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
+from scs_analysis.helper.document_batch import DocumentBatch
+from scs_analysis.helper.document_pool import DocumentPool
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.sample_ah import SampleAH
+from scs_analysis.helper.stream_stats import StreamStats
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -65,67 +72,57 @@ if __name__ == '__main__':
         cmd.print_help(sys.stderr)
         exit(2)
 
+    if cmd.batch is not None and not DocumentBatch.is_available():
+        print("sample_ah: the --batch option requires numpy.", file=sys.stderr)
+        exit(1)
+
     if cmd.verbose:
         print("sample_ah: %s" % cmd, file=sys.stderr)
 
-    try:
-        # ------------------------------------------------------------------------------------------------------------
-        # run...
-
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
 
-            if datum is None:
-                continue
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('sample_ah', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    pool = None if cmd.workers is None else DocumentPool.construct(cmd.workers, codec, stdout)
+    batch = None if cmd.batch is None else DocumentBatch.construct(cmd.batch, stdout)
 
-            document_count += 1
+    idle_handler = pool.idle if pool is not None else batch.idle if batch is not None else stdout.idle
+    stdin = InputStream.construct(idle_handler=idle_handler, stats=stats)
 
-            paths = datum.paths()
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
 
-            # rH / t...
-            if cmd.rh_path not in paths or cmd.t_path not in paths:
-                continue
+        sampler = SampleAH(cmd.rh_path, cmd.t_path, codec)
 
-            rh_node = datum.node(cmd.rh_path)
-            t_node = datum.node(cmd.t_path)
+        if cmd.verbose:
+            print("sample_ah: %s" % sampler, file=sys.stderr)
+            sys.stderr.flush()
 
-            if rh_node == '' or t_node == '':
-                continue
 
-            try:
-                rh = float(rh_node)
-            except ValueError:
-                rh = None
-                print("sample_ah: invalid value for rH in %s" % jstr, file=sys.stderr)
-                exit(1)
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
 
-            try:
-                t = float(t_node)
-            except ValueError:
-                t = None
-                print("sample_ah: invalid value for t in %s" % jstr, file=sys.stderr)
-                exit(1)
+        if pool is not None:
+            pool.run(stdin, sampler.datum)
 
-            # compute...
-            ah = round(AbsoluteHumidity.from_rh_t(rh, t), 3)                # report to 0.001 g / m3
+        elif batch is not None:
+            batch.run(stdin, codec, sampler.batch)
 
-            # copy...
-            target = PathDict()
+        else:
+            for _, datum in stdin.documents(codec):
+                document_count += 1
 
-            for path in paths:
-                if path == cmd.rh_path:
-                    target.append(path + '.rH', rh)
-                    target.append(path + '.aH', ah)
+                target = sampler.datum(datum)
 
-                else:
-                    target.append(path, datum.node(path))
+                if target is None:
+                    continue
 
-            # report...
-            print(JSONify.dumps(target.node()))
-            sys.stdout.flush()
+                stdout.write_document(target)
 
-            processed_count += 1
+                processed_count += 1
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -139,5 +136,17 @@ if __name__ == '__main__':
             print("sample_ah: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        if pool is not None:
+            pool.close()
+            document_count, processed_count = pool.document_count, pool.processed_count
+
+        if batch is not None:
+            document_count, processed_count = batch.document_count, batch.processed_count
+
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
             print("sample_ah: documents: %d processed: %d" % (document_count, processed_count), file=sys.stderr)
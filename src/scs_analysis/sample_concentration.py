@@ -19,8 +19,13 @@ The path for the node in the output document indicating concentration is based o
 input document indicating density. For example, if the input path is SUB-PATH.dns, the output path is SUB-PATH.cnc. If
 a SUB-PATH.cnc field exists in the input document, it is overwritten.
 
+Documents are independent of one another, so the --workers option may be used to divide a large input between a
+number of processes. The order of the documents is preserved. With the --batch option, concentrations are computed as
+NumPy arrays, for batches of documents - the values reported are those of the document-by-document computation.
+
 SYNOPSIS
-sample_concentration.py [-v] GAS DENSITY_PATH T_PATH [{P_PATH | -p PRESSURE}]
+sample_concentration.py [--format FORMAT] [{ --workers WORKERS | --batch BATCH }]
+[--stats [--stats-interval INTERVAL]] [-v] GAS DENSITY_PATH T_PATH [{P_PATH | -p PRESSURE}]
 
 EXAMPLES
 csv_reader.py joined_2019-02.csv | sample_concentration.py -v NO2 ref.val.NO2.dns praxis.val.sht.tmp
@@ -42,8 +47,13 @@ http://www.apis.ac.uk/unit-conversion
 import sys
 
 from scs_analysis.cmd.cmd_sample_concentration import CmdSampleConcentration
+from scs_analysis.helper.document_batch import DocumentBatch
+from scs_analysis.helper.document_pool import DocumentPool
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.stream_stats import StreamStats
 
-from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
 
 from scs_core.gas.gas import Gas
@@ -51,11 +61,153 @@ from scs_core.gas.gas import Gas
 
 # --------------------------------------------------------------------------------------------------------------------
 
-if __name__ == '__main__':
+class SampleConcentration(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, gas, density_path, t_path, p_path, pressure, codec):
+        """
+        Constructor
+        """
+        self.__gas = gas
+        self.__density_path = density_path
+        self.__t_path = t_path
+        self.__p_path = p_path
+        self.__pressure = pressure
+        self.__codec = codec
+
+        density_nodes = density_path.split('.')
+        self.__concentration_path = '.'.join(density_nodes[:-1] + ['cnc'])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def datum(self, sample):
+        try:
+            values = self.__values(sample)
+        except ValueError as ex:
+            print("sample_concentration: %s" % ex, file=sys.stderr)
+            exit(1)
+
+        if values is None:
+            return None
+
+        paths, density, t, p = values
+
+        # compute...
+        cnc = round(Gas.concentration(self.__gas, density, t, p), 1)
+
+        return self.__target(sample, paths, cnc)
+
+
+    def batch(self, samples):
+        # imported on the --batch path only...
+        from scs_analysis.helper.gas_array import GasArray
+
+        values = []
+        error = None
+
+        for sample in samples:
+            try:
+                values.append(self.__values(sample))
+            except ValueError as ex:
+                error = ex
+                break
+
+        # compute...
+        valid = [value for value in values if value is not None]
+
+        densities = DocumentBatch.array([value[1] for value in valid])
+        ts = DocumentBatch.array([value[2] for value in valid])
+        ps = DocumentBatch.array([value[3] for value in valid]) if self.__p_path else self.__pressure
+
+        try:
+            cncs = iter(DocumentBatch.rounded(GasArray.concentration(self.__gas, densities, ts, ps), 1))
+
+        except (FloatingPointError, ZeroDivisionError):     # the scalar path raises - if it does - at the same document
+            cncs = (round(Gas.concentration(self.__gas, value[1], value[2], value[3]), 1) for value in valid)
+
+        for sample, value in zip(samples, values):
+            yield None if value is None else self.__target(sample, value[0], next(cncs))
+
+        if error is not None:
+            print("sample_concentration: %s" % error, file=sys.stderr)
+            exit(1)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __values(self, sample):
+        paths = sample.paths()
+
+        # density / t...
+        if self.__density_path not in paths or self.__t_path not in paths:
+            return None
+
+        density_node = sample.node(self.__density_path)
+        t_node = sample.node(self.__t_path)
+
+        if density_node == '' or t_node == '':
+            return None
+
+        try:
+            density = float(density_node)
+        except ValueError:
+            raise ValueError("invalid value for density in %s" % self.__codec.dumps(sample))
+
+        try:
+            t = float(t_node)
+        except ValueError:
+            raise ValueError("invalid value for t in %s" % self.__codec.dumps(sample))
+
+        # p...
+        if self.__p_path:
+            p_node = sample.node(self.__p_path)
+
+            if p_node == '':
+                return None
+
+            try:
+                p = float(p_node)
+            except ValueError:
+                raise ValueError("invalid value for p in %s" % self.__codec.dumps(sample))
+
+        else:
+            p = self.__pressure
+
+        return paths, density, t, p
+
+
+    def __target(self, sample, paths, cnc):
+        target = PathDict()
+
+        for path in paths:
+            if path == self.__concentration_path:
+                continue
 
-    density = None
-    t = None
-    p = None
+            target.append(path, sample.node(path))
+
+            if path == self.__density_path:
+                target.append(self.__concentration_path, cnc)
+
+        return target
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleConcentration:{gas:%s, density_path:%s, t_path:%s, p_path:%s, pressure:%s, " \
+               "concentration_path:%s}" % \
+               (self.__gas, self.__density_path, self.__t_path, self.__p_path, self.__pressure,
+                self.__concentration_path)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
 
     document_count = 0
     processed_count = 0
@@ -73,89 +225,57 @@ if __name__ == '__main__':
         print("sample_concentration: the gas '%s' is not recognised." % cmd.gas, file=sys.stderr)
         exit(1)
 
+    if cmd.batch is not None and not DocumentBatch.is_available():
+        print("sample_concentration: the --batch option requires numpy.", file=sys.stderr)
+        exit(1)
+
     if cmd.verbose:
         print("sample_concentration: %s" % cmd, file=sys.stderr)
 
-    try:
-        # ------------------------------------------------------------------------------------------------------------
-        # resources...
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
 
-        density_nodes = cmd.density_path.split('.')
-        concentration_path = '.'.join(density_nodes[:-1] + ['cnc'])
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('sample_concentration', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    pool = None if cmd.workers is None else DocumentPool.construct(cmd.workers, codec, stdout)
+    batch = None if cmd.batch is None else DocumentBatch.construct(cmd.batch, stdout)
 
+    idle_handler = pool.idle if pool is not None else batch.idle if batch is not None else stdout.idle
+    stdin = InputStream.construct(idle_handler=idle_handler, stats=stats)
 
+    try:
         # ------------------------------------------------------------------------------------------------------------
-        # run...
-
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
-            document_count += 1
-
-            paths = datum.paths()
-
-            # density / t...
-            if cmd.density_path not in paths or cmd.t_path not in paths:
-                continue
-
-            density_node = datum.node(cmd.density_path)
-            t_node = datum.node(cmd.t_path)
-
-            if density_node == '' or t_node == '':
-                continue
+        # resources...
 
-            try:
-                density = float(density_node)
-            except ValueError:
-                print("sample_concentration: invalid value for density in %s" % jstr, file=sys.stderr)
-                exit(1)
+        sampler = SampleConcentration(cmd.gas, cmd.density_path, cmd.t_path, cmd.p_path, cmd.pressure, codec)
 
-            try:
-                t = float(t_node)
-            except ValueError:
-                print("sample_concentration: invalid value for t in %s" % jstr, file=sys.stderr)
-                exit(1)
+        if cmd.verbose:
+            print("sample_concentration: %s" % sampler, file=sys.stderr)
+            sys.stderr.flush()
 
-            # p...
-            if cmd.p_path:
-                p_node = datum.node(cmd.p_path)
 
-                if p_node == '':
-                    continue
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
 
-                try:
-                    p = float(p_node)
-                except ValueError:
-                    print("sample_concentration: invalid value for p in %s" % jstr, file=sys.stderr)
-                    exit(1)
+        if pool is not None:
+            pool.run(stdin, sampler.datum)
 
-            else:
-                p = cmd.pressure
+        elif batch is not None:
+            batch.run(stdin, codec, sampler.batch)
 
-            # compute...
-            cnc = round(Gas.concentration(cmd.gas, density, t, p), 1)
+        else:
+            for _, datum in stdin.documents(codec):
+                document_count += 1
 
-            # copy...
-            target = PathDict()
+                target = sampler.datum(datum)
 
-            for path in paths:
-                if path == concentration_path:
+                if target is None:
                     continue
 
-                target.append(path, datum.node(path))
-
-                if path == cmd.density_path:
-                    target.append(concentration_path, cnc)
+                stdout.write_document(target)
 
-            # report...
-            print(JSONify.dumps(target))
-            sys.stdout.flush()
-
-            processed_count += 1
+                processed_count += 1
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -169,6 +289,18 @@ if __name__ == '__main__':
             print("sample_concentration: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        if pool is not None:
+            pool.close()
+            document_count, processed_count = pool.document_count, pool.processed_count
+
+        if batch is not None:
+            document_count, processed_count = batch.document_count, batch.processed_count
+
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
             print("sample_concentration: documents: %d processed: %d" % (document_count, processed_count),
                   file=sys.stderr)
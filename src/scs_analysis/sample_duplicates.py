@@ -20,8 +20,10 @@ the input document itself.
 In the --counts mode, the output report is sequence of JSON dictionaries with a field for each value where duplicates
 were found, whose value is the number of matching documents.
 
+If the --stats flag is used, stream statistics are reported to stderr on exit.
+
 SYNOPSIS
-sample_duplicates.py [-c] [-v] PATH
+sample_duplicates.py [-c] [--stats [--stats-interval INTERVAL]] [-v] PATH
 
 EXAMPLES
 csv_reader.py climate.csv | sample_duplicates.py -v val.hmd
@@ -38,10 +40,12 @@ counts mode:
 import sys
 
 from scs_analysis.cmd.cmd_sample_duplicates import CmdSampleDuplicates
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.stream_stats import StreamStats
 
 from scs_core.data.duplicates import Duplicates
-from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -65,6 +69,14 @@ if __name__ == '__main__':
     if cmd.verbose:
         print("sample_duplicates: %s" % cmd, file=sys.stderr)
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('sample_duplicates', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, stats=stats)
+    stdin = InputStream.construct(idle_handler=stdout.idle, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
@@ -75,13 +87,7 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
+        for _, datum in stdin.documents(codec):
             document_count += 1
 
             if not datum.has_path(cmd.path):
@@ -97,11 +103,11 @@ if __name__ == '__main__':
 
         if cmd.counts:
             for count in dupes.match_counts():
-                print(JSONify.dumps(count))
+                stdout.write_document(count)
 
         else:
             for match in dupes.matches():
-                print(JSONify.dumps(match))
+                stdout.write_document(match)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -112,6 +118,11 @@ if __name__ == '__main__':
             print("sample_duplicates: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
             print("sample_duplicates: documents: %d processed: %d" % (document_count, processed_count), file=sys.stderr)
 
@@ -16,8 +16,13 @@ REFERENCE_PATH and REPORTED_PATH are not present, the utility terminates. If eit
 floating-point value, the document is ignored. If the specified ERROR_PATH is already present in the document, it is
 overwritten.
 
+Each document is processed on its own, so that a large input may be divided between a number of processes, with the
+--workers option. The output preserves the order of the input. The --batch option computes the errors of batches of
+documents as NumPy arrays - the values are those of the document-by-document computation.
+
 SYNOPSIS
-sample_error.py { -l | -s } [-p PRECISION] [-v] REFERENCE_PATH REPORTED_PATH ERROR_PATH
+sample_error.py { -l | -s } [-p PRECISION] [--format FORMAT] [{ --workers WORKERS | --batch BATCH }]
+[--stats [--stats-interval INTERVAL]] [-v] REFERENCE_PATH REPORTED_PATH ERROR_PATH
 
 EXAMPLES
 csv_reader.py -v Pi-R1-joined-2019-10-15min.csv | \
@@ -44,9 +49,132 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_error import CmdSampleError
+from scs_analysis.helper.document_batch import DocumentBatch
+from scs_analysis.helper.document_pool import DocumentPool
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.path_accessor import PathAccessor
+from scs_analysis.helper.stream_stats import StreamStats
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleError(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, reference_path, reported_path, error_path, scaling, precision):
+        """
+        Constructor
+        """
+        self.__reference_path = reference_path
+        self.__reported_path = reported_path
+        self.__error_path = error_path
+        self.__scaling = scaling
+        self.__precision = precision
+
+        self.__reference_accessor = PathAccessor.construct(reference_path)
+        self.__reported_accessor = PathAccessor.construct(reported_path)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def datum(self, sample):
+        try:
+            values = self.__values(sample)
+        except ValueError as ex:
+            print("sample_error: %s" % ex, file=sys.stderr)
+            exit(1)
+
+        if values is None:
+            return None
+
+        reference, reported = values
+
+        # error...
+        error = reported / reference if self.__scaling else reported - reference
+
+        sample.append(self.__error_path, round(error, self.__precision))
+
+        return sample
+
+
+    def batch(self, samples):
+        values = []
+        failure = None
+
+        for sample in samples:
+            try:
+                value = self.__values(sample)
+            except ValueError as ex:
+                failure = ex
+                break
+
+            if value is not None and self.__scaling and value[0] == 0.0:
+                failure = ZeroDivisionError("float division by zero")
+                break
+
+            values.append(value)
+
+        # error...
+        valid = [value for value in values if value is not None]
+
+        references = DocumentBatch.array([value[0] for value in valid])
+        reporteds = DocumentBatch.array([value[1] for value in valid])
+
+        errors = reporteds / references if self.__scaling else reporteds - references
+        rounded_errors = iter(DocumentBatch.rounded(errors, self.__precision))
+
+        for sample, value in zip(samples, values):
+            if value is None:
+                yield None
+                continue
+
+            sample.append(self.__error_path, next(rounded_errors))
+
+            yield sample
+
+        if isinstance(failure, ValueError):
+            print("sample_error: %s" % failure, file=sys.stderr)
+            exit(1)
 
-from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
+        if failure is not None:
+            raise failure
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __values(self, sample):
+        # reference...
+        if not self.__reference_accessor.has(sample):
+            raise ValueError("reference path '%s' not present" % self.__reference_path)
+
+        try:
+            reference = float(self.__reference_accessor.node(sample))
+        except (TypeError, ValueError):
+            return None
+
+        # reported...
+        if not self.__reported_accessor.has(sample):
+            raise ValueError("reported path '%s' not present" % self.__reference_path)
+
+        try:
+            reported = float(self.__reported_accessor.node(sample))
+        except (TypeError, ValueError):
+            return None
+
+        return reference, reported
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleError:{reference_path:%s, reported_path:%s, error_path:%s, scaling:%s, precision:%s}" % \
+               (self.__reference_path, self.__reported_path, self.__error_path, self.__scaling, self.__precision)
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -65,55 +193,59 @@ if __name__ == '__main__':
         cmd.print_help(sys.stderr)
         exit(2)
 
+    if cmd.batch is not None and not DocumentBatch.is_available():
+        print("sample_error: the --batch option requires numpy.", file=sys.stderr)
+        exit(1)
+
     if cmd.verbose:
         print("sample_error: %s" % cmd, file=sys.stderr)
         sys.stderr.flush()
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('sample_error', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    pool = None if cmd.workers is None else DocumentPool.construct(cmd.workers, codec, stdout)
+    batch = None if cmd.batch is None else DocumentBatch.construct(cmd.batch, stdout)
+
+    idle_handler = pool.idle if pool is not None else batch.idle if batch is not None else stdout.idle
+    stdin = InputStream.construct(idle_handler=idle_handler, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
-        # run...
+        # resources...
 
-        max_datum = None
+        sampler = SampleError(cmd.reference_path, cmd.reported_path, cmd.error_path, cmd.scaling, cmd.precision)
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
+        if cmd.verbose:
+            print("sample_error: %s" % sampler, file=sys.stderr)
+            sys.stderr.flush()
 
-            if datum is None:
-                continue
 
-            document_count += 1
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
 
-            # reference...
-            if cmd.reference_path not in datum.paths():
-                print("sample_error: reference path '%s' not present" % cmd.reference_path, file=sys.stderr)
-                exit(1)
+        if pool is not None:
+            pool.run(stdin, sampler.datum)
 
-            try:
-                reference = float(datum.node(cmd.reference_path))
-            except (TypeError, ValueError):
-                continue
+        elif batch is not None:
+            batch.run(stdin, codec, sampler.batch)
 
-            # reported...
-            if cmd.reported_path not in datum.paths():
-                print("sample_error: reported path '%s' not present" % cmd.reference_path, file=sys.stderr)
-                exit(1)
+        else:
+            for _, datum in stdin.documents(codec):
+                document_count += 1
 
-            try:
-                reported = float(datum.node(cmd.reported_path))
-            except (TypeError, ValueError):
-                continue
+                target = sampler.datum(datum)
 
-            # error...
-            error = reported / reference if cmd.scaling else reported - reference
+                if target is None:
+                    continue
 
-            # report...
-            datum.append(cmd.error_path, round(error, cmd.precision))
-            sys.stdout.flush()
+                stdout.write_document(target)
 
-            processed_count += 1
-
-            print(JSONify.dumps(datum))
+                processed_count += 1
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -127,5 +259,17 @@ if __name__ == '__main__':
             print("sample_error: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        if pool is not None:
+            pool.close()
+            document_count, processed_count = pool.document_count, pool.processed_count
+
+        if batch is not None:
+            document_count, processed_count = batch.document_count, batch.processed_count
+
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
             print("sample_error: documents: %d processed: %d" % (document_count, processed_count), file=sys.stderr)
@@ -16,7 +16,7 @@ the sample_interval utility includes the date / time value, and the time differe
 in seconds.
 
 SYNOPSIS
-sample_interval.py [-p PRECISION] [-v] [PATH]
+sample_interval.py [-p PRECISION] [--format FORMAT] [--stats [--stats-interval INTERVAL]] [-v] [PATH]
 
 EXAMPLES
 osio_topic_history.py -m1 /orgs/south-coast-science-demo/brighton/loc/1/gases | sample_interval.py -p3 rec
@@ -36,11 +36,13 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_interval import CmdSampleInterval
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.stream_stats import StreamStats
 
 from scs_core.data.datetime import LocalizedDatetime
 from scs_core.data.interval import Interval
-from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -60,28 +62,30 @@ if __name__ == '__main__':
         sys.stderr.flush()
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('sample_interval', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    stdin = InputStream.construct(idle_handler=stdout.idle, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
         prev_time = None
 
-        for line in sys.stdin:
+        for _, datum in stdin.documents(codec):
             if cmd.verbose:
-                print(line, file=sys.stderr)
-
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                break
+                print(codec.dumps(datum), file=sys.stderr)
 
             document_count += 1
 
             time = LocalizedDatetime.construct_from_iso8601(datum.node(cmd.path))
 
             interval = Interval.construct(prev_time, time, cmd.precision)
-            print(JSONify.dumps(interval))
-            sys.stdout.flush()
+            stdout.write_document(interval)
 
             prev_time = time
 
@@ -99,5 +103,10 @@ if __name__ == '__main__':
             print("sample_interval: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
             print("sample_interval: documents: %d processed: %d" % (document_count, processed_count), file=sys.stderr)
@@ -35,9 +35,13 @@ All fields in the input document are presented in the output document, with the
 datetime fields. The default name for the ISO 8601 datetime output field is 'rec' but an alternate name may be
 specified.
 
+Each document is converted independently, so that a large input may be divided between a number of processes, with
+the --workers option. The output is written in the order of the input.
+
 SYNOPSIS
 sample_iso_8601.py { -z | { -o | -f DATE_FORMAT } [-t TIMEZONE_NAME [-u]] [-i ISO_PATH]
-{ DATETIME_PATH | DATE_PATH TIME_PATH } } [-v]
+{ DATETIME_PATH | DATE_PATH TIME_PATH } } [--output-format FORMAT] [--workers WORKERS]
+[--stats [--stats-interval INTERVAL]] [-v]
 
 EXAMPLES
 csv_reader.py 15_min_Praxis_LHR2.csv -l10 | sample_iso_8601.py -v -f DD/MM/YYYY "Max of Time" -t Europe/Athens -u
@@ -61,14 +65,134 @@ https://docs.microsoft.com/en-us/dotnet/api/system.datetime.tooadate?view=netfra
 import sys
 
 from scs_analysis.cmd.cmd_sample_iso_8601 import CmdSampleISO8601
+from scs_analysis.helper.document_pool import DocumentPool
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.path_accessor import PathAccessor
+from scs_analysis.helper.stream_stats import StreamStats
 
 from scs_core.data.datetime import DateParser, LocalizedDatetime
-from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
 
 from scs_core.location.timezone import Timezone
 
 
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleISO8601(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, oad, parser, zone, utc, iso_path, datetime_path, date_path, time_path, codec):
+        """
+        Constructor
+        """
+        self.__oad = oad
+        self.__parser = parser
+        self.__zone = zone
+        self.__utc = utc
+        self.__iso_path = iso_path
+        self.__datetime_path = datetime_path
+        self.__date_path = date_path
+        self.__time_path = time_path
+        self.__codec = codec
+
+        self.__datetime_accessor = None if datetime_path is None else PathAccessor.construct(datetime_path)
+        self.__date_accessor = None if date_path is None else PathAccessor.construct(date_path)
+        self.__time_accessor = None if time_path is None else PathAccessor.construct(time_path)
+
+        self.__datetime_paths = {path for path in (iso_path, datetime_path, date_path, time_path) if path is not None}
+        self.__copy_accessors = {}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def datum(self, sample):
+        if self.__oad:
+            # OAD...
+            if self.__datetime_accessor is None or not self.__datetime_accessor.has(sample):
+                print("sample_iso_8601: datetime path '%s' not in %s" %
+                      (self.__datetime_path, self.__codec.dumps(sample)), file=sys.stderr)
+                exit(1)
+
+            # ISO 8601...
+            iso = LocalizedDatetime.construct_from_oad(self.__datetime_accessor.node(sample), tz=self.__zone)
+
+        elif self.__datetime_path is not None:
+            # datetime...
+            if not self.__datetime_accessor.has(sample):
+                print("sample_iso_8601: datetime path '%s' not in %s" %
+                      (self.__datetime_path, self.__codec.dumps(sample)), file=sys.stderr)
+                exit(1)
+
+            pieces = self.__datetime_accessor.node(sample).rsplit(' ', 1)       # split on last space character
+
+            if len(pieces) != 2:
+                print("sample_iso_8601: malformed datetime '%s' in %s" %
+                      (self.__datetime_path, self.__codec.dumps(sample)), file=sys.stderr)
+                exit(1)
+
+            date = pieces[0].strip()
+            time = pieces[1].strip()
+
+            # ISO 8601...
+            iso = LocalizedDatetime.construct_from_date_time(self.__parser, date, time, tz=self.__zone)
+
+        else:
+            # date / time...
+            if not self.__date_accessor.has(sample):
+                print("sample_iso_8601: date path '%s' not in %s" % (self.__date_path, self.__codec.dumps(sample)),
+                      file=sys.stderr)
+                exit(1)
+
+            if not self.__time_accessor.has(sample):
+                print("sample_iso_8601: time path '%s' not in %s" % (self.__time_path, self.__codec.dumps(sample)),
+                      file=sys.stderr)
+                exit(1)
+
+            date = self.__date_accessor.node(sample)
+            time = self.__time_accessor.node(sample)
+
+            # ISO 8601...
+            iso = LocalizedDatetime.construct_from_date_time(self.__parser, date, time, tz=self.__zone)
+
+        if iso is None:
+            print("sample_iso_8601: malformed date/time in %s" % self.__codec.dumps(sample), file=sys.stderr)
+            exit(1)
+
+        if self.__utc:
+            iso = iso.utc()
+
+        target = PathDict()
+        target.append(self.__iso_path, iso.as_iso8601())
+
+        # copy...
+        for path in sample.paths():
+            if path in self.__datetime_paths:
+                continue
+
+            if path not in self.__copy_accessors:
+                self.__copy_accessors[path] = PathAccessor.construct(path)
+
+            accessor = self.__copy_accessors[path]
+            accessor.append(target, accessor.node(sample))
+
+        return target
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleISO8601:{oad:%s, zone:%s, utc:%s, iso_path:%s, datetime_path:%s, date_path:%s, " \
+               "time_path:%s}" % \
+               (self.__oad, self.__zone, self.__utc, self.__iso_path, self.__datetime_path, self.__date_path,
+                self.__time_path)
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
@@ -96,6 +220,15 @@ if __name__ == '__main__':
     if cmd.verbose:
         print("sample_iso_8601: %s" % cmd, file=sys.stderr)
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('sample_iso_8601', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    pool = None if cmd.workers is None else DocumentPool.construct(cmd.workers, codec, stdout)
+    stdin = InputStream.construct(idle_handler=stdout.idle if pool is None else pool.idle, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
@@ -122,6 +255,16 @@ if __name__ == '__main__':
                 print("sample_iso_8601: %s" % timezone, file=sys.stderr)
                 sys.stderr.flush()
 
+        # sampler...
+        utc = cmd.timezone is not None and cmd.utc
+
+        sampler = SampleISO8601(cmd.oad, parser, zone, utc, cmd.iso, cmd.datetime_path, cmd.date_path, cmd.time_path,
+                                codec)
+
+        if cmd.verbose:
+            print("sample_iso_8601: %s" % sampler, file=sys.stderr)
+            sys.stderr.flush()
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -131,80 +274,21 @@ if __name__ == '__main__':
                 print(zone, file=sys.stderr)
             exit(0)
 
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
-            document_count += 1
+        if pool is not None:
+            pool.run(stdin, sampler.datum)
 
-            paths = datum.paths()
+        else:
+            for _, datum in stdin.documents(codec):
+                document_count += 1
 
-            if cmd.oad:
-                # OAD...
-                if cmd.datetime_path not in paths:
-                    print("sample_iso_8601: datetime path '%s' not in %s" % (cmd.datetime_path, jstr), file=sys.stderr)
-                    exit(1)
+                target = sampler.datum(datum)
 
-                # ISO 8601...
-                iso = LocalizedDatetime.construct_from_oad(datum.node(cmd.datetime_path), tz=zone)
+                if target is None:
+                    continue
 
-            elif cmd.uses_datetime():
-                # datetime...
-                if cmd.datetime_path not in paths:
-                    print("sample_iso_8601: datetime path '%s' not in %s" % (cmd.datetime_path, jstr), file=sys.stderr)
-                    exit(1)
+                stdout.write_document(target)
 
-                pieces = datum.node(cmd.datetime_path).rsplit(' ', 1)           # split on last space character
-
-                if len(pieces) != 2:
-                    print("sample_iso_8601: malformed datetime '%s' in %s" % (cmd.datetime_path, jstr), file=sys.stderr)
-                    exit(1)
-
-                date = pieces[0].strip()
-                time = pieces[1].strip()
-
-                # ISO 8601...
-                iso = LocalizedDatetime.construct_from_date_time(parser, date, time, tz=zone)
-
-            else:
-                # date / time...
-                if cmd.date_path not in paths:
-                    print("sample_iso_8601: date path '%s' not in %s" % (cmd.date_path, jstr), file=sys.stderr)
-                    exit(1)
-
-                if cmd.time_path not in paths:
-                    print("sample_iso_8601: time path '%s' not in %s" % (cmd.time_path, jstr), file=sys.stderr)
-                    exit(1)
-
-                date = datum.node(cmd.date_path)
-                time = datum.node(cmd.time_path)
-
-                # ISO 8601...
-                iso = LocalizedDatetime.construct_from_date_time(parser, date, time, tz=zone)
-
-            if iso is None:
-                print("sample_iso_8601: malformed date/time in %s" % jstr, file=sys.stderr)
-                exit(1)
-
-            if cmd.timezone is not None and cmd.utc:
-                iso = iso.utc()
-
-            target = PathDict()
-            target.append(cmd.iso, iso.as_iso8601())
-
-            # copy...
-            for path in paths:
-                if path not in cmd.datetime_paths():
-                    target.append(path, datum.node(path))
-
-            # report...
-            print(JSONify.dumps(target))
-            sys.stdout.flush()
-
-            processed_count += 1
+                processed_count += 1
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -218,5 +302,14 @@ if __name__ == '__main__':
             print("sample_iso_8601: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        if pool is not None:
+            pool.close()
+            document_count, processed_count = pool.document_count, pool.processed_count
+
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
             print("sample_iso_8601: documents: %d processed: %d" % (document_count, processed_count), file=sys.stderr)
@@ -16,7 +16,8 @@ the document that is to be filtered. The node is typically a leaf node integer o
 sample_low_pass utility includes the source value, and the smoothed value.
 
 SYNOPSIS
-sample_low_pass.py -d DELTA_T -c CUT_OFF [-p PRECISION] [-v] [PATH]
+sample_low_pass.py -d DELTA_T -c CUT_OFF [-p PRECISION] [--format FORMAT] [--stats [--stats-interval INTERVAL]] [-v]
+[PATH]
 
 EXAMPLES
 osio_topic_history.py -m60 /orgs/south-coast-science-demo/brighton/loc/1/gases | \
@@ -41,8 +42,11 @@ https://www.embeddedrelated.com/showarticle/779.php
 import sys
 
 from scs_analysis.cmd.cmd_sample_low_pass import CmdLowPass
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.stream_stats import StreamStats
 
-from scs_core.data.json import JSONify
 from scs_core.data.low_pass_filter import LowPassFilter
 from scs_core.data.path_dict import PathDict
 
@@ -76,16 +80,19 @@ if __name__ == '__main__':
         print("sample_low_pass: %s" % lpf, file=sys.stderr)
         sys.stderr.flush()
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('sample_low_pass', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    stdin = InputStream.construct(idle_handler=stdout.idle, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                break
-
+        for _, datum in stdin.documents(codec):
             document_count += 1
 
             value = datum.node(cmd.path)
@@ -101,8 +108,7 @@ if __name__ == '__main__':
             target.append(cmd.path + '.src', value)
             target.append(cmd.path + '.lpf', round(lpf.line(value), cmd.precision))
 
-            print(JSONify.dumps(target.node()))
-            sys.stdout.flush()
+            stdout.write_document(target.node())
 
             processed_count += 1
 
@@ -118,5 +124,10 @@ if __name__ == '__main__':
             print("sample_low_pass: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
             print("sample_low_pass: documents: %d processed: %d" % (document_count, processed_count), file=sys.stderr)
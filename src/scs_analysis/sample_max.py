@@ -16,8 +16,10 @@ sample_max utility includes the whole input document.
 
 If there are multiple input documents with the same maximum value, the first document only is written to stdout.
 
+If the --stats flag is used, stream statistics are reported to stderr on exit.
+
 SYNOPSIS
-sample_max.py [-v] [PATH]
+sample_max.py [--stats [--stats-interval INTERVAL]] [-v] [PATH]
 
 EXAMPLES
 osio_topic_history.py -m60 /orgs/south-coast-science-demo/brighton/loc/1/gases | sample_max.py val.CO.cnc
@@ -42,9 +44,10 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_record import CmdSampleRecord
-
-from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.stream_stats import StreamStats
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -67,6 +70,14 @@ if __name__ == '__main__':
         print("sample_max: %s" % cmd, file=sys.stderr)
         sys.stderr.flush()
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('sample_max', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, stats=stats)
+    stdin = InputStream.construct(idle_handler=stdout.idle, stats=stats)
+
 
     try:
         # ------------------------------------------------------------------------------------------------------------
@@ -74,12 +85,7 @@ if __name__ == '__main__':
 
         max_datum = None
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                continue
-
+        for _, datum in stdin.documents(codec):
             document_count += 1
 
             if cmd.path not in datum.paths():
@@ -96,7 +102,7 @@ if __name__ == '__main__':
             processed_count += 1
 
         if max_datum:
-            print(JSONify.dumps(max_datum))
+            stdout.write_document(max_datum)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -110,5 +116,10 @@ if __name__ == '__main__':
             print("sample_max: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
             print("sample_max: documents: %d processed: %d" % (document_count, processed_count), file=sys.stderr)
@@ -17,7 +17,7 @@ the document that is to be filtered. The node is typically a leaf node integer o
 sample_median utility includes the source value, and the smoothed value.
 
 SYNOPSIS
-sample_median.py [-w SIZE] [-p PRECISION] [-v] [PATH]
+sample_median.py [-w SIZE] [-p PRECISION] [--format FORMAT] [--stats [--stats-interval INTERVAL]] [-v] [PATH]
 
 EXAMPLES
 osio_topic_history.py -m60 /orgs/south-coast-science-demo/brighton/loc/1/gases | \
@@ -42,10 +42,11 @@ https://en.wikipedia.org/wiki/Median_filter
 import sys
 
 from scs_analysis.cmd.cmd_sample_median import CmdSampleMedian
-
-from scs_core.data.json import JSONify
-from scs_core.data.median_filter import MedianFilter
-from scs_core.data.path_dict import PathDict
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.sample_median import SampleMedian
+from scs_analysis.helper.stream_stats import StreamStats
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -71,39 +72,33 @@ if __name__ == '__main__':
     # ----------------------------------------------------------------------------------------------------------------
     # resources...
 
-    median_filter = MedianFilter(cmd.window)
+    sampler = SampleMedian(cmd.path, cmd.window, cmd.precision)
 
     if cmd.verbose:
-        print("sample_median: %s" % median_filter, file=sys.stderr)
+        print("sample_median: %s" % sampler.median_filter, file=sys.stderr)
         sys.stderr.flush()
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('sample_median', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    stdin = InputStream.construct(idle_handler=stdout.idle, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                continue
-
+        for _, datum in stdin.documents(codec):
             document_count += 1
 
-            value = datum.node(cmd.path)
+            target = sampler.datum(datum)
 
-            if value is None:
+            if target is None:
                 continue
 
-            target = PathDict()
-
-            if datum.has_path('rec'):
-                target.copy(datum, 'rec')
-
-            target.append(cmd.path + '.src', value)
-            target.append(cmd.path + '.med', round(median_filter.compute(value), cmd.precision))
-
-            print(JSONify.dumps(target.node()))
-            sys.stdout.flush()
+            stdout.write_document(target)
 
             processed_count += 1
 
@@ -119,5 +114,10 @@ if __name__ == '__main__':
             print("sample_median: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
             print("sample_median: documents: %d processed: %d" % (document_count, processed_count), file=sys.stderr)
@@ -17,7 +17,7 @@ the document that is to be examined. The node is typically a leaf node integer o
 sample_noise utility includes the source value, aggregate, and the error.
 
 SYNOPSIS
-sample_noise.py [-p PRECISION] [-v] [PATH]
+sample_noise.py [-p PRECISION] [--format FORMAT] [--stats [--stats-interval INTERVAL]] [-v] [PATH]
 
 EXAMPLES
 aws_topic_history.py -t 10 /orgs/south-coast-science-demo/brighton/loc/1/gases | sample_noise.py -p 3 val.CO.cnc
@@ -37,8 +37,11 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_filter import CmdSampleFilter
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.stream_stats import StreamStats
 
-from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
 
 
@@ -115,6 +118,14 @@ if __name__ == '__main__':
     if cmd.verbose:
         print("sample_noise: %s" % cmd, file=sys.stderr)
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('sample_noise', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    stdin = InputStream.construct(idle_handler=stdout.idle, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
@@ -129,19 +140,13 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                continue
-
+        for _, datum in stdin.documents(codec):
             document_count += 1
 
             error_datum = err.datum(datum)
 
             if error_datum is not None:
-                print(JSONify.dumps(error_datum))
-                sys.stdout.flush()
+                stdout.write_document(error_datum)
 
             processed_count += 1
 
@@ -157,5 +162,10 @@ if __name__ == '__main__':
             print("sample_noise: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
             print("sample_noise: documents: %d processed: %d" % (document_count, processed_count), file=sys.stderr)
@@ -20,7 +20,8 @@ Both upper and lower bounds are optional. If both are present, then the lower bo
 upper bounding value.
 
 SYNOPSIS
-sample_nullify.py -t TARGET_PATH -s SOURCE_PATH [-l LOWER] [-u UPPER] [-v]
+sample_nullify.py -t TARGET_PATH -s SOURCE_PATH [-l LOWER] [-u UPPER] [--format FORMAT]
+[--stats [--stats-interval INTERVAL]] [-v]
 
 EXAMPLES
 csv_reader.py -v scs-bgx-405-corrected-2019-04-1min.csv | sample_nullify.py -v -u 80 -s meteo.val.hmd -t proc_PM10 |
@@ -42,9 +43,12 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_nullify import CmdSampleNullify
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.path_accessor import PathAccessor
+from scs_analysis.helper.stream_stats import StreamStats
 
-from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -68,40 +72,48 @@ if __name__ == '__main__':
         print("sample_nullify: %s" % cmd, file=sys.stderr)
         sys.stderr.flush()
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('sample_nullify', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    stdin = InputStream.construct(idle_handler=stdout.idle, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
-        # run...
+        # resources...
 
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
+        source_accessor = PathAccessor.construct(cmd.source)
+        target_accessor = PathAccessor.construct(cmd.target)
 
-            if datum is None:
-                continue
 
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        for _, datum in stdin.documents(codec):
             document_count += 1
 
-            paths = datum.paths()
-            if cmd.source not in paths or cmd.target not in paths:
+            if not source_accessor.has(datum) or not target_accessor.has(datum):
                 continue
 
-            value_node = datum.node(cmd.source)
+            value_node = source_accessor.node(datum)
 
             if value_node is not None and value_node != '':
                 try:
                     source_value = float(value_node)
                 except ValueError:
                     source_value = None
-                    print("sample_nullify: invalid numeric value '%s' in %s" % (value_node, jstr), file=sys.stderr)
+                    print("sample_nullify: invalid numeric value '%s' in %s" % (value_node, codec.dumps(datum)),
+                          file=sys.stderr)
                     exit(1)
 
                 if (cmd.lower is not None and source_value < cmd.lower) or \
                         (cmd.upper is not None and source_value >= cmd.upper):
-                    datum.set_node(cmd.target, None)
+                    target_accessor.append(datum, None)
                     nullified_count += 1
 
-            print(JSONify.dumps(datum))
-            sys.stdout.flush()
+            stdout.write_document(datum)
 
             processed_count += 1
 
@@ -117,6 +129,11 @@ if __name__ == '__main__':
             print("sample_nullify: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
             print("sample_nullify: documents: %d processed: %d nullified: %d" %
                   (document_count, processed_count, nullified_count), file=sys.stderr)
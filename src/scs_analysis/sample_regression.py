@@ -15,7 +15,7 @@ the document that is to be averaged. The node is typically a leaf node integer o
 sample_regression utility includes the last source value, slope and intercept.
 
 SYNOPSIS
-sample_regression.py [-t TALLY] [-p PRECISION] [-v] [PATH]
+sample_regression.py [-t TALLY] [-p PRECISION] [--format FORMAT] [--stats [--stats-interval INTERVAL]] [-v] [PATH]
 
 EXAMPLES
 osio_topic_history.py -m60 /orgs/south-coast-science-demo/brighton/loc/1/gases | \
@@ -37,9 +37,12 @@ DOCUMENT EXAMPLE - OUTPUT
 import sys
 
 from scs_analysis.cmd.cmd_sample_tally import CmdSampleTally
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.stream_stats import StreamStats
 
 from scs_core.data.datetime import LocalizedDatetime
-from scs_core.data.json import JSONify
 from scs_core.data.linear_regression import LinearRegression
 from scs_core.data.path_dict import PathDict
 
@@ -128,6 +131,14 @@ if __name__ == '__main__':
     if cmd.verbose:
         print("sample_regression: %s" % cmd, file=sys.stderr)
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('sample_regression', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    stdin = InputStream.construct(idle_handler=stdout.idle, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
@@ -142,19 +153,13 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            datum = PathDict.construct_from_jstr(line)
-
-            if datum is None:
-                continue
-
+        for _, datum in stdin.documents(codec):
             document_count += 1
 
             average = sampler.datum(datum)
 
             if average is not None:
-                print(JSONify.dumps(average))
-                sys.stdout.flush()
+                stdout.write_document(average)
 
             processed_count += 1
 
@@ -167,5 +172,10 @@ if __name__ == '__main__':
             print("sample_regression: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
             print("sample_regression: documents: %d processed: %d" % (document_count, processed_count), file=sys.stderr)
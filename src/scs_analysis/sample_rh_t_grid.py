@@ -20,8 +20,11 @@ utility may simply report the average standard deviation for all cells.
 Input documents whose temperature or humidity values are outside the specified bounds of the grid are ignored,
 input documents with empty or non-floating point values will also be ignored.
 
+If the --stats flag is used, stream statistics are reported to stderr on exit.
+
 SYNOPSIS
-sample_rh_t_grid.py -r MIN MAX STEP -t MIN MAX STEP -o { R | C | M | S } [-v] RH_PATH T_PATH REPORT_PATH REF_PATH
+sample_rh_t_grid.py -r MIN MAX STEP -t MIN MAX STEP -o { R | C | M | S } [--stats [--stats-interval INTERVAL]] [-v]
+RH_PATH T_PATH REPORT_PATH REF_PATH
 
 EXAMPLES
 csv_reader.py -v praxis_431_gases_2019-02-07_2019-03-14_15min_joined.csv | \
@@ -33,10 +36,15 @@ https://joshualoong.com/2018/10/03/Fitting-Polynomial-Regressions-in-Python/
 
 import sys
 
-from scs_analysis.cmd.cmd_sample_rh_t_grid import CmdSampleRhTGrid
+from scs_analysis.helper.fork_client import ForkClient
+
+ForkClient.delegate()                   # if a scs_analysis_server is running, this utility is run there
 
-from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
+from scs_analysis.cmd.cmd_sample_rh_t_grid import CmdSampleRhTGrid
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.stream_stats import StreamStats
 
 from scs_core.error.error_grid import ErrorGrid
 
@@ -65,6 +73,14 @@ if __name__ == '__main__':
     if cmd.verbose:
         print("sample_t_rh_grid: %s" % cmd, file=sys.stderr)
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('sample_rh_t_grid', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, stats=stats)
+    stdin = InputStream.construct(idle_handler=stdout.idle, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
@@ -80,13 +96,7 @@ if __name__ == '__main__':
         # run...
 
         # input...
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
+        for jstr, datum in stdin.documents(codec):
             document_count += 1
 
             # fields...
@@ -115,7 +125,7 @@ if __name__ == '__main__':
 
             if not included:
                 if cmd.verbose:
-                    print("sample_t_rh_grid: rejected: %s" % jstr, file=sys.stderr)
+                    print("sample_t_rh_grid: rejected: %s" % (jstr or codec.dumps(datum)), file=sys.stderr)
                     sys.stderr.flush()
 
                 continue
@@ -127,28 +137,28 @@ if __name__ == '__main__':
             report = ErrorGridReportRhT.construct(grid)
 
             for row in report.rows():
-                print(JSONify.dumps(row))
+                stdout.write_document(row)
 
         # report t columns...
         elif cmd.output_mode == 'C':
             report = ErrorGridReportTRh.construct(grid)
 
             for row in report.rows():
-                print(JSONify.dumps(row))
+                stdout.write_document(row)
 
         # report mesh...
         elif cmd.output_mode == 'M':
             mesh = ErrorMeshTRh.construct(grid)
 
             for line in mesh.lines():
-                print(JSONify.dumps(line))
+                stdout.write_document(line)
 
         # report surface...
         elif cmd.output_mode == 'S':
             mesh = ErrorMeshTRh.construct(grid)
             surface = ErrorSurface.construct(mesh)
 
-            print(JSONify.dumps(surface))
+            stdout.write_document(surface)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -162,5 +172,10 @@ if __name__ == '__main__':
             print("sample_t_rh_grid: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
             print("sample_t_rh_grid: documents: %d included: %d" % (document_count, included_count), file=sys.stderr)
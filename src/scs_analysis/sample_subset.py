@@ -31,7 +31,8 @@ If the --exclusions flag is used, the sample_subset utility outputs only the doc
 specified bounds. Note that, in this case, documents with missing or empty fields are still discarded.
 
 SYNOPSIS
-sample_subset.py [{ -i | -n }] [-l LOWER] [-u UPPER] [-x] [-v] PATH
+sample_subset.py [{ -i | -n }] [-l LOWER] [-u UPPER] [-x] [--format FORMAT] [--stats [--stats-interval INTERVAL]] [-v]
+PATH
 
 EXAMPLES
 csv_reader.py praxis_303.csv | sample_subset.py -v -i -l 2018-09-26T00:00:00Z -u 2018-09-27T00:00:00Z rec
@@ -40,9 +41,11 @@ csv_reader.py praxis_303.csv | sample_subset.py -v -i -l 2018-09-26T00:00:00Z -u
 import sys
 
 from scs_analysis.cmd.cmd_sample_subset import CmdSampleSubset
-
-from scs_core.data.datum import Datum
-from scs_core.data.path_dict import PathDict
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.sample_subset import SampleSubset
+from scs_analysis.helper.stream_stats import StreamStats
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -51,10 +54,9 @@ if __name__ == '__main__':
 
     lower_bound = None
     upper_bound = None
-    value = None
+    subset = None
 
     document_count = 0
-    processed_count = 0
     output_count = 0
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -69,6 +71,14 @@ if __name__ == '__main__':
     if cmd.verbose:
         print("sample_subset: %s" % cmd, file=sys.stderr)
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('sample_subset', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    stdin = InputStream.construct(idle_handler=stdout.idle, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
@@ -85,61 +95,20 @@ if __name__ == '__main__':
             print("sample_subset: invalid value for upper bound: %s" % ex, file=sys.stderr)
             exit(2)
 
+        subset = SampleSubset(cmd.path, lower_bound, upper_bound, cmd.iso8601, cmd.numeric, cmd.exclusions, codec)
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
-
+        for jstr, datum in stdin.documents(codec):
             document_count += 1
 
-            paths = datum.paths()
-
-            # value...
-            if cmd.path not in paths:
-                continue
-
-            value_node = datum.node(cmd.path)
-
-            if value_node == '':
-                continue
-
-            if cmd.iso8601:
-                value = Datum.datetime(value_node)
-
-                if value is None:
-                    print("sample_subset: invalid ISO 8601 value '%s' in %s" % (value_node, jstr), file=sys.stderr)
-                    exit(1)
-
-            elif cmd.numeric:
-                value = Datum.float(value_node)
-
-                if value is None:
-                    print("sample_subset: invalid numeric value '%s' in %s" % (value_node, jstr), file=sys.stderr)
-                    exit(1)
-
-            else:
-                value = value_node
-
-                if not value:
-                    continue
-
-            processed_count += 1
-
-            # bounds...
-            in_bounds = (lower_bound is None or value >= lower_bound) and (upper_bound is None or value < upper_bound)
-
-            if (cmd.inclusions and not in_bounds) or (cmd.exclusions and in_bounds):
+            if not subset.includes(datum):
                 continue
 
             # report...
-            print(jstr)
-            sys.stdout.flush()
+            stdout.write_document(datum, jstr)
 
             output_count += 1
 
@@ -155,6 +124,13 @@ if __name__ == '__main__':
             print("sample_subset: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
+            processed_count = 0 if subset is None else subset.processed_count
+
             print("sample_subset: documents: %d processed: %d output: %d" %
                   (document_count, processed_count, output_count), file=sys.stderr)
@@ -27,8 +27,11 @@ The sample_timezone utility silently ignores input lines which have:
 
 Note that the timezone of a South Coast Science device is normally reported on its status topic.
 
+The rec field of each document is shifted independently, so the --workers option may be used to divide a large input
+between a number of processes. Documents are written in their original order.
+
 SYNOPSIS
-sample_timezone.py { -z | TIMEZONE_NAME }
+sample_timezone.py [--format FORMAT] [--workers WORKERS] [--stats [--stats-interval INTERVAL]] { -z | TIMEZONE_NAME }
 
 EXAMPLES
 aws_topic_history.py south-coast-science-dev/production-test/loc/1/climate -s 2018-10-28T00:00:00+00:00 \
@@ -49,17 +52,63 @@ Because the sample_timezone utility is based on the pytz library, offset errors
 pseudo-timezones.
 """
 
-import json
 import sys
 
 from scs_analysis.cmd.cmd_sample_timezone import CmdSampleTimezone
+from scs_analysis.helper.document_pool import DocumentPool
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.stream_stats import StreamStats
 
 from scs_core.data.datetime import LocalizedDatetime
-from scs_core.data.json import JSONify
 
 from scs_core.location.timezone import Timezone
 
 
+# --------------------------------------------------------------------------------------------------------------------
+
+class SampleTimezone(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, zone):
+        """
+        Constructor
+        """
+        self.__zone = zone
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def datum(self, sample):
+        jdict = sample.node()
+
+        try:
+            rec = jdict['rec']
+        except KeyError:
+            return None
+
+        # zone shift...
+        datetime = LocalizedDatetime.construct_from_iso8601(rec)
+
+        if datetime is None:
+            return None
+
+        jdict['rec'] = datetime.localize(self.__zone).as_iso8601()
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleTimezone:{zone:%s}" % self.__zone
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
@@ -82,6 +131,15 @@ if __name__ == '__main__':
     if cmd.verbose:
         print("sample_timezone: %s" % cmd, file=sys.stderr)
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('sample_timezone', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    pool = None if cmd.workers is None else DocumentPool.construct(cmd.workers, codec, stdout)
+    stdin = InputStream.construct(idle_handler=stdout.idle if pool is None else pool.idle, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
@@ -99,6 +157,8 @@ if __name__ == '__main__':
                 print("sample_timezone: %s" % timezone, file=sys.stderr)
                 sys.stderr.flush()
 
+        sampler = SampleTimezone(zone)
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
@@ -108,32 +168,21 @@ if __name__ == '__main__':
                 print(zone, file=sys.stderr)
             exit(0)
 
-        for line in sys.stdin:
-            try:
-                jdict = json.loads(line)
-            except ValueError:
-                continue
-
-            document_count += 1
-
-            try:
-                rec = jdict['rec']
-            except KeyError:
-                continue
+        if pool is not None:
+            pool.run(stdin, sampler.datum)
 
-            # zone shift...
-            datetime = LocalizedDatetime.construct_from_iso8601(rec)
+        else:
+            for _, datum in stdin.documents(codec):
+                document_count += 1
 
-            if datetime is None:
-                continue
+                target = sampler.datum(datum)
 
-            jdict['rec'] = datetime.localize(zone).as_iso8601()
+                if target is None:
+                    continue
 
-            # report...
-            print(JSONify.dumps(jdict))
-            sys.stdout.flush()
+                stdout.write_document(target)
 
-            processed_count += 1
+                processed_count += 1
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -144,5 +193,14 @@ if __name__ == '__main__':
             print("sample_timezone: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        if pool is not None:
+            pool.close()
+            document_count, processed_count = pool.document_count, pool.processed_count
+
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
             print("sample_timezone: documents: %d processed: %d" % (document_count, processed_count), file=sys.stderr)
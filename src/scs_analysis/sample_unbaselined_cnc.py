@@ -32,8 +32,13 @@ Single sensor interface (DSI) systems are not currently supported.
 
 NOTE: The utility requires access to the alphasense-technology web API.
 
+The --workers option divides the documents between a number of processes - each document is interpreted
+independently of the others. Documents are written in the order in which they were read. The --batch option
+computes the u-cnc values of each gas as a NumPy array, for batches of documents, with the same results.
+
 SYNOPSIS
-sample_unbaselined_cnc.py -a AFE_SERIAL_NUMBER [-v] REPORT_SUB_PATH
+sample_unbaselined_cnc.py -a AFE_SERIAL_NUMBER [--format FORMAT] [{ --workers WORKERS | --batch BATCH }]
+[--stats [--stats-interval INTERVAL]] [-v] REPORT_SUB_PATH
 
 EXAMPLES
 csv_reader.py gases.csv | sample_unbaselined_cnc.py -a 26-000077 val | csv_writer.py -v gases-u-cnc.csv
@@ -63,9 +68,14 @@ import sys
 from collections import OrderedDict
 
 from scs_analysis.cmd.cmd_sample_unbaselined_cnc import CmdSampleUnbaselinedCnc
+from scs_analysis.helper.document_batch import DocumentBatch
+from scs_analysis.helper.document_pool import DocumentPool
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.path_accessor import PathAccessor
+from scs_analysis.helper.stream_stats import StreamStats
 
-from scs_core.data.json import JSONify
-from scs_core.data.path_dict import PathDict
 
 from scs_core.gas.afe_calib import AFECalib
 
@@ -76,10 +86,99 @@ from scs_host.client.http_client import HTTPClient
 
 # --------------------------------------------------------------------------------------------------------------------
 
-if __name__ == '__main__':
+class SampleUnbaselinedCnc(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, afe_calib, report_sub_path):
+        """
+        Constructor
+        """
+        self.__report_sub_path = report_sub_path
+
+        # SensorCalib lookup...
+        gas_names = afe_calib.gas_names()
+
+        self.__sensor_calibs = OrderedDict()
+        for i in range(len(afe_calib)):
+            self.__sensor_calibs[gas_names[i]] = afe_calib.sensor_calib(i)
+
+        # paths...
+        self.__we_c_accessors = OrderedDict()
+        self.__u_cnc_accessors = OrderedDict()
+
+        for gas_name in self.__sensor_calibs.keys():
+            gas_sub_path = report_sub_path + '.' + gas_name
+
+            self.__we_c_accessors[gas_name] = PathAccessor.construct(gas_sub_path + '.weC')
+            self.__u_cnc_accessors[gas_name] = PathAccessor.construct(gas_sub_path + '.u-cnc')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def datum(self, sample):
+        # gases...
+        for gas_name, sensor_calib in self.__sensor_calibs.items():         # uses calibration ordering
+            try:
+                we_c = float(self.__we_c_accessors[gas_name].node(sample))
+            except (TypeError, ValueError):
+                continue
+
+            unbaselined_cnc = round(we_c / (sensor_calib.we_sens_mv / 1000.0), 1)
+            self.__u_cnc_accessors[gas_name].append(sample, unbaselined_cnc)
+
+        return sample
+
+
+    def batch(self, samples):
+        columns = []
+
+        # gases...
+        for gas_name, sensor_calib in self.__sensor_calibs.items():         # uses calibration ordering
+            accessor = self.__we_c_accessors[gas_name]
+
+            indices = []
+            we_cs = []
+
+            for i, sample in enumerate(samples):
+                try:
+                    we_c = float(accessor.node(sample))
+                except (TypeError, ValueError):
+                    continue
+
+                indices.append(i)
+                we_cs.append(we_c)
+
+            try:
+                with DocumentBatch.strict():
+                    unbaselined_cncs = DocumentBatch.array(we_cs) / (sensor_calib.we_sens_mv / 1000.0)
+
+            except FloatingPointError:              # the scalar path raises - if it does - at the same document
+                yield from (self.datum(sample) for sample in samples)
+                return
 
-    afe_calib = None
-    we_c = None
+            columns.append((gas_name, indices, DocumentBatch.rounded(unbaselined_cncs, 1)))
+
+        for gas_name, indices, unbaselined_cncs in columns:
+            for i, unbaselined_cnc in zip(indices, unbaselined_cncs):
+                self.__u_cnc_accessors[gas_name].append(samples[i], unbaselined_cnc)
+
+        yield from samples
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SampleUnbaselinedCnc:{report_sub_path:%s, gas_names:%s}" % \
+               (self.__report_sub_path, list(self.__sensor_calibs.keys()))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
 
     document_count = 0
     processed_count = 0
@@ -93,9 +192,25 @@ if __name__ == '__main__':
         cmd.print_help(sys.stderr)
         exit(2)
 
+    if cmd.batch is not None and not DocumentBatch.is_available():
+        print("sample_unbaselined_cnc: the --batch option requires numpy.", file=sys.stderr)
+        exit(1)
+
     if cmd.verbose:
         print("sample_unbaselined_cnc: %s" % cmd, file=sys.stderr)
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('sample_unbaselined_cnc', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    pool = None if cmd.workers is None else DocumentPool.construct(cmd.workers, codec, stdout)
+    batch = None if cmd.batch is None else DocumentBatch.construct(cmd.batch, stdout)
+
+    idle_handler = pool.idle if pool is not None else batch.idle if batch is not None else stdout.idle
+    stdin = InputStream.construct(idle_handler=idle_handler, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # resources...
@@ -110,47 +225,35 @@ if __name__ == '__main__':
 
         if cmd.verbose:
             print("sample_unbaselined_cnc: %s" % afe_calib, file=sys.stderr)
-            sys.stderr.flush()
 
-        # SensorCalib lookup...
-        gas_names = afe_calib.gas_names()
+        sampler = SampleUnbaselinedCnc(afe_calib, cmd.report_sub_path)
 
-        sensor_calibs = OrderedDict()
-        for i in range(len(afe_calib)):
-            sensor_calibs[gas_names[i]] = afe_calib.sensor_calib(i)
+        if cmd.verbose:
+            print("sample_unbaselined_cnc: %s" % sampler, file=sys.stderr)
+            sys.stderr.flush()
 
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            jstr = line.strip()
-            datum = PathDict.construct_from_jstr(jstr)
-
-            if datum is None:
-                continue
+        if pool is not None:
+            pool.run(stdin, sampler.datum)
 
-            document_count += 1
+        elif batch is not None:
+            batch.run(stdin, codec, sampler.batch)
 
-            paths = datum.paths()
+        else:
+            for _, datum in stdin.documents(codec):
+                document_count += 1
 
-            # gases...
-            for gas_name, sensor_calib in sensor_calibs.items():                # uses calibration ordering
-                report_sub_path = cmd.report_sub_path + '.' + gas_name
+                target = sampler.datum(datum)
 
-                try:
-                    we_c = float(datum.node(report_sub_path + '.weC'))
-                except (TypeError, ValueError):
+                if target is None:
                     continue
 
-                unbaselined_cnc = round(we_c / (sensor_calib.we_sens_mv / 1000.0), 1)
-                datum.append(report_sub_path + '.u-cnc', unbaselined_cnc)
+                stdout.write_document(target)
 
-            # report...
-            print(JSONify.dumps(datum))
-            sys.stdout.flush()
-
-            processed_count += 1
+                processed_count += 1
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -164,6 +267,18 @@ if __name__ == '__main__':
             print("sample_unbaselined_cnc: KeyboardInterrupt", file=sys.stderr)
 
     finally:
+        if pool is not None:
+            pool.close()
+            document_count, processed_count = pool.document_count, pool.processed_count
+
+        if batch is not None:
+            document_count, processed_count = batch.document_count, batch.processed_count
+
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         if cmd.verbose:
             print("sample_unbaselined_cnc: documents: %d processed: %d" % (document_count, processed_count),
                   file=sys.stderr)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+DESCRIPTION
+The scs_analysis_server utility keeps a set of scs_analysis utilities - and the scs_core modules that they use -
+imported in a single process. When one of these utilities is run while the server is running, it passes its arguments
+and its stdin, stdout and stderr to the server, which forks a worker to run it. The utility exits with the worker's
+exit status. This saves the interpreter startup and import time of every invocation, which dominates short runs such
+as those made for each cell of the timeshift_grid_reporter offset grid.
+
+If the server is not running, the utilities run as usual. The utilities may be specified on the command line - by
+default, they are csv_join, csv_reader, csv_writer, node_shift, sample_aggregate and sample_rh_t_grid.
+
+The server listens on a Unix domain socket, accessible to its owner only - by default, scs_analysis_server in
+XDG_RUNTIME_DIR, or in the private directory scs_analysis_server-UID in TMPDIR. If the socket is specified with the -s
+flag, the utilities find it by the SCS_ANALYSIS_SERVER environment variable. A utility is not passed to a server that is
+run by another user. Only the user, home, locale, path, shell, terminal and time zone variables of the utility's
+environment are passed. The server is stopped with SIGINT or SIGTERM.
+
+SYNOPSIS
+scs_analysis_server.py [-s SOCKET] [-v] [UTILITY_1 .. UTILITY_N]
+
+EXAMPLES
+scs_analysis_server.py -v &
+timeshift_grid_reporter.py -r -300 -120 5 -t -125 -125 1 -p praxis_climate_status_joined_1min.csv \
+-f LHR2_ref_15_min_rec.csv env.climate.val.hmd env.gas.val.sht.tmp env.gas.val.NO2 real
+
+SEE ALSO
+scs_analysis/timeshift_grid_reporter
+"""
+
+import signal
+import sys
+
+from scs_analysis.cmd.cmd_scs_analysis_server import CmdSCSAnalysisServer
+from scs_analysis.helper.fork_server import ForkServer
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    server = None
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdSCSAnalysisServer()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("scs_analysis_server: %s" % cmd, file=sys.stderr)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+        server = ForkServer.construct(cmd.utilities, path=cmd.socket)
+
+        try:
+            server.preload()
+
+        except ImportError as ex:
+            print("scs_analysis_server: %s" % ex, file=sys.stderr)
+            exit(1)
+
+        try:
+            server.open()
+
+        except OSError as ex:
+            print("scs_analysis_server: %s" % ex, file=sys.stderr)
+            exit(1)
+
+        if cmd.verbose:
+            print("scs_analysis_server: %s" % server, file=sys.stderr)
+            sys.stderr.flush()
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        server.serve()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except KeyboardInterrupt:
+        if cmd.verbose:
+            print("scs_analysis_server: KeyboardInterrupt", file=sys.stderr)
+
+    finally:
+        if server is not None:
+            server.close()
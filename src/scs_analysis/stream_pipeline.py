@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+source repo: scs_analysis
+
+DESCRIPTION
+The stream_pipeline utility is used to run a pipeline of scs_analysis utilities within a single process. The pipeline
+is specified in the same form as a shell pipeline, and each of the utilities accepts the same flags, and has the same
+semantics, as its standalone equivalent.
+
+Documents are passed from one stage of the pipeline to the next as in-memory objects. Documents are therefore parsed
+only once, on entry to the pipeline, and serialised only once, on exit. This avoids the cost of JSON parsing and
+serialisation at every stage, together with the cost of starting an interpreter for every utility.
+
+If the first utility is csv_reader, then the pipeline reads CSV from the named files or from stdin. Otherwise, the
+pipeline reads a sequence of JSON documents from stdin. If the last utility is csv_writer, then output is written as
+CSV. Otherwise, output is written to stdout as a sequence of JSON documents.
+
+The pipeline should be given as a single, quoted argument. The utilities currently supported are:
+
+csv_reader, csv_writer, node, node_shift, sample_aggregate, sample_ah, sample_median, sample_subset
+
+The csv_reader --array, node --array and node --sequence options are not supported.
+
+SYNOPSIS
+stream_pipeline.py [--format FORMAT] [--stats [--stats-interval INTERVAL]] [-v] PIPELINE
+
+EXAMPLES
+stream_pipeline.py "csv_reader.py climate.csv | sample_aggregate.py -f -c **:/01:00 | \
+node_shift.py -o 2 -f val.hmd val.hmd-s2 | csv_writer.py climate-s2.csv"
+
+SEE ALSO
+scs_analysis/csv_reader
+scs_analysis/csv_writer
+"""
+
+import sys
+
+from scs_analysis.cmd.cmd_stream_pipeline import CmdStreamPipeline
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.stream_stats import StreamStats
+from scs_analysis.pipeline.pipeline import Pipeline, PipelineException
+
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    pipeline = None
+    output_count = 0
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdStreamPipeline()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("stream_pipeline: %s" % cmd, file=sys.stderr)
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # stdio...
+
+    codec = JSONCodec.construct()
+    stats = StreamStats.construct('stream_pipeline', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(codec=codec, doc_format=cmd.doc_format, stats=stats)
+    stdin = InputStream.construct(idle_handler=stdout.idle, stats=stats)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        try:
+            pipeline = Pipeline.construct_from_tokens(cmd.tokens)
+
+        except PipelineException as ex:
+            print("stream_pipeline: %s" % ex, file=sys.stderr)
+            print("stream_pipeline: supported utilities: %s" % ', '.join(Pipeline.stage_names()), file=sys.stderr)
+            exit(2)
+
+        if cmd.verbose:
+            print("stream_pipeline: %s" % pipeline, file=sys.stderr)
+            sys.stderr.flush()
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        for document in pipeline.run(datum for _, datum in stdin.documents(codec)):
+            stdout.write_document(document)
+
+            output_count += 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except KeyError as ex:
+        print("stream_pipeline: KeyError: %s" % ex, file=sys.stderr)
+
+    except KeyboardInterrupt:
+        if cmd.verbose:
+            print("stream_pipeline: KeyboardInterrupt", file=sys.stderr)
+
+    finally:
+        if pipeline is not None:
+            pipeline.close()
+
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
+        if cmd.verbose:
+            print("stream_pipeline: output: %d" % output_count, file=sys.stderr)
@@ -11,8 +11,11 @@ DESCRIPTION
 The timer utility is used to report elapsed time for a command line job. To use, it should be threaded into a pipeline,
 where it passes stdin to stout. On terminating, the timer utility reports a timedelta to stderr.
 
+If the --stats flag is used, stream statistics are also reported to stderr on exit - each line is counted as a
+document. With --stats-interval, they are also reported every INTERVAL seconds.
+
 SYNOPSIS
-timer.py
+timer.py [--stats [--stats-interval INTERVAL]]
 
 EXAMPLES
 csv_reader.py source*.csv | timer.py | csv_writer.py target.csv
@@ -21,6 +24,11 @@ csv_reader.py source*.csv | timer.py | csv_writer.py target.csv
 import sys
 import time
 
+from scs_analysis.cmd.cmd_timer import CmdTimer
+from scs_analysis.helper.input_stream import InputStream
+from scs_analysis.helper.output_stream import OutputStream
+from scs_analysis.helper.stream_stats import StreamStats
+
 from scs_core.data.json import JSONify
 from scs_core.data.timedelta import Timedelta
 
@@ -29,6 +37,16 @@ from scs_core.data.timedelta import Timedelta
 
 if __name__ == '__main__':
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdTimer()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+
     # ----------------------------------------------------------------------------------------------------------------
     # resources...
 
@@ -37,13 +55,16 @@ if __name__ == '__main__':
 
     start_time = time.time()
 
+    stats = StreamStats.construct('timer', cmd.stats_interval) if cmd.stats else None
+    stdout = OutputStream.construct(stats=stats)
+    stdin = InputStream.construct(idle_handler=stdout.idle, stats=stats)
+
     try:
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
-        for line in sys.stdin:
-            print(line, end='')
-            sys.stdout.flush()
+        for line in stdin.lines():
+            stdout.write(line)
 
     # ----------------------------------------------------------------------------------------------------------------
     # end...
@@ -55,6 +76,11 @@ if __name__ == '__main__':
     # close...
 
     finally:
+        stdout.close()
+
+        if stats is not None:
+            stats.report()
+
         elapsed_time = time.time() - start_time
         delta = Timedelta(seconds=elapsed_time)
 
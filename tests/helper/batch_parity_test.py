@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The array forms of the --batch mode against their scalar implementations: each element must be the value of the
+scalar implementation - so that the constants held by the array forms agree with those of scs_core - and a division
+by zero must raise FloatingPointError. Requires numpy.
+"""
+
+from scs_analysis.helper.document_batch import DocumentBatch
+
+assert DocumentBatch.is_available(), "numpy is not installed"
+
+from scs_analysis.helper.absolute_humidity_array import AbsoluteHumidityArray
+from scs_analysis.helper.gas_array import GasArray
+
+from scs_core.climate.absolute_humidity import AbsoluteHumidity
+
+from scs_core.gas.gas import Gas
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+gases = ('CO', 'CO2', 'NO', 'NO2', 'O3', 'SO2')
+
+densities = [0.0, 0.5, 12.25, 51.0, 1000.0]
+ts = [-40.0, -0.5, 0.0, 13.1, 25.0, 60.0]
+ps = [80.0, 101.3, 110.0]
+rhs = [0.0, 0.1, 45.5, 67.6, 100.0]
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+# concentration...
+for gas in gases:
+    cases = [(density, t, p) for density in densities for t in ts for p in ps]
+
+    expected = [Gas.concentration(gas, density, t, p) for density, t, p in cases]
+    actual = GasArray.concentration(gas, DocumentBatch.array([case[0] for case in cases]),
+                                    DocumentBatch.array([case[1] for case in cases]),
+                                    DocumentBatch.array([case[2] for case in cases])).tolist()
+
+    print("%s: %d cases" % (gas, len(cases)))
+    assert actual == expected, "%s: concentration differs" % gas
+
+print("-")
+
+# absolute humidity...
+cases = [(rh, t) for rh in rhs for t in ts]
+
+expected = [AbsoluteHumidity.from_rh_t(rh, t) for rh, t in cases]
+actual = AbsoluteHumidityArray.from_rh_t(DocumentBatch.array([case[0] for case in cases]),
+                                         DocumentBatch.array([case[1] for case in cases])).tolist()
+
+print("ah: %d cases, max difference: %s" % (len(cases), max(abs(a - e) for a, e in zip(actual, expected))))
+assert DocumentBatch.rounded(DocumentBatch.array(actual), 3) == [round(value, 3) for value in expected], \
+    "ah differs"
+
+print("-")
+
+# division by zero...
+try:
+    Gas.concentration('NO2', 1.0, 20.0, 0.0)
+    raise AssertionError("scalar: no exception")
+except ZeroDivisionError:
+    pass
+
+try:
+    GasArray.concentration('NO2', DocumentBatch.array([1.0]), DocumentBatch.array([20.0]), DocumentBatch.array([0.0]))
+    raise AssertionError("array: no exception")
+except FloatingPointError:
+    pass
+
+try:
+    AbsoluteHumidityArray.from_rh_t(DocumentBatch.array([50.0]), DocumentBatch.array([-273.15]))
+    raise AssertionError("array: no exception")
+except FloatingPointError:
+    pass
+
+print("division by zero: raised")
+print("=")
+print("OK")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A CSVWriterPool with max_open 1 and exclude_header set: every write to an alternate file evicts the other, so each
+file is reopened for every row, and must keep the paths that it was first given.
+"""
+
+import csv
+import os
+import tempfile
+
+from scs_analysis.helper.csv_writer_pool import CSVWriterPool
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+documents = [
+    '{"tag": "a", "rec": "2026-10-18T00:00:00Z", "val": 1}',
+    '{"tag": "b", "rec": "2026-10-18T00:00:00Z", "val": 2}',
+    '{"tag": "a", "rec": "2026-10-18T00:01:00Z", "val": 3}',
+    '{"tag": "b", "rec": "2026-10-18T00:01:00Z", "val": 4}',
+    '{"tag": "a", "rec": "2026-10-18T00:02:00Z", "val": 5}',
+]
+
+expected = {
+    'a': [['a', '2026-10-18T00:00:00Z', '1'], ['a', '2026-10-18T00:01:00Z', '3'], ['a', '2026-10-18T00:02:00Z', '5']],
+    'b': [['b', '2026-10-18T00:00:00Z', '2'], ['b', '2026-10-18T00:01:00Z', '4']],
+}
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    pool = CSVWriterPool(max_open=1, exclude_header=True)
+    print(pool)
+    print("-")
+
+    for jstr in documents:
+        tag = jstr.split('"')[3]
+        pool.write(os.path.join(tmp_dir, tag + '.csv'), jstr)
+
+    pool.close()
+    print(pool)
+    print("=")
+
+    for tag in sorted(expected):
+        with open(os.path.join(tmp_dir, tag + '.csv'), newline='') as file:
+            rows = list(csv.reader(file))
+
+        print("%s: %s" % (tag, rows))
+        assert rows == expected[tag], "%s: expected %s" % (tag, expected[tag])
+
+    print("-")
+    print("OK")
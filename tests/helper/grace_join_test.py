@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A GraceJoin with a budget that the first level of MAX_PARTITIONS partitions cannot meet: the oversized partitions
+must be partitioned again, so that no partition joined in memory exceeds the budget, and the joined documents must
+be those of an in-memory Join, for every join type.
+"""
+
+from scs_analysis.helper.grace_join import GraceJoin
+from scs_analysis.helper.json_codec import JSONCodec
+
+from scs_core.data.join import Join
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+codec = JSONCodec.construct()
+
+left_rows = ['{"rec": "%04d", "val": {"a": %d}}' % (i, i) for i in range(0, 3000, 2)]
+right_rows = ['{"rec": "%04d", "val": {"b": %d}}' % (i, i * 10) for i in range(0, 3000, 3)]
+
+tables = [('L', 'rec', None), ('R', 'rec', None)]
+
+max_memory = 40000
+GraceJoin.MAX_PARTITIONS = 4
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+for join_type in ('INNER', 'LEFT', 'RIGHT', 'FULL'):
+    join = Join.construct('L', 'rec', 'R', 'rec', False)
+
+    for row in left_rows:
+        join.append_to_left(codec.decode(row))
+
+    for row in right_rows:
+        join.append_to_right(codec.decode(row))
+
+    operation = {'INNER': join.inner, 'LEFT': join.left, 'RIGHT': join.right, 'FULL': join.full}[join_type]
+    expected = sorted(codec.dumps(datum) for datum in operation())
+
+    grace_join = GraceJoin.construct(tables, False, codec, max_memory, 1000000)
+    actual = sorted(codec.dumps(datum) for datum in grace_join.join(join_type, [left_rows, right_rows]))
+
+    print("%s: %s" % (join_type, grace_join))
+    print("%s: documents: %d" % (join_type, len(actual)))
+
+    assert grace_join.partitions == GraceJoin.MAX_PARTITIONS, "partitions not capped"
+    assert 0 < GraceJoin.SPILL_EXPANSION * grace_join.max_partition_size <= max_memory, "partition exceeds budget"
+    assert actual == expected, "%s: differs from Join" % join_type
+
+    print("-")
+
+print("OK")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A SortedJoin of three sequences L, R and R2 against a brute-force chain of two-way joins, ((L JOIN R) JOIN R2), for
+every join type: the primary keys, and the node of each sequence - or null - must be those of the chain.
+"""
+
+import random
+
+from scs_analysis.helper.json_codec import JSONCodec
+from scs_analysis.helper.sorted_join import SortedJoin
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def chain(join_type, tables):
+    result = {pk: [node] for pk, node in tables[0].items()}
+    width = 1
+
+    for table in tables[1:]:
+        if join_type == 'INNER':
+            pks = result.keys() & table.keys()
+        elif join_type == 'LEFT':
+            pks = result.keys()
+        elif join_type == 'RIGHT':
+            pks = table.keys()
+        else:
+            pks = result.keys() | table.keys()
+
+        result = {pk: result.get(pk, [None] * width) + [table.get(pk)] for pk in pks}
+        width += 1
+
+    return sorted(result.items())
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+random.seed(24)
+
+codec = JSONCodec.construct()
+set_paths = ('L', 'R', 'R2')
+
+tables = [{pk: {'val': i * 1000 + pk} for pk in sorted(random.sample(range(200), 120))} for i in range(len(set_paths))]
+sequences = [['{"rec": %d, "val": %d}' % (pk, node['val']) for pk, node in table.items()] for table in tables]
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+for join_type in ('INNER', 'LEFT', 'RIGHT', 'FULL'):
+    join = SortedJoin.construct([(set_path, 'rec', None) for set_path in set_paths], False, codec)
+
+    actual = []
+
+    for datum in join.join(join_type, sequences):
+        nodes = [datum.node(set_path) for set_path in set_paths]
+        actual.append((datum.node('rec'), [None if node is None else node.node() for node in nodes]))
+
+    expected = chain(join_type, tables)
+
+    print("%s: joined: %d" % (join_type, len(actual)))
+    assert actual == expected, "%s: differs from the chain" % join_type
+
+print("-")
+
+# a right join: the L node is null where R does not have the primary key, even if L has it...
+right = dict(chain('RIGHT', tables))
+pks = [pk for pk in tables[2] if pk in tables[0] and pk not in tables[1]]
+
+print("RIGHT: pks in L and R2, not R: %d" % len(pks))
+assert pks and all(right[pk][0] is None for pk in pks), "RIGHT: L node not null"
+
+print("=")
+print("OK")